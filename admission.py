@@ -0,0 +1,120 @@
+# admission.py
+"""
+Admission control for LLM turns.
+
+When upstream latency spikes, queued turns pile up. The controller
+watches the queue depth and a moving average of OpenAI latency. The queue
+depth is the turn runner's backlog (turns.py), or the rate limiter's queue
+when turns run inline. Past either threshold the engine stops sending new
+turns to the LLM and answers immediately from the stateless-command cache, a
+static answer, or a short "busy" line.
+"""
+import os
+import re
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import metrics
+
+MAX_QUEUE_DEPTH = int(os.getenv("AGBOT_SHED_QUEUE_DEPTH", "40"))
+MAX_LATENCY_SECONDS = float(os.getenv("AGBOT_SHED_LATENCY", "20"))
+LATENCY_ALPHA = 0.2           # Weight of the newest sample in the moving average
+LATENCY_STALE_SECONDS = 60.0  # Forget a latency spike if nothing has been measured since
+CACHE_SIZE = 256
+CACHE_TTL_SECONDS = 6 * 3600
+
+BUSY_MESSAGE = "Working on a lot of reps right now. Give it a few seconds and send that again."
+
+# Commands whose answer doesn't depend on roleplay or daily-log state
+_STATEFUL_PREFIXES = ("!roleplay", "!dailylog", "!priceobjection", "!paymenttoohigh", "!tradevalue")
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_command(text: str) -> str:
+    return _WS_RE.sub(" ", text.strip().lower())
+
+
+def is_cacheable(text: str) -> bool:
+    cmd = normalize_command(text)
+    return cmd.startswith("!") and not cmd.startswith(_STATEFUL_PREFIXES)
+
+
+class AdmissionController:
+    def __init__(self, max_queue_depth: int = MAX_QUEUE_DEPTH,
+                 max_latency: float = MAX_LATENCY_SECONDS):
+        self.max_queue_depth = max_queue_depth
+        self.max_latency = max_latency
+        self._lock = threading.Lock()
+        self.latency_avg = 0.0
+        self._latency_stamp = 0.0
+        self.shed_count = 0
+
+    def record_latency(self, seconds: float) -> None:
+        with self._lock:
+            if self._latency_stamp == 0.0:
+                self.latency_avg = seconds
+            else:
+                self.latency_avg += LATENCY_ALPHA * (seconds - self.latency_avg)
+            self._latency_stamp = time.monotonic()
+
+    def reset(self) -> None:
+        """Forget measured latency (replays and profiles start from a clean slate)."""
+        with self._lock:
+            self.latency_avg = 0.0
+            self._latency_stamp = 0.0
+            self.shed_count = 0
+
+    def shed_reason(self, queue_depth: int) -> Optional[str]:
+        """Why a new LLM turn should be refused right now, or None to admit it."""
+        with self._lock:
+            if queue_depth >= self.max_queue_depth:
+                reason = f"queue depth {queue_depth} >= {self.max_queue_depth}"
+            elif (self.latency_avg >= self.max_latency
+                  and time.monotonic() - self._latency_stamp < LATENCY_STALE_SECONDS):
+                reason = f"LLM latency {self.latency_avg:.1f}s >= {self.max_latency:.1f}s"
+            else:
+                return None
+            self.shed_count += 1
+            return reason
+
+
+class ResponseCache:
+    """Last LLM answer per stateless command, served while shedding load."""
+
+    def __init__(self, size: int = CACHE_SIZE, ttl: float = CACHE_TTL_SECONDS):
+        self.size = size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, text: str, version: str = "") -> Optional[str]:
+        """``version`` (the system prompt's) keeps answers from an edited prompt apart."""
+        key = f"{version}|{normalize_command(text)}"
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or time.time() - item[1] > self.ttl:
+                metrics.cache_result("response", False)
+                return None
+            self._items.move_to_end(key)
+        metrics.cache_result("response", True)
+        return item[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def put(self, text: str, answer: str, version: str = "") -> None:
+        if not is_cacheable(text):
+            return
+        key = f"{version}|{normalize_command(text)}"
+        with self._lock:
+            self._items[key] = (answer, time.time())
+            self._items.move_to_end(key)
+            while len(self._items) > self.size:
+                self._items.popitem(last=False)
+
+
+ADMISSION = AdmissionController()
+RESPONSE_CACHE = ResponseCache()
@@ -0,0 +1,126 @@
+# amounts.py
+"""
+Dollar amounts and terms in what a rep types, classified in one pass.
+
+    extract("budget is 32k out the door, we're at $489/mo, 72 months")
+    -> [Amount("price", 32000, "target"), Amount("monthly", 489, "offer"), Amount("term", 72, None)]
+
+A single precompiled pattern walks the text left to right, matching either a
+cue word or an amount. Each amount gets a kind — monthly payment, price,
+down payment, term (months) or trade value — from the unit after it ("/mo",
+"down", "otd", "months"), else from a kind cue just before it ("trade was",
+"price is"), else from its size. Its role is "offer" when the rep is stating
+where the deal is ("we're at", "at", "=", or a message that opens with "$")
+and "target" when they're naming the customer's number ("under", "around",
+"budget", "cap" ...). A cue only reaches the next amount within CUE_REACH
+characters, so a keyword in a long paste doesn't claim a number far away.
+A term ("72 months") leaves the cue for the amount after it, so in "at 72
+months 450/mo" the 450 is still the offer. A bare year ("2024 model") is not
+an amount unless a "$", "k", unit or kind cue says otherwise. Times of day
+("at 10am", "10:30") and misgrouped thousands ("1,5000") are skipped, and the
+cue before them goes with them.
+"""
+import re
+from typing import List, NamedTuple, Optional
+
+KINDS = ("monthly", "price", "down", "term", "trade")
+PRICE_MIN = 2000   # An unlabelled amount this large is a price, not a payment
+MAX_TERM = 120     # "84 months" is a term; "450 months" is someone typing "/mo" loosely
+CUE_REACH = 24     # Characters between a cue and the amount it applies to
+_YEAR_RE = re.compile(r"^(?:19|20)\d\d$")
+_GROUPED_RE = re.compile(r"^\d{1,3}(?:,\d{3})+$")
+
+_TOKEN_RE = re.compile(r"""
+    (?P<offer>\bwe(?:'|’)?re\s+at\b|\bwe\s+are\s+at\b|\bat\b|=|\boffer(?:ing)?\b)
+  | (?P<target>\bunder\b|\bcloser\s+to\b|\baround\b|\babout\b|\btarget\b|\bbudget\b|\bcap\b)
+  | (?P<trade>\btrade(?:[\s-]?in)?\b)
+  | (?P<down>\bdown\s+payment\b|\bdown\b)
+  | (?P<price>\bprice\b|\bsticker\b|\bmsrp\b|\botd\b|\bout\s+the\s+door\b)
+  | (?P<clock>\b\d{1,2}(?::\d\d)?\s*[ap]\.?m\b\.?|\b\d{1,2}:\d\d\b)
+  | (?P<amount>
+        (?P<dollar>\$\s?)?
+        (?P<num>\d[\d,]*\d|\d)(?P<frac>\.\d+)?
+        (?:\s?(?P<k>k)\b)?
+        (?:\s*(?P<unit>
+            (?P<per_month>/\s?mo(?:nth)?\b|(?:a|per|each|every)\s+mo(?:nth)?\b|monthly\b)
+          | (?P<months>mo(?:nth)?s?\b)
+          | (?P<down_unit>down\b)
+          | (?P<otd>otd\b|out\s+the\s+door\b)
+        ))?
+    )
+""", re.IGNORECASE | re.VERBOSE)
+
+
+class Amount(NamedTuple):
+    kind: str              # One of KINDS
+    value: int
+    role: Optional[str]    # "offer", "target" or None
+
+
+def extract(text: str) -> List[Amount]:
+    """Every amount in ``text``, in order, with its kind and role."""
+    found: List[Amount] = []
+    role: Optional[str] = None
+    kind: Optional[str] = None
+    role_end = kind_end = -CUE_REACH - 1
+    for m in _TOKEN_RE.finditer(text):
+        cue = m.lastgroup
+        if cue in ("offer", "target"):
+            # "cap at 450": the first cue in a run names the role
+            if role is None or m.start() - role_end > CUE_REACH:
+                role = cue
+            role_end = m.end()
+            continue
+        if cue == "clock" or (cue == "amount" and "," in m.group("num")
+                               and not _GROUPED_RE.match(m.group("num"))):
+            role = kind = None
+            continue  # "at 10am", "around 1,5000": no amount, and the cue was for it
+        if cue != "amount":
+            kind, kind_end = cue, m.end()
+            continue
+
+        num = m.group("num").replace(",", "")
+        if m.group("k"):
+            value = round(float(num + (m.group("frac") or "")) * 1000)  # "12.5k"
+        else:
+            value = int(num)
+        cued = kind is not None and m.start() - kind_end <= CUE_REACH
+        if (_YEAR_RE.match(m.group("num")) and not (m.group("dollar") or m.group("k") or m.group("unit"))
+                and not cued):
+            kind = None
+            continue  # "2024 model year"
+        if m.group("per_month"):
+            this_kind = "monthly"
+        elif m.group("months"):
+            this_kind = "term" if value <= MAX_TERM else "monthly"
+        elif m.group("down_unit"):
+            this_kind = "down"
+        elif m.group("otd"):
+            this_kind = "price"
+        elif cued:
+            this_kind = kind
+        else:
+            this_kind = "price" if value >= PRICE_MIN else "monthly"
+        kind = None
+        if value < 10 and this_kind != "term":
+            continue  # "4 fifty", "2 kids": not an amount
+
+        if this_kind == "term":
+            found.append(Amount(this_kind, value, None))
+            continue  # The role cue is for the amount after the term
+        this_role = None
+        if role is not None and m.start() - role_end <= CUE_REACH:
+            this_role = role
+        elif m.group("dollar") and not text[:m.start()].strip():
+            this_role = "offer"
+        role = None
+        found.append(Amount(this_kind, value, this_role))
+    return found
+
+
+def first(found: List[Amount], kind: str, role: Optional[str] = None) -> Optional[int]:
+    """Value of the first amount of ``kind`` (and ``role``, if given)."""
+    for a in found:
+        if a.kind == kind and (role is None or a.role == role):
+            return a.value
+    return None
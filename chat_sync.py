@@ -0,0 +1,103 @@
+# chat_sync.py
+"""
+Sequence-numbered message sync between the engine and the elite_chat component.
+
+Every message kept in the transcript carries an integer ``id`` (creation order)
+and a ``seq`` (the sync sequence at which it was created or last changed).
+The component acknowledges the last ``seq`` it applied with every event it
+sends back, so each render only ships the messages the client hasn't seen.
+
+Component builds from before this protocol only read a full ``messages``
+list; bundle_speaks_sync tells the two apart so app.py can keep such a
+build rendering until it is rebuilt.
+"""
+import functools
+import json
+import os
+from typing import Dict, Any, List, Optional
+
+
+def new_sync_state() -> Dict[str, int]:
+    """Fresh per-session sync counters."""
+    return {"seq": 0, "next_id": 1, "acked": 0}
+
+
+def stamp(sync: Dict[str, int], msg: Dict[str, Any]) -> Dict[str, Any]:
+    """Give a message an id (if it has none) and the next sequence number."""
+    if "id" not in msg:
+        msg["id"] = sync["next_id"]
+        sync["next_id"] += 1
+    sync["seq"] += 1
+    msg["seq"] = sync["seq"]
+    return msg
+
+
+def touch(sync: Dict[str, int], msg: Dict[str, Any]) -> Dict[str, Any]:
+    """Mark an existing message as changed so the next patch re-sends it."""
+    return stamp(sync, msg)
+
+
+def stamp_all(sync: Dict[str, int], messages: List[Dict[str, Any]]) -> None:
+    """Stamp any messages that predate the sync protocol (e.g. restored history)."""
+    for msg in messages:
+        if "id" not in msg or "seq" not in msg:
+            stamp(sync, msg)
+
+
+def ack(sync: Dict[str, int], client_seq: Optional[Any]) -> None:
+    """Record the last sequence the client says it has applied."""
+    try:
+        seq = int(client_seq)
+    except (TypeError, ValueError):
+        return
+    sync["acked"] = max(0, min(seq, sync["seq"]))
+
+
+def build_patch(sync: Dict[str, int], messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the render payload: only messages created or changed after the
+    client's last acknowledged sequence, plus the bounds the client needs to
+    detect gaps (``base``) and drop trimmed history (``first_id``).
+    """
+    acked = sync["acked"]
+    upserts = [
+        {"id": m["id"], "seq": m["seq"], "role": m["role"], "content": m["content"], "pending": bool(m.get("pending"))}
+        for m in messages
+        if m.get("seq", 0) > acked
+    ]
+    return {
+        "seq": sync["seq"],
+        "base": acked,
+        "first_id": messages[0]["id"] if messages else sync["next_id"],
+        "upserts": upserts,
+    }
+
+
+def openai_view(messages: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Strip sync metadata (and pending placeholders) before sending transcript messages to OpenAI."""
+    return [{"role": m["role"], "content": m["content"]} for m in messages if not m.get("pending")]
+
+
+def legacy_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Full transcript in the shape pre-sync component builds render (placeholders included)."""
+    return [{"role": m["role"], "content": m["content"]} for m in messages]
+
+
+@functools.lru_cache(maxsize=4)
+def bundle_speaks_sync(build_dir: str) -> bool:
+    """Whether the component build in ``build_dir`` applies sync patches.
+
+    Minifiers keep property names, so a build that reads ``args.sync`` has the
+    patch's ``upserts`` field in its JS; one that doesn't predates the protocol.
+    """
+    try:
+        with open(os.path.join(build_dir, "asset-manifest.json")) as f:
+            files = json.load(f).get("files", {}).values()
+        for rel in files:
+            if rel.endswith(".js"):
+                with open(os.path.normpath(os.path.join(build_dir, rel)), "rb") as f:
+                    if b"upserts" in f.read():
+                        return True
+    except (OSError, ValueError):
+        pass
+    return False
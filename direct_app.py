@@ -1,7 +1,8 @@
-import os
 import streamlit as st
 import streamlit.components.v1 as components
 
+import static_assets
+
 # =========================
 # Setup
 # =========================
@@ -16,24 +17,26 @@ div[data-testid="stSidebar"] {display:none;}
 </style>
 """, unsafe_allow_html=True)
 
-# Path to your React build directory
-build_dir = os.path.join(os.path.dirname(__file__), "elite_chat_component", "frontend", "build")
-build_index = os.path.join(build_dir, "index.html")
+# The build is read and compressed once per build hash (see
+# static_assets.py); reruns reuse the in-memory copy.
+@st.cache_resource
+def asset_pipeline() -> static_assets.AssetBundle:
+    static_assets.start_asset_server()
+    return static_assets.get_bundle()
 
-if not os.path.exists(build_index):
-    st.error(f"Could not find build index.html at {build_index}")
-    st.stop()
+def page_host():
+    """Host the browser opened this page on (None before Streamlit 1.37)."""
+    context = getattr(st, "context", None)
+    return context.headers.get("Host") if context is not None else None
 
-# Read the build index.html file
 try:
-    with open(build_index, "r", encoding="utf-8") as f:
-        html_content = f.read()
-    
-    # Modify paths to be relative (from absolute paths starting with /)
-    html_content = html_content.replace('src="/', 'src="./elite_chat_component/frontend/build/')
-    html_content = html_content.replace('href="/', 'href="./elite_chat_component/frontend/build/')
-    
-    # Display the HTML component
+    html_content = asset_pipeline().index_html(static_assets.asset_url(page_host=page_host()))
     components.html(html_content, height=800, scrolling=True)
+except static_assets.AssetConfigError as e:
+    st.error(str(e))
+    st.stop()
+except FileNotFoundError as e:
+    st.error(f"Could not find build index.html at {e}")
+    st.stop()
 except Exception as e:
     st.error(f"Error loading React build: {str(e)}")
@@ -1,3 +0,0 @@
-/*! For license information please see main.01850ca4.js.LICENSE.txt */
-(()=>{"use strict";var e={4:(e,t,n)=>{var r=n(853),i=n(43),o=n(950);function s(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function a(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function l(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!==(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function u(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function c(e){if(l(e)!==e)throw Error(s(188))}function d(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e;for(e=e.child;null!==e;){if(null!==(t=d(e)))return t;e=e.sibling}return null}var f=Object.assign,h=Symbol.for("react.element"),p=Symbol.for("react.transitional.element"),y=Symbol.for("react.portal"),b=Symbol.for("react.fragment"),m=Symbol.for("react.strict_mode"),g=Symbol.for("react.profiler"),v=Symbol.for("react.provider"),w=Symbol.for("react.consumer"),_=Symbol.for("react.context"),S=Symbol.for("react.forward_ref"),k=Symbol.for("react.suspense"),I=Symbol.for("react.suspense_list"),x=Symbol.for("react.memo"),T=Symbol.for("react.lazy");Symbol.for("react.scope");var E=Symbol.for("react.activity");Symbol.for("react.legacy_hidden"),Symbol.for("react.tracing_marker");var A=Symbol.for("react.memo_cache_sentinel");Symbol.for("react.view_transition");var O=Symbol.iterator;function C(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=O&&e[O]||e["@@iterator"])?e:null}var N=Symbol.for("react.client.reference");function D(e){if(null==e)return null;if("function"===typeof e)return e.$$typeof===N?null:e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case b:return"Fragment";case g:return"Profiler";case m:return"StrictMode";case k:return"Suspense";case I:return"SuspenseList";case E:return"Activity"}if("object"===typeof e)switch(e.$$typeof){case y:return"Portal";case _:return(e.displayName||"Context")+".Provider";case w:return(e._context.displayName||"Context")+".Consumer";case S:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case x:return null!==(t=e.displayName||null)?t:D(e.type)||"Memo";case T:t=e._payload,e=e._init;try{return D(e(t))}catch(n){}}return null}var L=Array.isArray,B=i.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,F=o.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,M={pending:!1,data:null,method:null,action:null},P=[],z=-1;function U(e){return{current:e}}function R(e){0>z||(e.current=P[z],P[z]=null,z--)}function j(e,t){z++,P[z]=e.current,e.current=t}var V=U(null),H=U(null),$=U(null),W=U(null);function Y(e,t){switch(j($,t),j(H,e),j(V,null),t.nodeType){case 9:case 11:e=(e=t.documentElement)&&(e=e.namespaceURI)?id(e):0;break;default:if(e=t.tagName,t=t.namespaceURI)e=od(t=id(t),e);else switch(e){case"svg":e=1;break;case"math":e=2;break;default:e=0}}R(V),j(V,e)}function q(){R(V),R(H),R($)}function Q(e){null!==e.memoizedState&&j(W,e);var t=V.current,n=od(t,e.type);t!==n&&(j(H,e),j(V,n))}function K(e){H.current===e&&(R(V),R(H)),W.current===e&&(R(W),Qd._currentValue=M)}var G=Object.prototype.hasOwnProperty,X=r.unstable_scheduleCallback,J=r.unstable_cancelCallback,Z=r.unstable_shouldYield,ee=r.unstable_requestPaint,te=r.unstable_now,ne=r.unstable_getCurrentPriorityLevel,re=r.unstable_ImmediatePriority,ie=r.unstable_UserBlockingPriority,oe=r.unstable_NormalPriority,se=r.unstable_LowPriority,ae=r.unstable_IdlePriority,le=r.log,ue=r.unstable_setDisableYieldValue,ce=null,de=null;function fe(e){if("function"===typeof le&&ue(e),de&&"function"===typeof de.setStrictMode)try{de.setStrictMode(ce,e)}catch(t){}}var he=Math.clz32?Math.clz32:function(e){return 0===(e>>>=0)?32:31-(pe(e)/ye|0)|0},pe=Math.log,ye=Math.LN2;var be=256,me=4194304;function ge(e){var t=42&e;if(0!==t)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194048&e;case 4194304:case 8388608:case 16777216:case 33554432:return 62914560&e;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function ve(e,t,n){var r=e.pendingLanes;if(0===r)return 0;var i=0,o=e.suspendedLanes,s=e.pingedLanes;e=e.warmLanes;var a=134217727&r;return 0!==a?0!==(r=a&~o)?i=ge(r):0!==(s&=a)?i=ge(s):n||0!==(n=a&~e)&&(i=ge(n)):0!==(a=r&~o)?i=ge(a):0!==s?i=ge(s):n||0!==(n=r&~e)&&(i=ge(n)),0===i?0:0!==t&&t!==i&&0===(t&o)&&((o=i&-i)>=(n=t&-t)||32===o&&0!==(4194048&n))?t:i}function we(e,t){return 0===(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)}function _e(e,t){switch(e){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function Se(){var e=be;return 0===(4194048&(be<<=1))&&(be=256),e}function ke(){var e=me;return 0===(62914560&(me<<=1))&&(me=4194304),e}function Ie(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function xe(e,t){e.pendingLanes|=t,268435456!==t&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function Te(e,t,n){e.pendingLanes|=t,e.suspendedLanes&=~t;var r=31-he(t);e.entangledLanes|=t,e.entanglements[r]=1073741824|e.entanglements[r]|4194090&n}function Ee(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-he(n),i=1<<r;i&t|e[r]&t&&(e[r]|=t),n&=~i}}function Ae(e){switch(e){case 2:e=1;break;case 8:e=4;break;case 32:e=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:e=128;break;case 268435456:e=134217728;break;default:e=0}return e}function Oe(e){return 2<(e&=-e)?8<e?0!==(134217727&e)?32:268435456:8:2}function Ce(){var e=F.p;return 0!==e?e:void 0===(e=window.event)?32:cf(e.type)}var Ne=Math.random().toString(36).slice(2),De="__reactFiber$"+Ne,Le="__reactProps$"+Ne,Be="__reactContainer$"+Ne,Fe="__reactEvents$"+Ne,Me="__reactListeners$"+Ne,Pe="__reactHandles$"+Ne,ze="__reactResources$"+Ne,Ue="__reactMarker$"+Ne;function Re(e){delete e[De],delete e[Le],delete e[Fe],delete e[Me],delete e[Pe]}function je(e){var t=e[De];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Be]||n[De]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=vd(e);null!==e;){if(n=e[De])return n;e=vd(e)}return t}n=(e=n).parentNode}return null}function Ve(e){if(e=e[De]||e[Be]){var t=e.tag;if(5===t||6===t||13===t||26===t||27===t||3===t)return e}return null}function He(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e.stateNode;throw Error(s(33))}function $e(e){var t=e[ze];return t||(t=e[ze]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function We(e){e[Ue]=!0}var Ye=new Set,qe={};function Qe(e,t){Ke(e,t),Ke(e+"Capture",t)}function Ke(e,t){for(qe[e]=t,e=0;e<t.length;e++)Ye.add(t[e])}var Ge,Xe,Je=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Ze={},et={};function tt(e,t,n){if(i=t,G.call(et,i)||!G.call(Ze,i)&&(Je.test(i)?et[i]=!0:(Ze[i]=!0,0)))if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":return void e.removeAttribute(t);case"boolean":var r=t.toLowerCase().slice(0,5);if("data-"!==r&&"aria-"!==r)return void e.removeAttribute(t)}e.setAttribute(t,""+n)}var i}function nt(e,t,n){if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(t)}e.setAttribute(t,""+n)}}function rt(e,t,n,r){if(null===r)e.removeAttribute(n);else{switch(typeof r){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(n)}e.setAttributeNS(t,n,""+r)}}function it(e){if(void 0===Ge)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Ge=t&&t[1]||"",Xe=-1<n.stack.indexOf("\n    at")?" (<anonymous>)":-1<n.stack.indexOf("@")?"@unknown:0:0":""}return"\n"+Ge+e+Xe}var ot=!1;function st(e,t){if(!e||ot)return"";ot=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var r={DetermineComponentFrameRoot:function(){try{if(t){var n=function(){throw Error()};if(Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(i){var r=i}Reflect.construct(e,[],n)}else{try{n.call()}catch(o){r=o}e.call(n.prototype)}}else{try{throw Error()}catch(s){r=s}(n=e())&&"function"===typeof n.catch&&n.catch(function(){})}}catch(a){if(a&&r&&"string"===typeof a.stack)return[a.stack,r.stack]}return[null,null]}};r.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var i=Object.getOwnPropertyDescriptor(r.DetermineComponentFrameRoot,"name");i&&i.configurable&&Object.defineProperty(r.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var o=r.DetermineComponentFrameRoot(),s=o[0],a=o[1];if(s&&a){var l=s.split("\n"),u=a.split("\n");for(i=r=0;r<l.length&&!l[r].includes("DetermineComponentFrameRoot");)r++;for(;i<u.length&&!u[i].includes("DetermineComponentFrameRoot");)i++;if(r===l.length||i===u.length)for(r=l.length-1,i=u.length-1;1<=r&&0<=i&&l[r]!==u[i];)i--;for(;1<=r&&0<=i;r--,i--)if(l[r]!==u[i]){if(1!==r||1!==i)do{if(r--,0>--i||l[r]!==u[i]){var c="\n"+l[r].replace(" at new "," at ");return e.displayName&&c.includes("<anonymous>")&&(c=c.replace("<anonymous>",e.displayName)),c}}while(1<=r&&0<=i);break}}}finally{ot=!1,Error.prepareStackTrace=n}return(n=e?e.displayName||e.name:"")?it(n):""}function at(e){switch(e.tag){case 26:case 27:case 5:return it(e.type);case 16:return it("Lazy");case 13:return it("Suspense");case 19:return it("SuspenseList");case 0:case 15:return st(e.type,!1);case 11:return st(e.type.render,!1);case 1:return st(e.type,!0);case 31:return it("Activity");default:return""}}function lt(e){try{var t="";do{t+=at(e),e=e.return}while(e);return t}catch(n){return"\nError generating stack: "+n.message+"\n"+n.stack}}function ut(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function ct(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function dt(e){e._valueTracker||(e._valueTracker=function(e){var t=ct(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var i=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return i.call(this)},set:function(e){r=""+e,o.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function ft(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ct(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function ht(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}var pt=/[\n"\\]/g;function yt(e){return e.replace(pt,function(e){return"\\"+e.charCodeAt(0).toString(16)+" "})}function bt(e,t,n,r,i,o,s,a){e.name="",null!=s&&"function"!==typeof s&&"symbol"!==typeof s&&"boolean"!==typeof s?e.type=s:e.removeAttribute("type"),null!=t?"number"===s?(0===t&&""===e.value||e.value!=t)&&(e.value=""+ut(t)):e.value!==""+ut(t)&&(e.value=""+ut(t)):"submit"!==s&&"reset"!==s||e.removeAttribute("value"),null!=t?gt(e,s,ut(t)):null!=n?gt(e,s,ut(n)):null!=r&&e.removeAttribute("value"),null==i&&null!=o&&(e.defaultChecked=!!o),null!=i&&(e.checked=i&&"function"!==typeof i&&"symbol"!==typeof i),null!=a&&"function"!==typeof a&&"symbol"!==typeof a&&"boolean"!==typeof a?e.name=""+ut(a):e.removeAttribute("name")}function mt(e,t,n,r,i,o,s,a){if(null!=o&&"function"!==typeof o&&"symbol"!==typeof o&&"boolean"!==typeof o&&(e.type=o),null!=t||null!=n){if(!("submit"!==o&&"reset"!==o||void 0!==t&&null!==t))return;n=null!=n?""+ut(n):"",t=null!=t?""+ut(t):n,a||t===e.value||(e.value=t),e.defaultValue=t}r="function"!==typeof(r=null!=r?r:i)&&"symbol"!==typeof r&&!!r,e.checked=a?e.checked:!!r,e.defaultChecked=!!r,null!=s&&"function"!==typeof s&&"symbol"!==typeof s&&"boolean"!==typeof s&&(e.name=s)}function gt(e,t,n){"number"===t&&ht(e.ownerDocument)===e||e.defaultValue===""+n||(e.defaultValue=""+n)}function vt(e,t,n,r){if(e=e.options,t){t={};for(var i=0;i<n.length;i++)t["$"+n[i]]=!0;for(n=0;n<e.length;n++)i=t.hasOwnProperty("$"+e[n].value),e[n].selected!==i&&(e[n].selected=i),i&&r&&(e[n].defaultSelected=!0)}else{for(n=""+ut(n),t=null,i=0;i<e.length;i++){if(e[i].value===n)return e[i].selected=!0,void(r&&(e[i].defaultSelected=!0));null!==t||e[i].disabled||(t=e[i])}null!==t&&(t.selected=!0)}}function wt(e,t,n){null==t||((t=""+ut(t))!==e.value&&(e.value=t),null!=n)?e.defaultValue=null!=n?""+ut(n):"":e.defaultValue!==t&&(e.defaultValue=t)}function _t(e,t,n,r){if(null==t){if(null!=r){if(null!=n)throw Error(s(92));if(L(r)){if(1<r.length)throw Error(s(93));r=r[0]}n=r}null==n&&(n=""),t=n}n=ut(t),e.defaultValue=n,(r=e.textContent)===n&&""!==r&&null!==r&&(e.value=r)}function St(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var kt=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function It(e,t,n){var r=0===t.indexOf("--");null==n||"boolean"===typeof n||""===n?r?e.setProperty(t,""):"float"===t?e.cssFloat="":e[t]="":r?e.setProperty(t,n):"number"!==typeof n||0===n||kt.has(t)?"float"===t?e.cssFloat=n:e[t]=(""+n).trim():e[t]=n+"px"}function xt(e,t,n){if(null!=t&&"object"!==typeof t)throw Error(s(62));if(e=e.style,null!=n){for(var r in n)!n.hasOwnProperty(r)||null!=t&&t.hasOwnProperty(r)||(0===r.indexOf("--")?e.setProperty(r,""):"float"===r?e.cssFloat="":e[r]="");for(var i in t)r=t[i],t.hasOwnProperty(i)&&n[i]!==r&&It(e,i,r)}else for(var o in t)t.hasOwnProperty(o)&&It(e,o,t[o])}function Tt(e){if(-1===e.indexOf("-"))return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Et=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),At=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Ot(e){return At.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}var Ct=null;function Nt(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Dt=null,Lt=null;function Bt(e){var t=Ve(e);if(t&&(e=t.stateNode)){var n=e[Le]||null;e:switch(e=t.stateNode,t.type){case"input":if(bt(e,n.value,n.defaultValue,n.defaultValue,n.checked,n.defaultChecked,n.type,n.name),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll('input[name="'+yt(""+t)+'"][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var i=r[Le]||null;if(!i)throw Error(s(90));bt(r,i.value,i.defaultValue,i.defaultValue,i.checked,i.defaultChecked,i.type,i.name)}}for(t=0;t<n.length;t++)(r=n[t]).form===e.form&&ft(r)}break e;case"textarea":wt(e,n.value,n.defaultValue);break e;case"select":null!=(t=n.value)&&vt(e,!!n.multiple,t,!1)}}}var Ft=!1;function Mt(e,t,n){if(Ft)return e(t,n);Ft=!0;try{return e(t)}finally{if(Ft=!1,(null!==Dt||null!==Lt)&&(ju(),Dt&&(t=Dt,e=Lt,Lt=Dt=null,Bt(t),e)))for(t=0;t<e.length;t++)Bt(e[t])}}function Pt(e,t){var n=e.stateNode;if(null===n)return null;var r=n[Le]||null;if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!==typeof n)throw Error(s(231,t,typeof n));return n}var zt=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),Ut=!1;if(zt)try{var Rt={};Object.defineProperty(Rt,"passive",{get:function(){Ut=!0}}),window.addEventListener("test",Rt,Rt),window.removeEventListener("test",Rt,Rt)}catch(Bf){Ut=!1}var jt=null,Vt=null,Ht=null;function $t(){if(Ht)return Ht;var e,t,n=Vt,r=n.length,i="value"in jt?jt.value:jt.textContent,o=i.length;for(e=0;e<r&&n[e]===i[e];e++);var s=r-e;for(t=1;t<=s&&n[r-t]===i[o-t];t++);return Ht=i.slice(e,1<t?1-t:void 0)}function Wt(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function Yt(){return!0}function qt(){return!1}function Qt(e){function t(t,n,r,i,o){for(var s in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=i,this.target=o,this.currentTarget=null,e)e.hasOwnProperty(s)&&(t=e[s],this[s]=t?t(i):i[s]);return this.isDefaultPrevented=(null!=i.defaultPrevented?i.defaultPrevented:!1===i.returnValue)?Yt:qt,this.isPropagationStopped=qt,this}return f(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=Yt)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=Yt)},persist:function(){},isPersistent:Yt}),t}var Kt,Gt,Xt,Jt={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Zt=Qt(Jt),en=f({},Jt,{view:0,detail:0}),tn=Qt(en),nn=f({},en,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:pn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Xt&&(Xt&&"mousemove"===e.type?(Kt=e.screenX-Xt.screenX,Gt=e.screenY-Xt.screenY):Gt=Kt=0,Xt=e),Kt)},movementY:function(e){return"movementY"in e?e.movementY:Gt}}),rn=Qt(nn),on=Qt(f({},nn,{dataTransfer:0})),sn=Qt(f({},en,{relatedTarget:0})),an=Qt(f({},Jt,{animationName:0,elapsedTime:0,pseudoElement:0})),ln=Qt(f({},Jt,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}})),un=Qt(f({},Jt,{data:0})),cn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},dn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},fn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function hn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=fn[e])&&!!t[e]}function pn(){return hn}var yn=Qt(f({},en,{key:function(e){if(e.key){var t=cn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=Wt(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?dn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:pn,charCode:function(e){return"keypress"===e.type?Wt(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?Wt(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}})),bn=Qt(f({},nn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),mn=Qt(f({},en,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:pn})),gn=Qt(f({},Jt,{propertyName:0,elapsedTime:0,pseudoElement:0})),vn=Qt(f({},nn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0})),wn=Qt(f({},Jt,{newState:0,oldState:0})),_n=[9,13,27,32],Sn=zt&&"CompositionEvent"in window,kn=null;zt&&"documentMode"in document&&(kn=document.documentMode);var In=zt&&"TextEvent"in window&&!kn,xn=zt&&(!Sn||kn&&8<kn&&11>=kn),Tn=String.fromCharCode(32),En=!1;function An(e,t){switch(e){case"keyup":return-1!==_n.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function On(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var Cn=!1;var Nn={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Dn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Nn[e.type]:"textarea"===t}function Ln(e,t,n,r){Dt?Lt?Lt.push(r):Lt=[r]:Dt=r,0<(t=$c(t,"onChange")).length&&(n=new Zt("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Bn=null,Fn=null;function Mn(e){Mc(e,0)}function Pn(e){if(ft(He(e)))return e}function zn(e,t){if("change"===e)return t}var Un=!1;if(zt){var Rn;if(zt){var jn="oninput"in document;if(!jn){var Vn=document.createElement("div");Vn.setAttribute("oninput","return;"),jn="function"===typeof Vn.oninput}Rn=jn}else Rn=!1;Un=Rn&&(!document.documentMode||9<document.documentMode)}function Hn(){Bn&&(Bn.detachEvent("onpropertychange",$n),Fn=Bn=null)}function $n(e){if("value"===e.propertyName&&Pn(Fn)){var t=[];Ln(t,Fn,e,Nt(e)),Mt(Mn,t)}}function Wn(e,t,n){"focusin"===e?(Hn(),Fn=n,(Bn=t).attachEvent("onpropertychange",$n)):"focusout"===e&&Hn()}function Yn(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Pn(Fn)}function qn(e,t){if("click"===e)return Pn(t)}function Qn(e,t){if("input"===e||"change"===e)return Pn(t)}var Kn="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t};function Gn(e,t){if(Kn(e,t))return!0;if("object"!==typeof e||null===e||"object"!==typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var i=n[r];if(!G.call(t,i)||!Kn(e[i],t[i]))return!1}return!0}function Xn(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Jn(e,t){var n,r=Xn(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=Xn(r)}}function Zn(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?Zn(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function er(e){for(var t=ht((e=null!=e&&null!=e.ownerDocument&&null!=e.ownerDocument.defaultView?e.ownerDocument.defaultView:window).document);t instanceof e.HTMLIFrameElement;){try{var n="string"===typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=ht((e=t.contentWindow).document)}return t}function tr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var nr=zt&&"documentMode"in document&&11>=document.documentMode,rr=null,ir=null,or=null,sr=!1;function ar(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;sr||null==rr||rr!==ht(r)||("selectionStart"in(r=rr)&&tr(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},or&&Gn(or,r)||(or=r,0<(r=$c(ir,"onSelect")).length&&(t=new Zt("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=rr)))}function lr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var ur={animationend:lr("Animation","AnimationEnd"),animationiteration:lr("Animation","AnimationIteration"),animationstart:lr("Animation","AnimationStart"),transitionrun:lr("Transition","TransitionRun"),transitionstart:lr("Transition","TransitionStart"),transitioncancel:lr("Transition","TransitionCancel"),transitionend:lr("Transition","TransitionEnd")},cr={},dr={};function fr(e){if(cr[e])return cr[e];if(!ur[e])return e;var t,n=ur[e];for(t in n)if(n.hasOwnProperty(t)&&t in dr)return cr[e]=n[t];return e}zt&&(dr=document.createElement("div").style,"AnimationEvent"in window||(delete ur.animationend.animation,delete ur.animationiteration.animation,delete ur.animationstart.animation),"TransitionEvent"in window||delete ur.transitionend.transition);var hr=fr("animationend"),pr=fr("animationiteration"),yr=fr("animationstart"),br=fr("transitionrun"),mr=fr("transitionstart"),gr=fr("transitioncancel"),vr=fr("transitionend"),wr=new Map,_r="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Sr(e,t){wr.set(e,t),Qe(t,[e])}_r.push("scrollEnd");var kr=new WeakMap;function Ir(e,t){if("object"===typeof e&&null!==e){var n=kr.get(e);return void 0!==n?n:(t={value:e,source:t,stack:lt(t)},kr.set(e,t),t)}return{value:e,source:t,stack:lt(t)}}var xr=[],Tr=0,Er=0;function Ar(){for(var e=Tr,t=Er=Tr=0;t<e;){var n=xr[t];xr[t++]=null;var r=xr[t];xr[t++]=null;var i=xr[t];xr[t++]=null;var o=xr[t];if(xr[t++]=null,null!==r&&null!==i){var s=r.pending;null===s?i.next=i:(i.next=s.next,s.next=i),r.pending=i}0!==o&&Dr(n,i,o)}}function Or(e,t,n,r){xr[Tr++]=e,xr[Tr++]=t,xr[Tr++]=n,xr[Tr++]=r,Er|=r,e.lanes|=r,null!==(e=e.alternate)&&(e.lanes|=r)}function Cr(e,t,n,r){return Or(e,t,n,r),Lr(e)}function Nr(e,t){return Or(e,null,null,t),Lr(e)}function Dr(e,t,n){e.lanes|=n;var r=e.alternate;null!==r&&(r.lanes|=n);for(var i=!1,o=e.return;null!==o;)o.childLanes|=n,null!==(r=o.alternate)&&(r.childLanes|=n),22===o.tag&&(null===(e=o.stateNode)||1&e._visibility||(i=!0)),e=o,o=o.return;return 3===e.tag?(o=e.stateNode,i&&null!==t&&(i=31-he(n),null===(r=(e=o.hiddenUpdates)[i])?e[i]=[t]:r.push(t),t.lane=536870912|n),o):null}function Lr(e){if(50<Du)throw Du=0,Lu=null,Error(s(185));for(var t=e.return;null!==t;)t=(e=t).return;return 3===e.tag?e.stateNode:null}var Br={};function Fr(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Mr(e,t,n,r){return new Fr(e,t,n,r)}function Pr(e){return!(!(e=e.prototype)||!e.isReactComponent)}function zr(e,t){var n=e.alternate;return null===n?((n=Mr(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=65011712&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n.refCleanup=e.refCleanup,n}function Ur(e,t){e.flags&=65011714;var n=e.alternate;return null===n?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=n.childLanes,e.lanes=n.lanes,e.child=n.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=n.memoizedProps,e.memoizedState=n.memoizedState,e.updateQueue=n.updateQueue,e.type=n.type,t=n.dependencies,e.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function Rr(e,t,n,r,i,o){var a=0;if(r=e,"function"===typeof e)Pr(e)&&(a=1);else if("string"===typeof e)a=function(e,t,n){if(1===n||null!=t.itemProp)return!1;switch(e){case"meta":case"title":return!0;case"style":if("string"!==typeof t.precedence||"string"!==typeof t.href||""===t.href)break;return!0;case"link":if("string"!==typeof t.rel||"string"!==typeof t.href||""===t.href||t.onLoad||t.onError)break;return"stylesheet"!==t.rel||(e=t.disabled,"string"===typeof t.precedence&&null==e);case"script":if(t.async&&"function"!==typeof t.async&&"symbol"!==typeof t.async&&!t.onLoad&&!t.onError&&t.src&&"string"===typeof t.src)return!0}return!1}(e,n,V.current)?26:"html"===e||"head"===e||"body"===e?27:5;else e:switch(e){case E:return(e=Mr(31,n,t,i)).elementType=E,e.lanes=o,e;case b:return jr(n.children,i,o,t);case m:a=8,i|=24;break;case g:return(e=Mr(12,n,t,2|i)).elementType=g,e.lanes=o,e;case k:return(e=Mr(13,n,t,i)).elementType=k,e.lanes=o,e;case I:return(e=Mr(19,n,t,i)).elementType=I,e.lanes=o,e;default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case v:case _:a=10;break e;case w:a=9;break e;case S:a=11;break e;case x:a=14;break e;case T:a=16,r=null;break e}a=29,n=Error(s(130,null===e?"null":typeof e,"")),r=null}return(t=Mr(a,n,t,i)).elementType=e,t.type=r,t.lanes=o,t}function jr(e,t,n,r){return(e=Mr(7,e,r,t)).lanes=n,e}function Vr(e,t,n){return(e=Mr(6,e,null,t)).lanes=n,e}function Hr(e,t,n){return(t=Mr(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}var $r=[],Wr=0,Yr=null,qr=0,Qr=[],Kr=0,Gr=null,Xr=1,Jr="";function Zr(e,t){$r[Wr++]=qr,$r[Wr++]=Yr,Yr=e,qr=t}function ei(e,t,n){Qr[Kr++]=Xr,Qr[Kr++]=Jr,Qr[Kr++]=Gr,Gr=e;var r=Xr;e=Jr;var i=32-he(r)-1;r&=~(1<<i),n+=1;var o=32-he(t)+i;if(30<o){var s=i-i%5;o=(r&(1<<s)-1).toString(32),r>>=s,i-=s,Xr=1<<32-he(t)+i|n<<i|r,Jr=o+e}else Xr=1<<o|n<<i|r,Jr=e}function ti(e){null!==e.return&&(Zr(e,1),ei(e,1,0))}function ni(e){for(;e===Yr;)Yr=$r[--Wr],$r[Wr]=null,qr=$r[--Wr],$r[Wr]=null;for(;e===Gr;)Gr=Qr[--Kr],Qr[Kr]=null,Jr=Qr[--Kr],Qr[Kr]=null,Xr=Qr[--Kr],Qr[Kr]=null}var ri=null,ii=null,oi=!1,si=null,ai=!1,li=Error(s(519));function ui(e){throw yi(Ir(Error(s(418,"")),e)),li}function ci(e){var t=e.stateNode,n=e.type,r=e.memoizedProps;switch(t[De]=e,t[Le]=r,n){case"dialog":Pc("cancel",t),Pc("close",t);break;case"iframe":case"object":case"embed":Pc("load",t);break;case"video":case"audio":for(n=0;n<Bc.length;n++)Pc(Bc[n],t);break;case"source":Pc("error",t);break;case"img":case"image":case"link":Pc("error",t),Pc("load",t);break;case"details":Pc("toggle",t);break;case"input":Pc("invalid",t),mt(t,r.value,r.defaultValue,r.checked,r.defaultChecked,r.type,r.name,!0),dt(t);break;case"select":Pc("invalid",t);break;case"textarea":Pc("invalid",t),_t(t,r.value,r.defaultValue,r.children),dt(t)}"string"!==typeof(n=r.children)&&"number"!==typeof n&&"bigint"!==typeof n||t.textContent===""+n||!0===r.suppressHydrationWarning||Gc(t.textContent,n)?(null!=r.popover&&(Pc("beforetoggle",t),Pc("toggle",t)),null!=r.onScroll&&Pc("scroll",t),null!=r.onScrollEnd&&Pc("scrollend",t),null!=r.onClick&&(t.onclick=Xc),t=!0):t=!1,t||ui(e)}function di(e){for(ri=e.return;ri;)switch(ri.tag){case 5:case 13:return void(ai=!1);case 27:case 3:return void(ai=!0);default:ri=ri.return}}function fi(e){if(e!==ri)return!1;if(!oi)return di(e),oi=!0,!1;var t,n=e.tag;if((t=3!==n&&27!==n)&&((t=5===n)&&(t=!("form"!==(t=e.type)&&"button"!==t)||sd(e.type,e.memoizedProps)),t=!t),t&&ii&&ui(e),di(e),13===n){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(s(317));e:{for(e=e.nextSibling,n=0;e;){if(8===e.nodeType)if("/$"===(t=e.data)){if(0===n){ii=md(e.nextSibling);break e}n--}else"$"!==t&&"$!"!==t&&"$?"!==t||n++;e=e.nextSibling}ii=null}}else 27===n?(n=ii,hd(e.type)?(e=gd,gd=null,ii=e):ii=n):ii=ri?md(e.stateNode.nextSibling):null;return!0}function hi(){ii=ri=null,oi=!1}function pi(){var e=si;return null!==e&&(null===vu?vu=e:vu.push.apply(vu,e),si=null),e}function yi(e){null===si?si=[e]:si.push(e)}var bi=U(null),mi=null,gi=null;function vi(e,t,n){j(bi,t._currentValue),t._currentValue=n}function wi(e){e._currentValue=bi.current,R(bi)}function _i(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Si(e,t,n,r){var i=e.child;for(null!==i&&(i.return=e);null!==i;){var o=i.dependencies;if(null!==o){var a=i.child;o=o.firstContext;e:for(;null!==o;){var l=o;o=i;for(var u=0;u<t.length;u++)if(l.context===t[u]){o.lanes|=n,null!==(l=o.alternate)&&(l.lanes|=n),_i(o.return,n,e),r||(a=null);break e}o=l.next}}else if(18===i.tag){if(null===(a=i.return))throw Error(s(341));a.lanes|=n,null!==(o=a.alternate)&&(o.lanes|=n),_i(a,n,e),a=null}else a=i.child;if(null!==a)a.return=i;else for(a=i;null!==a;){if(a===e){a=null;break}if(null!==(i=a.sibling)){i.return=a.return,a=i;break}a=a.return}i=a}}function ki(e,t,n,r){e=null;for(var i=t,o=!1;null!==i;){if(!o)if(0!==(524288&i.flags))o=!0;else if(0!==(262144&i.flags))break;if(10===i.tag){var a=i.alternate;if(null===a)throw Error(s(387));if(null!==(a=a.memoizedProps)){var l=i.type;Kn(i.pendingProps.value,a.value)||(null!==e?e.push(l):e=[l])}}else if(i===W.current){if(null===(a=i.alternate))throw Error(s(387));a.memoizedState.memoizedState!==i.memoizedState.memoizedState&&(null!==e?e.push(Qd):e=[Qd])}i=i.return}null!==e&&Si(t,e,n,r),t.flags|=262144}function Ii(e){for(e=e.firstContext;null!==e;){if(!Kn(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function xi(e){mi=e,gi=null,null!==(e=e.dependencies)&&(e.firstContext=null)}function Ti(e){return Ai(mi,e)}function Ei(e,t){return null===mi&&xi(e),Ai(e,t)}function Ai(e,t){var n=t._currentValue;if(t={context:t,memoizedValue:n,next:null},null===gi){if(null===e)throw Error(s(308));gi=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else gi=gi.next=t;return n}var Oi="undefined"!==typeof AbortController?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(t,n){e.push(n)}};this.abort=function(){t.aborted=!0,e.forEach(function(e){return e()})}},Ci=r.unstable_scheduleCallback,Ni=r.unstable_NormalPriority,Di={$$typeof:_,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Li(){return{controller:new Oi,data:new Map,refCount:0}}function Bi(e){e.refCount--,0===e.refCount&&Ci(Ni,function(){e.controller.abort()})}var Fi=null,Mi=0,Pi=0,zi=null;function Ui(){if(0===--Mi&&null!==Fi){null!==zi&&(zi.status="fulfilled");var e=Fi;Fi=null,Pi=0,zi=null;for(var t=0;t<e.length;t++)(0,e[t])()}}var Ri=B.S;B.S=function(e,t){"object"===typeof t&&null!==t&&"function"===typeof t.then&&function(e,t){if(null===Fi){var n=Fi=[];Mi=0,Pi=Oc(),zi={status:"pending",value:void 0,then:function(e){n.push(e)}}}Mi++,t.then(Ui,Ui)}(0,t),null!==Ri&&Ri(e,t)};var ji=U(null);function Vi(){var e=ji.current;return null!==e?e:ru.pooledCache}function Hi(e,t){j(ji,null===t?ji.current:t.pool)}function $i(){var e=Vi();return null===e?null:{parent:Di._currentValue,pool:e}}var Wi=Error(s(460)),Yi=Error(s(474)),qi=Error(s(542)),Qi={then:function(){}};function Ki(e){return"fulfilled"===(e=e.status)||"rejected"===e}function Gi(){}function Xi(e,t,n){switch(void 0===(n=e[n])?e.push(t):n!==t&&(t.then(Gi,Gi),t=n),t.status){case"fulfilled":return t.value;case"rejected":throw eo(e=t.reason),e;default:if("string"===typeof t.status)t.then(Gi,Gi);else{if(null!==(e=ru)&&100<e.shellSuspendCounter)throw Error(s(482));(e=t).status="pending",e.then(function(e){if("pending"===t.status){var n=t;n.status="fulfilled",n.value=e}},function(e){if("pending"===t.status){var n=t;n.status="rejected",n.reason=e}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw eo(e=t.reason),e}throw Ji=t,Wi}}var Ji=null;function Zi(){if(null===Ji)throw Error(s(459));var e=Ji;return Ji=null,e}function eo(e){if(e===Wi||e===qi)throw Error(s(483))}var to=!1;function no(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function ro(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function io(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function oo(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&nu)){var i=r.pending;return null===i?t.next=t:(t.next=i.next,i.next=t),r.pending=t,t=Lr(e),Dr(e,null,n),t}return Or(e,r,t,n),Lr(e)}function so(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,0!==(4194048&n))){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Ee(e,n)}}function ao(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var i=null,o=null;if(null!==(n=n.firstBaseUpdate)){do{var s={lane:n.lane,tag:n.tag,payload:n.payload,callback:null,next:null};null===o?i=o=s:o=o.next=s,n=n.next}while(null!==n);null===o?i=o=t:o=o.next=t}else i=o=t;return n={baseState:r.baseState,firstBaseUpdate:i,lastBaseUpdate:o,shared:r.shared,callbacks:r.callbacks},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}var lo=!1;function uo(){if(lo){if(null!==zi)throw zi}}function co(e,t,n,r){lo=!1;var i=e.updateQueue;to=!1;var o=i.firstBaseUpdate,s=i.lastBaseUpdate,a=i.shared.pending;if(null!==a){i.shared.pending=null;var l=a,u=l.next;l.next=null,null===s?o=u:s.next=u,s=l;var c=e.alternate;null!==c&&((a=(c=c.updateQueue).lastBaseUpdate)!==s&&(null===a?c.firstBaseUpdate=u:a.next=u,c.lastBaseUpdate=l))}if(null!==o){var d=i.baseState;for(s=0,c=u=l=null,a=o;;){var h=-536870913&a.lane,p=h!==a.lane;if(p?(ou&h)===h:(r&h)===h){0!==h&&h===Pi&&(lo=!0),null!==c&&(c=c.next={lane:0,tag:a.tag,payload:a.payload,callback:null,next:null});e:{var y=e,b=a;h=t;var m=n;switch(b.tag){case 1:if("function"===typeof(y=b.payload)){d=y.call(m,d,h);break e}d=y;break e;case 3:y.flags=-65537&y.flags|128;case 0:if(null===(h="function"===typeof(y=b.payload)?y.call(m,d,h):y)||void 0===h)break e;d=f({},d,h);break e;case 2:to=!0}}null!==(h=a.callback)&&(e.flags|=64,p&&(e.flags|=8192),null===(p=i.callbacks)?i.callbacks=[h]:p.push(h))}else p={lane:h,tag:a.tag,payload:a.payload,callback:a.callback,next:null},null===c?(u=c=p,l=d):c=c.next=p,s|=h;if(null===(a=a.next)){if(null===(a=i.shared.pending))break;a=(p=a).next,p.next=null,i.lastBaseUpdate=p,i.shared.pending=null}}null===c&&(l=d),i.baseState=l,i.firstBaseUpdate=u,i.lastBaseUpdate=c,null===o&&(i.shared.lanes=0),hu|=s,e.lanes=s,e.memoizedState=d}}function fo(e,t){if("function"!==typeof e)throw Error(s(191,e));e.call(t)}function ho(e,t){var n=e.callbacks;if(null!==n)for(e.callbacks=null,e=0;e<n.length;e++)fo(n[e],t)}var po=U(null),yo=U(0);function bo(e,t){j(yo,e=du),j(po,t),du=e|t.baseLanes}function mo(){j(yo,du),j(po,po.current)}function go(){du=yo.current,R(po),R(yo)}var vo=0,wo=null,_o=null,So=null,ko=!1,Io=!1,xo=!1,To=0,Eo=0,Ao=null,Oo=0;function Co(){throw Error(s(321))}function No(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Kn(e[n],t[n]))return!1;return!0}function Do(e,t,n,r,i,o){return vo=o,wo=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,B.H=null===e||null===e.memoizedState?Ys:qs,xo=!1,o=n(r,i),xo=!1,Io&&(o=Bo(t,n,r,i)),Lo(e),o}function Lo(e){B.H=Ws;var t=null!==_o&&null!==_o.next;if(vo=0,So=_o=wo=null,ko=!1,Eo=0,Ao=null,t)throw Error(s(300));null===e||Ea||null!==(e=e.dependencies)&&Ii(e)&&(Ea=!0)}function Bo(e,t,n,r){wo=e;var i=0;do{if(Io&&(Ao=null),Eo=0,Io=!1,25<=i)throw Error(s(301));if(i+=1,So=_o=null,null!=e.updateQueue){var o=e.updateQueue;o.lastEffect=null,o.events=null,o.stores=null,null!=o.memoCache&&(o.memoCache.index=0)}B.H=Qs,o=t(n,r)}while(Io);return o}function Fo(){var e=B.H,t=e.useState()[0];return t="function"===typeof t.then?jo(t):t,e=e.useState()[0],(null!==_o?_o.memoizedState:null)!==e&&(wo.flags|=1024),t}function Mo(){var e=0!==To;return To=0,e}function Po(e,t,n){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~n}function zo(e){if(ko){for(e=e.memoizedState;null!==e;){var t=e.queue;null!==t&&(t.pending=null),e=e.next}ko=!1}vo=0,So=_o=wo=null,Io=!1,Eo=To=0,Ao=null}function Uo(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===So?wo.memoizedState=So=e:So=So.next=e,So}function Ro(){if(null===_o){var e=wo.alternate;e=null!==e?e.memoizedState:null}else e=_o.next;var t=null===So?wo.memoizedState:So.next;if(null!==t)So=t,_o=e;else{if(null===e){if(null===wo.alternate)throw Error(s(467));throw Error(s(310))}e={memoizedState:(_o=e).memoizedState,baseState:_o.baseState,baseQueue:_o.baseQueue,queue:_o.queue,next:null},null===So?wo.memoizedState=So=e:So=So.next=e}return So}function jo(e){var t=Eo;return Eo+=1,null===Ao&&(Ao=[]),e=Xi(Ao,e,t),t=wo,null===(null===So?t.memoizedState:So.next)&&(t=t.alternate,B.H=null===t||null===t.memoizedState?Ys:qs),e}function Vo(e){if(null!==e&&"object"===typeof e){if("function"===typeof e.then)return jo(e);if(e.$$typeof===_)return Ti(e)}throw Error(s(438,String(e)))}function Ho(e){var t=null,n=wo.updateQueue;if(null!==n&&(t=n.memoCache),null==t){var r=wo.alternate;null!==r&&(null!==(r=r.updateQueue)&&(null!=(r=r.memoCache)&&(t={data:r.data.map(function(e){return e.slice()}),index:0})))}if(null==t&&(t={data:[],index:0}),null===n&&(n={lastEffect:null,events:null,stores:null,memoCache:null},wo.updateQueue=n),n.memoCache=t,void 0===(n=t.data[t.index]))for(n=t.data[t.index]=Array(e),r=0;r<e;r++)n[r]=A;return t.index++,n}function $o(e,t){return"function"===typeof t?t(e):t}function Wo(e){return Yo(Ro(),_o,e)}function Yo(e,t,n){var r=e.queue;if(null===r)throw Error(s(311));r.lastRenderedReducer=n;var i=e.baseQueue,o=r.pending;if(null!==o){if(null!==i){var a=i.next;i.next=o.next,o.next=a}t.baseQueue=i=o,r.pending=null}if(o=e.baseState,null===i)e.memoizedState=o;else{var l=a=null,u=null,c=t=i.next,d=!1;do{var f=-536870913&c.lane;if(f!==c.lane?(ou&f)===f:(vo&f)===f){var h=c.revertLane;if(0===h)null!==u&&(u=u.next={lane:0,revertLane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),f===Pi&&(d=!0);else{if((vo&h)===h){c=c.next,h===Pi&&(d=!0);continue}f={lane:0,revertLane:c.revertLane,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null},null===u?(l=u=f,a=o):u=u.next=f,wo.lanes|=h,hu|=h}f=c.action,xo&&n(o,f),o=c.hasEagerState?c.eagerState:n(o,f)}else h={lane:f,revertLane:c.revertLane,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null},null===u?(l=u=h,a=o):u=u.next=h,wo.lanes|=f,hu|=f;c=c.next}while(null!==c&&c!==t);if(null===u?a=o:u.next=l,!Kn(o,e.memoizedState)&&(Ea=!0,d&&null!==(n=zi)))throw n;e.memoizedState=o,e.baseState=a,e.baseQueue=u,r.lastRenderedState=o}return null===i&&(r.lanes=0),[e.memoizedState,r.dispatch]}function qo(e){var t=Ro(),n=t.queue;if(null===n)throw Error(s(311));n.lastRenderedReducer=e;var r=n.dispatch,i=n.pending,o=t.memoizedState;if(null!==i){n.pending=null;var a=i=i.next;do{o=e(o,a.action),a=a.next}while(a!==i);Kn(o,t.memoizedState)||(Ea=!0),t.memoizedState=o,null===t.baseQueue&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function Qo(e,t,n){var r=wo,i=Ro(),o=oi;if(o){if(void 0===n)throw Error(s(407));n=n()}else n=t();var a=!Kn((_o||i).memoizedState,n);if(a&&(i.memoizedState=n,Ea=!0),i=i.queue,ms(2048,8,Xo.bind(null,r,i,e),[e]),i.getSnapshot!==t||a||null!==So&&1&So.memoizedState.tag){if(r.flags|=2048,ps(9,{destroy:void 0,resource:void 0},Go.bind(null,r,i,n,t),null),null===ru)throw Error(s(349));o||0!==(124&vo)||Ko(r,t,n)}return n}function Ko(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=wo.updateQueue)?(t={lastEffect:null,events:null,stores:null,memoCache:null},wo.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Go(e,t,n,r){t.value=n,t.getSnapshot=r,Jo(t)&&Zo(e)}function Xo(e,t,n){return n(function(){Jo(t)&&Zo(e)})}function Jo(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Kn(e,n)}catch(r){return!0}}function Zo(e){var t=Nr(e,2);null!==t&&Mu(t,e,2)}function es(e){var t=Uo();if("function"===typeof e){var n=e;if(e=n(),xo){fe(!0);try{n()}finally{fe(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:$o,lastRenderedState:e},t}function ts(e,t,n,r){return e.baseState=n,Yo(e,_o,"function"===typeof r?r:$o)}function ns(e,t,n,r,i){if(Vs(e))throw Error(s(485));if(null!==(e=t.action)){var o={payload:i,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(e){o.listeners.push(e)}};null!==B.T?n(!0):o.isTransition=!1,r(o),null===(n=t.pending)?(o.next=t.pending=o,rs(t,o)):(o.next=n.next,t.pending=n.next=o)}}function rs(e,t){var n=t.action,r=t.payload,i=e.state;if(t.isTransition){var o=B.T,s={};B.T=s;try{var a=n(i,r),l=B.S;null!==l&&l(s,a),is(e,t,a)}catch(u){ss(e,t,u)}finally{B.T=o}}else try{is(e,t,o=n(i,r))}catch(c){ss(e,t,c)}}function is(e,t,n){null!==n&&"object"===typeof n&&"function"===typeof n.then?n.then(function(n){os(e,t,n)},function(n){return ss(e,t,n)}):os(e,t,n)}function os(e,t,n){t.status="fulfilled",t.value=n,as(t),e.state=n,null!==(t=e.pending)&&((n=t.next)===t?e.pending=null:(n=n.next,t.next=n,rs(e,n)))}function ss(e,t,n){var r=e.pending;if(e.pending=null,null!==r){r=r.next;do{t.status="rejected",t.reason=n,as(t),t=t.next}while(t!==r)}e.action=null}function as(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function ls(e,t){return t}function us(e,t){if(oi){var n=ru.formState;if(null!==n){e:{var r=wo;if(oi){if(ii){t:{for(var i=ii,o=ai;8!==i.nodeType;){if(!o){i=null;break t}if(null===(i=md(i.nextSibling))){i=null;break t}}i="F!"===(o=i.data)||"F"===o?i:null}if(i){ii=md(i.nextSibling),r="F!"===i.data;break e}}ui(r)}r=!1}r&&(t=n[0])}}return(n=Uo()).memoizedState=n.baseState=t,r={pending:null,lanes:0,dispatch:null,lastRenderedReducer:ls,lastRenderedState:t},n.queue=r,n=Us.bind(null,wo,r),r.dispatch=n,r=es(!1),o=js.bind(null,wo,!1,r.queue),i={state:t,dispatch:null,action:e,pending:null},(r=Uo()).queue=i,n=ns.bind(null,wo,i,o,n),i.dispatch=n,r.memoizedState=e,[t,n,!1]}function cs(e){return ds(Ro(),_o,e)}function ds(e,t,n){if(t=Yo(e,t,ls)[0],e=Wo($o)[0],"object"===typeof t&&null!==t&&"function"===typeof t.then)try{var r=jo(t)}catch(s){if(s===Wi)throw qi;throw s}else r=t;var i=(t=Ro()).queue,o=i.dispatch;return n!==t.memoizedState&&(wo.flags|=2048,ps(9,{destroy:void 0,resource:void 0},fs.bind(null,i,n),null)),[r,o,e]}function fs(e,t){e.action=t}function hs(e){var t=Ro(),n=_o;if(null!==n)return ds(t,n,e);Ro(),t=t.memoizedState;var r=(n=Ro()).queue.dispatch;return n.memoizedState=e,[t,r,!1]}function ps(e,t,n,r){return e={tag:e,create:n,deps:r,inst:t,next:null},null===(t=wo.updateQueue)&&(t={lastEffect:null,events:null,stores:null,memoCache:null},wo.updateQueue=t),null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function ys(){return Ro().memoizedState}function bs(e,t,n,r){var i=Uo();r=void 0===r?null:r,wo.flags|=e,i.memoizedState=ps(1|t,{destroy:void 0,resource:void 0},n,r)}function ms(e,t,n,r){var i=Ro();r=void 0===r?null:r;var o=i.memoizedState.inst;null!==_o&&null!==r&&No(r,_o.memoizedState.deps)?i.memoizedState=ps(t,o,n,r):(wo.flags|=e,i.memoizedState=ps(1|t,o,n,r))}function gs(e,t){bs(8390656,8,e,t)}function vs(e,t){ms(2048,8,e,t)}function ws(e,t){return ms(4,2,e,t)}function _s(e,t){return ms(4,4,e,t)}function Ss(e,t){if("function"===typeof t){e=e();var n=t(e);return function(){"function"===typeof n?n():t(null)}}if(null!==t&&void 0!==t)return e=e(),t.current=e,function(){t.current=null}}function ks(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,ms(4,4,Ss.bind(null,t,e),n)}function Is(){}function xs(e,t){var n=Ro();t=void 0===t?null:t;var r=n.memoizedState;return null!==t&&No(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Ts(e,t){var n=Ro();t=void 0===t?null:t;var r=n.memoizedState;if(null!==t&&No(t,r[1]))return r[0];if(r=e(),xo){fe(!0);try{e()}finally{fe(!1)}}return n.memoizedState=[r,t],r}function Es(e,t,n){return void 0===n||0!==(1073741824&vo)?e.memoizedState=t:(e.memoizedState=n,e=Fu(),wo.lanes|=e,hu|=e,n)}function As(e,t,n,r){return Kn(n,t)?n:null!==po.current?(e=Es(e,n,r),Kn(e,t)||(Ea=!0),e):0===(42&vo)?(Ea=!0,e.memoizedState=n):(e=Fu(),wo.lanes|=e,hu|=e,t)}function Os(e,t,n,r,i){var o=F.p;F.p=0!==o&&8>o?o:8;var s=B.T,a={};B.T=a,js(e,!1,t,n);try{var l=i(),u=B.S;if(null!==u&&u(a,l),null!==l&&"object"===typeof l&&"function"===typeof l.then)Rs(e,t,function(e,t){var n=[],r={status:"pending",value:null,reason:null,then:function(e){n.push(e)}};return e.then(function(){r.status="fulfilled",r.value=t;for(var e=0;e<n.length;e++)(0,n[e])(t)},function(e){for(r.status="rejected",r.reason=e,e=0;e<n.length;e++)(0,n[e])(void 0)}),r}(l,r),Bu());else Rs(e,t,r,Bu())}catch(c){Rs(e,t,{then:function(){},status:"rejected",reason:c},Bu())}finally{F.p=o,B.T=s}}function Cs(){}function Ns(e,t,n,r){if(5!==e.tag)throw Error(s(476));var i=Ds(e).queue;Os(e,i,t,M,null===n?Cs:function(){return Ls(e),n(r)})}function Ds(e){var t=e.memoizedState;if(null!==t)return t;var n={};return(t={memoizedState:M,baseState:M,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:$o,lastRenderedState:M},next:null}).next={memoizedState:n,baseState:n,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:$o,lastRenderedState:n},next:null},e.memoizedState=t,null!==(e=e.alternate)&&(e.memoizedState=t),t}function Ls(e){Rs(e,Ds(e).next.queue,{},Bu())}function Bs(){return Ti(Qd)}function Fs(){return Ro().memoizedState}function Ms(){return Ro().memoizedState}function Ps(e){for(var t=e.return;null!==t;){switch(t.tag){case 24:case 3:var n=Bu(),r=oo(t,e=io(n),n);return null!==r&&(Mu(r,t,n),so(r,t,n)),t={cache:Li()},void(e.payload=t)}t=t.return}}function zs(e,t,n){var r=Bu();n={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null},Vs(e)?Hs(t,n):null!==(n=Cr(e,t,n,r))&&(Mu(n,e,r),$s(n,t,r))}function Us(e,t,n){Rs(e,t,n,Bu())}function Rs(e,t,n,r){var i={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null};if(Vs(e))Hs(t,i);else{var o=e.alternate;if(0===e.lanes&&(null===o||0===o.lanes)&&null!==(o=t.lastRenderedReducer))try{var s=t.lastRenderedState,a=o(s,n);if(i.hasEagerState=!0,i.eagerState=a,Kn(a,s))return Or(e,t,i,0),null===ru&&Ar(),!1}catch(l){}if(null!==(n=Cr(e,t,i,r)))return Mu(n,e,r),$s(n,t,r),!0}return!1}function js(e,t,n,r){if(r={lane:2,revertLane:Oc(),action:r,hasEagerState:!1,eagerState:null,next:null},Vs(e)){if(t)throw Error(s(479))}else null!==(t=Cr(e,n,r,2))&&Mu(t,e,2)}function Vs(e){var t=e.alternate;return e===wo||null!==t&&t===wo}function Hs(e,t){Io=ko=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function $s(e,t,n){if(0!==(4194048&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Ee(e,n)}}var Ws={readContext:Ti,use:Vo,useCallback:Co,useContext:Co,useEffect:Co,useImperativeHandle:Co,useLayoutEffect:Co,useInsertionEffect:Co,useMemo:Co,useReducer:Co,useRef:Co,useState:Co,useDebugValue:Co,useDeferredValue:Co,useTransition:Co,useSyncExternalStore:Co,useId:Co,useHostTransitionStatus:Co,useFormState:Co,useActionState:Co,useOptimistic:Co,useMemoCache:Co,useCacheRefresh:Co},Ys={readContext:Ti,use:Vo,useCallback:function(e,t){return Uo().memoizedState=[e,void 0===t?null:t],e},useContext:Ti,useEffect:gs,useImperativeHandle:function(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,bs(4194308,4,Ss.bind(null,t,e),n)},useLayoutEffect:function(e,t){return bs(4194308,4,e,t)},useInsertionEffect:function(e,t){bs(4,2,e,t)},useMemo:function(e,t){var n=Uo();t=void 0===t?null:t;var r=e();if(xo){fe(!0);try{e()}finally{fe(!1)}}return n.memoizedState=[r,t],r},useReducer:function(e,t,n){var r=Uo();if(void 0!==n){var i=n(t);if(xo){fe(!0);try{n(t)}finally{fe(!1)}}}else i=t;return r.memoizedState=r.baseState=i,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:i},r.queue=e,e=e.dispatch=zs.bind(null,wo,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},Uo().memoizedState=e},useState:function(e){var t=(e=es(e)).queue,n=Us.bind(null,wo,t);return t.dispatch=n,[e.memoizedState,n]},useDebugValue:Is,useDeferredValue:function(e,t){return Es(Uo(),e,t)},useTransition:function(){var e=es(!1);return e=Os.bind(null,wo,e.queue,!0,!1),Uo().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,n){var r=wo,i=Uo();if(oi){if(void 0===n)throw Error(s(407));n=n()}else{if(n=t(),null===ru)throw Error(s(349));0!==(124&ou)||Ko(r,t,n)}i.memoizedState=n;var o={value:n,getSnapshot:t};return i.queue=o,gs(Xo.bind(null,r,o,e),[e]),r.flags|=2048,ps(9,{destroy:void 0,resource:void 0},Go.bind(null,r,o,n,t),null),n},useId:function(){var e=Uo(),t=ru.identifierPrefix;if(oi){var n=Jr;t="\xab"+t+"R"+(n=(Xr&~(1<<32-he(Xr)-1)).toString(32)+n),0<(n=To++)&&(t+="H"+n.toString(32)),t+="\xbb"}else t="\xab"+t+"r"+(n=Oo++).toString(32)+"\xbb";return e.memoizedState=t},useHostTransitionStatus:Bs,useFormState:us,useActionState:us,useOptimistic:function(e){var t=Uo();t.memoizedState=t.baseState=e;var n={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=n,t=js.bind(null,wo,!0,n),n.dispatch=t,[e,t]},useMemoCache:Ho,useCacheRefresh:function(){return Uo().memoizedState=Ps.bind(null,wo)}},qs={readContext:Ti,use:Vo,useCallback:xs,useContext:Ti,useEffect:vs,useImperativeHandle:ks,useInsertionEffect:ws,useLayoutEffect:_s,useMemo:Ts,useReducer:Wo,useRef:ys,useState:function(){return Wo($o)},useDebugValue:Is,useDeferredValue:function(e,t){return As(Ro(),_o.memoizedState,e,t)},useTransition:function(){var e=Wo($o)[0],t=Ro().memoizedState;return["boolean"===typeof e?e:jo(e),t]},useSyncExternalStore:Qo,useId:Fs,useHostTransitionStatus:Bs,useFormState:cs,useActionState:cs,useOptimistic:function(e,t){return ts(Ro(),0,e,t)},useMemoCache:Ho,useCacheRefresh:Ms},Qs={readContext:Ti,use:Vo,useCallback:xs,useContext:Ti,useEffect:vs,useImperativeHandle:ks,useInsertionEffect:ws,useLayoutEffect:_s,useMemo:Ts,useReducer:qo,useRef:ys,useState:function(){return qo($o)},useDebugValue:Is,useDeferredValue:function(e,t){var n=Ro();return null===_o?Es(n,e,t):As(n,_o.memoizedState,e,t)},useTransition:function(){var e=qo($o)[0],t=Ro().memoizedState;return["boolean"===typeof e?e:jo(e),t]},useSyncExternalStore:Qo,useId:Fs,useHostTransitionStatus:Bs,useFormState:hs,useActionState:hs,useOptimistic:function(e,t){var n=Ro();return null!==_o?ts(n,0,e,t):(n.baseState=e,[e,n.queue.dispatch])},useMemoCache:Ho,useCacheRefresh:Ms},Ks=null,Gs=0;function Xs(e){var t=Gs;return Gs+=1,null===Ks&&(Ks=[]),Xi(Ks,e,t)}function Js(e,t){t=t.props.ref,e.ref=void 0!==t?t:null}function Zs(e,t){if(t.$$typeof===h)throw Error(s(525));throw e=Object.prototype.toString.call(t),Error(s(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function ea(e){return(0,e._init)(e._payload)}function ta(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e){for(var t=new Map;null!==e;)null!==e.key?t.set(e.key,e):t.set(e.index,e),e=e.sibling;return t}function i(e,t){return(e=zr(e,t)).index=0,e.sibling=null,e}function o(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=67108866,n):r:(t.flags|=67108866,n):(t.flags|=1048576,n)}function a(t){return e&&null===t.alternate&&(t.flags|=67108866),t}function l(e,t,n,r){return null===t||6!==t.tag?((t=Vr(n,e.mode,r)).return=e,t):((t=i(t,n)).return=e,t)}function u(e,t,n,r){var o=n.type;return o===b?d(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===o||"object"===typeof o&&null!==o&&o.$$typeof===T&&ea(o)===t.type)?(Js(t=i(t,n.props),n),t.return=e,t):(Js(t=Rr(n.type,n.key,n.props,null,e.mode,r),n),t.return=e,t)}function c(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Hr(n,e.mode,r)).return=e,t):((t=i(t,n.children||[])).return=e,t)}function d(e,t,n,r,o){return null===t||7!==t.tag?((t=jr(n,e.mode,r,o)).return=e,t):((t=i(t,n)).return=e,t)}function f(e,t,n){if("string"===typeof t&&""!==t||"number"===typeof t||"bigint"===typeof t)return(t=Vr(""+t,e.mode,n)).return=e,t;if("object"===typeof t&&null!==t){switch(t.$$typeof){case p:return Js(n=Rr(t.type,t.key,t.props,null,e.mode,n),t),n.return=e,n;case y:return(t=Hr(t,e.mode,n)).return=e,t;case T:return f(e,t=(0,t._init)(t._payload),n)}if(L(t)||C(t))return(t=jr(t,e.mode,n,null)).return=e,t;if("function"===typeof t.then)return f(e,Xs(t),n);if(t.$$typeof===_)return f(e,Ei(e,t),n);Zs(e,t)}return null}function h(e,t,n,r){var i=null!==t?t.key:null;if("string"===typeof n&&""!==n||"number"===typeof n||"bigint"===typeof n)return null!==i?null:l(e,t,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case p:return n.key===i?u(e,t,n,r):null;case y:return n.key===i?c(e,t,n,r):null;case T:return h(e,t,n=(i=n._init)(n._payload),r)}if(L(n)||C(n))return null!==i?null:d(e,t,n,r,null);if("function"===typeof n.then)return h(e,t,Xs(n),r);if(n.$$typeof===_)return h(e,t,Ei(e,n),r);Zs(e,n)}return null}function m(e,t,n,r,i){if("string"===typeof r&&""!==r||"number"===typeof r||"bigint"===typeof r)return l(t,e=e.get(n)||null,""+r,i);if("object"===typeof r&&null!==r){switch(r.$$typeof){case p:return u(t,e=e.get(null===r.key?n:r.key)||null,r,i);case y:return c(t,e=e.get(null===r.key?n:r.key)||null,r,i);case T:return m(e,t,n,r=(0,r._init)(r._payload),i)}if(L(r)||C(r))return d(t,e=e.get(n)||null,r,i,null);if("function"===typeof r.then)return m(e,t,n,Xs(r),i);if(r.$$typeof===_)return m(e,t,n,Ei(t,r),i);Zs(t,r)}return null}function g(l,u,c,d){if("object"===typeof c&&null!==c&&c.type===b&&null===c.key&&(c=c.props.children),"object"===typeof c&&null!==c){switch(c.$$typeof){case p:e:{for(var v=c.key;null!==u;){if(u.key===v){if((v=c.type)===b){if(7===u.tag){n(l,u.sibling),(d=i(u,c.props.children)).return=l,l=d;break e}}else if(u.elementType===v||"object"===typeof v&&null!==v&&v.$$typeof===T&&ea(v)===u.type){n(l,u.sibling),Js(d=i(u,c.props),c),d.return=l,l=d;break e}n(l,u);break}t(l,u),u=u.sibling}c.type===b?((d=jr(c.props.children,l.mode,d,c.key)).return=l,l=d):(Js(d=Rr(c.type,c.key,c.props,null,l.mode,d),c),d.return=l,l=d)}return a(l);case y:e:{for(v=c.key;null!==u;){if(u.key===v){if(4===u.tag&&u.stateNode.containerInfo===c.containerInfo&&u.stateNode.implementation===c.implementation){n(l,u.sibling),(d=i(u,c.children||[])).return=l,l=d;break e}n(l,u);break}t(l,u),u=u.sibling}(d=Hr(c,l.mode,d)).return=l,l=d}return a(l);case T:return g(l,u,c=(v=c._init)(c._payload),d)}if(L(c))return function(i,s,a,l){for(var u=null,c=null,d=s,p=s=0,y=null;null!==d&&p<a.length;p++){d.index>p?(y=d,d=null):y=d.sibling;var b=h(i,d,a[p],l);if(null===b){null===d&&(d=y);break}e&&d&&null===b.alternate&&t(i,d),s=o(b,s,p),null===c?u=b:c.sibling=b,c=b,d=y}if(p===a.length)return n(i,d),oi&&Zr(i,p),u;if(null===d){for(;p<a.length;p++)null!==(d=f(i,a[p],l))&&(s=o(d,s,p),null===c?u=d:c.sibling=d,c=d);return oi&&Zr(i,p),u}for(d=r(d);p<a.length;p++)null!==(y=m(d,i,p,a[p],l))&&(e&&null!==y.alternate&&d.delete(null===y.key?p:y.key),s=o(y,s,p),null===c?u=y:c.sibling=y,c=y);return e&&d.forEach(function(e){return t(i,e)}),oi&&Zr(i,p),u}(l,u,c,d);if(C(c)){if("function"!==typeof(v=C(c)))throw Error(s(150));return function(i,a,l,u){if(null==l)throw Error(s(151));for(var c=null,d=null,p=a,y=a=0,b=null,g=l.next();null!==p&&!g.done;y++,g=l.next()){p.index>y?(b=p,p=null):b=p.sibling;var v=h(i,p,g.value,u);if(null===v){null===p&&(p=b);break}e&&p&&null===v.alternate&&t(i,p),a=o(v,a,y),null===d?c=v:d.sibling=v,d=v,p=b}if(g.done)return n(i,p),oi&&Zr(i,y),c;if(null===p){for(;!g.done;y++,g=l.next())null!==(g=f(i,g.value,u))&&(a=o(g,a,y),null===d?c=g:d.sibling=g,d=g);return oi&&Zr(i,y),c}for(p=r(p);!g.done;y++,g=l.next())null!==(g=m(p,i,y,g.value,u))&&(e&&null!==g.alternate&&p.delete(null===g.key?y:g.key),a=o(g,a,y),null===d?c=g:d.sibling=g,d=g);return e&&p.forEach(function(e){return t(i,e)}),oi&&Zr(i,y),c}(l,u,c=v.call(c),d)}if("function"===typeof c.then)return g(l,u,Xs(c),d);if(c.$$typeof===_)return g(l,u,Ei(l,c),d);Zs(l,c)}return"string"===typeof c&&""!==c||"number"===typeof c||"bigint"===typeof c?(c=""+c,null!==u&&6===u.tag?(n(l,u.sibling),(d=i(u,c)).return=l,l=d):(n(l,u),(d=Vr(c,l.mode,d)).return=l,l=d),a(l)):n(l,u)}return function(e,t,n,r){try{Gs=0;var i=g(e,t,n,r);return Ks=null,i}catch(s){if(s===Wi||s===qi)throw s;var o=Mr(29,s,null,e.mode);return o.lanes=r,o.return=e,o}}}var na=ta(!0),ra=ta(!1),ia=U(null),oa=null;function sa(e){var t=e.alternate;j(ca,1&ca.current),j(ia,e),null===oa&&(null===t||null!==po.current||null!==t.memoizedState)&&(oa=e)}function aa(e){if(22===e.tag){if(j(ca,ca.current),j(ia,e),null===oa){var t=e.alternate;null!==t&&null!==t.memoizedState&&(oa=e)}}else la()}function la(){j(ca,ca.current),j(ia,ia.current)}function ua(e){R(ia),oa===e&&(oa=null),R(ca)}var ca=U(0);function da(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||bd(n)))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!==(128&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function fa(e,t,n,r){n=null===(n=n(r,t=e.memoizedState))||void 0===n?t:f({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var ha={enqueueSetState:function(e,t,n){e=e._reactInternals;var r=Bu(),i=io(r);i.payload=t,void 0!==n&&null!==n&&(i.callback=n),null!==(t=oo(e,i,r))&&(Mu(t,e,r),so(t,e,r))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=Bu(),i=io(r);i.tag=1,i.payload=t,void 0!==n&&null!==n&&(i.callback=n),null!==(t=oo(e,i,r))&&(Mu(t,e,r),so(t,e,r))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=Bu(),r=io(n);r.tag=2,void 0!==t&&null!==t&&(r.callback=t),null!==(t=oo(e,r,n))&&(Mu(t,e,n),so(t,e,n))}};function pa(e,t,n,r,i,o,s){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,o,s):!t.prototype||!t.prototype.isPureReactComponent||(!Gn(n,r)||!Gn(i,o))}function ya(e,t,n,r){e=t.state,"function"===typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"===typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&ha.enqueueReplaceState(t,t.state,null)}function ba(e,t){var n=t;if("ref"in t)for(var r in n={},t)"ref"!==r&&(n[r]=t[r]);if(e=e.defaultProps)for(var i in n===t&&(n=f({},n)),e)void 0===n[i]&&(n[i]=e[i]);return n}var ma="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function ga(e){ma(e)}function va(e){console.error(e)}function wa(e){ma(e)}function _a(e,t){try{(0,e.onUncaughtError)(t.value,{componentStack:t.stack})}catch(n){setTimeout(function(){throw n})}}function Sa(e,t,n){try{(0,e.onCaughtError)(n.value,{componentStack:n.stack,errorBoundary:1===t.tag?t.stateNode:null})}catch(r){setTimeout(function(){throw r})}}function ka(e,t,n){return(n=io(n)).tag=3,n.payload={element:null},n.callback=function(){_a(e,t)},n}function Ia(e){return(e=io(e)).tag=3,e}function xa(e,t,n,r){var i=n.type.getDerivedStateFromError;if("function"===typeof i){var o=r.value;e.payload=function(){return i(o)},e.callback=function(){Sa(t,n,r)}}var s=n.stateNode;null!==s&&"function"===typeof s.componentDidCatch&&(e.callback=function(){Sa(t,n,r),"function"!==typeof i&&(null===Iu?Iu=new Set([this]):Iu.add(this));var e=r.stack;this.componentDidCatch(r.value,{componentStack:null!==e?e:""})})}var Ta=Error(s(461)),Ea=!1;function Aa(e,t,n,r){t.child=null===e?ra(t,null,n,r):na(t,e.child,n,r)}function Oa(e,t,n,r,i){n=n.render;var o=t.ref;if("ref"in r){var s={};for(var a in r)"ref"!==a&&(s[a]=r[a])}else s=r;return xi(t),r=Do(e,t,n,s,o,i),a=Mo(),null===e||Ea?(oi&&a&&ti(t),t.flags|=1,Aa(e,t,r,i),t.child):(Po(e,t,i),Ka(e,t,i))}function Ca(e,t,n,r,i){if(null===e){var o=n.type;return"function"!==typeof o||Pr(o)||void 0!==o.defaultProps||null!==n.compare?((e=Rr(n.type,null,r,t,t.mode,i)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=o,Na(e,t,o,r,i))}if(o=e.child,!Ga(e,i)){var s=o.memoizedProps;if((n=null!==(n=n.compare)?n:Gn)(s,r)&&e.ref===t.ref)return Ka(e,t,i)}return t.flags|=1,(e=zr(o,r)).ref=t.ref,e.return=t,t.child=e}function Na(e,t,n,r,i){if(null!==e){var o=e.memoizedProps;if(Gn(o,r)&&e.ref===t.ref){if(Ea=!1,t.pendingProps=r=o,!Ga(e,i))return t.lanes=e.lanes,Ka(e,t,i);0!==(131072&e.flags)&&(Ea=!0)}}return Fa(e,t,n,r,i)}function Da(e,t,n){var r=t.pendingProps,i=r.children,o=null!==e?e.memoizedState:null;if("hidden"===r.mode){if(0!==(128&t.flags)){if(r=null!==o?o.baseLanes|n:n,null!==e){for(i=t.child=e.child,o=0;null!==i;)o=o|i.lanes|i.childLanes,i=i.sibling;t.childLanes=o&~r}else t.childLanes=0,t.child=null;return La(e,t,r,n)}if(0===(536870912&n))return t.lanes=t.childLanes=536870912,La(e,t,null!==o?o.baseLanes|n:n,n);t.memoizedState={baseLanes:0,cachePool:null},null!==e&&Hi(0,null!==o?o.cachePool:null),null!==o?bo(t,o):mo(),aa(t)}else null!==o?(Hi(0,o.cachePool),bo(t,o),la(),t.memoizedState=null):(null!==e&&Hi(0,null),mo(),la());return Aa(e,t,i,n),t.child}function La(e,t,n,r){var i=Vi();return i=null===i?null:{parent:Di._currentValue,pool:i},t.memoizedState={baseLanes:n,cachePool:i},null!==e&&Hi(0,null),mo(),aa(t),null!==e&&ki(e,t,r,!0),null}function Ba(e,t){var n=t.ref;if(null===n)null!==e&&null!==e.ref&&(t.flags|=4194816);else{if("function"!==typeof n&&"object"!==typeof n)throw Error(s(284));null!==e&&e.ref===n||(t.flags|=4194816)}}function Fa(e,t,n,r,i){return xi(t),n=Do(e,t,n,r,void 0,i),r=Mo(),null===e||Ea?(oi&&r&&ti(t),t.flags|=1,Aa(e,t,n,i),t.child):(Po(e,t,i),Ka(e,t,i))}function Ma(e,t,n,r,i,o){return xi(t),t.updateQueue=null,n=Bo(t,r,n,i),Lo(e),r=Mo(),null===e||Ea?(oi&&r&&ti(t),t.flags|=1,Aa(e,t,n,o),t.child):(Po(e,t,o),Ka(e,t,o))}function Pa(e,t,n,r,i){if(xi(t),null===t.stateNode){var o=Br,s=n.contextType;"object"===typeof s&&null!==s&&(o=Ti(s)),o=new n(r,o),t.memoizedState=null!==o.state&&void 0!==o.state?o.state:null,o.updater=ha,t.stateNode=o,o._reactInternals=t,(o=t.stateNode).props=r,o.state=t.memoizedState,o.refs={},no(t),s=n.contextType,o.context="object"===typeof s&&null!==s?Ti(s):Br,o.state=t.memoizedState,"function"===typeof(s=n.getDerivedStateFromProps)&&(fa(t,n,s,r),o.state=t.memoizedState),"function"===typeof n.getDerivedStateFromProps||"function"===typeof o.getSnapshotBeforeUpdate||"function"!==typeof o.UNSAFE_componentWillMount&&"function"!==typeof o.componentWillMount||(s=o.state,"function"===typeof o.componentWillMount&&o.componentWillMount(),"function"===typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount(),s!==o.state&&ha.enqueueReplaceState(o,o.state,null),co(t,r,o,i),uo(),o.state=t.memoizedState),"function"===typeof o.componentDidMount&&(t.flags|=4194308),r=!0}else if(null===e){o=t.stateNode;var a=t.memoizedProps,l=ba(n,a);o.props=l;var u=o.context,c=n.contextType;s=Br,"object"===typeof c&&null!==c&&(s=Ti(c));var d=n.getDerivedStateFromProps;c="function"===typeof d||"function"===typeof o.getSnapshotBeforeUpdate,a=t.pendingProps!==a,c||"function"!==typeof o.UNSAFE_componentWillReceiveProps&&"function"!==typeof o.componentWillReceiveProps||(a||u!==s)&&ya(t,o,r,s),to=!1;var f=t.memoizedState;o.state=f,co(t,r,o,i),uo(),u=t.memoizedState,a||f!==u||to?("function"===typeof d&&(fa(t,n,d,r),u=t.memoizedState),(l=to||pa(t,n,l,r,f,u,s))?(c||"function"!==typeof o.UNSAFE_componentWillMount&&"function"!==typeof o.componentWillMount||("function"===typeof o.componentWillMount&&o.componentWillMount(),"function"===typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount()),"function"===typeof o.componentDidMount&&(t.flags|=4194308)):("function"===typeof o.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=u),o.props=r,o.state=u,o.context=s,r=l):("function"===typeof o.componentDidMount&&(t.flags|=4194308),r=!1)}else{o=t.stateNode,ro(e,t),c=ba(n,s=t.memoizedProps),o.props=c,d=t.pendingProps,f=o.context,u=n.contextType,l=Br,"object"===typeof u&&null!==u&&(l=Ti(u)),(u="function"===typeof(a=n.getDerivedStateFromProps)||"function"===typeof o.getSnapshotBeforeUpdate)||"function"!==typeof o.UNSAFE_componentWillReceiveProps&&"function"!==typeof o.componentWillReceiveProps||(s!==d||f!==l)&&ya(t,o,r,l),to=!1,f=t.memoizedState,o.state=f,co(t,r,o,i),uo();var h=t.memoizedState;s!==d||f!==h||to||null!==e&&null!==e.dependencies&&Ii(e.dependencies)?("function"===typeof a&&(fa(t,n,a,r),h=t.memoizedState),(c=to||pa(t,n,c,r,f,h,l)||null!==e&&null!==e.dependencies&&Ii(e.dependencies))?(u||"function"!==typeof o.UNSAFE_componentWillUpdate&&"function"!==typeof o.componentWillUpdate||("function"===typeof o.componentWillUpdate&&o.componentWillUpdate(r,h,l),"function"===typeof o.UNSAFE_componentWillUpdate&&o.UNSAFE_componentWillUpdate(r,h,l)),"function"===typeof o.componentDidUpdate&&(t.flags|=4),"function"===typeof o.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!==typeof o.componentDidUpdate||s===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!==typeof o.getSnapshotBeforeUpdate||s===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=h),o.props=r,o.state=h,o.context=l,r=c):("function"!==typeof o.componentDidUpdate||s===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!==typeof o.getSnapshotBeforeUpdate||s===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),r=!1)}return o=r,Ba(e,t),r=0!==(128&t.flags),o||r?(o=t.stateNode,n=r&&"function"!==typeof n.getDerivedStateFromError?null:o.render(),t.flags|=1,null!==e&&r?(t.child=na(t,e.child,null,i),t.child=na(t,null,n,i)):Aa(e,t,n,i),t.memoizedState=o.state,e=t.child):e=Ka(e,t,i),e}function za(e,t,n,r){return hi(),t.flags|=256,Aa(e,t,n,r),t.child}var Ua={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Ra(e){return{baseLanes:e,cachePool:$i()}}function ja(e,t,n){return e=null!==e?e.childLanes&~n:0,t&&(e|=bu),e}function Va(e,t,n){var r,i=t.pendingProps,o=!1,a=0!==(128&t.flags);if((r=a)||(r=(null===e||null!==e.memoizedState)&&0!==(2&ca.current)),r&&(o=!0,t.flags&=-129),r=0!==(32&t.flags),t.flags&=-33,null===e){if(oi){if(o?sa(t):la(),oi){var l,u=ii;if(l=u){e:{for(l=u,u=ai;8!==l.nodeType;){if(!u){u=null;break e}if(null===(l=md(l.nextSibling))){u=null;break e}}u=l}null!==u?(t.memoizedState={dehydrated:u,treeContext:null!==Gr?{id:Xr,overflow:Jr}:null,retryLane:536870912,hydrationErrors:null},(l=Mr(18,null,null,0)).stateNode=u,l.return=t,t.child=l,ri=t,ii=null,l=!0):l=!1}l||ui(t)}if(null!==(u=t.memoizedState)&&null!==(u=u.dehydrated))return bd(u)?t.lanes=32:t.lanes=536870912,null;ua(t)}return u=i.children,i=i.fallback,o?(la(),u=$a({mode:"hidden",children:u},o=t.mode),i=jr(i,o,n,null),u.return=t,i.return=t,u.sibling=i,t.child=u,(o=t.child).memoizedState=Ra(n),o.childLanes=ja(e,r,n),t.memoizedState=Ua,i):(sa(t),Ha(t,u))}if(null!==(l=e.memoizedState)&&null!==(u=l.dehydrated)){if(a)256&t.flags?(sa(t),t.flags&=-257,t=Wa(e,t,n)):null!==t.memoizedState?(la(),t.child=e.child,t.flags|=128,t=null):(la(),o=i.fallback,u=t.mode,i=$a({mode:"visible",children:i.children},u),(o=jr(o,u,n,null)).flags|=2,i.return=t,o.return=t,i.sibling=o,t.child=i,na(t,e.child,null,n),(i=t.child).memoizedState=Ra(n),i.childLanes=ja(e,r,n),t.memoizedState=Ua,t=o);else if(sa(t),bd(u)){if(r=u.nextSibling&&u.nextSibling.dataset)var c=r.dgst;r=c,(i=Error(s(419))).stack="",i.digest=r,yi({value:i,source:null,stack:null}),t=Wa(e,t,n)}else if(Ea||ki(e,t,n,!1),r=0!==(n&e.childLanes),Ea||r){if(null!==(r=ru)&&(0!==(i=0!==((i=0!==(42&(i=n&-n))?1:Ae(i))&(r.suspendedLanes|n))?0:i)&&i!==l.retryLane))throw l.retryLane=i,Nr(e,i),Mu(r,e,i),Ta;"$?"===u.data||qu(),t=Wa(e,t,n)}else"$?"===u.data?(t.flags|=192,t.child=e.child,t=null):(e=l.treeContext,ii=md(u.nextSibling),ri=t,oi=!0,si=null,ai=!1,null!==e&&(Qr[Kr++]=Xr,Qr[Kr++]=Jr,Qr[Kr++]=Gr,Xr=e.id,Jr=e.overflow,Gr=t),(t=Ha(t,i.children)).flags|=4096);return t}return o?(la(),o=i.fallback,u=t.mode,c=(l=e.child).sibling,(i=zr(l,{mode:"hidden",children:i.children})).subtreeFlags=65011712&l.subtreeFlags,null!==c?o=zr(c,o):(o=jr(o,u,n,null)).flags|=2,o.return=t,i.return=t,i.sibling=o,t.child=i,i=o,o=t.child,null===(u=e.child.memoizedState)?u=Ra(n):(null!==(l=u.cachePool)?(c=Di._currentValue,l=l.parent!==c?{parent:c,pool:c}:l):l=$i(),u={baseLanes:u.baseLanes|n,cachePool:l}),o.memoizedState=u,o.childLanes=ja(e,r,n),t.memoizedState=Ua,i):(sa(t),e=(n=e.child).sibling,(n=zr(n,{mode:"visible",children:i.children})).return=t,n.sibling=null,null!==e&&(null===(r=t.deletions)?(t.deletions=[e],t.flags|=16):r.push(e)),t.child=n,t.memoizedState=null,n)}function Ha(e,t){return(t=$a({mode:"visible",children:t},e.mode)).return=e,e.child=t}function $a(e,t){return(e=Mr(22,e,null,t)).lanes=0,e.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null},e}function Wa(e,t,n){return na(t,e.child,null,n),(e=Ha(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function Ya(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),_i(e.return,t,n)}function qa(e,t,n,r,i){var o=e.memoizedState;null===o?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:i}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=i)}function Qa(e,t,n){var r=t.pendingProps,i=r.revealOrder,o=r.tail;if(Aa(e,t,r.children,n),0!==(2&(r=ca.current)))r=1&r|2,t.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Ya(e,n,t);else if(19===e.tag)Ya(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}switch(j(ca,r),i){case"forwards":for(n=t.child,i=null;null!==n;)null!==(e=n.alternate)&&null===da(e)&&(i=n),n=n.sibling;null===(n=i)?(i=t.child,t.child=null):(i=n.sibling,n.sibling=null),qa(t,!1,i,n,o);break;case"backwards":for(n=null,i=t.child,t.child=null;null!==i;){if(null!==(e=i.alternate)&&null===da(e)){t.child=i;break}e=i.sibling,i.sibling=n,n=i,i=e}qa(t,!0,n,null,o);break;case"together":qa(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Ka(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),hu|=t.lanes,0===(n&t.childLanes)){if(null===e)return null;if(ki(e,t,n,!1),0===(n&t.childLanes))return null}if(null!==e&&t.child!==e.child)throw Error(s(153));if(null!==t.child){for(n=zr(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=zr(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function Ga(e,t){return 0!==(e.lanes&t)||!(null===(e=e.dependencies)||!Ii(e))}function Xa(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps)Ea=!0;else{if(!Ga(e,n)&&0===(128&t.flags))return Ea=!1,function(e,t,n){switch(t.tag){case 3:Y(t,t.stateNode.containerInfo),vi(0,Di,e.memoizedState.cache),hi();break;case 27:case 5:Q(t);break;case 4:Y(t,t.stateNode.containerInfo);break;case 10:vi(0,t.type,t.memoizedProps.value);break;case 13:var r=t.memoizedState;if(null!==r)return null!==r.dehydrated?(sa(t),t.flags|=128,null):0!==(n&t.child.childLanes)?Va(e,t,n):(sa(t),null!==(e=Ka(e,t,n))?e.sibling:null);sa(t);break;case 19:var i=0!==(128&e.flags);if((r=0!==(n&t.childLanes))||(ki(e,t,n,!1),r=0!==(n&t.childLanes)),i){if(r)return Qa(e,t,n);t.flags|=128}if(null!==(i=t.memoizedState)&&(i.rendering=null,i.tail=null,i.lastEffect=null),j(ca,ca.current),r)break;return null;case 22:case 23:return t.lanes=0,Da(e,t,n);case 24:vi(0,Di,e.memoizedState.cache)}return Ka(e,t,n)}(e,t,n);Ea=0!==(131072&e.flags)}else Ea=!1,oi&&0!==(1048576&t.flags)&&ei(t,qr,t.index);switch(t.lanes=0,t.tag){case 16:e:{e=t.pendingProps;var r=t.elementType,i=r._init;if(r=i(r._payload),t.type=r,"function"!==typeof r){if(void 0!==r&&null!==r){if((i=r.$$typeof)===S){t.tag=11,t=Oa(null,t,r,e,n);break e}if(i===x){t.tag=14,t=Ca(null,t,r,e,n);break e}}throw t=D(r)||r,Error(s(306,t,""))}Pr(r)?(e=ba(r,e),t.tag=1,t=Pa(null,t,r,e,n)):(t.tag=0,t=Fa(null,t,r,e,n))}return t;case 0:return Fa(e,t,t.type,t.pendingProps,n);case 1:return Pa(e,t,r=t.type,i=ba(r,t.pendingProps),n);case 3:e:{if(Y(t,t.stateNode.containerInfo),null===e)throw Error(s(387));r=t.pendingProps;var o=t.memoizedState;i=o.element,ro(e,t),co(t,r,null,n);var a=t.memoizedState;if(r=a.cache,vi(0,Di,r),r!==o.cache&&Si(t,[Di],n,!0),uo(),r=a.element,o.isDehydrated){if(o={element:r,isDehydrated:!1,cache:a.cache},t.updateQueue.baseState=o,t.memoizedState=o,256&t.flags){t=za(e,t,r,n);break e}if(r!==i){yi(i=Ir(Error(s(424)),t)),t=za(e,t,r,n);break e}if(9===(e=t.stateNode.containerInfo).nodeType)e=e.body;else e="HTML"===e.nodeName?e.ownerDocument.body:e;for(ii=md(e.firstChild),ri=t,oi=!0,si=null,ai=!0,n=ra(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(hi(),r===i){t=Ka(e,t,n);break e}Aa(e,t,r,n)}t=t.child}return t;case 26:return Ba(e,t),null===e?(n=Ad(t.type,null,t.pendingProps,null))?t.memoizedState=n:oi||(n=t.type,e=t.pendingProps,(r=rd($.current).createElement(n))[De]=t,r[Le]=e,ed(r,n,e),We(r),t.stateNode=r):t.memoizedState=Ad(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return Q(t),null===e&&oi&&(r=t.stateNode=wd(t.type,t.pendingProps,$.current),ri=t,ai=!0,i=ii,hd(t.type)?(gd=i,ii=md(r.firstChild)):ii=i),Aa(e,t,t.pendingProps.children,n),Ba(e,t),null===e&&(t.flags|=4194304),t.child;case 5:return null===e&&oi&&((i=r=ii)&&(r=function(e,t,n,r){for(;1===e.nodeType;){var i=n;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!r&&("INPUT"!==e.nodeName||"hidden"!==e.type))break}else if(r){if(!e[Ue])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if("stylesheet"===(o=e.getAttribute("rel"))&&e.hasAttribute("data-precedence"))break;if(o!==i.rel||e.getAttribute("href")!==(null==i.href||""===i.href?null:i.href)||e.getAttribute("crossorigin")!==(null==i.crossOrigin?null:i.crossOrigin)||e.getAttribute("title")!==(null==i.title?null:i.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(((o=e.getAttribute("src"))!==(null==i.src?null:i.src)||e.getAttribute("type")!==(null==i.type?null:i.type)||e.getAttribute("crossorigin")!==(null==i.crossOrigin?null:i.crossOrigin))&&o&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else{if("input"!==t||"hidden"!==e.type)return e;var o=null==i.name?null:""+i.name;if("hidden"===i.type&&e.getAttribute("name")===o)return e}if(null===(e=md(e.nextSibling)))break}return null}(r,t.type,t.pendingProps,ai),null!==r?(t.stateNode=r,ri=t,ii=md(r.firstChild),ai=!1,i=!0):i=!1),i||ui(t)),Q(t),i=t.type,o=t.pendingProps,a=null!==e?e.memoizedProps:null,r=o.children,sd(i,o)?r=null:null!==a&&sd(i,a)&&(t.flags|=32),null!==t.memoizedState&&(i=Do(e,t,Fo,null,null,n),Qd._currentValue=i),Ba(e,t),Aa(e,t,r,n),t.child;case 6:return null===e&&oi&&((e=n=ii)&&(n=function(e,t,n){if(""===t)return null;for(;3!==e.nodeType;){if((1!==e.nodeType||"INPUT"!==e.nodeName||"hidden"!==e.type)&&!n)return null;if(null===(e=md(e.nextSibling)))return null}return e}(n,t.pendingProps,ai),null!==n?(t.stateNode=n,ri=t,ii=null,e=!0):e=!1),e||ui(t)),null;case 13:return Va(e,t,n);case 4:return Y(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=na(t,null,r,n):Aa(e,t,r,n),t.child;case 11:return Oa(e,t,t.type,t.pendingProps,n);case 7:return Aa(e,t,t.pendingProps,n),t.child;case 8:case 12:return Aa(e,t,t.pendingProps.children,n),t.child;case 10:return r=t.pendingProps,vi(0,t.type,r.value),Aa(e,t,r.children,n),t.child;case 9:return i=t.type._context,r=t.pendingProps.children,xi(t),r=r(i=Ti(i)),t.flags|=1,Aa(e,t,r,n),t.child;case 14:return Ca(e,t,t.type,t.pendingProps,n);case 15:return Na(e,t,t.type,t.pendingProps,n);case 19:return Qa(e,t,n);case 31:return r=t.pendingProps,n=t.mode,r={mode:r.mode,children:r.children},null===e?((n=$a(r,n)).ref=t.ref,t.child=n,n.return=t,t=n):((n=zr(e.child,r)).ref=t.ref,t.child=n,n.return=t,t=n),t;case 22:return Da(e,t,n);case 24:return xi(t),r=Ti(Di),null===e?(null===(i=Vi())&&(i=ru,o=Li(),i.pooledCache=o,o.refCount++,null!==o&&(i.pooledCacheLanes|=n),i=o),t.memoizedState={parent:r,cache:i},no(t),vi(0,Di,i)):(0!==(e.lanes&n)&&(ro(e,t),co(t,null,null,n),uo()),i=e.memoizedState,o=t.memoizedState,i.parent!==r?(i={parent:r,cache:r},t.memoizedState=i,0===t.lanes&&(t.memoizedState=t.updateQueue.baseState=i),vi(0,Di,r)):(r=o.cache,vi(0,Di,r),r!==i.cache&&Si(t,[Di],n,!0))),Aa(e,t,t.pendingProps.children,n),t.child;case 29:throw t.pendingProps}throw Error(s(156,t.tag))}function Ja(e){e.flags|=4}function Za(e,t){if("stylesheet"!==t.type||0!==(4&t.state.loading))e.flags&=-16777217;else if(e.flags|=16777216,!jd(t)){if(null!==(t=ia.current)&&((4194048&ou)===ou?null!==oa:(62914560&ou)!==ou&&0===(536870912&ou)||t!==oa))throw Ji=Qi,Yi;e.flags|=8192}}function el(e,t){null!==t&&(e.flags|=4),16384&e.flags&&(t=22!==e.tag?ke():536870912,e.lanes|=t,mu|=t)}function tl(e,t){if(!oi)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function nl(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var i=e.child;null!==i;)n|=i.lanes|i.childLanes,r|=65011712&i.subtreeFlags,r|=65011712&i.flags,i.return=e,i=i.sibling;else for(i=e.child;null!==i;)n|=i.lanes|i.childLanes,r|=i.subtreeFlags,r|=i.flags,i.return=e,i=i.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function rl(e,t,n){var r=t.pendingProps;switch(ni(t),t.tag){case 31:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:case 1:return nl(t),null;case 3:return n=t.stateNode,r=null,null!==e&&(r=e.memoizedState.cache),t.memoizedState.cache!==r&&(t.flags|=2048),wi(Di),q(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==e&&null!==e.child||(fi(t)?Ja(t):null===e||e.memoizedState.isDehydrated&&0===(256&t.flags)||(t.flags|=1024,pi())),nl(t),null;case 26:return n=t.memoizedState,null===e?(Ja(t),null!==n?(nl(t),Za(t,n)):(nl(t),t.flags&=-16777217)):n?n!==e.memoizedState?(Ja(t),nl(t),Za(t,n)):(nl(t),t.flags&=-16777217):(e.memoizedProps!==r&&Ja(t),nl(t),t.flags&=-16777217),null;case 27:K(t),n=$.current;var i=t.type;if(null!==e&&null!=t.stateNode)e.memoizedProps!==r&&Ja(t);else{if(!r){if(null===t.stateNode)throw Error(s(166));return nl(t),null}e=V.current,fi(t)?ci(t):(e=wd(i,r,n),t.stateNode=e,Ja(t))}return nl(t),null;case 5:if(K(t),n=t.type,null!==e&&null!=t.stateNode)e.memoizedProps!==r&&Ja(t);else{if(!r){if(null===t.stateNode)throw Error(s(166));return nl(t),null}if(e=V.current,fi(t))ci(t);else{switch(i=rd($.current),e){case 1:e=i.createElementNS("http://www.w3.org/2000/svg",n);break;case 2:e=i.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;default:switch(n){case"svg":e=i.createElementNS("http://www.w3.org/2000/svg",n);break;case"math":e=i.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;case"script":(e=i.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild);break;case"select":e="string"===typeof r.is?i.createElement("select",{is:r.is}):i.createElement("select"),r.multiple?e.multiple=!0:r.size&&(e.size=r.size);break;default:e="string"===typeof r.is?i.createElement(n,{is:r.is}):i.createElement(n)}}e[De]=t,e[Le]=r;e:for(i=t.child;null!==i;){if(5===i.tag||6===i.tag)e.appendChild(i.stateNode);else if(4!==i.tag&&27!==i.tag&&null!==i.child){i.child.return=i,i=i.child;continue}if(i===t)break e;for(;null===i.sibling;){if(null===i.return||i.return===t)break e;i=i.return}i.sibling.return=i.return,i=i.sibling}t.stateNode=e;e:switch(ed(e,n,r),n){case"button":case"input":case"select":case"textarea":e=!!r.autoFocus;break e;case"img":e=!0;break e;default:e=!1}e&&Ja(t)}}return nl(t),t.flags&=-16777217,null;case 6:if(e&&null!=t.stateNode)e.memoizedProps!==r&&Ja(t);else{if("string"!==typeof r&&null===t.stateNode)throw Error(s(166));if(e=$.current,fi(t)){if(e=t.stateNode,n=t.memoizedProps,r=null,null!==(i=ri))switch(i.tag){case 27:case 5:r=i.memoizedProps}e[De]=t,(e=!!(e.nodeValue===n||null!==r&&!0===r.suppressHydrationWarning||Gc(e.nodeValue,n)))||ui(t)}else(e=rd(e).createTextNode(r))[De]=t,t.stateNode=e}return nl(t),null;case 13:if(r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(i=fi(t),null!==r&&null!==r.dehydrated){if(null===e){if(!i)throw Error(s(318));if(!(i=null!==(i=t.memoizedState)?i.dehydrated:null))throw Error(s(317));i[De]=t}else hi(),0===(128&t.flags)&&(t.memoizedState=null),t.flags|=4;nl(t),i=!1}else i=pi(),null!==e&&null!==e.memoizedState&&(e.memoizedState.hydrationErrors=i),i=!0;if(!i)return 256&t.flags?(ua(t),t):(ua(t),null)}if(ua(t),0!==(128&t.flags))return t.lanes=n,t;if(n=null!==r,e=null!==e&&null!==e.memoizedState,n){i=null,null!==(r=t.child).alternate&&null!==r.alternate.memoizedState&&null!==r.alternate.memoizedState.cachePool&&(i=r.alternate.memoizedState.cachePool.pool);var o=null;null!==r.memoizedState&&null!==r.memoizedState.cachePool&&(o=r.memoizedState.cachePool.pool),o!==i&&(r.flags|=2048)}return n!==e&&n&&(t.child.flags|=8192),el(t,t.updateQueue),nl(t),null;case 4:return q(),null===e&&Rc(t.stateNode.containerInfo),nl(t),null;case 10:return wi(t.type),nl(t),null;case 19:if(R(ca),null===(i=t.memoizedState))return nl(t),null;if(r=0!==(128&t.flags),null===(o=i.rendering))if(r)tl(i,!1);else{if(0!==fu||null!==e&&0!==(128&e.flags))for(e=t.child;null!==e;){if(null!==(o=da(e))){for(t.flags|=128,tl(i,!1),e=o.updateQueue,t.updateQueue=e,el(t,e),t.subtreeFlags=0,e=n,n=t.child;null!==n;)Ur(n,e),n=n.sibling;return j(ca,1&ca.current|2),t.child}e=e.sibling}null!==i.tail&&te()>Su&&(t.flags|=128,r=!0,tl(i,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=da(o))){if(t.flags|=128,r=!0,e=e.updateQueue,t.updateQueue=e,el(t,e),tl(i,!0),null===i.tail&&"hidden"===i.tailMode&&!o.alternate&&!oi)return nl(t),null}else 2*te()-i.renderingStartTime>Su&&536870912!==n&&(t.flags|=128,r=!0,tl(i,!1),t.lanes=4194304);i.isBackwards?(o.sibling=t.child,t.child=o):(null!==(e=i.last)?e.sibling=o:t.child=o,i.last=o)}return null!==i.tail?(t=i.tail,i.rendering=t,i.tail=t.sibling,i.renderingStartTime=te(),t.sibling=null,e=ca.current,j(ca,r?1&e|2:1&e),t):(nl(t),null);case 22:case 23:return ua(t),go(),r=null!==t.memoizedState,null!==e?null!==e.memoizedState!==r&&(t.flags|=8192):r&&(t.flags|=8192),r?0!==(536870912&n)&&0===(128&t.flags)&&(nl(t),6&t.subtreeFlags&&(t.flags|=8192)):nl(t),null!==(n=t.updateQueue)&&el(t,n.retryQueue),n=null,null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),r=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(r=t.memoizedState.cachePool.pool),r!==n&&(t.flags|=2048),null!==e&&R(ji),null;case 24:return n=null,null!==e&&(n=e.memoizedState.cache),t.memoizedState.cache!==n&&(t.flags|=2048),wi(Di),nl(t),null;case 25:case 30:return null}throw Error(s(156,t.tag))}function il(e,t){switch(ni(t),t.tag){case 1:return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return wi(Di),q(),0!==(65536&(e=t.flags))&&0===(128&e)?(t.flags=-65537&e|128,t):null;case 26:case 27:case 5:return K(t),null;case 13:if(ua(t),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(s(340));hi()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return R(ca),null;case 4:return q(),null;case 10:return wi(t.type),null;case 22:case 23:return ua(t),go(),null!==e&&R(ji),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 24:return wi(Di),null;default:return null}}function ol(e,t){switch(ni(t),t.tag){case 3:wi(Di),q();break;case 26:case 27:case 5:K(t);break;case 4:q();break;case 13:ua(t);break;case 19:R(ca);break;case 10:wi(t.type);break;case 22:case 23:ua(t),go(),null!==e&&R(ji);break;case 24:wi(Di)}}function sl(e,t){try{var n=t.updateQueue,r=null!==n?n.lastEffect:null;if(null!==r){var i=r.next;n=i;do{if((n.tag&e)===e){r=void 0;var o=n.create,s=n.inst;r=o(),s.destroy=r}n=n.next}while(n!==i)}}catch(a){cc(t,t.return,a)}}function al(e,t,n){try{var r=t.updateQueue,i=null!==r?r.lastEffect:null;if(null!==i){var o=i.next;r=o;do{if((r.tag&e)===e){var s=r.inst,a=s.destroy;if(void 0!==a){s.destroy=void 0,i=t;var l=n,u=a;try{u()}catch(c){cc(i,l,c)}}}r=r.next}while(r!==o)}}catch(c){cc(t,t.return,c)}}function ll(e){var t=e.updateQueue;if(null!==t){var n=e.stateNode;try{ho(t,n)}catch(r){cc(e,e.return,r)}}}function ul(e,t,n){n.props=ba(e.type,e.memoizedProps),n.state=e.memoizedState;try{n.componentWillUnmount()}catch(r){cc(e,t,r)}}function cl(e,t){try{var n=e.ref;if(null!==n){switch(e.tag){case 26:case 27:case 5:var r=e.stateNode;break;default:r=e.stateNode}"function"===typeof n?e.refCleanup=n(r):n.current=r}}catch(i){cc(e,t,i)}}function dl(e,t){var n=e.ref,r=e.refCleanup;if(null!==n)if("function"===typeof r)try{r()}catch(i){cc(e,t,i)}finally{e.refCleanup=null,null!=(e=e.alternate)&&(e.refCleanup=null)}else if("function"===typeof n)try{n(null)}catch(o){cc(e,t,o)}else n.current=null}function fl(e){var t=e.type,n=e.memoizedProps,r=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":n.autoFocus&&r.focus();break e;case"img":n.src?r.src=n.src:n.srcSet&&(r.srcset=n.srcSet)}}catch(i){cc(e,e.return,i)}}function hl(e,t,n){try{var r=e.stateNode;!function(e,t,n,r){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var i=null,o=null,a=null,l=null,u=null,c=null,d=null;for(p in n){var f=n[p];if(n.hasOwnProperty(p)&&null!=f)switch(p){case"checked":case"value":break;case"defaultValue":u=f;default:r.hasOwnProperty(p)||Jc(e,t,p,null,r,f)}}for(var h in r){var p=r[h];if(f=n[h],r.hasOwnProperty(h)&&(null!=p||null!=f))switch(h){case"type":o=p;break;case"name":i=p;break;case"checked":c=p;break;case"defaultChecked":d=p;break;case"value":a=p;break;case"defaultValue":l=p;break;case"children":case"dangerouslySetInnerHTML":if(null!=p)throw Error(s(137,t));break;default:p!==f&&Jc(e,t,h,p,r,f)}}return void bt(e,a,l,u,c,d,o,i);case"select":for(o in p=a=l=h=null,n)if(u=n[o],n.hasOwnProperty(o)&&null!=u)switch(o){case"value":break;case"multiple":p=u;default:r.hasOwnProperty(o)||Jc(e,t,o,null,r,u)}for(i in r)if(o=r[i],u=n[i],r.hasOwnProperty(i)&&(null!=o||null!=u))switch(i){case"value":h=o;break;case"defaultValue":l=o;break;case"multiple":a=o;default:o!==u&&Jc(e,t,i,o,r,u)}return t=l,n=a,r=p,void(null!=h?vt(e,!!n,h,!1):!!r!==!!n&&(null!=t?vt(e,!!n,t,!0):vt(e,!!n,n?[]:"",!1)));case"textarea":for(l in p=h=null,n)if(i=n[l],n.hasOwnProperty(l)&&null!=i&&!r.hasOwnProperty(l))switch(l){case"value":case"children":break;default:Jc(e,t,l,null,r,i)}for(a in r)if(i=r[a],o=n[a],r.hasOwnProperty(a)&&(null!=i||null!=o))switch(a){case"value":h=i;break;case"defaultValue":p=i;break;case"children":break;case"dangerouslySetInnerHTML":if(null!=i)throw Error(s(91));break;default:i!==o&&Jc(e,t,a,i,r,o)}return void wt(e,h,p);case"option":for(var y in n)if(h=n[y],n.hasOwnProperty(y)&&null!=h&&!r.hasOwnProperty(y))if("selected"===y)e.selected=!1;else Jc(e,t,y,null,r,h);for(u in r)if(h=r[u],p=n[u],r.hasOwnProperty(u)&&h!==p&&(null!=h||null!=p))if("selected"===u)e.selected=h&&"function"!==typeof h&&"symbol"!==typeof h;else Jc(e,t,u,h,r,p);return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var b in n)h=n[b],n.hasOwnProperty(b)&&null!=h&&!r.hasOwnProperty(b)&&Jc(e,t,b,null,r,h);for(c in r)if(h=r[c],p=n[c],r.hasOwnProperty(c)&&h!==p&&(null!=h||null!=p))switch(c){case"children":case"dangerouslySetInnerHTML":if(null!=h)throw Error(s(137,t));break;default:Jc(e,t,c,h,r,p)}return;default:if(Tt(t)){for(var m in n)h=n[m],n.hasOwnProperty(m)&&void 0!==h&&!r.hasOwnProperty(m)&&Zc(e,t,m,void 0,r,h);for(d in r)h=r[d],p=n[d],!r.hasOwnProperty(d)||h===p||void 0===h&&void 0===p||Zc(e,t,d,h,r,p);return}}for(var g in n)h=n[g],n.hasOwnProperty(g)&&null!=h&&!r.hasOwnProperty(g)&&Jc(e,t,g,null,r,h);for(f in r)h=r[f],p=n[f],!r.hasOwnProperty(f)||h===p||null==h&&null==p||Jc(e,t,f,h,r,p)}(r,e.type,n,t),r[Le]=t}catch(i){cc(e,e.return,i)}}function pl(e){return 5===e.tag||3===e.tag||26===e.tag||27===e.tag&&hd(e.type)||4===e.tag}function yl(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||pl(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(27===e.tag&&hd(e.type))continue e;if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function bl(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?(9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).insertBefore(e,t):((t=9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).appendChild(e),null!==(n=n._reactRootContainer)&&void 0!==n||null!==t.onclick||(t.onclick=Xc));else if(4!==r&&(27===r&&hd(e.type)&&(n=e.stateNode,t=null),null!==(e=e.child)))for(bl(e,t,n),e=e.sibling;null!==e;)bl(e,t,n),e=e.sibling}function ml(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&(27===r&&hd(e.type)&&(n=e.stateNode),null!==(e=e.child)))for(ml(e,t,n),e=e.sibling;null!==e;)ml(e,t,n),e=e.sibling}function gl(e){var t=e.stateNode,n=e.memoizedProps;try{for(var r=e.type,i=t.attributes;i.length;)t.removeAttributeNode(i[0]);ed(t,r,n),t[De]=e,t[Le]=n}catch(o){cc(e,e.return,o)}}var vl=!1,wl=!1,_l=!1,Sl="function"===typeof WeakSet?WeakSet:Set,kl=null;function Il(e,t,n){var r=n.flags;switch(n.tag){case 0:case 11:case 15:Pl(e,n),4&r&&sl(5,n);break;case 1:if(Pl(e,n),4&r)if(e=n.stateNode,null===t)try{e.componentDidMount()}catch(s){cc(n,n.return,s)}else{var i=ba(n.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(i,t,e.__reactInternalSnapshotBeforeUpdate)}catch(a){cc(n,n.return,a)}}64&r&&ll(n),512&r&&cl(n,n.return);break;case 3:if(Pl(e,n),64&r&&null!==(e=n.updateQueue)){if(t=null,null!==n.child)switch(n.child.tag){case 27:case 5:case 1:t=n.child.stateNode}try{ho(e,t)}catch(s){cc(n,n.return,s)}}break;case 27:null===t&&4&r&&gl(n);case 26:case 5:Pl(e,n),null===t&&4&r&&fl(n),512&r&&cl(n,n.return);break;case 12:Pl(e,n);break;case 13:Pl(e,n),4&r&&Cl(e,n),64&r&&(null!==(e=n.memoizedState)&&(null!==(e=e.dehydrated)&&function(e,t){var n=e.ownerDocument;if("$?"!==e.data||"complete"===n.readyState)t();else{var r=function(){t(),n.removeEventListener("DOMContentLoaded",r)};n.addEventListener("DOMContentLoaded",r),e._reactRetry=r}}(e,n=pc.bind(null,n))));break;case 22:if(!(r=null!==n.memoizedState||vl)){t=null!==t&&null!==t.memoizedState||wl,i=vl;var o=wl;vl=r,(wl=t)&&!o?Ul(e,n,0!==(8772&n.subtreeFlags)):Pl(e,n),vl=i,wl=o}break;case 30:break;default:Pl(e,n)}}function xl(e){var t=e.alternate;null!==t&&(e.alternate=null,xl(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(t=e.stateNode)&&Re(t)),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var Tl=null,El=!1;function Al(e,t,n){for(n=n.child;null!==n;)Ol(e,t,n),n=n.sibling}function Ol(e,t,n){if(de&&"function"===typeof de.onCommitFiberUnmount)try{de.onCommitFiberUnmount(ce,n)}catch(o){}switch(n.tag){case 26:wl||dl(n,t),Al(e,t,n),n.memoizedState?n.memoizedState.count--:n.stateNode&&(n=n.stateNode).parentNode.removeChild(n);break;case 27:wl||dl(n,t);var r=Tl,i=El;hd(n.type)&&(Tl=n.stateNode,El=!1),Al(e,t,n),_d(n.stateNode),Tl=r,El=i;break;case 5:wl||dl(n,t);case 6:if(r=Tl,i=El,Tl=null,Al(e,t,n),El=i,null!==(Tl=r))if(El)try{(9===Tl.nodeType?Tl.body:"HTML"===Tl.nodeName?Tl.ownerDocument.body:Tl).removeChild(n.stateNode)}catch(s){cc(n,t,s)}else try{Tl.removeChild(n.stateNode)}catch(s){cc(n,t,s)}break;case 18:null!==Tl&&(El?(pd(9===(e=Tl).nodeType?e.body:"HTML"===e.nodeName?e.ownerDocument.body:e,n.stateNode),Af(e)):pd(Tl,n.stateNode));break;case 4:r=Tl,i=El,Tl=n.stateNode.containerInfo,El=!0,Al(e,t,n),Tl=r,El=i;break;case 0:case 11:case 14:case 15:wl||al(2,n,t),wl||al(4,n,t),Al(e,t,n);break;case 1:wl||(dl(n,t),"function"===typeof(r=n.stateNode).componentWillUnmount&&ul(n,t,r)),Al(e,t,n);break;case 21:Al(e,t,n);break;case 22:wl=(r=wl)||null!==n.memoizedState,Al(e,t,n),wl=r;break;default:Al(e,t,n)}}function Cl(e,t){if(null===t.memoizedState&&(null!==(e=t.alternate)&&(null!==(e=e.memoizedState)&&null!==(e=e.dehydrated))))try{Af(e)}catch(n){cc(t,t.return,n)}}function Nl(e,t){var n=function(e){switch(e.tag){case 13:case 19:var t=e.stateNode;return null===t&&(t=e.stateNode=new Sl),t;case 22:return null===(t=(e=e.stateNode)._retryCache)&&(t=e._retryCache=new Sl),t;default:throw Error(s(435,e.tag))}}(e);t.forEach(function(t){var r=yc.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))})}function Dl(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var i=n[r],o=e,a=t,l=a;e:for(;null!==l;){switch(l.tag){case 27:if(hd(l.type)){Tl=l.stateNode,El=!1;break e}break;case 5:Tl=l.stateNode,El=!1;break e;case 3:case 4:Tl=l.stateNode.containerInfo,El=!0;break e}l=l.return}if(null===Tl)throw Error(s(160));Ol(o,a,i),Tl=null,El=!1,null!==(o=i.alternate)&&(o.return=null),i.return=null}if(13878&t.subtreeFlags)for(t=t.child;null!==t;)Bl(t,e),t=t.sibling}var Ll=null;function Bl(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:Dl(t,e),Fl(e),4&r&&(al(3,e,e.return),sl(3,e),al(5,e,e.return));break;case 1:Dl(t,e),Fl(e),512&r&&(wl||null===n||dl(n,n.return)),64&r&&vl&&(null!==(e=e.updateQueue)&&(null!==(r=e.callbacks)&&(n=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=null===n?r:n.concat(r))));break;case 26:var i=Ll;if(Dl(t,e),Fl(e),512&r&&(wl||null===n||dl(n,n.return)),4&r){var o=null!==n?n.memoizedState:null;if(r=e.memoizedState,null===n)if(null===r)if(null===e.stateNode){e:{r=e.type,n=e.memoizedProps,i=i.ownerDocument||i;t:switch(r){case"title":(!(o=i.getElementsByTagName("title")[0])||o[Ue]||o[De]||"http://www.w3.org/2000/svg"===o.namespaceURI||o.hasAttribute("itemprop"))&&(o=i.createElement(r),i.head.insertBefore(o,i.querySelector("head > title"))),ed(o,r,n),o[De]=e,We(o),r=o;break e;case"link":var a=Ud("link","href",i).get(r+(n.href||""));if(a)for(var l=0;l<a.length;l++)if((o=a[l]).getAttribute("href")===(null==n.href||""===n.href?null:n.href)&&o.getAttribute("rel")===(null==n.rel?null:n.rel)&&o.getAttribute("title")===(null==n.title?null:n.title)&&o.getAttribute("crossorigin")===(null==n.crossOrigin?null:n.crossOrigin)){a.splice(l,1);break t}ed(o=i.createElement(r),r,n),i.head.appendChild(o);break;case"meta":if(a=Ud("meta","content",i).get(r+(n.content||"")))for(l=0;l<a.length;l++)if((o=a[l]).getAttribute("content")===(null==n.content?null:""+n.content)&&o.getAttribute("name")===(null==n.name?null:n.name)&&o.getAttribute("property")===(null==n.property?null:n.property)&&o.getAttribute("http-equiv")===(null==n.httpEquiv?null:n.httpEquiv)&&o.getAttribute("charset")===(null==n.charSet?null:n.charSet)){a.splice(l,1);break t}ed(o=i.createElement(r),r,n),i.head.appendChild(o);break;default:throw Error(s(468,r))}o[De]=e,We(o),r=o}e.stateNode=r}else Rd(i,e.type,e.stateNode);else e.stateNode=Bd(i,r,e.memoizedProps);else o!==r?(null===o?null!==n.stateNode&&(n=n.stateNode).parentNode.removeChild(n):o.count--,null===r?Rd(i,e.type,e.stateNode):Bd(i,r,e.memoizedProps)):null===r&&null!==e.stateNode&&hl(e,e.memoizedProps,n.memoizedProps)}break;case 27:Dl(t,e),Fl(e),512&r&&(wl||null===n||dl(n,n.return)),null!==n&&4&r&&hl(e,e.memoizedProps,n.memoizedProps);break;case 5:if(Dl(t,e),Fl(e),512&r&&(wl||null===n||dl(n,n.return)),32&e.flags){i=e.stateNode;try{St(i,"")}catch(p){cc(e,e.return,p)}}4&r&&null!=e.stateNode&&hl(e,i=e.memoizedProps,null!==n?n.memoizedProps:i),1024&r&&(_l=!0);break;case 6:if(Dl(t,e),Fl(e),4&r){if(null===e.stateNode)throw Error(s(162));r=e.memoizedProps,n=e.stateNode;try{n.nodeValue=r}catch(p){cc(e,e.return,p)}}break;case 3:if(zd=null,i=Ll,Ll=Id(t.containerInfo),Dl(t,e),Ll=i,Fl(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Af(t.containerInfo)}catch(p){cc(e,e.return,p)}_l&&(_l=!1,Ml(e));break;case 4:r=Ll,Ll=Id(e.stateNode.containerInfo),Dl(t,e),Fl(e),Ll=r;break;case 12:default:Dl(t,e),Fl(e);break;case 13:Dl(t,e),Fl(e),8192&e.child.flags&&null!==e.memoizedState!==(null!==n&&null!==n.memoizedState)&&(_u=te()),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,Nl(e,r)));break;case 22:i=null!==e.memoizedState;var u=null!==n&&null!==n.memoizedState,c=vl,d=wl;if(vl=c||i,wl=d||u,Dl(t,e),wl=d,vl=c,Fl(e),8192&r)e:for(t=e.stateNode,t._visibility=i?-2&t._visibility:1|t._visibility,i&&(null===n||u||vl||wl||zl(e)),n=null,t=e;;){if(5===t.tag||26===t.tag){if(null===n){u=n=t;try{if(o=u.stateNode,i)"function"===typeof(a=o.style).setProperty?a.setProperty("display","none","important"):a.display="none";else{l=u.stateNode;var f=u.memoizedProps.style,h=void 0!==f&&null!==f&&f.hasOwnProperty("display")?f.display:null;l.style.display=null==h||"boolean"===typeof h?"":(""+h).trim()}}catch(p){cc(u,u.return,p)}}}else if(6===t.tag){if(null===n){u=t;try{u.stateNode.nodeValue=i?"":u.memoizedProps}catch(p){cc(u,u.return,p)}}}else if((22!==t.tag&&23!==t.tag||null===t.memoizedState||t===e)&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;null===t.sibling;){if(null===t.return||t.return===e)break e;n===t&&(n=null),t=t.return}n===t&&(n=null),t.sibling.return=t.return,t=t.sibling}4&r&&(null!==(r=e.updateQueue)&&(null!==(n=r.retryQueue)&&(r.retryQueue=null,Nl(e,n))));break;case 19:Dl(t,e),Fl(e),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,Nl(e,r)));case 30:case 21:}}function Fl(e){var t=e.flags;if(2&t){try{for(var n,r=e.return;null!==r;){if(pl(r)){n=r;break}r=r.return}if(null==n)throw Error(s(160));switch(n.tag){case 27:var i=n.stateNode;ml(e,yl(e),i);break;case 5:var o=n.stateNode;32&n.flags&&(St(o,""),n.flags&=-33),ml(e,yl(e),o);break;case 3:case 4:var a=n.stateNode.containerInfo;bl(e,yl(e),a);break;default:throw Error(s(161))}}catch(l){cc(e,e.return,l)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function Ml(e){if(1024&e.subtreeFlags)for(e=e.child;null!==e;){var t=e;Ml(t),5===t.tag&&1024&t.flags&&t.stateNode.reset(),e=e.sibling}}function Pl(e,t){if(8772&t.subtreeFlags)for(t=t.child;null!==t;)Il(e,t.alternate,t),t=t.sibling}function zl(e){for(e=e.child;null!==e;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:al(4,t,t.return),zl(t);break;case 1:dl(t,t.return);var n=t.stateNode;"function"===typeof n.componentWillUnmount&&ul(t,t.return,n),zl(t);break;case 27:_d(t.stateNode);case 26:case 5:dl(t,t.return),zl(t);break;case 22:null===t.memoizedState&&zl(t);break;default:zl(t)}e=e.sibling}}function Ul(e,t,n){for(n=n&&0!==(8772&t.subtreeFlags),t=t.child;null!==t;){var r=t.alternate,i=e,o=t,s=o.flags;switch(o.tag){case 0:case 11:case 15:Ul(i,o,n),sl(4,o);break;case 1:if(Ul(i,o,n),"function"===typeof(i=(r=o).stateNode).componentDidMount)try{i.componentDidMount()}catch(u){cc(r,r.return,u)}if(null!==(i=(r=o).updateQueue)){var a=r.stateNode;try{var l=i.shared.hiddenCallbacks;if(null!==l)for(i.shared.hiddenCallbacks=null,i=0;i<l.length;i++)fo(l[i],a)}catch(u){cc(r,r.return,u)}}n&&64&s&&ll(o),cl(o,o.return);break;case 27:gl(o);case 26:case 5:Ul(i,o,n),n&&null===r&&4&s&&fl(o),cl(o,o.return);break;case 12:Ul(i,o,n);break;case 13:Ul(i,o,n),n&&4&s&&Cl(i,o);break;case 22:null===o.memoizedState&&Ul(i,o,n),cl(o,o.return);break;case 30:break;default:Ul(i,o,n)}t=t.sibling}}function Rl(e,t){var n=null;null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),e=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(e=t.memoizedState.cachePool.pool),e!==n&&(null!=e&&e.refCount++,null!=n&&Bi(n))}function jl(e,t){e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&Bi(e))}function Vl(e,t,n,r){if(10256&t.subtreeFlags)for(t=t.child;null!==t;)Hl(e,t,n,r),t=t.sibling}function Hl(e,t,n,r){var i=t.flags;switch(t.tag){case 0:case 11:case 15:Vl(e,t,n,r),2048&i&&sl(9,t);break;case 1:case 13:default:Vl(e,t,n,r);break;case 3:Vl(e,t,n,r),2048&i&&(e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&Bi(e)));break;case 12:if(2048&i){Vl(e,t,n,r),e=t.stateNode;try{var o=t.memoizedProps,s=o.id,a=o.onPostCommit;"function"===typeof a&&a(s,null===t.alternate?"mount":"update",e.passiveEffectDuration,-0)}catch(l){cc(t,t.return,l)}}else Vl(e,t,n,r);break;case 23:break;case 22:o=t.stateNode,s=t.alternate,null!==t.memoizedState?2&o._visibility?Vl(e,t,n,r):Wl(e,t):2&o._visibility?Vl(e,t,n,r):(o._visibility|=2,$l(e,t,n,r,0!==(10256&t.subtreeFlags))),2048&i&&Rl(s,t);break;case 24:Vl(e,t,n,r),2048&i&&jl(t.alternate,t)}}function $l(e,t,n,r,i){for(i=i&&0!==(10256&t.subtreeFlags),t=t.child;null!==t;){var o=e,s=t,a=n,l=r,u=s.flags;switch(s.tag){case 0:case 11:case 15:$l(o,s,a,l,i),sl(8,s);break;case 23:break;case 22:var c=s.stateNode;null!==s.memoizedState?2&c._visibility?$l(o,s,a,l,i):Wl(o,s):(c._visibility|=2,$l(o,s,a,l,i)),i&&2048&u&&Rl(s.alternate,s);break;case 24:$l(o,s,a,l,i),i&&2048&u&&jl(s.alternate,s);break;default:$l(o,s,a,l,i)}t=t.sibling}}function Wl(e,t){if(10256&t.subtreeFlags)for(t=t.child;null!==t;){var n=e,r=t,i=r.flags;switch(r.tag){case 22:Wl(n,r),2048&i&&Rl(r.alternate,r);break;case 24:Wl(n,r),2048&i&&jl(r.alternate,r);break;default:Wl(n,r)}t=t.sibling}}var Yl=8192;function ql(e){if(e.subtreeFlags&Yl)for(e=e.child;null!==e;)Ql(e),e=e.sibling}function Ql(e){switch(e.tag){case 26:ql(e),e.flags&Yl&&null!==e.memoizedState&&function(e,t,n){if(null===Vd)throw Error(s(475));var r=Vd;if("stylesheet"===t.type&&("string"!==typeof n.media||!1!==matchMedia(n.media).matches)&&0===(4&t.state.loading)){if(null===t.instance){var i=Od(n.href),o=e.querySelector(Cd(i));if(o)return null!==(e=o._p)&&"object"===typeof e&&"function"===typeof e.then&&(r.count++,r=$d.bind(r),e.then(r,r)),t.state.loading|=4,t.instance=o,void We(o);o=e.ownerDocument||e,n=Nd(n),(i=Sd.get(i))&&Md(n,i),We(o=o.createElement("link"));var a=o;a._p=new Promise(function(e,t){a.onload=e,a.onerror=t}),ed(o,"link",n),t.instance=o}null===r.stylesheets&&(r.stylesheets=new Map),r.stylesheets.set(t,e),(e=t.state.preload)&&0===(3&t.state.loading)&&(r.count++,t=$d.bind(r),e.addEventListener("load",t),e.addEventListener("error",t))}}(Ll,e.memoizedState,e.memoizedProps);break;case 5:default:ql(e);break;case 3:case 4:var t=Ll;Ll=Id(e.stateNode.containerInfo),ql(e),Ll=t;break;case 22:null===e.memoizedState&&(null!==(t=e.alternate)&&null!==t.memoizedState?(t=Yl,Yl=16777216,ql(e),Yl=t):ql(e))}}function Kl(e){var t=e.alternate;if(null!==t&&null!==(e=t.child)){t.child=null;do{t=e.sibling,e.sibling=null,e=t}while(null!==e)}}function Gl(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];kl=r,Zl(r,e)}Kl(e)}if(10256&e.subtreeFlags)for(e=e.child;null!==e;)Xl(e),e=e.sibling}function Xl(e){switch(e.tag){case 0:case 11:case 15:Gl(e),2048&e.flags&&al(9,e,e.return);break;case 3:case 12:default:Gl(e);break;case 22:var t=e.stateNode;null!==e.memoizedState&&2&t._visibility&&(null===e.return||13!==e.return.tag)?(t._visibility&=-3,Jl(e)):Gl(e)}}function Jl(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];kl=r,Zl(r,e)}Kl(e)}for(e=e.child;null!==e;){switch((t=e).tag){case 0:case 11:case 15:al(8,t,t.return),Jl(t);break;case 22:2&(n=t.stateNode)._visibility&&(n._visibility&=-3,Jl(t));break;default:Jl(t)}e=e.sibling}}function Zl(e,t){for(;null!==kl;){var n=kl;switch(n.tag){case 0:case 11:case 15:al(8,n,t);break;case 23:case 22:if(null!==n.memoizedState&&null!==n.memoizedState.cachePool){var r=n.memoizedState.cachePool.pool;null!=r&&r.refCount++}break;case 24:Bi(n.memoizedState.cache)}if(null!==(r=n.child))r.return=n,kl=r;else e:for(n=e;null!==kl;){var i=(r=kl).sibling,o=r.return;if(xl(r),r===n){kl=null;break e}if(null!==i){i.return=o,kl=i;break e}kl=o}}}var eu={getCacheForType:function(e){var t=Ti(Di),n=t.data.get(e);return void 0===n&&(n=e(),t.data.set(e,n)),n}},tu="function"===typeof WeakMap?WeakMap:Map,nu=0,ru=null,iu=null,ou=0,su=0,au=null,lu=!1,uu=!1,cu=!1,du=0,fu=0,hu=0,pu=0,yu=0,bu=0,mu=0,gu=null,vu=null,wu=!1,_u=0,Su=1/0,ku=null,Iu=null,xu=0,Tu=null,Eu=null,Au=0,Ou=0,Cu=null,Nu=null,Du=0,Lu=null;function Bu(){if(0!==(2&nu)&&0!==ou)return ou&-ou;if(null!==B.T){return 0!==Pi?Pi:Oc()}return Ce()}function Fu(){0===bu&&(bu=0===(536870912&ou)||oi?Se():536870912);var e=ia.current;return null!==e&&(e.flags|=32),bu}function Mu(e,t,n){(e!==ru||2!==su&&9!==su)&&null===e.cancelPendingCommit||(Hu(e,0),Ru(e,ou,bu,!1)),xe(e,n),0!==(2&nu)&&e===ru||(e===ru&&(0===(2&nu)&&(pu|=n),4===fu&&Ru(e,ou,bu,!1)),Sc(e))}function Pu(e,t,n){if(0!==(6&nu))throw Error(s(327));for(var r=!n&&0===(124&t)&&0===(t&e.expiredLanes)||we(e,t),i=r?function(e,t){var n=nu;nu|=2;var r=Wu(),i=Yu();ru!==e||ou!==t?(ku=null,Su=te()+500,Hu(e,t)):uu=we(e,t);e:for(;;)try{if(0!==su&&null!==iu){t=iu;var o=au;t:switch(su){case 1:su=0,au=null,Zu(e,t,o,1);break;case 2:case 9:if(Ki(o)){su=0,au=null,Ju(t);break}t=function(){2!==su&&9!==su||ru!==e||(su=7),Sc(e)},o.then(t,t);break e;case 3:su=7;break e;case 4:su=5;break e;case 7:Ki(o)?(su=0,au=null,Ju(t)):(su=0,au=null,Zu(e,t,o,7));break;case 5:var a=null;switch(iu.tag){case 26:a=iu.memoizedState;case 5:case 27:var l=iu;if(!a||jd(a)){su=0,au=null;var u=l.sibling;if(null!==u)iu=u;else{var c=l.return;null!==c?(iu=c,ec(c)):iu=null}break t}}su=0,au=null,Zu(e,t,o,5);break;case 6:su=0,au=null,Zu(e,t,o,6);break;case 8:Vu(),fu=6;break e;default:throw Error(s(462))}}Gu();break}catch(d){$u(e,d)}return gi=mi=null,B.H=r,B.A=i,nu=n,null!==iu?0:(ru=null,ou=0,Ar(),fu)}(e,t):Qu(e,t,!0),o=r;;){if(0===i){uu&&!r&&Ru(e,t,0,!1);break}if(n=e.current.alternate,!o||Uu(n)){if(2===i){if(o=t,e.errorRecoveryDisabledLanes&o)var a=0;else a=0!==(a=-536870913&e.pendingLanes)?a:536870912&a?536870912:0;if(0!==a){t=a;e:{var l=e;i=gu;var u=l.current.memoizedState.isDehydrated;if(u&&(Hu(l,a).flags|=256),2!==(a=Qu(l,a,!1))){if(cu&&!u){l.errorRecoveryDisabledLanes|=o,pu|=o,i=4;break e}o=vu,vu=i,null!==o&&(null===vu?vu=o:vu.push.apply(vu,o))}i=a}if(o=!1,2!==i)continue}}if(1===i){Hu(e,0),Ru(e,t,0,!0);break}e:{switch(r=e,o=i){case 0:case 1:throw Error(s(345));case 4:if((4194048&t)!==t)break;case 6:Ru(r,t,bu,!lu);break e;case 2:vu=null;break;case 3:case 5:break;default:throw Error(s(329))}if((62914560&t)===t&&10<(i=_u+300-te())){if(Ru(r,t,bu,!lu),0!==ve(r,0,!0))break e;r.timeoutHandle=ld(zu.bind(null,r,n,vu,ku,wu,t,bu,pu,mu,lu,o,2,-0,0),i)}else zu(r,n,vu,ku,wu,t,bu,pu,mu,lu,o,0,-0,0)}break}i=Qu(e,t,!1),o=!1}Sc(e)}function zu(e,t,n,r,i,o,a,l,u,c,d,f,h,p){if(e.timeoutHandle=-1,(8192&(f=t.subtreeFlags)||16785408===(16785408&f))&&(Vd={stylesheets:null,count:0,unsuspend:Hd},Ql(t),null!==(f=function(){if(null===Vd)throw Error(s(475));var e=Vd;return e.stylesheets&&0===e.count&&Yd(e,e.stylesheets),0<e.count?function(t){var n=setTimeout(function(){if(e.stylesheets&&Yd(e,e.stylesheets),e.unsuspend){var t=e.unsuspend;e.unsuspend=null,t()}},6e4);return e.unsuspend=t,function(){e.unsuspend=null,clearTimeout(n)}}:null}())))return e.cancelPendingCommit=f(nc.bind(null,e,t,o,n,r,i,a,l,u,d,1,h,p)),void Ru(e,o,a,!c);nc(e,t,o,n,r,i,a,l,u)}function Uu(e){for(var t=e;;){var n=t.tag;if((0===n||11===n||15===n)&&16384&t.flags&&(null!==(n=t.updateQueue)&&null!==(n=n.stores)))for(var r=0;r<n.length;r++){var i=n[r],o=i.getSnapshot;i=i.value;try{if(!Kn(o(),i))return!1}catch(s){return!1}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Ru(e,t,n,r){t&=~yu,t&=~pu,e.suspendedLanes|=t,e.pingedLanes&=~t,r&&(e.warmLanes|=t),r=e.expirationTimes;for(var i=t;0<i;){var o=31-he(i),s=1<<o;r[o]=-1,i&=~s}0!==n&&Te(e,n,t)}function ju(){return 0!==(6&nu)||(kc(0,!1),!1)}function Vu(){if(null!==iu){if(0===su)var e=iu.return;else gi=mi=null,zo(e=iu),Ks=null,Gs=0,e=iu;for(;null!==e;)ol(e.alternate,e),e=e.return;iu=null}}function Hu(e,t){var n=e.timeoutHandle;-1!==n&&(e.timeoutHandle=-1,ud(n)),null!==(n=e.cancelPendingCommit)&&(e.cancelPendingCommit=null,n()),Vu(),ru=e,iu=n=zr(e.current,null),ou=t,su=0,au=null,lu=!1,uu=we(e,t),cu=!1,mu=bu=yu=pu=hu=fu=0,vu=gu=null,wu=!1,0!==(8&t)&&(t|=32&t);var r=e.entangledLanes;if(0!==r)for(e=e.entanglements,r&=t;0<r;){var i=31-he(r),o=1<<i;t|=e[i],r&=~o}return du=t,Ar(),n}function $u(e,t){wo=null,B.H=Ws,t===Wi||t===qi?(t=Zi(),su=3):t===Yi?(t=Zi(),su=4):su=t===Ta?8:null!==t&&"object"===typeof t&&"function"===typeof t.then?6:1,au=t,null===iu&&(fu=1,_a(e,Ir(t,e.current)))}function Wu(){var e=B.H;return B.H=Ws,null===e?Ws:e}function Yu(){var e=B.A;return B.A=eu,e}function qu(){fu=4,lu||(4194048&ou)!==ou&&null!==ia.current||(uu=!0),0===(134217727&hu)&&0===(134217727&pu)||null===ru||Ru(ru,ou,bu,!1)}function Qu(e,t,n){var r=nu;nu|=2;var i=Wu(),o=Yu();ru===e&&ou===t||(ku=null,Hu(e,t)),t=!1;var s=fu;e:for(;;)try{if(0!==su&&null!==iu){var a=iu,l=au;switch(su){case 8:Vu(),s=6;break e;case 3:case 2:case 9:case 6:null===ia.current&&(t=!0);var u=su;if(su=0,au=null,Zu(e,a,l,u),n&&uu){s=0;break e}break;default:u=su,su=0,au=null,Zu(e,a,l,u)}}Ku(),s=fu;break}catch(c){$u(e,c)}return t&&e.shellSuspendCounter++,gi=mi=null,nu=r,B.H=i,B.A=o,null===iu&&(ru=null,ou=0,Ar()),s}function Ku(){for(;null!==iu;)Xu(iu)}function Gu(){for(;null!==iu&&!Z();)Xu(iu)}function Xu(e){var t=Xa(e.alternate,e,du);e.memoizedProps=e.pendingProps,null===t?ec(e):iu=t}function Ju(e){var t=e,n=t.alternate;switch(t.tag){case 15:case 0:t=Ma(n,t,t.pendingProps,t.type,void 0,ou);break;case 11:t=Ma(n,t,t.pendingProps,t.type.render,t.ref,ou);break;case 5:zo(t);default:ol(n,t),t=Xa(n,t=iu=Ur(t,du),du)}e.memoizedProps=e.pendingProps,null===t?ec(e):iu=t}function Zu(e,t,n,r){gi=mi=null,zo(t),Ks=null,Gs=0;var i=t.return;try{if(function(e,t,n,r,i){if(n.flags|=32768,null!==r&&"object"===typeof r&&"function"===typeof r.then){if(null!==(t=n.alternate)&&ki(t,n,i,!0),null!==(n=ia.current)){switch(n.tag){case 13:return null===oa?qu():null===n.alternate&&0===fu&&(fu=3),n.flags&=-257,n.flags|=65536,n.lanes=i,r===Qi?n.flags|=16384:(null===(t=n.updateQueue)?n.updateQueue=new Set([r]):t.add(r),dc(e,r,i)),!1;case 22:return n.flags|=65536,r===Qi?n.flags|=16384:(null===(t=n.updateQueue)?(t={transitions:null,markerInstances:null,retryQueue:new Set([r])},n.updateQueue=t):null===(n=t.retryQueue)?t.retryQueue=new Set([r]):n.add(r),dc(e,r,i)),!1}throw Error(s(435,n.tag))}return dc(e,r,i),qu(),!1}if(oi)return null!==(t=ia.current)?(0===(65536&t.flags)&&(t.flags|=256),t.flags|=65536,t.lanes=i,r!==li&&yi(Ir(e=Error(s(422),{cause:r}),n))):(r!==li&&yi(Ir(t=Error(s(423),{cause:r}),n)),(e=e.current.alternate).flags|=65536,i&=-i,e.lanes|=i,r=Ir(r,n),ao(e,i=ka(e.stateNode,r,i)),4!==fu&&(fu=2)),!1;var o=Error(s(520),{cause:r});if(o=Ir(o,n),null===gu?gu=[o]:gu.push(o),4!==fu&&(fu=2),null===t)return!0;r=Ir(r,n),n=t;do{switch(n.tag){case 3:return n.flags|=65536,e=i&-i,n.lanes|=e,ao(n,e=ka(n.stateNode,r,e)),!1;case 1:if(t=n.type,o=n.stateNode,0===(128&n.flags)&&("function"===typeof t.getDerivedStateFromError||null!==o&&"function"===typeof o.componentDidCatch&&(null===Iu||!Iu.has(o))))return n.flags|=65536,i&=-i,n.lanes|=i,xa(i=Ia(i),e,n,r),ao(n,i),!1}n=n.return}while(null!==n);return!1}(e,i,t,n,ou))return fu=1,_a(e,Ir(n,e.current)),void(iu=null)}catch(o){if(null!==i)throw iu=i,o;return fu=1,_a(e,Ir(n,e.current)),void(iu=null)}32768&t.flags?(oi||1===r?e=!0:uu||0!==(536870912&ou)?e=!1:(lu=e=!0,(2===r||9===r||3===r||6===r)&&(null!==(r=ia.current)&&13===r.tag&&(r.flags|=16384))),tc(t,e)):ec(t)}function ec(e){var t=e;do{if(0!==(32768&t.flags))return void tc(t,lu);e=t.return;var n=rl(t.alternate,t,du);if(null!==n)return void(iu=n);if(null!==(t=t.sibling))return void(iu=t);iu=t=e}while(null!==t);0===fu&&(fu=5)}function tc(e,t){do{var n=il(e.alternate,e);if(null!==n)return n.flags&=32767,void(iu=n);if(null!==(n=e.return)&&(n.flags|=32768,n.subtreeFlags=0,n.deletions=null),!t&&null!==(e=e.sibling))return void(iu=e);iu=e=n}while(null!==e);fu=6,iu=null}function nc(e,t,n,r,i,o,a,l,u){e.cancelPendingCommit=null;do{ac()}while(0!==xu);if(0!==(6&nu))throw Error(s(327));if(null!==t){if(t===e.current)throw Error(s(177));if(o=t.lanes|t.childLanes,function(e,t,n,r,i,o){var s=e.pendingLanes;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=n,e.entangledLanes&=n,e.errorRecoveryDisabledLanes&=n,e.shellSuspendCounter=0;var a=e.entanglements,l=e.expirationTimes,u=e.hiddenUpdates;for(n=s&~n;0<n;){var c=31-he(n),d=1<<c;a[c]=0,l[c]=-1;var f=u[c];if(null!==f)for(u[c]=null,c=0;c<f.length;c++){var h=f[c];null!==h&&(h.lane&=-536870913)}n&=~d}0!==r&&Te(e,r,0),0!==o&&0===i&&0!==e.tag&&(e.suspendedLanes|=o&~(s&~t))}(e,n,o|=Er,a,l,u),e===ru&&(iu=ru=null,ou=0),Eu=t,Tu=e,Au=n,Ou=o,Cu=i,Nu=r,0!==(10256&t.subtreeFlags)||0!==(10256&t.flags)?(e.callbackNode=null,e.callbackPriority=0,X(oe,function(){return lc(),null})):(e.callbackNode=null,e.callbackPriority=0),r=0!==(13878&t.flags),0!==(13878&t.subtreeFlags)||r){r=B.T,B.T=null,i=F.p,F.p=2,a=nu,nu|=4;try{!function(e,t){if(e=e.containerInfo,td=nf,tr(e=er(e))){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var i=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch(b){n=null;break e}var a=0,l=-1,u=-1,c=0,d=0,f=e,h=null;t:for(;;){for(var p;f!==n||0!==i&&3!==f.nodeType||(l=a+i),f!==o||0!==r&&3!==f.nodeType||(u=a+r),3===f.nodeType&&(a+=f.nodeValue.length),null!==(p=f.firstChild);)h=f,f=p;for(;;){if(f===e)break t;if(h===n&&++c===i&&(l=a),h===o&&++d===r&&(u=a),null!==(p=f.nextSibling))break;h=(f=h).parentNode}f=p}n=-1===l||-1===u?null:{start:l,end:u}}else n=null}n=n||{start:0,end:0}}else n=null;for(nd={focusedElem:e,selectionRange:n},nf=!1,kl=t;null!==kl;)if(e=(t=kl).child,0!==(1024&t.subtreeFlags)&&null!==e)e.return=t,kl=e;else for(;null!==kl;){switch(o=(t=kl).alternate,e=t.flags,t.tag){case 0:case 11:case 15:case 5:case 26:case 27:case 6:case 4:case 17:break;case 1:if(0!==(1024&e)&&null!==o){e=void 0,n=t,i=o.memoizedProps,o=o.memoizedState,r=n.stateNode;try{var y=ba(n.type,i,(n.elementType,n.type));e=r.getSnapshotBeforeUpdate(y,o),r.__reactInternalSnapshotBeforeUpdate=e}catch(m){cc(n,n.return,m)}}break;case 3:if(0!==(1024&e))if(9===(n=(e=t.stateNode.containerInfo).nodeType))yd(e);else if(1===n)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":yd(e);break;default:e.textContent=""}break;default:if(0!==(1024&e))throw Error(s(163))}if(null!==(e=t.sibling)){e.return=t.return,kl=e;break}kl=t.return}}(e,t)}finally{nu=a,F.p=i,B.T=r}}xu=1,rc(),ic(),oc()}}function rc(){if(1===xu){xu=0;var e=Tu,t=Eu,n=0!==(13878&t.flags);if(0!==(13878&t.subtreeFlags)||n){n=B.T,B.T=null;var r=F.p;F.p=2;var i=nu;nu|=4;try{Bl(t,e);var o=nd,s=er(e.containerInfo),a=o.focusedElem,l=o.selectionRange;if(s!==a&&a&&a.ownerDocument&&Zn(a.ownerDocument.documentElement,a)){if(null!==l&&tr(a)){var u=l.start,c=l.end;if(void 0===c&&(c=u),"selectionStart"in a)a.selectionStart=u,a.selectionEnd=Math.min(c,a.value.length);else{var d=a.ownerDocument||document,f=d&&d.defaultView||window;if(f.getSelection){var h=f.getSelection(),p=a.textContent.length,y=Math.min(l.start,p),b=void 0===l.end?y:Math.min(l.end,p);!h.extend&&y>b&&(s=b,b=y,y=s);var m=Jn(a,y),g=Jn(a,b);if(m&&g&&(1!==h.rangeCount||h.anchorNode!==m.node||h.anchorOffset!==m.offset||h.focusNode!==g.node||h.focusOffset!==g.offset)){var v=d.createRange();v.setStart(m.node,m.offset),h.removeAllRanges(),y>b?(h.addRange(v),h.extend(g.node,g.offset)):(v.setEnd(g.node,g.offset),h.addRange(v))}}}}for(d=[],h=a;h=h.parentNode;)1===h.nodeType&&d.push({element:h,left:h.scrollLeft,top:h.scrollTop});for("function"===typeof a.focus&&a.focus(),a=0;a<d.length;a++){var w=d[a];w.element.scrollLeft=w.left,w.element.scrollTop=w.top}}nf=!!td,nd=td=null}finally{nu=i,F.p=r,B.T=n}}e.current=t,xu=2}}function ic(){if(2===xu){xu=0;var e=Tu,t=Eu,n=0!==(8772&t.flags);if(0!==(8772&t.subtreeFlags)||n){n=B.T,B.T=null;var r=F.p;F.p=2;var i=nu;nu|=4;try{Il(e,t.alternate,t)}finally{nu=i,F.p=r,B.T=n}}xu=3}}function oc(){if(4===xu||3===xu){xu=0,ee();var e=Tu,t=Eu,n=Au,r=Nu;0!==(10256&t.subtreeFlags)||0!==(10256&t.flags)?xu=5:(xu=0,Eu=Tu=null,sc(e,e.pendingLanes));var i=e.pendingLanes;if(0===i&&(Iu=null),Oe(n),t=t.stateNode,de&&"function"===typeof de.onCommitFiberRoot)try{de.onCommitFiberRoot(ce,t,void 0,128===(128&t.current.flags))}catch(l){}if(null!==r){t=B.T,i=F.p,F.p=2,B.T=null;try{for(var o=e.onRecoverableError,s=0;s<r.length;s++){var a=r[s];o(a.value,{componentStack:a.stack})}}finally{B.T=t,F.p=i}}0!==(3&Au)&&ac(),Sc(e),i=e.pendingLanes,0!==(4194090&n)&&0!==(42&i)?e===Lu?Du++:(Du=0,Lu=e):Du=0,kc(0,!1)}}function sc(e,t){0===(e.pooledCacheLanes&=t)&&(null!=(t=e.pooledCache)&&(e.pooledCache=null,Bi(t)))}function ac(e){return rc(),ic(),oc(),lc()}function lc(){if(5!==xu)return!1;var e=Tu,t=Ou;Ou=0;var n=Oe(Au),r=B.T,i=F.p;try{F.p=32>n?32:n,B.T=null,n=Cu,Cu=null;var o=Tu,a=Au;if(xu=0,Eu=Tu=null,Au=0,0!==(6&nu))throw Error(s(331));var l=nu;if(nu|=4,Xl(o.current),Hl(o,o.current,a,n),nu=l,kc(0,!1),de&&"function"===typeof de.onPostCommitFiberRoot)try{de.onPostCommitFiberRoot(ce,o)}catch(u){}return!0}finally{F.p=i,B.T=r,sc(e,t)}}function uc(e,t,n){t=Ir(n,t),null!==(e=oo(e,t=ka(e.stateNode,t,2),2))&&(xe(e,2),Sc(e))}function cc(e,t,n){if(3===e.tag)uc(e,e,n);else for(;null!==t;){if(3===t.tag){uc(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"===typeof t.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===Iu||!Iu.has(r))){e=Ir(n,e),null!==(r=oo(t,n=Ia(2),2))&&(xa(n,r,t,e),xe(r,2),Sc(r));break}}t=t.return}}function dc(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new tu;var i=new Set;r.set(t,i)}else void 0===(i=r.get(t))&&(i=new Set,r.set(t,i));i.has(n)||(cu=!0,i.add(n),e=fc.bind(null,e,t,n),t.then(e,e))}function fc(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),e.pingedLanes|=e.suspendedLanes&n,e.warmLanes&=~n,ru===e&&(ou&n)===n&&(4===fu||3===fu&&(62914560&ou)===ou&&300>te()-_u?0===(2&nu)&&Hu(e,0):yu|=n,mu===ou&&(mu=0)),Sc(e)}function hc(e,t){0===t&&(t=ke()),null!==(e=Nr(e,t))&&(xe(e,t),Sc(e))}function pc(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),hc(e,n)}function yc(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,i=e.memoizedState;null!==i&&(n=i.retryLane);break;case 19:r=e.stateNode;break;case 22:r=e.stateNode._retryCache;break;default:throw Error(s(314))}null!==r&&r.delete(t),hc(e,n)}var bc=null,mc=null,gc=!1,vc=!1,wc=!1,_c=0;function Sc(e){e!==mc&&null===e.next&&(null===mc?bc=mc=e:mc=mc.next=e),vc=!0,gc||(gc=!0,dd(function(){0!==(6&nu)?X(re,Ic):xc()}))}function kc(e,t){if(!wc&&vc){wc=!0;do{for(var n=!1,r=bc;null!==r;){if(!t)if(0!==e){var i=r.pendingLanes;if(0===i)var o=0;else{var s=r.suspendedLanes,a=r.pingedLanes;o=(1<<31-he(42|e)+1)-1,o=201326741&(o&=i&~(s&~a))?201326741&o|1:o?2|o:0}0!==o&&(n=!0,Ac(r,o))}else o=ou,0===(3&(o=ve(r,r===ru?o:0,null!==r.cancelPendingCommit||-1!==r.timeoutHandle)))||we(r,o)||(n=!0,Ac(r,o));r=r.next}}while(n);wc=!1}}function Ic(){xc()}function xc(){vc=gc=!1;var e=0;0!==_c&&(function(){var e=window.event;if(e&&"popstate"===e.type)return e!==ad&&(ad=e,!0);return ad=null,!1}()&&(e=_c),_c=0);for(var t=te(),n=null,r=bc;null!==r;){var i=r.next,o=Tc(r,t);0===o?(r.next=null,null===n?bc=i:n.next=i,null===i&&(mc=n)):(n=r,(0!==e||0!==(3&o))&&(vc=!0)),r=i}kc(e,!1)}function Tc(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,i=e.expirationTimes,o=-62914561&e.pendingLanes;0<o;){var s=31-he(o),a=1<<s,l=i[s];-1===l?0!==(a&n)&&0===(a&r)||(i[s]=_e(a,t)):l<=t&&(e.expiredLanes|=a),o&=~a}if(n=ou,n=ve(e,e===(t=ru)?n:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle),r=e.callbackNode,0===n||e===t&&(2===su||9===su)||null!==e.cancelPendingCommit)return null!==r&&null!==r&&J(r),e.callbackNode=null,e.callbackPriority=0;if(0===(3&n)||we(e,n)){if((t=n&-n)===e.callbackPriority)return t;switch(null!==r&&J(r),Oe(n)){case 2:case 8:n=ie;break;case 32:default:n=oe;break;case 268435456:n=ae}return r=Ec.bind(null,e),n=X(n,r),e.callbackPriority=t,e.callbackNode=n,t}return null!==r&&null!==r&&J(r),e.callbackPriority=2,e.callbackNode=null,2}function Ec(e,t){if(0!==xu&&5!==xu)return e.callbackNode=null,e.callbackPriority=0,null;var n=e.callbackNode;if(ac()&&e.callbackNode!==n)return null;var r=ou;return 0===(r=ve(e,e===ru?r:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle))?null:(Pu(e,r,t),Tc(e,te()),null!=e.callbackNode&&e.callbackNode===n?Ec.bind(null,e):null)}function Ac(e,t){if(ac())return null;Pu(e,t,!0)}function Oc(){return 0===_c&&(_c=Se()),_c}function Cc(e){return null==e||"symbol"===typeof e||"boolean"===typeof e?null:"function"===typeof e?e:Ot(""+e)}function Nc(e,t){var n=t.ownerDocument.createElement("input");return n.name=t.name,n.value=t.value,e.id&&n.setAttribute("form",e.id),t.parentNode.insertBefore(n,t),e=new FormData(e),n.parentNode.removeChild(n),e}for(var Dc=0;Dc<_r.length;Dc++){var Lc=_r[Dc];Sr(Lc.toLowerCase(),"on"+(Lc[0].toUpperCase()+Lc.slice(1)))}Sr(hr,"onAnimationEnd"),Sr(pr,"onAnimationIteration"),Sr(yr,"onAnimationStart"),Sr("dblclick","onDoubleClick"),Sr("focusin","onFocus"),Sr("focusout","onBlur"),Sr(br,"onTransitionRun"),Sr(mr,"onTransitionStart"),Sr(gr,"onTransitionCancel"),Sr(vr,"onTransitionEnd"),Ke("onMouseEnter",["mouseout","mouseover"]),Ke("onMouseLeave",["mouseout","mouseover"]),Ke("onPointerEnter",["pointerout","pointerover"]),Ke("onPointerLeave",["pointerout","pointerover"]),Qe("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Qe("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Qe("onBeforeInput",["compositionend","keypress","textInput","paste"]),Qe("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Qe("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Qe("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Bc="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Fc=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Bc));function Mc(e,t){t=0!==(4&t);for(var n=0;n<e.length;n++){var r=e[n],i=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var s=r.length-1;0<=s;s--){var a=r[s],l=a.instance,u=a.currentTarget;if(a=a.listener,l!==o&&i.isPropagationStopped())break e;o=a,i.currentTarget=u;try{o(i)}catch(c){ma(c)}i.currentTarget=null,o=l}else for(s=0;s<r.length;s++){if(l=(a=r[s]).instance,u=a.currentTarget,a=a.listener,l!==o&&i.isPropagationStopped())break e;o=a,i.currentTarget=u;try{o(i)}catch(c){ma(c)}i.currentTarget=null,o=l}}}}function Pc(e,t){var n=t[Fe];void 0===n&&(n=t[Fe]=new Set);var r=e+"__bubble";n.has(r)||(jc(t,e,2,!1),n.add(r))}function zc(e,t,n){var r=0;t&&(r|=4),jc(n,e,r,t)}var Uc="_reactListening"+Math.random().toString(36).slice(2);function Rc(e){if(!e[Uc]){e[Uc]=!0,Ye.forEach(function(t){"selectionchange"!==t&&(Fc.has(t)||zc(t,!1,e),zc(t,!0,e))});var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Uc]||(t[Uc]=!0,zc("selectionchange",!1,t))}}function jc(e,t,n,r){switch(cf(t)){case 2:var i=rf;break;case 8:i=of;break;default:i=sf}n=i.bind(null,t,n,e),i=void 0,!Ut||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(i=!0),r?void 0!==i?e.addEventListener(t,n,{capture:!0,passive:i}):e.addEventListener(t,n,!0):void 0!==i?e.addEventListener(t,n,{passive:i}):e.addEventListener(t,n,!1)}function Vc(e,t,n,r,i){var o=r;if(0===(1&t)&&0===(2&t)&&null!==r)e:for(;;){if(null===r)return;var s=r.tag;if(3===s||4===s){var a=r.stateNode.containerInfo;if(a===i)break;if(4===s)for(s=r.return;null!==s;){var u=s.tag;if((3===u||4===u)&&s.stateNode.containerInfo===i)return;s=s.return}for(;null!==a;){if(null===(s=je(a)))return;if(5===(u=s.tag)||6===u||26===u||27===u){r=o=s;continue e}a=a.parentNode}}r=r.return}Mt(function(){var r=o,i=Nt(n),s=[];e:{var a=wr.get(e);if(void 0!==a){var u=Zt,c=e;switch(e){case"keypress":if(0===Wt(n))break e;case"keydown":case"keyup":u=yn;break;case"focusin":c="focus",u=sn;break;case"focusout":c="blur",u=sn;break;case"beforeblur":case"afterblur":u=sn;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":u=rn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":u=on;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":u=mn;break;case hr:case pr:case yr:u=an;break;case vr:u=gn;break;case"scroll":case"scrollend":u=tn;break;case"wheel":u=vn;break;case"copy":case"cut":case"paste":u=ln;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":u=bn;break;case"toggle":case"beforetoggle":u=wn}var d=0!==(4&t),f=!d&&("scroll"===e||"scrollend"===e),h=d?null!==a?a+"Capture":null:a;d=[];for(var p,y=r;null!==y;){var b=y;if(p=b.stateNode,5!==(b=b.tag)&&26!==b&&27!==b||null===p||null===h||null!=(b=Pt(y,h))&&d.push(Hc(y,b,p)),f)break;y=y.return}0<d.length&&(a=new u(a,c,null,n,i),s.push({event:a,listeners:d}))}}if(0===(7&t)){if(u="mouseout"===e||"pointerout"===e,(!(a="mouseover"===e||"pointerover"===e)||n===Ct||!(c=n.relatedTarget||n.fromElement)||!je(c)&&!c[Be])&&(u||a)&&(a=i.window===i?i:(a=i.ownerDocument)?a.defaultView||a.parentWindow:window,u?(u=r,null!==(c=(c=n.relatedTarget||n.toElement)?je(c):null)&&(f=l(c),d=c.tag,c!==f||5!==d&&27!==d&&6!==d)&&(c=null)):(u=null,c=r),u!==c)){if(d=rn,b="onMouseLeave",h="onMouseEnter",y="mouse","pointerout"!==e&&"pointerover"!==e||(d=bn,b="onPointerLeave",h="onPointerEnter",y="pointer"),f=null==u?a:He(u),p=null==c?a:He(c),(a=new d(b,y+"leave",u,n,i)).target=f,a.relatedTarget=p,b=null,je(i)===r&&((d=new d(h,y+"enter",c,n,i)).target=p,d.relatedTarget=f,b=d),f=b,u&&c)e:{for(h=c,y=0,p=d=u;p;p=Wc(p))y++;for(p=0,b=h;b;b=Wc(b))p++;for(;0<y-p;)d=Wc(d),y--;for(;0<p-y;)h=Wc(h),p--;for(;y--;){if(d===h||null!==h&&d===h.alternate)break e;d=Wc(d),h=Wc(h)}d=null}else d=null;null!==u&&Yc(s,a,u,d,!1),null!==c&&null!==f&&Yc(s,f,c,d,!0)}if("select"===(u=(a=r?He(r):window).nodeName&&a.nodeName.toLowerCase())||"input"===u&&"file"===a.type)var m=zn;else if(Dn(a))if(Un)m=Qn;else{m=Yn;var g=Wn}else!(u=a.nodeName)||"input"!==u.toLowerCase()||"checkbox"!==a.type&&"radio"!==a.type?r&&Tt(r.elementType)&&(m=zn):m=qn;switch(m&&(m=m(e,r))?Ln(s,m,n,i):(g&&g(e,a,r),"focusout"===e&&r&&"number"===a.type&&null!=r.memoizedProps.value&&gt(a,"number",a.value)),g=r?He(r):window,e){case"focusin":(Dn(g)||"true"===g.contentEditable)&&(rr=g,ir=r,or=null);break;case"focusout":or=ir=rr=null;break;case"mousedown":sr=!0;break;case"contextmenu":case"mouseup":case"dragend":sr=!1,ar(s,n,i);break;case"selectionchange":if(nr)break;case"keydown":case"keyup":ar(s,n,i)}var v;if(Sn)e:{switch(e){case"compositionstart":var w="onCompositionStart";break e;case"compositionend":w="onCompositionEnd";break e;case"compositionupdate":w="onCompositionUpdate";break e}w=void 0}else Cn?An(e,n)&&(w="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(w="onCompositionStart");w&&(xn&&"ko"!==n.locale&&(Cn||"onCompositionStart"!==w?"onCompositionEnd"===w&&Cn&&(v=$t()):(Vt="value"in(jt=i)?jt.value:jt.textContent,Cn=!0)),0<(g=$c(r,w)).length&&(w=new un(w,e,null,n,i),s.push({event:w,listeners:g}),v?w.data=v:null!==(v=On(n))&&(w.data=v))),(v=In?function(e,t){switch(e){case"compositionend":return On(t);case"keypress":return 32!==t.which?null:(En=!0,Tn);case"textInput":return(e=t.data)===Tn&&En?null:e;default:return null}}(e,n):function(e,t){if(Cn)return"compositionend"===e||!Sn&&An(e,t)?(e=$t(),Ht=Vt=jt=null,Cn=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return xn&&"ko"!==t.locale?null:t.data}}(e,n))&&(0<(w=$c(r,"onBeforeInput")).length&&(g=new un("onBeforeInput","beforeinput",null,n,i),s.push({event:g,listeners:w}),g.data=v)),function(e,t,n,r,i){if("submit"===t&&n&&n.stateNode===i){var o=Cc((i[Le]||null).action),s=r.submitter;s&&null!==(t=(t=s[Le]||null)?Cc(t.formAction):s.getAttribute("formAction"))&&(o=t,s=null);var a=new Zt("action","action",null,r,i);e.push({event:a,listeners:[{instance:null,listener:function(){if(r.defaultPrevented){if(0!==_c){var e=s?Nc(i,s):new FormData(i);Ns(n,{pending:!0,data:e,method:i.method,action:o},null,e)}}else"function"===typeof o&&(a.preventDefault(),e=s?Nc(i,s):new FormData(i),Ns(n,{pending:!0,data:e,method:i.method,action:o},o,e))},currentTarget:i}]})}}(s,e,r,n,i)}Mc(s,t)})}function Hc(e,t,n){return{instance:e,listener:t,currentTarget:n}}function $c(e,t){for(var n=t+"Capture",r=[];null!==e;){var i=e,o=i.stateNode;if(5!==(i=i.tag)&&26!==i&&27!==i||null===o||(null!=(i=Pt(e,n))&&r.unshift(Hc(e,i,o)),null!=(i=Pt(e,t))&&r.push(Hc(e,i,o))),3===e.tag)return r;e=e.return}return[]}function Wc(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag&&27!==e.tag);return e||null}function Yc(e,t,n,r,i){for(var o=t._reactName,s=[];null!==n&&n!==r;){var a=n,l=a.alternate,u=a.stateNode;if(a=a.tag,null!==l&&l===r)break;5!==a&&26!==a&&27!==a||null===u||(l=u,i?null!=(u=Pt(n,o))&&s.unshift(Hc(n,u,l)):i||null!=(u=Pt(n,o))&&s.push(Hc(n,u,l))),n=n.return}0!==s.length&&e.push({event:t,listeners:s})}var qc=/\r\n?/g,Qc=/\u0000|\uFFFD/g;function Kc(e){return("string"===typeof e?e:""+e).replace(qc,"\n").replace(Qc,"")}function Gc(e,t){return t=Kc(t),Kc(e)===t}function Xc(){}function Jc(e,t,n,r,i,o){switch(n){case"children":"string"===typeof r?"body"===t||"textarea"===t&&""===r||St(e,r):("number"===typeof r||"bigint"===typeof r)&&"body"!==t&&St(e,""+r);break;case"className":nt(e,"class",r);break;case"tabIndex":nt(e,"tabindex",r);break;case"dir":case"role":case"viewBox":case"width":case"height":nt(e,n,r);break;case"style":xt(e,r,o);break;case"data":if("object"!==t){nt(e,"data",r);break}case"src":case"href":if(""===r&&("a"!==t||"href"!==n)){e.removeAttribute(n);break}if(null==r||"function"===typeof r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Ot(""+r),e.setAttribute(n,r);break;case"action":case"formAction":if("function"===typeof r){e.setAttribute(n,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}if("function"===typeof o&&("formAction"===n?("input"!==t&&Jc(e,t,"name",i.name,i,null),Jc(e,t,"formEncType",i.formEncType,i,null),Jc(e,t,"formMethod",i.formMethod,i,null),Jc(e,t,"formTarget",i.formTarget,i,null)):(Jc(e,t,"encType",i.encType,i,null),Jc(e,t,"method",i.method,i,null),Jc(e,t,"target",i.target,i,null))),null==r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Ot(""+r),e.setAttribute(n,r);break;case"onClick":null!=r&&(e.onclick=Xc);break;case"onScroll":null!=r&&Pc("scroll",e);break;case"onScrollEnd":null!=r&&Pc("scrollend",e);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(s(61));if(null!=(n=r.__html)){if(null!=i.children)throw Error(s(60));e.innerHTML=n}}break;case"multiple":e.multiple=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"muted":e.muted=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":case"autoFocus":break;case"xlinkHref":if(null==r||"function"===typeof r||"boolean"===typeof r||"symbol"===typeof r){e.removeAttribute("xlink:href");break}n=Ot(""+r),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",n);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""+r):e.removeAttribute(n);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""):e.removeAttribute(n);break;case"capture":case"download":!0===r?e.setAttribute(n,""):!1!==r&&null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,r):e.removeAttribute(n);break;case"cols":case"rows":case"size":case"span":null!=r&&"function"!==typeof r&&"symbol"!==typeof r&&!isNaN(r)&&1<=r?e.setAttribute(n,r):e.removeAttribute(n);break;case"rowSpan":case"start":null==r||"function"===typeof r||"symbol"===typeof r||isNaN(r)?e.removeAttribute(n):e.setAttribute(n,r);break;case"popover":Pc("beforetoggle",e),Pc("toggle",e),tt(e,"popover",r);break;case"xlinkActuate":rt(e,"http://www.w3.org/1999/xlink","xlink:actuate",r);break;case"xlinkArcrole":rt(e,"http://www.w3.org/1999/xlink","xlink:arcrole",r);break;case"xlinkRole":rt(e,"http://www.w3.org/1999/xlink","xlink:role",r);break;case"xlinkShow":rt(e,"http://www.w3.org/1999/xlink","xlink:show",r);break;case"xlinkTitle":rt(e,"http://www.w3.org/1999/xlink","xlink:title",r);break;case"xlinkType":rt(e,"http://www.w3.org/1999/xlink","xlink:type",r);break;case"xmlBase":rt(e,"http://www.w3.org/XML/1998/namespace","xml:base",r);break;case"xmlLang":rt(e,"http://www.w3.org/XML/1998/namespace","xml:lang",r);break;case"xmlSpace":rt(e,"http://www.w3.org/XML/1998/namespace","xml:space",r);break;case"is":tt(e,"is",r);break;case"innerText":case"textContent":break;default:(!(2<n.length)||"o"!==n[0]&&"O"!==n[0]||"n"!==n[1]&&"N"!==n[1])&&tt(e,n=Et.get(n)||n,r)}}function Zc(e,t,n,r,i,o){switch(n){case"style":xt(e,r,o);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(s(61));if(null!=(n=r.__html)){if(null!=i.children)throw Error(s(60));e.innerHTML=n}}break;case"children":"string"===typeof r?St(e,r):("number"===typeof r||"bigint"===typeof r)&&St(e,""+r);break;case"onScroll":null!=r&&Pc("scroll",e);break;case"onScrollEnd":null!=r&&Pc("scrollend",e);break;case"onClick":null!=r&&(e.onclick=Xc);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":case"innerText":case"textContent":break;default:qe.hasOwnProperty(n)||("o"!==n[0]||"n"!==n[1]||(i=n.endsWith("Capture"),t=n.slice(2,i?n.length-7:void 0),"function"===typeof(o=null!=(o=e[Le]||null)?o[n]:null)&&e.removeEventListener(t,o,i),"function"!==typeof r)?n in e?e[n]=r:!0===r?e.setAttribute(n,""):tt(e,n,r):("function"!==typeof o&&null!==o&&(n in e?e[n]=null:e.hasAttribute(n)&&e.removeAttribute(n)),e.addEventListener(t,r,i)))}}function ed(e,t,n){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":Pc("error",e),Pc("load",e);var r,i=!1,o=!1;for(r in n)if(n.hasOwnProperty(r)){var a=n[r];if(null!=a)switch(r){case"src":i=!0;break;case"srcSet":o=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(s(137,t));default:Jc(e,t,r,a,n,null)}}return o&&Jc(e,t,"srcSet",n.srcSet,n,null),void(i&&Jc(e,t,"src",n.src,n,null));case"input":Pc("invalid",e);var l=r=a=o=null,u=null,c=null;for(i in n)if(n.hasOwnProperty(i)){var d=n[i];if(null!=d)switch(i){case"name":o=d;break;case"type":a=d;break;case"checked":u=d;break;case"defaultChecked":c=d;break;case"value":r=d;break;case"defaultValue":l=d;break;case"children":case"dangerouslySetInnerHTML":if(null!=d)throw Error(s(137,t));break;default:Jc(e,t,i,d,n,null)}}return mt(e,r,l,u,c,a,o,!1),void dt(e);case"select":for(o in Pc("invalid",e),i=a=r=null,n)if(n.hasOwnProperty(o)&&null!=(l=n[o]))switch(o){case"value":r=l;break;case"defaultValue":a=l;break;case"multiple":i=l;default:Jc(e,t,o,l,n,null)}return t=r,n=a,e.multiple=!!i,void(null!=t?vt(e,!!i,t,!1):null!=n&&vt(e,!!i,n,!0));case"textarea":for(a in Pc("invalid",e),r=o=i=null,n)if(n.hasOwnProperty(a)&&null!=(l=n[a]))switch(a){case"value":i=l;break;case"defaultValue":o=l;break;case"children":r=l;break;case"dangerouslySetInnerHTML":if(null!=l)throw Error(s(91));break;default:Jc(e,t,a,l,n,null)}return _t(e,i,o,r),void dt(e);case"option":for(u in n)if(n.hasOwnProperty(u)&&null!=(i=n[u]))if("selected"===u)e.selected=i&&"function"!==typeof i&&"symbol"!==typeof i;else Jc(e,t,u,i,n,null);return;case"dialog":Pc("beforetoggle",e),Pc("toggle",e),Pc("cancel",e),Pc("close",e);break;case"iframe":case"object":Pc("load",e);break;case"video":case"audio":for(i=0;i<Bc.length;i++)Pc(Bc[i],e);break;case"image":Pc("error",e),Pc("load",e);break;case"details":Pc("toggle",e);break;case"embed":case"source":case"link":Pc("error",e),Pc("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(c in n)if(n.hasOwnProperty(c)&&null!=(i=n[c]))switch(c){case"children":case"dangerouslySetInnerHTML":throw Error(s(137,t));default:Jc(e,t,c,i,n,null)}return;default:if(Tt(t)){for(d in n)n.hasOwnProperty(d)&&(void 0!==(i=n[d])&&Zc(e,t,d,i,n,void 0));return}}for(l in n)n.hasOwnProperty(l)&&(null!=(i=n[l])&&Jc(e,t,l,i,n,null))}var td=null,nd=null;function rd(e){return 9===e.nodeType?e:e.ownerDocument}function id(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function od(e,t){if(0===e)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return 1===e&&"foreignObject"===t?0:e}function sd(e,t){return"textarea"===e||"noscript"===e||"string"===typeof t.children||"number"===typeof t.children||"bigint"===typeof t.children||"object"===typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var ad=null;var ld="function"===typeof setTimeout?setTimeout:void 0,ud="function"===typeof clearTimeout?clearTimeout:void 0,cd="function"===typeof Promise?Promise:void 0,dd="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof cd?function(e){return cd.resolve(null).then(e).catch(fd)}:ld;function fd(e){setTimeout(function(){throw e})}function hd(e){return"head"===e}function pd(e,t){var n=t,r=0,i=0;do{var o=n.nextSibling;if(e.removeChild(n),o&&8===o.nodeType)if("/$"===(n=o.data)){if(0<r&&8>r){n=r;var s=e.ownerDocument;if(1&n&&_d(s.documentElement),2&n&&_d(s.body),4&n)for(_d(n=s.head),s=n.firstChild;s;){var a=s.nextSibling,l=s.nodeName;s[Ue]||"SCRIPT"===l||"STYLE"===l||"LINK"===l&&"stylesheet"===s.rel.toLowerCase()||n.removeChild(s),s=a}}if(0===i)return e.removeChild(o),void Af(t);i--}else"$"===n||"$?"===n||"$!"===n?i++:r=n.charCodeAt(0)-48;else r=0;n=o}while(n);Af(t)}function yd(e){var t=e.firstChild;for(t&&10===t.nodeType&&(t=t.nextSibling);t;){var n=t;switch(t=t.nextSibling,n.nodeName){case"HTML":case"HEAD":case"BODY":yd(n),Re(n);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if("stylesheet"===n.rel.toLowerCase())continue}e.removeChild(n)}}function bd(e){return"$!"===e.data||"$?"===e.data&&"complete"===e.ownerDocument.readyState}function md(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t||"F!"===t||"F"===t)break;if("/$"===t)return null}}return e}var gd=null;function vd(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}function wd(e,t,n){switch(t=rd(n),e){case"html":if(!(e=t.documentElement))throw Error(s(452));return e;case"head":if(!(e=t.head))throw Error(s(453));return e;case"body":if(!(e=t.body))throw Error(s(454));return e;default:throw Error(s(451))}}function _d(e){for(var t=e.attributes;t.length;)e.removeAttributeNode(t[0]);Re(e)}var Sd=new Map,kd=new Set;function Id(e){return"function"===typeof e.getRootNode?e.getRootNode():9===e.nodeType?e:e.ownerDocument}var xd=F.d;F.d={f:function(){var e=xd.f(),t=ju();return e||t},r:function(e){var t=Ve(e);null!==t&&5===t.tag&&"form"===t.type?Ls(t):xd.r(e)},D:function(e){xd.D(e),Ed("dns-prefetch",e,null)},C:function(e,t){xd.C(e,t),Ed("preconnect",e,t)},L:function(e,t,n){xd.L(e,t,n);var r=Td;if(r&&e&&t){var i='link[rel="preload"][as="'+yt(t)+'"]';"image"===t&&n&&n.imageSrcSet?(i+='[imagesrcset="'+yt(n.imageSrcSet)+'"]',"string"===typeof n.imageSizes&&(i+='[imagesizes="'+yt(n.imageSizes)+'"]')):i+='[href="'+yt(e)+'"]';var o=i;switch(t){case"style":o=Od(e);break;case"script":o=Dd(e)}Sd.has(o)||(e=f({rel:"preload",href:"image"===t&&n&&n.imageSrcSet?void 0:e,as:t},n),Sd.set(o,e),null!==r.querySelector(i)||"style"===t&&r.querySelector(Cd(o))||"script"===t&&r.querySelector(Ld(o))||(ed(t=r.createElement("link"),"link",e),We(t),r.head.appendChild(t)))}},m:function(e,t){xd.m(e,t);var n=Td;if(n&&e){var r=t&&"string"===typeof t.as?t.as:"script",i='link[rel="modulepreload"][as="'+yt(r)+'"][href="'+yt(e)+'"]',o=i;switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":o=Dd(e)}if(!Sd.has(o)&&(e=f({rel:"modulepreload",href:e},t),Sd.set(o,e),null===n.querySelector(i))){switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(n.querySelector(Ld(o)))return}ed(r=n.createElement("link"),"link",e),We(r),n.head.appendChild(r)}}},X:function(e,t){xd.X(e,t);var n=Td;if(n&&e){var r=$e(n).hoistableScripts,i=Dd(e),o=r.get(i);o||((o=n.querySelector(Ld(i)))||(e=f({src:e,async:!0},t),(t=Sd.get(i))&&Pd(e,t),We(o=n.createElement("script")),ed(o,"link",e),n.head.appendChild(o)),o={type:"script",instance:o,count:1,state:null},r.set(i,o))}},S:function(e,t,n){xd.S(e,t,n);var r=Td;if(r&&e){var i=$e(r).hoistableStyles,o=Od(e);t=t||"default";var s=i.get(o);if(!s){var a={loading:0,preload:null};if(s=r.querySelector(Cd(o)))a.loading=5;else{e=f({rel:"stylesheet",href:e,"data-precedence":t},n),(n=Sd.get(o))&&Md(e,n);var l=s=r.createElement("link");We(l),ed(l,"link",e),l._p=new Promise(function(e,t){l.onload=e,l.onerror=t}),l.addEventListener("load",function(){a.loading|=1}),l.addEventListener("error",function(){a.loading|=2}),a.loading|=4,Fd(s,t,r)}s={type:"stylesheet",instance:s,count:1,state:a},i.set(o,s)}}},M:function(e,t){xd.M(e,t);var n=Td;if(n&&e){var r=$e(n).hoistableScripts,i=Dd(e),o=r.get(i);o||((o=n.querySelector(Ld(i)))||(e=f({src:e,async:!0,type:"module"},t),(t=Sd.get(i))&&Pd(e,t),We(o=n.createElement("script")),ed(o,"link",e),n.head.appendChild(o)),o={type:"script",instance:o,count:1,state:null},r.set(i,o))}}};var Td="undefined"===typeof document?null:document;function Ed(e,t,n){var r=Td;if(r&&"string"===typeof t&&t){var i=yt(t);i='link[rel="'+e+'"][href="'+i+'"]',"string"===typeof n&&(i+='[crossorigin="'+n+'"]'),kd.has(i)||(kd.add(i),e={rel:e,crossOrigin:n,href:t},null===r.querySelector(i)&&(ed(t=r.createElement("link"),"link",e),We(t),r.head.appendChild(t)))}}function Ad(e,t,n,r){var i,o,a,l,u=(u=$.current)?Id(u):null;if(!u)throw Error(s(446));switch(e){case"meta":case"title":return null;case"style":return"string"===typeof n.precedence&&"string"===typeof n.href?(t=Od(n.href),(r=(n=$e(u).hoistableStyles).get(t))||(r={type:"style",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};case"link":if("stylesheet"===n.rel&&"string"===typeof n.href&&"string"===typeof n.precedence){e=Od(n.href);var c=$e(u).hoistableStyles,d=c.get(e);if(d||(u=u.ownerDocument||u,d={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},c.set(e,d),(c=u.querySelector(Cd(e)))&&!c._p&&(d.instance=c,d.state.loading=5),Sd.has(e)||(n={rel:"preload",as:"style",href:n.href,crossOrigin:n.crossOrigin,integrity:n.integrity,media:n.media,hrefLang:n.hrefLang,referrerPolicy:n.referrerPolicy},Sd.set(e,n),c||(i=u,o=e,a=n,l=d.state,i.querySelector('link[rel="preload"][as="style"]['+o+"]")?l.loading=1:(o=i.createElement("link"),l.preload=o,o.addEventListener("load",function(){return l.loading|=1}),o.addEventListener("error",function(){return l.loading|=2}),ed(o,"link",a),We(o),i.head.appendChild(o))))),t&&null===r)throw Error(s(528,""));return d}if(t&&null!==r)throw Error(s(529,""));return null;case"script":return t=n.async,"string"===typeof(n=n.src)&&t&&"function"!==typeof t&&"symbol"!==typeof t?(t=Dd(n),(r=(n=$e(u).hoistableScripts).get(t))||(r={type:"script",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};default:throw Error(s(444,e))}}function Od(e){return'href="'+yt(e)+'"'}function Cd(e){return'link[rel="stylesheet"]['+e+"]"}function Nd(e){return f({},e,{"data-precedence":e.precedence,precedence:null})}function Dd(e){return'[src="'+yt(e)+'"]'}function Ld(e){return"script[async]"+e}function Bd(e,t,n){if(t.count++,null===t.instance)switch(t.type){case"style":var r=e.querySelector('style[data-href~="'+yt(n.href)+'"]');if(r)return t.instance=r,We(r),r;var i=f({},n,{"data-href":n.href,"data-precedence":n.precedence,href:null,precedence:null});return We(r=(e.ownerDocument||e).createElement("style")),ed(r,"style",i),Fd(r,n.precedence,e),t.instance=r;case"stylesheet":i=Od(n.href);var o=e.querySelector(Cd(i));if(o)return t.state.loading|=4,t.instance=o,We(o),o;r=Nd(n),(i=Sd.get(i))&&Md(r,i),We(o=(e.ownerDocument||e).createElement("link"));var a=o;return a._p=new Promise(function(e,t){a.onload=e,a.onerror=t}),ed(o,"link",r),t.state.loading|=4,Fd(o,n.precedence,e),t.instance=o;case"script":return o=Dd(n.src),(i=e.querySelector(Ld(o)))?(t.instance=i,We(i),i):(r=n,(i=Sd.get(o))&&Pd(r=f({},n),i),We(i=(e=e.ownerDocument||e).createElement("script")),ed(i,"link",r),e.head.appendChild(i),t.instance=i);case"void":return null;default:throw Error(s(443,t.type))}else"stylesheet"===t.type&&0===(4&t.state.loading)&&(r=t.instance,t.state.loading|=4,Fd(r,n.precedence,e));return t.instance}function Fd(e,t,n){for(var r=n.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),i=r.length?r[r.length-1]:null,o=i,s=0;s<r.length;s++){var a=r[s];if(a.dataset.precedence===t)o=a;else if(o!==i)break}o?o.parentNode.insertBefore(e,o.nextSibling):(t=9===n.nodeType?n.head:n).insertBefore(e,t.firstChild)}function Md(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.title&&(e.title=t.title)}function Pd(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.integrity&&(e.integrity=t.integrity)}var zd=null;function Ud(e,t,n){if(null===zd){var r=new Map,i=zd=new Map;i.set(n,r)}else(r=(i=zd).get(n))||(r=new Map,i.set(n,r));if(r.has(e))return r;for(r.set(e,null),n=n.getElementsByTagName(e),i=0;i<n.length;i++){var o=n[i];if(!(o[Ue]||o[De]||"link"===e&&"stylesheet"===o.getAttribute("rel"))&&"http://www.w3.org/2000/svg"!==o.namespaceURI){var s=o.getAttribute(t)||"";s=e+s;var a=r.get(s);a?a.push(o):r.set(s,[o])}}return r}function Rd(e,t,n){(e=e.ownerDocument||e).head.insertBefore(n,"title"===t?e.querySelector("head > title"):null)}function jd(e){return"stylesheet"!==e.type||0!==(3&e.state.loading)}var Vd=null;function Hd(){}function $d(){if(this.count--,0===this.count)if(this.stylesheets)Yd(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}var Wd=null;function Yd(e,t){e.stylesheets=null,null!==e.unsuspend&&(e.count++,Wd=new Map,t.forEach(qd,e),Wd=null,$d.call(e))}function qd(e,t){if(!(4&t.state.loading)){var n=Wd.get(e);if(n)var r=n.get(null);else{n=new Map,Wd.set(e,n);for(var i=e.querySelectorAll("link[data-precedence],style[data-precedence]"),o=0;o<i.length;o++){var s=i[o];"LINK"!==s.nodeName&&"not all"===s.getAttribute("media")||(n.set(s.dataset.precedence,s),r=s)}r&&n.set(null,r)}s=(i=t.instance).getAttribute("data-precedence"),(o=n.get(s)||r)===r&&n.set(null,i),n.set(s,i),this.count++,r=$d.bind(this),i.addEventListener("load",r),i.addEventListener("error",r),o?o.parentNode.insertBefore(i,o.nextSibling):(e=9===e.nodeType?e.head:e).insertBefore(i,e.firstChild),t.state.loading|=4}}var Qd={$$typeof:_,Provider:null,Consumer:null,_currentValue:M,_currentValue2:M,_threadCount:0};function Kd(e,t,n,r,i,o,s,a){this.tag=1,this.containerInfo=e,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Ie(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ie(0),this.hiddenUpdates=Ie(null),this.identifierPrefix=r,this.onUncaughtError=i,this.onCaughtError=o,this.onRecoverableError=s,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=a,this.incompleteTransitions=new Map}function Gd(e,t,n,r,i,o,s,a,l,u,c,d){return e=new Kd(e,t,n,s,a,l,u,d),t=1,!0===o&&(t|=24),o=Mr(3,null,null,t),e.current=o,o.stateNode=e,(t=Li()).refCount++,e.pooledCache=t,t.refCount++,o.memoizedState={element:r,isDehydrated:n,cache:t},no(o),e}function Xd(e){return e?e=Br:Br}function Jd(e,t,n,r,i,o){i=Xd(i),null===r.context?r.context=i:r.pendingContext=i,(r=io(t)).payload={element:n},null!==(o=void 0===o?null:o)&&(r.callback=o),null!==(n=oo(e,r,t))&&(Mu(n,0,t),so(n,e,t))}function Zd(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function ef(e,t){Zd(e,t),(e=e.alternate)&&Zd(e,t)}function tf(e){if(13===e.tag){var t=Nr(e,67108864);null!==t&&Mu(t,0,67108864),ef(e,67108864)}}var nf=!0;function rf(e,t,n,r){var i=B.T;B.T=null;var o=F.p;try{F.p=2,sf(e,t,n,r)}finally{F.p=o,B.T=i}}function of(e,t,n,r){var i=B.T;B.T=null;var o=F.p;try{F.p=8,sf(e,t,n,r)}finally{F.p=o,B.T=i}}function sf(e,t,n,r){if(nf){var i=af(r);if(null===i)Vc(e,t,r,lf,n),vf(e,r);else if(function(e,t,n,r,i){switch(t){case"focusin":return ff=wf(ff,e,t,n,r,i),!0;case"dragenter":return hf=wf(hf,e,t,n,r,i),!0;case"mouseover":return pf=wf(pf,e,t,n,r,i),!0;case"pointerover":var o=i.pointerId;return yf.set(o,wf(yf.get(o)||null,e,t,n,r,i)),!0;case"gotpointercapture":return o=i.pointerId,bf.set(o,wf(bf.get(o)||null,e,t,n,r,i)),!0}return!1}(i,e,t,n,r))r.stopPropagation();else if(vf(e,r),4&t&&-1<gf.indexOf(e)){for(;null!==i;){var o=Ve(i);if(null!==o)switch(o.tag){case 3:if((o=o.stateNode).current.memoizedState.isDehydrated){var s=ge(o.pendingLanes);if(0!==s){var a=o;for(a.pendingLanes|=2,a.entangledLanes|=2;s;){var l=1<<31-he(s);a.entanglements[1]|=l,s&=~l}Sc(o),0===(6&nu)&&(Su=te()+500,kc(0,!1))}}break;case 13:null!==(a=Nr(o,2))&&Mu(a,0,2),ju(),ef(o,2)}if(null===(o=af(r))&&Vc(e,t,r,lf,n),o===i)break;i=o}null!==i&&r.stopPropagation()}else Vc(e,t,r,null,n)}}function af(e){return uf(e=Nt(e))}var lf=null;function uf(e){if(lf=null,null!==(e=je(e))){var t=l(e);if(null===t)e=null;else{var n=t.tag;if(13===n){if(null!==(e=u(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return lf=e,null}function cf(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(ne()){case re:return 2;case ie:return 8;case oe:case se:return 32;case ae:return 268435456;default:return 32}default:return 32}}var df=!1,ff=null,hf=null,pf=null,yf=new Map,bf=new Map,mf=[],gf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function vf(e,t){switch(e){case"focusin":case"focusout":ff=null;break;case"dragenter":case"dragleave":hf=null;break;case"mouseover":case"mouseout":pf=null;break;case"pointerover":case"pointerout":yf.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":bf.delete(t.pointerId)}}function wf(e,t,n,r,i,o){return null===e||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[i]},null!==t&&(null!==(t=Ve(t))&&tf(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==i&&-1===t.indexOf(i)&&t.push(i),e)}function _f(e){var t=je(e.target);if(null!==t){var n=l(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=u(n)))return e.blockedOn=t,void function(e,t){var n=F.p;try{return F.p=e,t()}finally{F.p=n}}(e.priority,function(){if(13===n.tag){var e=Bu();e=Ae(e);var t=Nr(n,e);null!==t&&Mu(t,0,e),ef(n,e)}})}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function Sf(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=af(e.nativeEvent);if(null!==n)return null!==(t=Ve(n))&&tf(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);Ct=r,n.target.dispatchEvent(r),Ct=null,t.shift()}return!0}function kf(e,t,n){Sf(e)&&n.delete(t)}function If(){df=!1,null!==ff&&Sf(ff)&&(ff=null),null!==hf&&Sf(hf)&&(hf=null),null!==pf&&Sf(pf)&&(pf=null),yf.forEach(kf),bf.forEach(kf)}function xf(e,t){e.blockedOn===t&&(e.blockedOn=null,df||(df=!0,r.unstable_scheduleCallback(r.unstable_NormalPriority,If)))}var Tf=null;function Ef(e){Tf!==e&&(Tf=e,r.unstable_scheduleCallback(r.unstable_NormalPriority,function(){Tf===e&&(Tf=null);for(var t=0;t<e.length;t+=3){var n=e[t],r=e[t+1],i=e[t+2];if("function"!==typeof r){if(null===uf(r||n))continue;break}var o=Ve(n);null!==o&&(e.splice(t,3),t-=3,Ns(o,{pending:!0,data:i,method:n.method,action:r},r,i))}}))}function Af(e){function t(t){return xf(t,e)}null!==ff&&xf(ff,e),null!==hf&&xf(hf,e),null!==pf&&xf(pf,e),yf.forEach(t),bf.forEach(t);for(var n=0;n<mf.length;n++){var r=mf[n];r.blockedOn===e&&(r.blockedOn=null)}for(;0<mf.length&&null===(n=mf[0]).blockedOn;)_f(n),null===n.blockedOn&&mf.shift();if(null!=(n=(e.ownerDocument||e).$$reactFormReplay))for(r=0;r<n.length;r+=3){var i=n[r],o=n[r+1],s=i[Le]||null;if("function"===typeof o)s||Ef(n);else if(s){var a=null;if(o&&o.hasAttribute("formAction")){if(i=o,s=o[Le]||null)a=s.formAction;else if(null!==uf(i))continue}else a=s.action;"function"===typeof a?n[r+1]=a:(n.splice(r,3),r-=3),Ef(n)}}}function Of(e){this._internalRoot=e}function Cf(e){this._internalRoot=e}Cf.prototype.render=Of.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(s(409));Jd(t.current,Bu(),e,t,null,null)},Cf.prototype.unmount=Of.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;Jd(e.current,2,null,e,null,null),ju(),t[Be]=null}},Cf.prototype.unstable_scheduleHydration=function(e){if(e){var t=Ce();e={blockedOn:null,target:e,priority:t};for(var n=0;n<mf.length&&0!==t&&t<mf[n].priority;n++);mf.splice(n,0,e),0===n&&_f(e)}};var Nf=i.version;if("19.1.1"!==Nf)throw Error(s(527,Nf,"19.1.1"));F.findDOMNode=function(e){var t=e._reactInternals;if(void 0===t){if("function"===typeof e.render)throw Error(s(188));throw e=Object.keys(e).join(","),Error(s(268,e))}return e=function(e){var t=e.alternate;if(!t){if(null===(t=l(e)))throw Error(s(188));return t!==e?null:e}for(var n=e,r=t;;){var i=n.return;if(null===i)break;var o=i.alternate;if(null===o){if(null!==(r=i.return)){n=r;continue}break}if(i.child===o.child){for(o=i.child;o;){if(o===n)return c(i),e;if(o===r)return c(i),t;o=o.sibling}throw Error(s(188))}if(n.return!==r.return)n=i,r=o;else{for(var a=!1,u=i.child;u;){if(u===n){a=!0,n=i,r=o;break}if(u===r){a=!0,r=i,n=o;break}u=u.sibling}if(!a){for(u=o.child;u;){if(u===n){a=!0,n=o,r=i;break}if(u===r){a=!0,r=o,n=i;break}u=u.sibling}if(!a)throw Error(s(189))}}if(n.alternate!==r)throw Error(s(190))}if(3!==n.tag)throw Error(s(188));return n.stateNode.current===n?e:t}(t),e=null===(e=null!==e?d(e):null)?null:e.stateNode};var Df={bundleType:0,version:"19.1.1",rendererPackageName:"react-dom",currentDispatcherRef:B,reconcilerVersion:"19.1.1"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var Lf=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Lf.isDisabled&&Lf.supportsFiber)try{ce=Lf.inject(Df),de=Lf}catch(Ff){}}t.createRoot=function(e,t){if(!a(e))throw Error(s(299));var n=!1,r="",i=ga,o=va,l=wa;return null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onUncaughtError&&(i=t.onUncaughtError),void 0!==t.onCaughtError&&(o=t.onCaughtError),void 0!==t.onRecoverableError&&(l=t.onRecoverableError),void 0!==t.unstable_transitionCallbacks&&t.unstable_transitionCallbacks),t=Gd(e,1,!1,null,0,n,r,i,o,l,0,null),e[Be]=t.current,Rc(e),new Of(t)},t.hydrateRoot=function(e,t,n){if(!a(e))throw Error(s(299));var r=!1,i="",o=ga,l=va,u=wa,c=null;return null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(r=!0),void 0!==n.identifierPrefix&&(i=n.identifierPrefix),void 0!==n.onUncaughtError&&(o=n.onUncaughtError),void 0!==n.onCaughtError&&(l=n.onCaughtError),void 0!==n.onRecoverableError&&(u=n.onRecoverableError),void 0!==n.unstable_transitionCallbacks&&n.unstable_transitionCallbacks,void 0!==n.formState&&(c=n.formState)),(t=Gd(e,1,!0,t,0,r,i,o,l,u,0,c)).context=Xd(null),n=t.current,(i=io(r=Ae(r=Bu()))).callback=null,oo(n,i,r),n=r,t.current.lanes=n,xe(t,n),Sc(t),e[Be]=t.current,Rc(e),new Cf(t)},t.version="19.1.1"},43:(e,t,n)=>{e.exports=n(288)},123:e=>{var t=Object.getOwnPropertySymbols,n=Object.prototype.hasOwnProperty,r=Object.prototype.propertyIsEnumerable;e.exports=function(){try{if(!Object.assign)return!1;var e=new String("abc");if(e[5]="de","5"===Object.getOwnPropertyNames(e)[0])return!1;for(var t={},n=0;n<10;n++)t["_"+String.fromCharCode(n)]=n;if("0123456789"!==Object.getOwnPropertyNames(t).map(function(e){return t[e]}).join(""))return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach(function(e){r[e]=e}),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},r)).join("")}catch(i){return!1}}()?Object.assign:function(e,i){for(var o,s,a=function(e){if(null===e||void 0===e)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(e)}(e),l=1;l<arguments.length;l++){for(var u in o=Object(arguments[l]))n.call(o,u)&&(a[u]=o[u]);if(t){s=t(o);for(var c=0;c<s.length;c++)r.call(o,s[c])&&(a[s[c]]=o[s[c]])}}return a}},219:(e,t,n)=>{var r=n(763),i={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},o={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},s={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},a={};function l(e){return r.isMemo(e)?s:a[e.$$typeof]||i}a[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},a[r.Memo]=s;var u=Object.defineProperty,c=Object.getOwnPropertyNames,d=Object.getOwnPropertySymbols,f=Object.getOwnPropertyDescriptor,h=Object.getPrototypeOf,p=Object.prototype;e.exports=function e(t,n,r){if("string"!==typeof n){if(p){var i=h(n);i&&i!==p&&e(t,i,r)}var s=c(n);d&&(s=s.concat(d(n)));for(var a=l(t),y=l(n),b=0;b<s.length;++b){var m=s[b];if(!o[m]&&(!r||!r[m])&&(!y||!y[m])&&(!a||!a[m])){var g=f(n,m);try{u(t,m,g)}catch(v){}}}}return t}},288:(e,t)=>{var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.portal"),i=Symbol.for("react.fragment"),o=Symbol.for("react.strict_mode"),s=Symbol.for("react.profiler"),a=Symbol.for("react.consumer"),l=Symbol.for("react.context"),u=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),d=Symbol.for("react.memo"),f=Symbol.for("react.lazy"),h=Symbol.iterator;var p={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},y=Object.assign,b={};function m(e,t,n){this.props=e,this.context=t,this.refs=b,this.updater=n||p}function g(){}function v(e,t,n){this.props=e,this.context=t,this.refs=b,this.updater=n||p}m.prototype.isReactComponent={},m.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},m.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},g.prototype=m.prototype;var w=v.prototype=new g;w.constructor=v,y(w,m.prototype),w.isPureReactComponent=!0;var _=Array.isArray,S={H:null,A:null,T:null,S:null,V:null},k=Object.prototype.hasOwnProperty;function I(e,t,r,i,o,s){return r=s.ref,{$$typeof:n,type:e,key:t,ref:void 0!==r?r:null,props:s}}function x(e){return"object"===typeof e&&null!==e&&e.$$typeof===n}var T=/\/+/g;function E(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(e){return t[e]})}(""+e.key):t.toString(36)}function A(){}function O(e,t,i,o,s){var a=typeof e;"undefined"!==a&&"boolean"!==a||(e=null);var l,u,c=!1;if(null===e)c=!0;else switch(a){case"bigint":case"string":case"number":c=!0;break;case"object":switch(e.$$typeof){case n:case r:c=!0;break;case f:return O((c=e._init)(e._payload),t,i,o,s)}}if(c)return s=s(e),c=""===o?"."+E(e,0):o,_(s)?(i="",null!=c&&(i=c.replace(T,"$&/")+"/"),O(s,t,i,"",function(e){return e})):null!=s&&(x(s)&&(l=s,u=i+(null==s.key||e&&e.key===s.key?"":(""+s.key).replace(T,"$&/")+"/")+c,s=I(l.type,u,void 0,0,0,l.props)),t.push(s)),1;c=0;var d,p=""===o?".":o+":";if(_(e))for(var y=0;y<e.length;y++)c+=O(o=e[y],t,i,a=p+E(o,y),s);else if("function"===typeof(y=null===(d=e)||"object"!==typeof d?null:"function"===typeof(d=h&&d[h]||d["@@iterator"])?d:null))for(e=y.call(e),y=0;!(o=e.next()).done;)c+=O(o=o.value,t,i,a=p+E(o,y++),s);else if("object"===a){if("function"===typeof e.then)return O(function(e){switch(e.status){case"fulfilled":return e.value;case"rejected":throw e.reason;default:switch("string"===typeof e.status?e.then(A,A):(e.status="pending",e.then(function(t){"pending"===e.status&&(e.status="fulfilled",e.value=t)},function(t){"pending"===e.status&&(e.status="rejected",e.reason=t)})),e.status){case"fulfilled":return e.value;case"rejected":throw e.reason}}throw e}(e),t,i,o,s);throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.")}return c}function C(e,t,n){if(null==e)return e;var r=[],i=0;return O(e,r,"","",function(e){return t.call(n,e,i++)}),r}function N(e){if(-1===e._status){var t=e._result;(t=t()).then(function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)},function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)}),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var D="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function L(){}t.Children={map:C,forEach:function(e,t,n){C(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return C(e,function(){t++}),t},toArray:function(e){return C(e,function(e){return e})||[]},only:function(e){if(!x(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=m,t.Fragment=i,t.Profiler=s,t.PureComponent=v,t.StrictMode=o,t.Suspense=c,t.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=S,t.__COMPILER_RUNTIME={__proto__:null,c:function(e){return S.H.useMemoCache(e)}},t.cache=function(e){return function(){return e.apply(null,arguments)}},t.cloneElement=function(e,t,n){if(null===e||void 0===e)throw Error("The argument must be a React element, but you passed "+e+".");var r=y({},e.props),i=e.key;if(null!=t)for(o in void 0!==t.ref&&void 0,void 0!==t.key&&(i=""+t.key),t)!k.call(t,o)||"key"===o||"__self"===o||"__source"===o||"ref"===o&&void 0===t.ref||(r[o]=t[o]);var o=arguments.length-2;if(1===o)r.children=n;else if(1<o){for(var s=Array(o),a=0;a<o;a++)s[a]=arguments[a+2];r.children=s}return I(e.type,i,void 0,0,0,r)},t.createContext=function(e){return(e={$$typeof:l,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider=e,e.Consumer={$$typeof:a,_context:e},e},t.createElement=function(e,t,n){var r,i={},o=null;if(null!=t)for(r in void 0!==t.key&&(o=""+t.key),t)k.call(t,r)&&"key"!==r&&"__self"!==r&&"__source"!==r&&(i[r]=t[r]);var s=arguments.length-2;if(1===s)i.children=n;else if(1<s){for(var a=Array(s),l=0;l<s;l++)a[l]=arguments[l+2];i.children=a}if(e&&e.defaultProps)for(r in s=e.defaultProps)void 0===i[r]&&(i[r]=s[r]);return I(e,o,void 0,0,0,i)},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:u,render:e}},t.isValidElement=x,t.lazy=function(e){return{$$typeof:f,_payload:{_status:-1,_result:e},_init:N}},t.memo=function(e,t){return{$$typeof:d,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=S.T,n={};S.T=n;try{var r=e(),i=S.S;null!==i&&i(n,r),"object"===typeof r&&null!==r&&"function"===typeof r.then&&r.then(L,D)}catch(o){D(o)}finally{S.T=t}},t.unstable_useCacheRefresh=function(){return S.H.useCacheRefresh()},t.use=function(e){return S.H.use(e)},t.useActionState=function(e,t,n){return S.H.useActionState(e,t,n)},t.useCallback=function(e,t){return S.H.useCallback(e,t)},t.useContext=function(e){return S.H.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e,t){return S.H.useDeferredValue(e,t)},t.useEffect=function(e,t,n){var r=S.H;if("function"===typeof n)throw Error("useEffect CRUD overload is not enabled in this build of React.");return r.useEffect(e,t)},t.useId=function(){return S.H.useId()},t.useImperativeHandle=function(e,t,n){return S.H.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return S.H.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return S.H.useLayoutEffect(e,t)},t.useMemo=function(e,t){return S.H.useMemo(e,t)},t.useOptimistic=function(e,t){return S.H.useOptimistic(e,t)},t.useReducer=function(e,t,n){return S.H.useReducer(e,t,n)},t.useRef=function(e){return S.H.useRef(e)},t.useState=function(e){return S.H.useState(e)},t.useSyncExternalStore=function(e,t,n){return S.H.useSyncExternalStore(e,t,n)},t.useTransition=function(){return S.H.useTransition()},t.version="19.1.1"},391:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(4)},579:(e,t,n)=>{e.exports=n(799)},672:(e,t,n)=>{var r=n(43);function i(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function o(){}var s={d:{f:o,r:function(){throw Error(i(522))},D:o,C:o,L:o,m:o,X:o,S:o,M:o},p:0,findDOMNode:null},a=Symbol.for("react.portal");var l=r.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function u(e,t){return"font"===e?"":"string"===typeof t?"use-credentials"===t?t:"":void 0}t.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=s,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!t||1!==t.nodeType&&9!==t.nodeType&&11!==t.nodeType)throw Error(i(299));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:a,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.flushSync=function(e){var t=l.T,n=s.p;try{if(l.T=null,s.p=2,e)return e()}finally{l.T=t,s.p=n,s.d.f()}},t.preconnect=function(e,t){"string"===typeof e&&(t?t="string"===typeof(t=t.crossOrigin)?"use-credentials"===t?t:"":void 0:t=null,s.d.C(e,t))},t.prefetchDNS=function(e){"string"===typeof e&&s.d.D(e)},t.preinit=function(e,t){if("string"===typeof e&&t&&"string"===typeof t.as){var n=t.as,r=u(n,t.crossOrigin),i="string"===typeof t.integrity?t.integrity:void 0,o="string"===typeof t.fetchPriority?t.fetchPriority:void 0;"style"===n?s.d.S(e,"string"===typeof t.precedence?t.precedence:void 0,{crossOrigin:r,integrity:i,fetchPriority:o}):"script"===n&&s.d.X(e,{crossOrigin:r,integrity:i,fetchPriority:o,nonce:"string"===typeof t.nonce?t.nonce:void 0})}},t.preinitModule=function(e,t){if("string"===typeof e)if("object"===typeof t&&null!==t){if(null==t.as||"script"===t.as){var n=u(t.as,t.crossOrigin);s.d.M(e,{crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0})}}else null==t&&s.d.M(e)},t.preload=function(e,t){if("string"===typeof e&&"object"===typeof t&&null!==t&&"string"===typeof t.as){var n=t.as,r=u(n,t.crossOrigin);s.d.L(e,n,{crossOrigin:r,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0,type:"string"===typeof t.type?t.type:void 0,fetchPriority:"string"===typeof t.fetchPriority?t.fetchPriority:void 0,referrerPolicy:"string"===typeof t.referrerPolicy?t.referrerPolicy:void 0,imageSrcSet:"string"===typeof t.imageSrcSet?t.imageSrcSet:void 0,imageSizes:"string"===typeof t.imageSizes?t.imageSizes:void 0,media:"string"===typeof t.media?t.media:void 0})}},t.preloadModule=function(e,t){if("string"===typeof e)if(t){var n=u(t.as,t.crossOrigin);s.d.m(e,{as:"string"===typeof t.as&&"script"!==t.as?t.as:void 0,crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0})}else s.d.m(e)},t.requestFormReset=function(e){s.d.r(e)},t.unstable_batchedUpdates=function(e,t){return e(t)},t.useFormState=function(e,t,n){return l.H.useFormState(e,t,n)},t.useFormStatus=function(){return l.H.useHostTransitionStatus()},t.version="19.1.1"},739:(e,t,n)=>{var r=n(123),i="function"===typeof Symbol&&Symbol.for,o=i?Symbol.for("react.element"):60103,s=i?Symbol.for("react.portal"):60106,a=i?Symbol.for("react.fragment"):60107,l=i?Symbol.for("react.strict_mode"):60108,u=i?Symbol.for("react.profiler"):60114,c=i?Symbol.for("react.provider"):60109,d=i?Symbol.for("react.context"):60110,f=i?Symbol.for("react.forward_ref"):60112,h=i?Symbol.for("react.suspense"):60113,p=i?Symbol.for("react.memo"):60115,y=i?Symbol.for("react.lazy"):60116,b="function"===typeof Symbol&&Symbol.iterator;function m(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var g={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},v={};function w(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||g}function _(){}function S(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||g}w.prototype.isReactComponent={},w.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error(m(85));this.updater.enqueueSetState(this,e,t,"setState")},w.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},_.prototype=w.prototype;var k=S.prototype=new _;k.constructor=S,r(k,w.prototype),k.isPureReactComponent=!0;var I={current:null},x=Object.prototype.hasOwnProperty,T={key:!0,ref:!0,__self:!0,__source:!0};function E(e,t,n){var r,i={},s=null,a=null;if(null!=t)for(r in void 0!==t.ref&&(a=t.ref),void 0!==t.key&&(s=""+t.key),t)x.call(t,r)&&!T.hasOwnProperty(r)&&(i[r]=t[r]);var l=arguments.length-2;if(1===l)i.children=n;else if(1<l){for(var u=Array(l),c=0;c<l;c++)u[c]=arguments[c+2];i.children=u}if(e&&e.defaultProps)for(r in l=e.defaultProps)void 0===i[r]&&(i[r]=l[r]);return{$$typeof:o,type:e,key:s,ref:a,props:i,_owner:I.current}}function A(e){return"object"===typeof e&&null!==e&&e.$$typeof===o}var O=/\/+/g,C=[];function N(e,t,n,r){if(C.length){var i=C.pop();return i.result=e,i.keyPrefix=t,i.func=n,i.context=r,i.count=0,i}return{result:e,keyPrefix:t,func:n,context:r,count:0}}function D(e){e.result=null,e.keyPrefix=null,e.func=null,e.context=null,e.count=0,10>C.length&&C.push(e)}function L(e,t,n,r){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var a=!1;if(null===e)a=!0;else switch(i){case"string":case"number":a=!0;break;case"object":switch(e.$$typeof){case o:case s:a=!0}}if(a)return n(r,e,""===t?"."+F(e,0):t),1;if(a=0,t=""===t?".":t+":",Array.isArray(e))for(var l=0;l<e.length;l++){var u=t+F(i=e[l],l);a+=L(i,u,n,r)}else if(null===e||"object"!==typeof e?u=null:u="function"===typeof(u=b&&e[b]||e["@@iterator"])?u:null,"function"===typeof u)for(e=u.call(e),l=0;!(i=e.next()).done;)a+=L(i=i.value,u=t+F(i,l++),n,r);else if("object"===i)throw n=""+e,Error(m(31,"[object Object]"===n?"object with keys {"+Object.keys(e).join(", ")+"}":n,""));return a}function B(e,t,n){return null==e?0:L(e,"",t,n)}function F(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+(""+e).replace(/[=:]/g,function(e){return t[e]})}(e.key):t.toString(36)}function M(e,t){e.func.call(e.context,t,e.count++)}function P(e,t,n){var r=e.result,i=e.keyPrefix;e=e.func.call(e.context,t,e.count++),Array.isArray(e)?z(e,r,n,function(e){return e}):null!=e&&(A(e)&&(e=function(e,t){return{$$typeof:o,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(e,i+(!e.key||t&&t.key===e.key?"":(""+e.key).replace(O,"$&/")+"/")+n)),r.push(e))}function z(e,t,n,r,i){var o="";null!=n&&(o=(""+n).replace(O,"$&/")+"/"),B(e,P,t=N(t,o,r,i)),D(t)}var U={current:null};function R(){var e=U.current;if(null===e)throw Error(m(321));return e}var j={ReactCurrentDispatcher:U,ReactCurrentBatchConfig:{suspense:null},ReactCurrentOwner:I,IsSomeRendererActing:{current:!1},assign:r};t.Children={map:function(e,t,n){if(null==e)return e;var r=[];return z(e,r,null,t,n),r},forEach:function(e,t,n){if(null==e)return e;B(e,M,t=N(null,null,t,n)),D(t)},count:function(e){return B(e,function(){return null},null)},toArray:function(e){var t=[];return z(e,t,null,function(e){return e}),t},only:function(e){if(!A(e))throw Error(m(143));return e}},t.Component=w,t.Fragment=a,t.Profiler=u,t.PureComponent=S,t.StrictMode=l,t.Suspense=h,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=j,t.cloneElement=function(e,t,n){if(null===e||void 0===e)throw Error(m(267,e));var i=r({},e.props),s=e.key,a=e.ref,l=e._owner;if(null!=t){if(void 0!==t.ref&&(a=t.ref,l=I.current),void 0!==t.key&&(s=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(c in t)x.call(t,c)&&!T.hasOwnProperty(c)&&(i[c]=void 0===t[c]&&void 0!==u?u[c]:t[c])}var c=arguments.length-2;if(1===c)i.children=n;else if(1<c){u=Array(c);for(var d=0;d<c;d++)u[d]=arguments[d+2];i.children=u}return{$$typeof:o,type:e.type,key:s,ref:a,props:i,_owner:l}},t.createContext=function(e,t){return void 0===t&&(t=null),(e={$$typeof:d,_calculateChangedBits:t,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider={$$typeof:c,_context:e},e.Consumer=e},t.createElement=E,t.createFactory=function(e){var t=E.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:f,render:e}},t.isValidElement=A,t.lazy=function(e){return{$$typeof:y,_ctor:e,_status:-1,_result:null}},t.memo=function(e,t){return{$$typeof:p,type:e,compare:void 0===t?null:t}},t.useCallback=function(e,t){return R().useCallback(e,t)},t.useContext=function(e,t){return R().useContext(e,t)},t.useDebugValue=function(){},t.useEffect=function(e,t){return R().useEffect(e,t)},t.useImperativeHandle=function(e,t,n){return R().useImperativeHandle(e,t,n)},t.useLayoutEffect=function(e,t){return R().useLayoutEffect(e,t)},t.useMemo=function(e,t){return R().useMemo(e,t)},t.useReducer=function(e,t,n){return R().useReducer(e,t,n)},t.useRef=function(e){return R().useRef(e)},t.useState=function(e){return R().useState(e)},t.version="16.14.0"},763:(e,t,n)=>{e.exports=n(983)},799:(e,t)=>{var n=Symbol.for("react.transitional.element");function r(e,t,r){var i=null;if(void 0!==r&&(i=""+r),void 0!==t.key&&(i=""+t.key),"key"in t)for(var o in r={},t)"key"!==o&&(r[o]=t[o]);else r=t;return t=r.ref,{$$typeof:n,type:e,key:i,ref:void 0!==t?t:null,props:r}}Symbol.for("react.fragment"),t.jsx=r,t.jsxs=r},853:(e,t,n)=>{e.exports=n(896)},896:(e,t)=>{function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,i=e[r];if(!(0<o(i,t)))break e;e[r]=t,e[n]=i,n=r}}function r(e){return 0===e.length?null:e[0]}function i(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,i=e.length,s=i>>>1;r<s;){var a=2*(r+1)-1,l=e[a],u=a+1,c=e[u];if(0>o(l,n))u<i&&0>o(c,l)?(e[r]=c,e[u]=n,r=u):(e[r]=l,e[a]=n,r=a);else{if(!(u<i&&0>o(c,n)))break e;e[r]=c,e[u]=n,r=u}}}return t}function o(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if(t.unstable_now=void 0,"object"===typeof performance&&"function"===typeof performance.now){var s=performance;t.unstable_now=function(){return s.now()}}else{var a=Date,l=a.now();t.unstable_now=function(){return a.now()-l}}var u=[],c=[],d=1,f=null,h=3,p=!1,y=!1,b=!1,m=!1,g="function"===typeof setTimeout?setTimeout:null,v="function"===typeof clearTimeout?clearTimeout:null,w="undefined"!==typeof setImmediate?setImmediate:null;function _(e){for(var t=r(c);null!==t;){if(null===t.callback)i(c);else{if(!(t.startTime<=e))break;i(c),t.sortIndex=t.expirationTime,n(u,t)}t=r(c)}}function S(e){if(b=!1,_(e),!y)if(null!==r(u))y=!0,I||(I=!0,k());else{var t=r(c);null!==t&&D(S,t.startTime-e)}}var k,I=!1,x=-1,T=5,E=-1;function A(){return!!m||!(t.unstable_now()-E<T)}function O(){if(m=!1,I){var e=t.unstable_now();E=e;var n=!0;try{e:{y=!1,b&&(b=!1,v(x),x=-1),p=!0;var o=h;try{t:{for(_(e),f=r(u);null!==f&&!(f.expirationTime>e&&A());){var s=f.callback;if("function"===typeof s){f.callback=null,h=f.priorityLevel;var a=s(f.expirationTime<=e);if(e=t.unstable_now(),"function"===typeof a){f.callback=a,_(e),n=!0;break t}f===r(u)&&i(u),_(e)}else i(u);f=r(u)}if(null!==f)n=!0;else{var l=r(c);null!==l&&D(S,l.startTime-e),n=!1}}break e}finally{f=null,h=o,p=!1}n=void 0}}finally{n?k():I=!1}}}if("function"===typeof w)k=function(){w(O)};else if("undefined"!==typeof MessageChannel){var C=new MessageChannel,N=C.port2;C.port1.onmessage=O,k=function(){N.postMessage(null)}}else k=function(){g(O,0)};function D(e,n){x=g(function(){e(t.unstable_now())},n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):T=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return h},t.unstable_next=function(e){switch(h){case 1:case 2:case 3:var t=3;break;default:t=h}var n=h;h=t;try{return e()}finally{h=n}},t.unstable_requestPaint=function(){m=!0},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=h;h=e;try{return t()}finally{h=n}},t.unstable_scheduleCallback=function(e,i,o){var s=t.unstable_now();switch("object"===typeof o&&null!==o?o="number"===typeof(o=o.delay)&&0<o?s+o:s:o=s,e){case 1:var a=-1;break;case 2:a=250;break;case 5:a=1073741823;break;case 4:a=1e4;break;default:a=5e3}return e={id:d++,callback:i,priorityLevel:e,startTime:o,expirationTime:a=o+a,sortIndex:-1},o>s?(e.sortIndex=o,n(c,e),null===r(u)&&e===r(c)&&(b?(v(x),x=-1):b=!0,D(S,o-s))):(e.sortIndex=a,n(u,e),y||p||(y=!0,I||(I=!0,k()))),e},t.unstable_shouldYield=A,t.unstable_wrapCallback=function(e){var t=h;return function(){var n=h;h=t;try{return e.apply(this,arguments)}finally{h=n}}}},904:(e,t,n)=>{e.exports=n(739)},950:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(672)},983:(e,t)=>{var n="function"===typeof Symbol&&Symbol.for,r=n?Symbol.for("react.element"):60103,i=n?Symbol.for("react.portal"):60106,o=n?Symbol.for("react.fragment"):60107,s=n?Symbol.for("react.strict_mode"):60108,a=n?Symbol.for("react.profiler"):60114,l=n?Symbol.for("react.provider"):60109,u=n?Symbol.for("react.context"):60110,c=n?Symbol.for("react.async_mode"):60111,d=n?Symbol.for("react.concurrent_mode"):60111,f=n?Symbol.for("react.forward_ref"):60112,h=n?Symbol.for("react.suspense"):60113,p=n?Symbol.for("react.suspense_list"):60120,y=n?Symbol.for("react.memo"):60115,b=n?Symbol.for("react.lazy"):60116,m=n?Symbol.for("react.block"):60121,g=n?Symbol.for("react.fundamental"):60117,v=n?Symbol.for("react.responder"):60118,w=n?Symbol.for("react.scope"):60119;function _(e){if("object"===typeof e&&null!==e){var t=e.$$typeof;switch(t){case r:switch(e=e.type){case c:case d:case o:case a:case s:case h:return e;default:switch(e=e&&e.$$typeof){case u:case f:case b:case y:case l:return e;default:return t}}case i:return t}}}function S(e){return _(e)===d}t.AsyncMode=c,t.ConcurrentMode=d,t.ContextConsumer=u,t.ContextProvider=l,t.Element=r,t.ForwardRef=f,t.Fragment=o,t.Lazy=b,t.Memo=y,t.Portal=i,t.Profiler=a,t.StrictMode=s,t.Suspense=h,t.isAsyncMode=function(e){return S(e)||_(e)===c},t.isConcurrentMode=S,t.isContextConsumer=function(e){return _(e)===u},t.isContextProvider=function(e){return _(e)===l},t.isElement=function(e){return"object"===typeof e&&null!==e&&e.$$typeof===r},t.isForwardRef=function(e){return _(e)===f},t.isFragment=function(e){return _(e)===o},t.isLazy=function(e){return _(e)===b},t.isMemo=function(e){return _(e)===y},t.isPortal=function(e){return _(e)===i},t.isProfiler=function(e){return _(e)===a},t.isStrictMode=function(e){return _(e)===s},t.isSuspense=function(e){return _(e)===h},t.isValidElementType=function(e){return"string"===typeof e||"function"===typeof e||e===o||e===d||e===a||e===s||e===h||e===p||"object"===typeof e&&null!==e&&(e.$$typeof===b||e.$$typeof===y||e.$$typeof===l||e.$$typeof===u||e.$$typeof===f||e.$$typeof===g||e.$$typeof===v||e.$$typeof===w||e.$$typeof===m)},t.typeOf=_}},t={};function n(r){var i=t[r];if(void 0!==i)return i.exports;var o=t[r]={exports:{}};return e[r](o,o.exports,n),o.exports}n.m=e,n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.f={},n.e=e=>Promise.all(Object.keys(n.f).reduce((t,r)=>(n.f[r](e,t),t),[])),n.u=e=>"static/js/"+e+".28b203fe.chunk.js",n.miniCssF=e=>{},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),(()=>{var e={},t="react-frontend:";n.l=(r,i,o,s)=>{if(e[r])e[r].push(i);else{var a,l;if(void 0!==o)for(var u=document.getElementsByTagName("script"),c=0;c<u.length;c++){var d=u[c];if(d.getAttribute("src")==r||d.getAttribute("data-webpack")==t+o){a=d;break}}a||(l=!0,(a=document.createElement("script")).charset="utf-8",a.timeout=120,n.nc&&a.setAttribute("nonce",n.nc),a.setAttribute("data-webpack",t+o),a.src=r),e[r]=[i];var f=(t,n)=>{a.onerror=a.onload=null,clearTimeout(h);var i=e[r];if(delete e[r],a.parentNode&&a.parentNode.removeChild(a),i&&i.forEach(e=>e(n)),t)return t(n)},h=setTimeout(f.bind(null,void 0,{type:"timeout",target:a}),12e4);a.onerror=f.bind(null,a.onerror),a.onload=f.bind(null,a.onload),l&&document.head.appendChild(a)}}})(),n.r=e=>{"undefined"!==typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},n.p="/",(()=>{var e={792:0};n.f.j=(t,r)=>{var i=n.o(e,t)?e[t]:void 0;if(0!==i)if(i)r.push(i[2]);else{var o=new Promise((n,r)=>i=e[t]=[n,r]);r.push(i[2]=o);var s=n.p+n.u(t),a=new Error;n.l(s,r=>{if(n.o(e,t)&&(0!==(i=e[t])&&(e[t]=void 0),i)){var o=r&&("load"===r.type?"missing":r.type),s=r&&r.target&&r.target.src;a.message="Loading chunk "+t+" failed.\n("+o+": "+s+")",a.name="ChunkLoadError",a.type=o,a.request=s,i[1](a)}},"chunk-"+t,t)}};var t=(t,r)=>{var i,o,s=r[0],a=r[1],l=r[2],u=0;if(s.some(t=>0!==e[t])){for(i in a)n.o(a,i)&&(n.m[i]=a[i]);if(l)l(n)}for(t&&t(r);u<s.length;u++)o=s[u],n.o(e,o)&&e[o]&&e[o][0](),e[o]=0},r=self.webpackChunkreact_frontend=self.webpackChunkreact_frontend||[];r.forEach(t.bind(null,0)),r.push=t.bind(null,r.push.bind(r))})();var r,i,o,s,a,l,u,c,d,f=n(43),h=n(391),p=n(219),y=n.n(p),b=n(904);!function(e){e[e.V1=0]="V1",e[e.V2=1]="V2",e[e.V3=2]="V3",e[e.V4=3]="V4",e[e.V5=4]="V5"}(r||(r={})),function(e){e[e.Sparse=0]="Sparse",e[e.Dense=1]="Dense"}(i||(i={})),function(e){e[e.HALF=0]="HALF",e[e.SINGLE=1]="SINGLE",e[e.DOUBLE=2]="DOUBLE"}(o||(o={})),function(e){e[e.DAY=0]="DAY",e[e.MILLISECOND=1]="MILLISECOND"}(s||(s={})),function(e){e[e.SECOND=0]="SECOND",e[e.MILLISECOND=1]="MILLISECOND",e[e.MICROSECOND=2]="MICROSECOND",e[e.NANOSECOND=3]="NANOSECOND"}(a||(a={})),function(e){e[e.YEAR_MONTH=0]="YEAR_MONTH",e[e.DAY_TIME=1]="DAY_TIME",e[e.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"}(l||(l={})),function(e){e[e.NONE=0]="NONE",e[e.Schema=1]="Schema",e[e.DictionaryBatch=2]="DictionaryBatch",e[e.RecordBatch=3]="RecordBatch",e[e.Tensor=4]="Tensor",e[e.SparseTensor=5]="SparseTensor"}(u||(u={})),function(e){e[e.NONE=0]="NONE",e[e.Null=1]="Null",e[e.Int=2]="Int",e[e.Float=3]="Float",e[e.Binary=4]="Binary",e[e.Utf8=5]="Utf8",e[e.Bool=6]="Bool",e[e.Decimal=7]="Decimal",e[e.Date=8]="Date",e[e.Time=9]="Time",e[e.Timestamp=10]="Timestamp",e[e.Interval=11]="Interval",e[e.List=12]="List",e[e.Struct=13]="Struct",e[e.Union=14]="Union",e[e.FixedSizeBinary=15]="FixedSizeBinary",e[e.FixedSizeList=16]="FixedSizeList",e[e.Map=17]="Map",e[e.Dictionary=-1]="Dictionary",e[e.Int8=-2]="Int8",e[e.Int16=-3]="Int16",e[e.Int32=-4]="Int32",e[e.Int64=-5]="Int64",e[e.Uint8=-6]="Uint8",e[e.Uint16=-7]="Uint16",e[e.Uint32=-8]="Uint32",e[e.Uint64=-9]="Uint64",e[e.Float16=-10]="Float16",e[e.Float32=-11]="Float32",e[e.Float64=-12]="Float64",e[e.DateDay=-13]="DateDay",e[e.DateMillisecond=-14]="DateMillisecond",e[e.TimestampSecond=-15]="TimestampSecond",e[e.TimestampMillisecond=-16]="TimestampMillisecond",e[e.TimestampMicrosecond=-17]="TimestampMicrosecond",e[e.TimestampNanosecond=-18]="TimestampNanosecond",e[e.TimeSecond=-19]="TimeSecond",e[e.TimeMillisecond=-20]="TimeMillisecond",e[e.TimeMicrosecond=-21]="TimeMicrosecond",e[e.TimeNanosecond=-22]="TimeNanosecond",e[e.DenseUnion=-23]="DenseUnion",e[e.SparseUnion=-24]="SparseUnion",e[e.IntervalDayTime=-25]="IntervalDayTime",e[e.IntervalYearMonth=-26]="IntervalYearMonth"}(c||(c={})),function(e){e[e.OFFSET=0]="OFFSET",e[e.DATA=1]="DATA",e[e.VALIDITY=2]="VALIDITY",e[e.TYPE=3]="TYPE"}(d||(d={}));const[m,g]=(()=>{const e=()=>{throw new Error("BigInt is not available in this environment")};function t(){throw e()}return t.asIntN=()=>{throw e()},t.asUintN=()=>{throw e()},"undefined"!==typeof BigInt?[BigInt,!0]:[t,!1]})(),[v,w]=(()=>{const e=()=>{throw new Error("BigInt64Array is not available in this environment")};return"undefined"!==typeof BigInt64Array?[BigInt64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw e()}static from(){throw e()}constructor(){throw e()}},!1]})(),[_,S]=(()=>{const e=()=>{throw new Error("BigUint64Array is not available in this environment")};return"undefined"!==typeof BigUint64Array?[BigUint64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw e()}static from(){throw e()}constructor(){throw e()}},!1]})(),k=e=>"number"===typeof e,I=e=>"boolean"===typeof e,x=e=>"function"===typeof e,T=e=>null!=e&&Object(e)===e,E=e=>T(e)&&x(e.then),A=e=>T(e)&&x(e[Symbol.iterator]),O=e=>T(e)&&x(e[Symbol.asyncIterator]),C=e=>T(e)&&T(e.schema),N=e=>T(e)&&"done"in e&&"value"in e,D=e=>T(e)&&x(e.stat)&&k(e.fd),L=e=>T(e)&&F(e.body),B=e=>"_getDOMStream"in e&&"_getNodeStream"in e,F=e=>T(e)&&x(e.cancel)&&x(e.getReader)&&!B(e),M=e=>T(e)&&x(e.read)&&x(e.pipe)&&I(e.readable)&&!B(e);function P(e){if(null===e)return"null";if(undefined===e)return"undefined";switch(typeof e){case"number":case"bigint":return"".concat(e);case"string":return'"'.concat(e,'"')}return"function"===typeof e[Symbol.toPrimitive]?e[Symbol.toPrimitive]("string"):ArrayBuffer.isView(e)?"[".concat(e instanceof v||e instanceof _?[...e].map(e=>P(e)):e,"]"):ArrayBuffer.isView(e)?"[".concat(e,"]"):JSON.stringify(e,(e,t)=>"bigint"===typeof t?"".concat(t):t)}function z(e,t,n,r){return new(n||(n=Promise))(function(i,o){function s(e){try{l(r.next(e))}catch(t){o(t)}}function a(e){try{l(r.throw(e))}catch(t){o(t)}}function l(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n(function(e){e(t)})).then(s,a)}l((r=r.apply(e,t||[])).next())})}Object.create;function U(e){var t="function"===typeof Symbol&&Symbol.iterator,n=t&&e[t],r=0;if(n)return n.call(e);if(e&&"number"===typeof e.length)return{next:function(){return e&&r>=e.length&&(e=void 0),{value:e&&e[r++],done:!e}}};throw new TypeError(t?"Object is not iterable.":"Symbol.iterator is not defined.")}function R(e){return this instanceof R?(this.v=e,this):new R(e)}function j(e,t,n){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var r,i=n.apply(e,t||[]),o=[];return r=Object.create(("function"===typeof AsyncIterator?AsyncIterator:Object).prototype),s("next"),s("throw"),s("return",function(e){return function(t){return Promise.resolve(t).then(e,u)}}),r[Symbol.asyncIterator]=function(){return this},r;function s(e,t){i[e]&&(r[e]=function(t){return new Promise(function(n,r){o.push([e,t,n,r])>1||a(e,t)})},t&&(r[e]=t(r[e])))}function a(e,t){try{(n=i[e](t)).value instanceof R?Promise.resolve(n.value.v).then(l,u):c(o[0][2],n)}catch(r){c(o[0][3],r)}var n}function l(e){a("next",e)}function u(e){a("throw",e)}function c(e,t){e(t),o.shift(),o.length&&a(o[0][0],o[0][1])}}function V(e){var t,n;return t={},r("next"),r("throw",function(e){throw e}),r("return"),t[Symbol.iterator]=function(){return this},t;function r(r,i){t[r]=e[r]?function(t){return(n=!n)?{value:R(e[r](t)),done:!1}:i?i(t):t}:i}}function H(e){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var t,n=e[Symbol.asyncIterator];return n?n.call(e):(e=U(e),t={},r("next"),r("throw"),r("return"),t[Symbol.asyncIterator]=function(){return this},t);function r(n){t[n]=e[n]&&function(t){return new Promise(function(r,i){(function(e,t,n,r){Promise.resolve(r).then(function(t){e({value:t,done:n})},t)})(r,i,(t=e[n](t)).done,t.value)})}}}Object.create;"function"===typeof SuppressedError&&SuppressedError;const $=new TextDecoder("utf-8"),W=e=>$.decode(e),Y=new TextEncoder,q=e=>Y.encode(e),Q="undefined"!==typeof SharedArrayBuffer?SharedArrayBuffer:ArrayBuffer;function K(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:t.byteLength;const i=e.byteLength,o=new Uint8Array(e.buffer,e.byteOffset,i),s=new Uint8Array(t.buffer,t.byteOffset,Math.min(r,i));return o.set(s,n),e}function G(e,t){const n=function(e){const t=e[0]?[e[0]]:[];let n,r,i,o;for(let s,a,l=0,u=0,c=e.length;++l<c;)s=t[u],a=e[l],!s||!a||s.buffer!==a.buffer||a.byteOffset<s.byteOffset?a&&(t[++u]=a):(({byteOffset:n,byteLength:i}=s),({byteOffset:r,byteLength:o}=a),n+i<r||r+o<n?a&&(t[++u]=a):t[u]=new Uint8Array(s.buffer,n,r-n+o));return t}(e),r=n.reduce((e,t)=>e+t.byteLength,0);let i,o,s,a=0,l=-1;const u=Math.min(t||Number.POSITIVE_INFINITY,r);for(const c=n.length;++l<c;){if(i=n[l],o=i.subarray(0,Math.min(i.length,u-a)),u<=a+o.length){o.length<i.length?n[l]=i.subarray(o.length):o.length===i.length&&l++,s?K(s,o,a):s=o;break}K(s||(s=new Uint8Array(u)),o,a),a+=o.length}return[s||new Uint8Array(0),n.slice(l),r-(s?s.byteLength:0)]}function X(e,t){let n=N(t)?t.value:t;return n instanceof e?e===Uint8Array?new e(n.buffer,n.byteOffset,n.byteLength):n:n?("string"===typeof n&&(n=q(n)),n instanceof ArrayBuffer||n instanceof Q?new e(n):T(r=n)&&x(r.clear)&&x(r.bytes)&&x(r.position)&&x(r.setPosition)&&x(r.capacity)&&x(r.getBufferIdentifier)&&x(r.createLong)?X(e,n.bytes()):ArrayBuffer.isView(n)?n.byteLength<=0?new e(0):new e(n.buffer,n.byteOffset,n.byteLength/e.BYTES_PER_ELEMENT):e.from(n)):new e(0);var r}const J=e=>X(Int32Array,e),Z=e=>X(Uint8Array,e),ee=e=>(e.next(),e);function*te(e,t){const n=function*(e){yield e},r="string"===typeof t||ArrayBuffer.isView(t)||t instanceof ArrayBuffer||t instanceof Q?n(t):A(t)?t:n(t);return yield*ee(function*(t){let n=null;do{n=t.next(yield X(e,n))}while(!n.done)}(r[Symbol.iterator]())),new e}function ne(e,t){return j(this,arguments,function*(){if(E(t))return yield R(yield R(yield*V(H(ne(e,yield R(t))))));const n=function(e){return j(this,arguments,function*(){yield yield R(yield R(e))})},r="string"===typeof t||ArrayBuffer.isView(t)||t instanceof ArrayBuffer||t instanceof Q?n(t):A(t)?function(e){return j(this,arguments,function*(){yield R(yield*V(H(ee(function*(e){let t=null;do{t=e.next(yield null===t||void 0===t?void 0:t.value)}while(!t.done)}(e[Symbol.iterator]())))))})}(t):O(t)?t:n(t);return yield R(yield*V(H(ee(function(t){return j(this,arguments,function*(){let n=null;do{n=yield R(t.next(yield yield R(X(e,n))))}while(!n.done)})}(r[Symbol.asyncIterator]()))))),yield R(new e)})}function re(e,t,n){if(0!==e){n=n.slice(0,t+1);for(let r=-1;++r<=t;)n[r]+=e}return n}const ie=Symbol.for("isArrowBigNum");function oe(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return 0===n.length?Object.setPrototypeOf(X(this.TypedArray,e),this.constructor.prototype):Object.setPrototypeOf(new this.TypedArray(e,...n),this.constructor.prototype)}function se(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return oe.apply(this,t)}function ae(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return oe.apply(this,t)}function le(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return oe.apply(this,t)}function ue(e){const{buffer:t,byteOffset:n,length:r,signed:i}=e,o=new _(t,n,r),s=i&&o[o.length-1]&BigInt(1)<<BigInt(63);let a=s?BigInt(1):BigInt(0),l=BigInt(0);if(s){for(const e of o)a+=~e*(BigInt(1)<<BigInt(32)*l++);a*=BigInt(-1)}else for(const u of o)a+=u*(BigInt(1)<<BigInt(32)*l++);return a}let ce,de;function fe(e){let t="";const n=new Uint32Array(2);let r=new Uint16Array(e.buffer,e.byteOffset,e.byteLength/2);const i=new Uint32Array((r=new Uint16Array(r).reverse()).buffer);let o=-1;const s=r.length-1;do{for(n[0]=r[o=0];o<s;)r[o++]=n[1]=n[0]/10,n[0]=(n[0]-10*n[1]<<16)+r[o];r[o]=n[1]=n[0]/10,n[0]=n[0]-10*n[1],t="".concat(n[0]).concat(t)}while(i[0]||i[1]||i[2]||i[3]);return null!==t&&void 0!==t?t:"0"}oe.prototype[ie]=!0,oe.prototype.toJSON=function(){return'"'.concat(ce(this),'"')},oe.prototype.valueOf=function(){return ue(this)},oe.prototype.toString=function(){return ce(this)},oe.prototype[Symbol.toPrimitive]=function(){switch(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"default"){case"number":return ue(this);case"string":return ce(this);case"default":return de(this)}return ce(this)},Object.setPrototypeOf(se.prototype,Object.create(Int32Array.prototype)),Object.setPrototypeOf(ae.prototype,Object.create(Uint32Array.prototype)),Object.setPrototypeOf(le.prototype,Object.create(Uint32Array.prototype)),Object.assign(se.prototype,oe.prototype,{constructor:se,signed:!0,TypedArray:Int32Array,BigIntArray:v}),Object.assign(ae.prototype,oe.prototype,{constructor:ae,signed:!1,TypedArray:Uint32Array,BigIntArray:_}),Object.assign(le.prototype,oe.prototype,{constructor:le,signed:!0,TypedArray:Uint32Array,BigIntArray:_}),g?(de=e=>8===e.byteLength?new e.BigIntArray(e.buffer,e.byteOffset,1)[0]:fe(e),ce=e=>8===e.byteLength?"".concat(new e.BigIntArray(e.buffer,e.byteOffset,1)[0]):fe(e)):(ce=fe,de=ce);class he{static new(e,t){switch(t){case!0:return new se(e);case!1:return new ae(e)}switch(e.constructor){case Int8Array:case Int16Array:case Int32Array:case v:return new se(e)}return 16===e.byteLength?new le(e):new ae(e)}static signed(e){return new se(e)}static unsigned(e){return new ae(e)}static decimal(e){return new le(e)}constructor(e,t){return he.new(e,t)}}var pe,ye,be,me,ge,ve,we,_e,Se,ke,Ie,xe,Te,Ee,Ae,Oe,Ce,Ne,De,Le;class Be{static isNull(e){return(null===e||void 0===e?void 0:e.typeId)===c.Null}static isInt(e){return(null===e||void 0===e?void 0:e.typeId)===c.Int}static isFloat(e){return(null===e||void 0===e?void 0:e.typeId)===c.Float}static isBinary(e){return(null===e||void 0===e?void 0:e.typeId)===c.Binary}static isUtf8(e){return(null===e||void 0===e?void 0:e.typeId)===c.Utf8}static isBool(e){return(null===e||void 0===e?void 0:e.typeId)===c.Bool}static isDecimal(e){return(null===e||void 0===e?void 0:e.typeId)===c.Decimal}static isDate(e){return(null===e||void 0===e?void 0:e.typeId)===c.Date}static isTime(e){return(null===e||void 0===e?void 0:e.typeId)===c.Time}static isTimestamp(e){return(null===e||void 0===e?void 0:e.typeId)===c.Timestamp}static isInterval(e){return(null===e||void 0===e?void 0:e.typeId)===c.Interval}static isList(e){return(null===e||void 0===e?void 0:e.typeId)===c.List}static isStruct(e){return(null===e||void 0===e?void 0:e.typeId)===c.Struct}static isUnion(e){return(null===e||void 0===e?void 0:e.typeId)===c.Union}static isFixedSizeBinary(e){return(null===e||void 0===e?void 0:e.typeId)===c.FixedSizeBinary}static isFixedSizeList(e){return(null===e||void 0===e?void 0:e.typeId)===c.FixedSizeList}static isMap(e){return(null===e||void 0===e?void 0:e.typeId)===c.Map}static isDictionary(e){return(null===e||void 0===e?void 0:e.typeId)===c.Dictionary}static isDenseUnion(e){return Be.isUnion(e)&&e.mode===i.Dense}static isSparseUnion(e){return Be.isUnion(e)&&e.mode===i.Sparse}get typeId(){return c.NONE}}pe=Symbol.toStringTag,Be[pe]=((Le=Be.prototype).children=null,Le.ArrayType=Array,Le[Symbol.toStringTag]="DataType");class Fe extends Be{toString(){return"Null"}get typeId(){return c.Null}}ye=Symbol.toStringTag,Fe[ye]=(e=>e[Symbol.toStringTag]="Null")(Fe.prototype);class Me extends Be{constructor(e,t){super(),this.isSigned=e,this.bitWidth=t}get typeId(){return c.Int}get ArrayType(){switch(this.bitWidth){case 8:return this.isSigned?Int8Array:Uint8Array;case 16:return this.isSigned?Int16Array:Uint16Array;case 32:return this.isSigned?Int32Array:Uint32Array;case 64:return this.isSigned?v:_}throw new Error("Unrecognized ".concat(this[Symbol.toStringTag]," type"))}toString(){return"".concat(this.isSigned?"I":"Ui","nt").concat(this.bitWidth)}}be=Symbol.toStringTag,Me[be]=(e=>(e.isSigned=null,e.bitWidth=null,e[Symbol.toStringTag]="Int"))(Me.prototype);class Pe extends Me{constructor(){super(!0,32)}get ArrayType(){return Int32Array}}Object.defineProperty(class extends Me{constructor(){super(!0,8)}get ArrayType(){return Int8Array}}.prototype,"ArrayType",{value:Int8Array}),Object.defineProperty(class extends Me{constructor(){super(!0,16)}get ArrayType(){return Int16Array}}.prototype,"ArrayType",{value:Int16Array}),Object.defineProperty(Pe.prototype,"ArrayType",{value:Int32Array}),Object.defineProperty(class extends Me{constructor(){super(!0,64)}get ArrayType(){return v}}.prototype,"ArrayType",{value:v}),Object.defineProperty(class extends Me{constructor(){super(!1,8)}get ArrayType(){return Uint8Array}}.prototype,"ArrayType",{value:Uint8Array}),Object.defineProperty(class extends Me{constructor(){super(!1,16)}get ArrayType(){return Uint16Array}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends Me{constructor(){super(!1,32)}get ArrayType(){return Uint32Array}}.prototype,"ArrayType",{value:Uint32Array}),Object.defineProperty(class extends Me{constructor(){super(!1,64)}get ArrayType(){return _}}.prototype,"ArrayType",{value:_});class ze extends Be{constructor(e){super(),this.precision=e}get typeId(){return c.Float}get ArrayType(){switch(this.precision){case o.HALF:return Uint16Array;case o.SINGLE:return Float32Array;case o.DOUBLE:return Float64Array}throw new Error("Unrecognized ".concat(this[Symbol.toStringTag]," type"))}toString(){return"Float".concat(this.precision<<5||16)}}me=Symbol.toStringTag,ze[me]=(e=>(e.precision=null,e[Symbol.toStringTag]="Float"))(ze.prototype);Object.defineProperty(class extends ze{constructor(){super(o.HALF)}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends ze{constructor(){super(o.SINGLE)}}.prototype,"ArrayType",{value:Float32Array}),Object.defineProperty(class extends ze{constructor(){super(o.DOUBLE)}}.prototype,"ArrayType",{value:Float64Array});class Ue extends Be{constructor(){super()}get typeId(){return c.Binary}toString(){return"Binary"}}ge=Symbol.toStringTag,Ue[ge]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Binary"))(Ue.prototype);class Re extends Be{constructor(){super()}get typeId(){return c.Utf8}toString(){return"Utf8"}}ve=Symbol.toStringTag,Re[ve]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Utf8"))(Re.prototype);class je extends Be{constructor(){super()}get typeId(){return c.Bool}toString(){return"Bool"}}we=Symbol.toStringTag,je[we]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Bool"))(je.prototype);class Ve extends Be{constructor(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:128;super(),this.scale=e,this.precision=t,this.bitWidth=n}get typeId(){return c.Decimal}toString(){return"Decimal[".concat(this.precision,"e").concat(this.scale>0?"+":"").concat(this.scale,"]")}}_e=Symbol.toStringTag,Ve[_e]=(e=>(e.scale=null,e.precision=null,e.ArrayType=Uint32Array,e[Symbol.toStringTag]="Decimal"))(Ve.prototype);class He extends Be{constructor(e){super(),this.unit=e}get typeId(){return c.Date}toString(){return"Date".concat(32*(this.unit+1),"<").concat(s[this.unit],">")}}Se=Symbol.toStringTag,He[Se]=(e=>(e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Date"))(He.prototype);class $e extends Be{constructor(e,t){super(),this.unit=e,this.bitWidth=t}get typeId(){return c.Time}toString(){return"Time".concat(this.bitWidth,"<").concat(a[this.unit],">")}get ArrayType(){switch(this.bitWidth){case 32:return Int32Array;case 64:return v}throw new Error("Unrecognized ".concat(this[Symbol.toStringTag]," type"))}}ke=Symbol.toStringTag,$e[ke]=(e=>(e.unit=null,e.bitWidth=null,e[Symbol.toStringTag]="Time"))($e.prototype);class We extends Be{constructor(e,t){super(),this.unit=e,this.timezone=t}get typeId(){return c.Timestamp}toString(){return"Timestamp<".concat(a[this.unit]).concat(this.timezone?", ".concat(this.timezone):"",">")}}Ie=Symbol.toStringTag,We[Ie]=(e=>(e.unit=null,e.timezone=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Timestamp"))(We.prototype);class Ye extends Be{constructor(e){super(),this.unit=e}get typeId(){return c.Interval}toString(){return"Interval<".concat(l[this.unit],">")}}xe=Symbol.toStringTag,Ye[xe]=(e=>(e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Interval"))(Ye.prototype);class qe extends Be{constructor(e){super(),this.children=[e]}get typeId(){return c.List}toString(){return"List<".concat(this.valueType,">")}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}}Te=Symbol.toStringTag,qe[Te]=(e=>(e.children=null,e[Symbol.toStringTag]="List"))(qe.prototype);class Qe extends Be{constructor(e){super(),this.children=e}get typeId(){return c.Struct}toString(){return"Struct<{".concat(this.children.map(e=>"".concat(e.name,":").concat(e.type)).join(", "),"}>")}}Ee=Symbol.toStringTag,Qe[Ee]=(e=>(e.children=null,e[Symbol.toStringTag]="Struct"))(Qe.prototype);class Ke extends Be{constructor(e,t,n){super(),this.mode=e,this.children=n,this.typeIds=t=Int32Array.from(t),this.typeIdToChildIndex=t.reduce((e,t,n)=>(e[t]=n)&&e||e,Object.create(null))}get typeId(){return c.Union}toString(){return"".concat(this[Symbol.toStringTag],"<").concat(this.children.map(e=>"".concat(e.type)).join(" | "),">")}}Ae=Symbol.toStringTag,Ke[Ae]=(e=>(e.mode=null,e.typeIds=null,e.children=null,e.typeIdToChildIndex=null,e.ArrayType=Int8Array,e[Symbol.toStringTag]="Union"))(Ke.prototype);class Ge extends Be{constructor(e){super(),this.byteWidth=e}get typeId(){return c.FixedSizeBinary}toString(){return"FixedSizeBinary[".concat(this.byteWidth,"]")}}Oe=Symbol.toStringTag,Ge[Oe]=(e=>(e.byteWidth=null,e.ArrayType=Uint8Array,e[Symbol.toStringTag]="FixedSizeBinary"))(Ge.prototype);class Xe extends Be{constructor(e,t){super(),this.listSize=e,this.children=[t]}get typeId(){return c.FixedSizeList}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}toString(){return"FixedSizeList[".concat(this.listSize,"]<").concat(this.valueType,">")}}Ce=Symbol.toStringTag,Xe[Ce]=(e=>(e.children=null,e.listSize=null,e[Symbol.toStringTag]="FixedSizeList"))(Xe.prototype);class Je extends Be{constructor(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];super(),this.children=[e],this.keysSorted=t}get typeId(){return c.Map}get keyType(){return this.children[0].type.children[0].type}get valueType(){return this.children[0].type.children[1].type}get childType(){return this.children[0].type}toString(){return"Map<{".concat(this.children[0].type.children.map(e=>"".concat(e.name,":").concat(e.type)).join(", "),"}>")}}Ne=Symbol.toStringTag,Je[Ne]=(e=>(e.children=null,e.keysSorted=null,e[Symbol.toStringTag]="Map_"))(Je.prototype);const Ze=(et=-1,()=>++et);var et;class tt extends Be{constructor(e,t,n,r){super(),this.indices=t,this.dictionary=e,this.isOrdered=r||!1,this.id=null==n?Ze():"number"===typeof n?n:n.low}get typeId(){return c.Dictionary}get children(){return this.dictionary.children}get valueType(){return this.dictionary}get ArrayType(){return this.dictionary.ArrayType}toString(){return"Dictionary<".concat(this.indices,", ").concat(this.dictionary,">")}}function nt(e){const t=e;switch(e.typeId){case c.Decimal:return e.bitWidth/32;case c.Timestamp:return 2;case c.Date:case c.Interval:return 1+t.unit;case c.FixedSizeList:return t.listSize;case c.FixedSizeBinary:return t.byteWidth;default:return 1}}De=Symbol.toStringTag,tt[De]=(e=>(e.id=null,e.indices=null,e.isOrdered=null,e.dictionary=null,e[Symbol.toStringTag]="Dictionary"))(tt.prototype);class rt{visitMany(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return e.map((e,t)=>this.visit(e,...n.map(e=>e[t])))}visit(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return this.getVisitFn(t[0],!1).apply(this,t)}getVisitFn(e){return function(e,t){let n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if("number"===typeof t)return it(e,t,n);if("string"===typeof t&&t in c)return it(e,c[t],n);if(t&&t instanceof Be)return it(e,ot(t),n);if((null===t||void 0===t?void 0:t.type)&&t.type instanceof Be)return it(e,ot(t.type),n);return it(e,c.NONE,n)}(this,e,!(arguments.length>1&&void 0!==arguments[1])||arguments[1])}getVisitFnByTypeId(e){return it(this,e,!(arguments.length>1&&void 0!==arguments[1])||arguments[1])}visitNull(e){return null}visitBool(e){return null}visitInt(e){return null}visitFloat(e){return null}visitUtf8(e){return null}visitBinary(e){return null}visitFixedSizeBinary(e){return null}visitDate(e){return null}visitTimestamp(e){return null}visitTime(e){return null}visitDecimal(e){return null}visitList(e){return null}visitStruct(e){return null}visitUnion(e){return null}visitDictionary(e){return null}visitInterval(e){return null}visitFixedSizeList(e){return null}visitMap(e){return null}}function it(e,t){let n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],r=null;switch(t){case c.Null:r=e.visitNull;break;case c.Bool:r=e.visitBool;break;case c.Int:r=e.visitInt;break;case c.Int8:r=e.visitInt8||e.visitInt;break;case c.Int16:r=e.visitInt16||e.visitInt;break;case c.Int32:r=e.visitInt32||e.visitInt;break;case c.Int64:r=e.visitInt64||e.visitInt;break;case c.Uint8:r=e.visitUint8||e.visitInt;break;case c.Uint16:r=e.visitUint16||e.visitInt;break;case c.Uint32:r=e.visitUint32||e.visitInt;break;case c.Uint64:r=e.visitUint64||e.visitInt;break;case c.Float:r=e.visitFloat;break;case c.Float16:r=e.visitFloat16||e.visitFloat;break;case c.Float32:r=e.visitFloat32||e.visitFloat;break;case c.Float64:r=e.visitFloat64||e.visitFloat;break;case c.Utf8:r=e.visitUtf8;break;case c.Binary:r=e.visitBinary;break;case c.FixedSizeBinary:r=e.visitFixedSizeBinary;break;case c.Date:r=e.visitDate;break;case c.DateDay:r=e.visitDateDay||e.visitDate;break;case c.DateMillisecond:r=e.visitDateMillisecond||e.visitDate;break;case c.Timestamp:r=e.visitTimestamp;break;case c.TimestampSecond:r=e.visitTimestampSecond||e.visitTimestamp;break;case c.TimestampMillisecond:r=e.visitTimestampMillisecond||e.visitTimestamp;break;case c.TimestampMicrosecond:r=e.visitTimestampMicrosecond||e.visitTimestamp;break;case c.TimestampNanosecond:r=e.visitTimestampNanosecond||e.visitTimestamp;break;case c.Time:r=e.visitTime;break;case c.TimeSecond:r=e.visitTimeSecond||e.visitTime;break;case c.TimeMillisecond:r=e.visitTimeMillisecond||e.visitTime;break;case c.TimeMicrosecond:r=e.visitTimeMicrosecond||e.visitTime;break;case c.TimeNanosecond:r=e.visitTimeNanosecond||e.visitTime;break;case c.Decimal:r=e.visitDecimal;break;case c.List:r=e.visitList;break;case c.Struct:r=e.visitStruct;break;case c.Union:r=e.visitUnion;break;case c.DenseUnion:r=e.visitDenseUnion||e.visitUnion;break;case c.SparseUnion:r=e.visitSparseUnion||e.visitUnion;break;case c.Dictionary:r=e.visitDictionary;break;case c.Interval:r=e.visitInterval;break;case c.IntervalDayTime:r=e.visitIntervalDayTime||e.visitInterval;break;case c.IntervalYearMonth:r=e.visitIntervalYearMonth||e.visitInterval;break;case c.FixedSizeList:r=e.visitFixedSizeList;break;case c.Map:r=e.visitMap}if("function"===typeof r)return r;if(!n)return()=>null;throw new Error("Unrecognized type '".concat(c[t],"'"))}function ot(e){switch(e.typeId){case c.Null:return c.Null;case c.Int:{const{bitWidth:t,isSigned:n}=e;switch(t){case 8:return n?c.Int8:c.Uint8;case 16:return n?c.Int16:c.Uint16;case 32:return n?c.Int32:c.Uint32;case 64:return n?c.Int64:c.Uint64}return c.Int}case c.Float:switch(e.precision){case o.HALF:return c.Float16;case o.SINGLE:return c.Float32;case o.DOUBLE:return c.Float64}return c.Float;case c.Binary:return c.Binary;case c.Utf8:return c.Utf8;case c.Bool:return c.Bool;case c.Decimal:return c.Decimal;case c.Time:switch(e.unit){case a.SECOND:return c.TimeSecond;case a.MILLISECOND:return c.TimeMillisecond;case a.MICROSECOND:return c.TimeMicrosecond;case a.NANOSECOND:return c.TimeNanosecond}return c.Time;case c.Timestamp:switch(e.unit){case a.SECOND:return c.TimestampSecond;case a.MILLISECOND:return c.TimestampMillisecond;case a.MICROSECOND:return c.TimestampMicrosecond;case a.NANOSECOND:return c.TimestampNanosecond}return c.Timestamp;case c.Date:switch(e.unit){case s.DAY:return c.DateDay;case s.MILLISECOND:return c.DateMillisecond}return c.Date;case c.Interval:switch(e.unit){case l.DAY_TIME:return c.IntervalDayTime;case l.YEAR_MONTH:return c.IntervalYearMonth}return c.Interval;case c.Map:return c.Map;case c.List:return c.List;case c.Struct:return c.Struct;case c.Union:switch(e.mode){case i.Dense:return c.DenseUnion;case i.Sparse:return c.SparseUnion}return c.Union;case c.FixedSizeBinary:return c.FixedSizeBinary;case c.FixedSizeList:return c.FixedSizeList;case c.Dictionary:return c.Dictionary}throw new Error("Unrecognized type '".concat(c[e.typeId],"'"))}rt.prototype.visitInt8=null,rt.prototype.visitInt16=null,rt.prototype.visitInt32=null,rt.prototype.visitInt64=null,rt.prototype.visitUint8=null,rt.prototype.visitUint16=null,rt.prototype.visitUint32=null,rt.prototype.visitUint64=null,rt.prototype.visitFloat16=null,rt.prototype.visitFloat32=null,rt.prototype.visitFloat64=null,rt.prototype.visitDateDay=null,rt.prototype.visitDateMillisecond=null,rt.prototype.visitTimestampSecond=null,rt.prototype.visitTimestampMillisecond=null,rt.prototype.visitTimestampMicrosecond=null,rt.prototype.visitTimestampNanosecond=null,rt.prototype.visitTimeSecond=null,rt.prototype.visitTimeMillisecond=null,rt.prototype.visitTimeMicrosecond=null,rt.prototype.visitTimeNanosecond=null,rt.prototype.visitDenseUnion=null,rt.prototype.visitSparseUnion=null,rt.prototype.visitIntervalDayTime=null,rt.prototype.visitIntervalYearMonth=null;const st=new Float64Array(1),at=new Uint32Array(st.buffer);function lt(e){const t=(31744&e)>>10,n=(1023&e)/1024,r=Math.pow(-1,(32768&e)>>15);switch(t){case 31:return r*(n?Number.NaN:1/0);case 0:return r*(n?6103515625e-14*n:0)}return r*Math.pow(2,t-15)*(1+n)}class ut extends rt{}function ct(e){return(t,n,r)=>{if(t.setValid(n,null!=r))return e(t,n,r)}}const dt=(e,t,n)=>{e[t]=Math.trunc(n%4294967296),e[t+1]=Math.trunc(n/4294967296)},ft=(e,t,n,r)=>{if(n+1<t.length){const{[n]:i,[n+1]:o}=t;e.set(r.subarray(0,o-i),i)}},ht=(e,t,n)=>{let{values:r}=e;r[t]=n},pt=(e,t,n)=>{let{values:r}=e;r[t]=n},yt=(e,t,n)=>{let{values:r}=e;r[t]=function(e){if(e!==e)return 32256;st[0]=e;const t=(2147483648&at[1])>>16&65535;let n=2146435072&at[1],r=0;return n>=1089470464?at[0]>0?n=31744:(n=(2080374784&n)>>16,r=(1048575&at[1])>>10):n<=1056964608?(r=1048576+(1048575&at[1]),r=1048576+(r<<(n>>20)-998)>>21,n=0):(n=n-1056964608>>10,r=512+(1048575&at[1])>>10),t|n|65535&r}(n)},bt=(e,t,n)=>{let{values:r}=e;((e,t,n)=>{e[t]=Math.trunc(n/864e5)})(r,t,n.valueOf())},mt=(e,t,n)=>{let{values:r}=e;dt(r,2*t,n.valueOf())},gt=(e,t,n)=>{let{values:r}=e;return dt(r,2*t,n/1e3)},vt=(e,t,n)=>{let{values:r}=e;return dt(r,2*t,n)},wt=(e,t,n)=>{let{values:r}=e;return((e,t,n)=>{e[t]=Math.trunc(1e3*n%4294967296),e[t+1]=Math.trunc(1e3*n/4294967296)})(r,2*t,n)},_t=(e,t,n)=>{let{values:r}=e;return((e,t,n)=>{e[t]=Math.trunc(1e6*n%4294967296),e[t+1]=Math.trunc(1e6*n/4294967296)})(r,2*t,n)},St=(e,t,n)=>{let{values:r}=e;r[t]=n},kt=(e,t,n)=>{let{values:r}=e;r[t]=n},It=(e,t,n)=>{let{values:r}=e;r[t]=n},xt=(e,t,n)=>{let{values:r}=e;r[t]=n},Tt=(e,t,n)=>{const r=e.type.typeIdToChildIndex[e.typeIds[t]],i=e.children[r];Ct.visit(i,e.valueOffsets[t],n)},Et=(e,t,n)=>{const r=e.type.typeIdToChildIndex[e.typeIds[t]],i=e.children[r];Ct.visit(i,t,n)},At=(e,t,n)=>{let{values:r}=e;r.set(n.subarray(0,2),2*t)},Ot=(e,t,n)=>{let{values:r}=e;r[t]=12*n[0]+n[1]%12};ut.prototype.visitBool=ct((e,t,n)=>{let{offset:r,values:i}=e;const o=r+t;n?i[o>>3]|=1<<o%8:i[o>>3]&=~(1<<o%8)}),ut.prototype.visitInt=ct(ht),ut.prototype.visitInt8=ct(ht),ut.prototype.visitInt16=ct(ht),ut.prototype.visitInt32=ct(ht),ut.prototype.visitInt64=ct(ht),ut.prototype.visitUint8=ct(ht),ut.prototype.visitUint16=ct(ht),ut.prototype.visitUint32=ct(ht),ut.prototype.visitUint64=ct(ht),ut.prototype.visitFloat=ct((e,t,n)=>{switch(e.type.precision){case o.HALF:return yt(e,t,n);case o.SINGLE:case o.DOUBLE:return pt(e,t,n)}}),ut.prototype.visitFloat16=ct(yt),ut.prototype.visitFloat32=ct(pt),ut.prototype.visitFloat64=ct(pt),ut.prototype.visitUtf8=ct((e,t,n)=>{let{values:r,valueOffsets:i}=e;ft(r,i,t,q(n))}),ut.prototype.visitBinary=ct((e,t,n)=>{let{values:r,valueOffsets:i}=e;return ft(r,i,t,n)}),ut.prototype.visitFixedSizeBinary=ct((e,t,n)=>{let{stride:r,values:i}=e;i.set(n.subarray(0,r),r*t)}),ut.prototype.visitDate=ct((e,t,n)=>{e.type.unit===s.DAY?bt(e,t,n):mt(e,t,n)}),ut.prototype.visitDateDay=ct(bt),ut.prototype.visitDateMillisecond=ct(mt),ut.prototype.visitTimestamp=ct((e,t,n)=>{switch(e.type.unit){case a.SECOND:return gt(e,t,n);case a.MILLISECOND:return vt(e,t,n);case a.MICROSECOND:return wt(e,t,n);case a.NANOSECOND:return _t(e,t,n)}}),ut.prototype.visitTimestampSecond=ct(gt),ut.prototype.visitTimestampMillisecond=ct(vt),ut.prototype.visitTimestampMicrosecond=ct(wt),ut.prototype.visitTimestampNanosecond=ct(_t),ut.prototype.visitTime=ct((e,t,n)=>{switch(e.type.unit){case a.SECOND:return St(e,t,n);case a.MILLISECOND:return kt(e,t,n);case a.MICROSECOND:return It(e,t,n);case a.NANOSECOND:return xt(e,t,n)}}),ut.prototype.visitTimeSecond=ct(St),ut.prototype.visitTimeMillisecond=ct(kt),ut.prototype.visitTimeMicrosecond=ct(It),ut.prototype.visitTimeNanosecond=ct(xt),ut.prototype.visitDecimal=ct((e,t,n)=>{let{values:r,stride:i}=e;r.set(n.subarray(0,i),i*t)}),ut.prototype.visitList=ct((e,t,n)=>{const r=e.children[0],i=e.valueOffsets,o=Ct.getVisitFn(r);if(Array.isArray(n))for(let s=-1,a=i[t],l=i[t+1];a<l;)o(r,a++,n[++s]);else for(let s=-1,a=i[t],l=i[t+1];a<l;)o(r,a++,n.get(++s))}),ut.prototype.visitStruct=ct((e,t,n)=>{const r=e.type.children.map(e=>Ct.getVisitFn(e.type)),i=n instanceof Map?(o=t,s=n,(e,t,n,r)=>t&&e(t,o,s.get(n.name))):n instanceof Qn?((e,t)=>(n,r,i,o)=>r&&n(r,e,t.get(o)))(t,n):Array.isArray(n)?((e,t)=>(n,r,i,o)=>r&&n(r,e,t[o]))(t,n):((e,t)=>(n,r,i,o)=>r&&n(r,e,t[i.name]))(t,n);var o,s;e.type.children.forEach((t,n)=>i(r[n],e.children[n],t,n))}),ut.prototype.visitUnion=ct((e,t,n)=>{e.type.mode===i.Dense?Tt(e,t,n):Et(e,t,n)}),ut.prototype.visitDenseUnion=ct(Tt),ut.prototype.visitSparseUnion=ct(Et),ut.prototype.visitDictionary=ct((e,t,n)=>{var r;null===(r=e.dictionary)||void 0===r||r.set(e.values[t],n)}),ut.prototype.visitInterval=ct((e,t,n)=>{e.type.unit===l.DAY_TIME?At(e,t,n):Ot(e,t,n)}),ut.prototype.visitIntervalDayTime=ct(At),ut.prototype.visitIntervalYearMonth=ct(Ot),ut.prototype.visitFixedSizeList=ct((e,t,n)=>{const{stride:r}=e,i=e.children[0],o=Ct.getVisitFn(i);if(Array.isArray(n))for(let s=-1,a=t*r;++s<r;)o(i,a+s,n[s]);else for(let s=-1,a=t*r;++s<r;)o(i,a+s,n.get(s))}),ut.prototype.visitMap=ct((e,t,n)=>{const r=e.children[0],{valueOffsets:i}=e,o=Ct.getVisitFn(r);let{[t]:s,[t+1]:a}=i;const l=n instanceof Map?n.entries():Object.entries(n);for(const u of l)if(o(r,s,u),++s>=a)break});const Ct=new ut,Nt=Symbol.for("parent"),Dt=Symbol.for("rowIndex");class Lt{constructor(e,t){return this[Nt]=e,this[Dt]=t,new Proxy(this,new Ft)}toArray(){return Object.values(this.toJSON())}toJSON(){const e=this[Dt],t=this[Nt],n=t.type.children,r={};for(let i=-1,o=n.length;++i<o;)r[n[i].name]=rn.visit(t.children[i],e);return r}toString(){return"{".concat([...this].map(e=>{let[t,n]=e;return"".concat(P(t),": ").concat(P(n))}).join(", "),"}")}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}[Symbol.iterator](){return new Bt(this[Nt],this[Dt])}}class Bt{constructor(e,t){this.childIndex=0,this.children=e.children,this.rowIndex=t,this.childFields=e.type.children,this.numChildren=this.childFields.length}[Symbol.iterator](){return this}next(){const e=this.childIndex;return e<this.numChildren?(this.childIndex=e+1,{done:!1,value:[this.childFields[e].name,rn.visit(this.children[e],this.rowIndex)]}):{done:!0,value:null}}}Object.defineProperties(Lt.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[Nt]:{writable:!0,enumerable:!1,configurable:!1,value:null},[Dt]:{writable:!0,enumerable:!1,configurable:!1,value:-1}});class Ft{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(e){return e[Nt].type.children.map(e=>e.name)}has(e,t){return-1!==e[Nt].type.children.findIndex(e=>e.name===t)}getOwnPropertyDescriptor(e,t){if(-1!==e[Nt].type.children.findIndex(e=>e.name===t))return{writable:!0,enumerable:!0,configurable:!0}}get(e,t){if(Reflect.has(e,t))return e[t];const n=e[Nt].type.children.findIndex(e=>e.name===t);if(-1!==n){const r=rn.visit(e[Nt].children[n],e[Dt]);return Reflect.set(e,t,r),r}}set(e,t,n){const r=e[Nt].type.children.findIndex(e=>e.name===t);return-1!==r?(Ct.visit(e[Nt].children[r],e[Dt],n),Reflect.set(e,t,n)):!(!Reflect.has(e,t)&&"symbol"!==typeof t)&&Reflect.set(e,t,n)}}class Mt extends rt{}function Pt(e){return(t,n)=>t.getValid(n)?e(t,n):null}const zt=(e,t)=>4294967296*e[t+1]+(e[t]>>>0),Ut=e=>new Date(e),Rt=(e,t,n)=>{if(n+1>=t.length)return null;const r=t[n],i=t[n+1];return e.subarray(r,i)},jt=(e,t)=>{let{values:n}=e;return((e,t)=>Ut(((e,t)=>864e5*e[t])(e,t)))(n,t)},Vt=(e,t)=>{let{values:n}=e;return((e,t)=>Ut(zt(e,t)))(n,2*t)},Ht=(e,t)=>{let{stride:n,values:r}=e;return r[n*t]},$t=(e,t)=>{let{values:n}=e;return n[t]},Wt=(e,t)=>{let{values:n}=e;return 1e3*zt(n,2*t)},Yt=(e,t)=>{let{values:n}=e;return zt(n,2*t)},qt=(e,t)=>{let{values:n}=e;return((e,t)=>e[t+1]/1e3*4294967296+(e[t]>>>0)/1e3)(n,2*t)},Qt=(e,t)=>{let{values:n}=e;return((e,t)=>e[t+1]/1e6*4294967296+(e[t]>>>0)/1e6)(n,2*t)},Kt=(e,t)=>{let{values:n}=e;return n[t]},Gt=(e,t)=>{let{values:n}=e;return n[t]},Xt=(e,t)=>{let{values:n}=e;return n[t]},Jt=(e,t)=>{let{values:n}=e;return n[t]},Zt=(e,t)=>{const n=e.type.typeIdToChildIndex[e.typeIds[t]],r=e.children[n];return rn.visit(r,e.valueOffsets[t])},en=(e,t)=>{const n=e.type.typeIdToChildIndex[e.typeIds[t]],r=e.children[n];return rn.visit(r,t)},tn=(e,t)=>{let{values:n}=e;return n.subarray(2*t,2*(t+1))},nn=(e,t)=>{let{values:n}=e;const r=n[t],i=new Int32Array(2);return i[0]=Math.trunc(r/12),i[1]=Math.trunc(r%12),i};Mt.prototype.visitNull=Pt((e,t)=>null),Mt.prototype.visitBool=Pt((e,t)=>{let{offset:n,values:r}=e;const i=n+t;return 0!==(r[i>>3]&1<<i%8)}),Mt.prototype.visitInt=Pt((e,t)=>{let{values:n}=e;return n[t]}),Mt.prototype.visitInt8=Pt(Ht),Mt.prototype.visitInt16=Pt(Ht),Mt.prototype.visitInt32=Pt(Ht),Mt.prototype.visitInt64=Pt($t),Mt.prototype.visitUint8=Pt(Ht),Mt.prototype.visitUint16=Pt(Ht),Mt.prototype.visitUint32=Pt(Ht),Mt.prototype.visitUint64=Pt($t),Mt.prototype.visitFloat=Pt((e,t)=>{let{type:n,values:r}=e;return n.precision!==o.HALF?r[t]:lt(r[t])}),Mt.prototype.visitFloat16=Pt((e,t)=>{let{stride:n,values:r}=e;return lt(r[n*t])}),Mt.prototype.visitFloat32=Pt(Ht),Mt.prototype.visitFloat64=Pt(Ht),Mt.prototype.visitUtf8=Pt((e,t)=>{let{values:n,valueOffsets:r}=e;const i=Rt(n,r,t);return null!==i?W(i):null}),Mt.prototype.visitBinary=Pt((e,t)=>{let{values:n,valueOffsets:r}=e;return Rt(n,r,t)}),Mt.prototype.visitFixedSizeBinary=Pt((e,t)=>{let{stride:n,values:r}=e;return r.subarray(n*t,n*(t+1))}),Mt.prototype.visitDate=Pt((e,t)=>e.type.unit===s.DAY?jt(e,t):Vt(e,t)),Mt.prototype.visitDateDay=Pt(jt),Mt.prototype.visitDateMillisecond=Pt(Vt),Mt.prototype.visitTimestamp=Pt((e,t)=>{switch(e.type.unit){case a.SECOND:return Wt(e,t);case a.MILLISECOND:return Yt(e,t);case a.MICROSECOND:return qt(e,t);case a.NANOSECOND:return Qt(e,t)}}),Mt.prototype.visitTimestampSecond=Pt(Wt),Mt.prototype.visitTimestampMillisecond=Pt(Yt),Mt.prototype.visitTimestampMicrosecond=Pt(qt),Mt.prototype.visitTimestampNanosecond=Pt(Qt),Mt.prototype.visitTime=Pt((e,t)=>{switch(e.type.unit){case a.SECOND:return Kt(e,t);case a.MILLISECOND:return Gt(e,t);case a.MICROSECOND:return Xt(e,t);case a.NANOSECOND:return Jt(e,t)}}),Mt.prototype.visitTimeSecond=Pt(Kt),Mt.prototype.visitTimeMillisecond=Pt(Gt),Mt.prototype.visitTimeMicrosecond=Pt(Xt),Mt.prototype.visitTimeNanosecond=Pt(Jt),Mt.prototype.visitDecimal=Pt((e,t)=>{let{values:n,stride:r}=e;return he.decimal(n.subarray(r*t,r*(t+1)))}),Mt.prototype.visitList=Pt((e,t)=>{const{valueOffsets:n,stride:r,children:i}=e,{[t*r]:o,[t*r+1]:s}=n,a=i[0].slice(o,s-o);return new Qn([a])}),Mt.prototype.visitStruct=Pt((e,t)=>new Lt(e,t)),Mt.prototype.visitUnion=Pt((e,t)=>e.type.mode===i.Dense?Zt(e,t):en(e,t)),Mt.prototype.visitDenseUnion=Pt(Zt),Mt.prototype.visitSparseUnion=Pt(en),Mt.prototype.visitDictionary=Pt((e,t)=>{var n;return null===(n=e.dictionary)||void 0===n?void 0:n.get(e.values[t])}),Mt.prototype.visitInterval=Pt((e,t)=>e.type.unit===l.DAY_TIME?tn(e,t):nn(e,t)),Mt.prototype.visitIntervalDayTime=Pt(tn),Mt.prototype.visitIntervalYearMonth=Pt(nn),Mt.prototype.visitFixedSizeList=Pt((e,t)=>{const{stride:n,children:r}=e,i=r[0].slice(t*n,n);return new Qn([i])}),Mt.prototype.visitMap=Pt((e,t)=>{const{valueOffsets:n,children:r}=e,{[t]:i,[t+1]:o}=n,s=r[0];return new an(s.slice(i,o-i))});const rn=new Mt,on=Symbol.for("keys"),sn=Symbol.for("vals");class an{constructor(e){return this[on]=new Qn([e.children[0]]).memoize(),this[sn]=e.children[1],new Proxy(this,new un)}[Symbol.iterator](){return new ln(this[on],this[sn])}get size(){return this[on].length}toArray(){return Object.values(this.toJSON())}toJSON(){const e=this[on],t=this[sn],n={};for(let r=-1,i=e.length;++r<i;)n[e.get(r)]=rn.visit(t,r);return n}toString(){return"{".concat([...this].map(e=>{let[t,n]=e;return"".concat(P(t),": ").concat(P(n))}).join(", "),"}")}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}}class ln{constructor(e,t){this.keys=e,this.vals=t,this.keyIndex=0,this.numKeys=e.length}[Symbol.iterator](){return this}next(){const e=this.keyIndex;return e===this.numKeys?{done:!0,value:null}:(this.keyIndex++,{done:!1,value:[this.keys.get(e),rn.visit(this.vals,e)]})}}class un{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(e){return e[on].toArray().map(String)}has(e,t){return e[on].includes(t)}getOwnPropertyDescriptor(e,t){if(-1!==e[on].indexOf(t))return{writable:!0,enumerable:!0,configurable:!0}}get(e,t){if(Reflect.has(e,t))return e[t];const n=e[on].indexOf(t);if(-1!==n){const r=rn.visit(Reflect.get(e,sn),n);return Reflect.set(e,t,r),r}}set(e,t,n){const r=e[on].indexOf(t);return-1!==r?(Ct.visit(Reflect.get(e,sn),r,n),Reflect.set(e,t,n)):!!Reflect.has(e,t)&&Reflect.set(e,t,n)}}let cn;function dn(e,t,n,r){const{length:i=0}=e;let o="number"!==typeof t?0:t,s="number"!==typeof n?i:n;return o<0&&(o=(o%i+i)%i),s<0&&(s=(s%i+i)%i),s<o&&(cn=o,o=s,s=cn),s>i&&(s=i),r?r(e,o,s):[o,s]}Object.defineProperties(an.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[on]:{writable:!0,enumerable:!1,configurable:!1,value:null},[sn]:{writable:!0,enumerable:!1,configurable:!1,value:null}});const fn=e=>e!==e;function hn(e){if("object"!==typeof e||null===e)return fn(e)?fn:t=>t===e;if(e instanceof Date){const t=e.valueOf();return e=>e instanceof Date&&e.valueOf()===t}return ArrayBuffer.isView(e)?t=>!!t&&function(e,t){let n=0;const r=e.length;if(r!==t.length)return!1;if(r>0)do{if(e[n]!==t[n])return!1}while(++n<r);return!0}(e,t):e instanceof Map?function(e){let t=-1;const n=[];for(const r of e.values())n[++t]=hn(r);return pn(n)}(e):Array.isArray(e)?function(e){const t=[];for(let n=-1,r=e.length;++n<r;)t[n]=hn(e[n]);return pn(t)}(e):e instanceof Qn?function(e){const t=[];for(let n=-1,r=e.length;++n<r;)t[n]=hn(e.get(n));return pn(t)}(e):function(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];const n=Object.keys(e);if(!t&&0===n.length)return()=>!1;const r=[];for(let i=-1,o=n.length;++i<o;)r[i]=hn(e[n[i]]);return pn(r,n)}(e,!0)}function pn(e,t){return n=>{if(!n||"object"!==typeof n)return!1;switch(n.constructor){case Array:return function(e,t){const n=e.length;if(t.length!==n)return!1;for(let r=-1;++r<n;)if(!e[r](t[r]))return!1;return!0}(e,n);case Map:return yn(e,n,n.keys());case an:case Lt:case Object:case void 0:return yn(e,n,t||Object.keys(n))}return n instanceof Qn&&function(e,t){const n=e.length;if(t.length!==n)return!1;for(let r=-1;++r<n;)if(!e[r](t.get(r)))return!1;return!0}(e,n)}}function yn(e,t,n){const r=n[Symbol.iterator](),i=t instanceof Map?t.keys():Object.keys(t)[Symbol.iterator](),o=t instanceof Map?t.values():Object.values(t)[Symbol.iterator]();let s=0;const a=e.length;let l=o.next(),u=r.next(),c=i.next();for(;s<a&&!u.done&&!c.done&&!l.done&&(u.value===c.value&&e[s](l.value));++s,u=r.next(),c=i.next(),l=o.next());return!!(s===a&&u.done&&c.done&&l.done)||(r.return&&r.return(),i.return&&i.return(),o.return&&o.return(),!1)}class bn{constructor(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:0,t=arguments.length>1?arguments[1]:void 0;this.numChunks=e,this.getChunkIterator=t,this.chunkIndex=0,this.chunkIterator=this.getChunkIterator(0)}next(){for(;this.chunkIndex<this.numChunks;){const e=this.chunkIterator.next();if(!e.done)return e;++this.chunkIndex<this.numChunks&&(this.chunkIterator=this.getChunkIterator(this.chunkIndex))}return{done:!0,value:null}}[Symbol.iterator](){return this}}function mn(e){return e.reduce((e,t)=>e+t.nullCount,0)}function gn(e){return e.reduce((e,t,n)=>(e[n+1]=e[n]+t.length,e),new Uint32Array(e.length+1))}function vn(e,t,n,r){const i=[];for(let o=-1,s=e.length;++o<s;){const s=e[o],a=t[o],{length:l}=s;if(a>=r)break;if(n>=a+l)continue;if(a>=n&&a+l<=r){i.push(s);continue}const u=Math.max(0,n-a),c=Math.min(r-a,l);i.push(s.slice(u,c-u))}return 0===i.length&&i.push(e[0].slice(0,0)),i}function wn(e,t,n,r){let i=0,o=0,s=t.length-1;do{if(i>=s-1)return n<t[s]?r(e,i,n-t[i]):null;o=i+Math.trunc(.5*(s-i)),n<t[o]?s=o:i=o}while(i<s)}function _n(e,t){return e.getValid(t)}function Sn(e){function t(t,n,r){return e(t[n],r)}return function(e){return wn(this.data,this._offsets,e,t)}}function kn(e){let t;function n(n,r,i){return e(n[r],i,t)}return function(e,r){const i=this.data;t=r;const o=wn(i,this._offsets,e,n);return t=void 0,o}}function In(e){let t;function n(n,r,i){let o=i,s=0,a=0;for(let l=r-1,u=n.length;++l<u;){const r=n[l];if(~(s=e(r,t,o)))return a+s;o=0,a+=r.length}return-1}return function(e,r){t=e;const i=this.data,o="number"!==typeof r?n(i,0,0):wn(i,this._offsets,r,n);return t=void 0,o}}function xn(e,t,n,r){return 0!==(n&1<<r)}function Tn(e,t,n,r){return(n&1<<r)>>r}function En(e,t,n){const r=n.byteLength+7&-8;if(e>0||n.byteLength<r){const i=new Uint8Array(r);return i.set(e%8===0?n.subarray(e>>3):An(new On(n,e,t,null,xn)).subarray(0,r)),i}return n}function An(e){const t=[];let n=0,r=0,i=0;for(const s of e)s&&(i|=1<<r),8===++r&&(t[n++]=i,i=r=0);(0===n||r>0)&&(t[n++]=i);const o=new Uint8Array(t.length+7&-8);return o.set(t),o}class On{constructor(e,t,n,r,i){this.bytes=e,this.length=n,this.context=r,this.get=i,this.bit=t%8,this.byteIndex=t>>3,this.byte=e[this.byteIndex++],this.index=0}next(){return this.index<this.length?(8===this.bit&&(this.bit=0,this.byte=this.bytes[this.byteIndex++]),{value:this.get(this.context,this.index++,this.byte,this.bit++)}):{done:!0,value:null}}[Symbol.iterator](){return this}}function Cn(e,t,n){if(n-t<=0)return 0;if(n-t<8){let r=0;for(const i of new On(e,t,n-t,e,Tn))r+=i;return r}const r=n>>3<<3,i=t+(t%8===0?0:8-t%8);return Cn(e,t,i)+Cn(e,r,n)+function(e,t,n){let r=0,i=Math.trunc(t);const o=new DataView(e.buffer,e.byteOffset,e.byteLength),s=void 0===n?e.byteLength:i+n;for(;s-i>=4;)r+=Nn(o.getUint32(i)),i+=4;for(;s-i>=2;)r+=Nn(o.getUint16(i)),i+=2;for(;s-i>=1;)r+=Nn(o.getUint8(i)),i+=1;return r}(e,i>>3,r-i>>3)}function Nn(e){let t=Math.trunc(e);return t-=t>>>1&1431655765,t=(858993459&t)+(t>>>2&858993459),16843009*(t+(t>>>4)&252645135)>>>24}class Dn extends rt{}function Ln(e,t,n){if(void 0===t)return-1;if(null===t)return function(e,t){const{nullBitmap:n}=e;if(!n||e.nullCount<=0)return-1;let r=0;for(const i of new On(n,e.offset+(t||0),e.length,n,xn)){if(!i)return r;++r}return-1}(e,n);const r=rn.getVisitFn(e),i=hn(t);for(let o=(n||0)-1,s=e.length;++o<s;)if(i(r(e,o)))return o;return-1}function Bn(e,t,n){const r=rn.getVisitFn(e),i=hn(t);for(let o=(n||0)-1,s=e.length;++o<s;)if(i(r(e,o)))return o;return-1}Dn.prototype.visitNull=function(e,t){return null===t&&e.length>0?0:-1},Dn.prototype.visitBool=Ln,Dn.prototype.visitInt=Ln,Dn.prototype.visitInt8=Ln,Dn.prototype.visitInt16=Ln,Dn.prototype.visitInt32=Ln,Dn.prototype.visitInt64=Ln,Dn.prototype.visitUint8=Ln,Dn.prototype.visitUint16=Ln,Dn.prototype.visitUint32=Ln,Dn.prototype.visitUint64=Ln,Dn.prototype.visitFloat=Ln,Dn.prototype.visitFloat16=Ln,Dn.prototype.visitFloat32=Ln,Dn.prototype.visitFloat64=Ln,Dn.prototype.visitUtf8=Ln,Dn.prototype.visitBinary=Ln,Dn.prototype.visitFixedSizeBinary=Ln,Dn.prototype.visitDate=Ln,Dn.prototype.visitDateDay=Ln,Dn.prototype.visitDateMillisecond=Ln,Dn.prototype.visitTimestamp=Ln,Dn.prototype.visitTimestampSecond=Ln,Dn.prototype.visitTimestampMillisecond=Ln,Dn.prototype.visitTimestampMicrosecond=Ln,Dn.prototype.visitTimestampNanosecond=Ln,Dn.prototype.visitTime=Ln,Dn.prototype.visitTimeSecond=Ln,Dn.prototype.visitTimeMillisecond=Ln,Dn.prototype.visitTimeMicrosecond=Ln,Dn.prototype.visitTimeNanosecond=Ln,Dn.prototype.visitDecimal=Ln,Dn.prototype.visitList=Ln,Dn.prototype.visitStruct=Ln,Dn.prototype.visitUnion=Ln,Dn.prototype.visitDenseUnion=Bn,Dn.prototype.visitSparseUnion=Bn,Dn.prototype.visitDictionary=Ln,Dn.prototype.visitInterval=Ln,Dn.prototype.visitIntervalDayTime=Ln,Dn.prototype.visitIntervalYearMonth=Ln,Dn.prototype.visitFixedSizeList=Ln,Dn.prototype.visitMap=Ln;const Fn=new Dn;class Mn extends rt{}function Pn(e){const{type:t}=e;if(0===e.nullCount&&1===e.stride&&(t.typeId===c.Timestamp||t instanceof Me&&64!==t.bitWidth||t instanceof $e&&64!==t.bitWidth||t instanceof ze&&t.precision!==o.HALF))return new bn(e.data.length,t=>{const n=e.data[t];return n.values.subarray(0,n.length)[Symbol.iterator]()});let n=0;return new bn(e.data.length,t=>{const r=e.data[t].length,i=e.slice(n,n+r);return n+=r,new zn(i)})}class zn{constructor(e){this.vector=e,this.index=0}next(){return this.index<this.vector.length?{value:this.vector.get(this.index++)}:{done:!0,value:null}}[Symbol.iterator](){return this}}Mn.prototype.visitNull=Pn,Mn.prototype.visitBool=Pn,Mn.prototype.visitInt=Pn,Mn.prototype.visitInt8=Pn,Mn.prototype.visitInt16=Pn,Mn.prototype.visitInt32=Pn,Mn.prototype.visitInt64=Pn,Mn.prototype.visitUint8=Pn,Mn.prototype.visitUint16=Pn,Mn.prototype.visitUint32=Pn,Mn.prototype.visitUint64=Pn,Mn.prototype.visitFloat=Pn,Mn.prototype.visitFloat16=Pn,Mn.prototype.visitFloat32=Pn,Mn.prototype.visitFloat64=Pn,Mn.prototype.visitUtf8=Pn,Mn.prototype.visitBinary=Pn,Mn.prototype.visitFixedSizeBinary=Pn,Mn.prototype.visitDate=Pn,Mn.prototype.visitDateDay=Pn,Mn.prototype.visitDateMillisecond=Pn,Mn.prototype.visitTimestamp=Pn,Mn.prototype.visitTimestampSecond=Pn,Mn.prototype.visitTimestampMillisecond=Pn,Mn.prototype.visitTimestampMicrosecond=Pn,Mn.prototype.visitTimestampNanosecond=Pn,Mn.prototype.visitTime=Pn,Mn.prototype.visitTimeSecond=Pn,Mn.prototype.visitTimeMillisecond=Pn,Mn.prototype.visitTimeMicrosecond=Pn,Mn.prototype.visitTimeNanosecond=Pn,Mn.prototype.visitDecimal=Pn,Mn.prototype.visitList=Pn,Mn.prototype.visitStruct=Pn,Mn.prototype.visitUnion=Pn,Mn.prototype.visitDenseUnion=Pn,Mn.prototype.visitSparseUnion=Pn,Mn.prototype.visitDictionary=Pn,Mn.prototype.visitInterval=Pn,Mn.prototype.visitIntervalDayTime=Pn,Mn.prototype.visitIntervalYearMonth=Pn,Mn.prototype.visitFixedSizeList=Pn,Mn.prototype.visitMap=Pn;const Un=new Mn,Rn=(e,t)=>e+t;class jn extends rt{visitNull(e,t){return 0}visitInt(e,t){return e.type.bitWidth/8}visitFloat(e,t){return e.type.ArrayType.BYTES_PER_ELEMENT}visitBool(e,t){return 1/8}visitDecimal(e,t){return e.type.bitWidth/8}visitDate(e,t){return 4*(e.type.unit+1)}visitTime(e,t){return e.type.bitWidth/8}visitTimestamp(e,t){return e.type.unit===a.SECOND?4:8}visitInterval(e,t){return 4*(e.type.unit+1)}visitStruct(e,t){return e.children.reduce((e,n)=>e+$n.visit(n,t),0)}visitFixedSizeBinary(e,t){return e.type.byteWidth}visitMap(e,t){return 8+e.children.reduce((e,n)=>e+$n.visit(n,t),0)}visitDictionary(e,t){var n;return e.type.indices.bitWidth/8+((null===(n=e.dictionary)||void 0===n?void 0:n.getByteLength(e.values[t]))||0)}}const Vn=(e,t)=>{let{type:n,children:r,typeIds:i,valueOffsets:o}=e;const s=n.typeIdToChildIndex[i[t]];return 8+$n.visit(r[s],o[t])},Hn=(e,t)=>{let{children:n}=e;return 4+$n.visitMany(n,n.map(()=>t)).reduce(Rn,0)};jn.prototype.visitUtf8=(e,t)=>{let{valueOffsets:n}=e;return n[t+1]-n[t]+8},jn.prototype.visitBinary=(e,t)=>{let{valueOffsets:n}=e;return n[t+1]-n[t]+8},jn.prototype.visitList=(e,t)=>{let{valueOffsets:n,stride:r,children:i}=e;const o=i[0],{[t*r]:s}=n,{[t*r+1]:a}=n,l=$n.getVisitFn(o.type),u=o.slice(s,a-s);let c=8;for(let d=-1,f=a-s;++d<f;)c+=l(u,d);return c},jn.prototype.visitFixedSizeList=(e,t)=>{let{stride:n,children:r}=e;const i=r[0],o=i.slice(t*n,n),s=$n.getVisitFn(i.type);let a=0;for(let l=-1,u=o.length;++l<u;)a+=s(o,l);return a},jn.prototype.visitUnion=(e,t)=>e.type.mode===i.Dense?Vn(e,t):Hn(e,t),jn.prototype.visitDenseUnion=Vn,jn.prototype.visitSparseUnion=Hn;const $n=new jn;var Wn;const Yn={},qn={};class Qn{constructor(e){var t,n,r;const i=e[0]instanceof Qn?e.flatMap(e=>e.data):e;if(0===i.length||i.some(e=>!(e instanceof Gn)))throw new TypeError("Vector constructor expects an Array of Data instances.");const o=null===(t=i[0])||void 0===t?void 0:t.type;switch(i.length){case 0:this._offsets=[0];break;case 1:{const{get:e,set:t,indexOf:n,byteLength:r}=Yn[o.typeId],s=i[0];this.isValid=e=>_n(s,e),this.get=t=>e(s,t),this.set=(e,n)=>t(s,e,n),this.indexOf=e=>n(s,e),this.getByteLength=e=>r(s,e),this._offsets=[0,s.length];break}default:Object.setPrototypeOf(this,qn[o.typeId]),this._offsets=gn(i)}this.data=i,this.type=o,this.stride=nt(o),this.numChildren=null!==(r=null===(n=o.children)||void 0===n?void 0:n.length)&&void 0!==r?r:0,this.length=this._offsets[this._offsets.length-1]}get byteLength(){return-1===this._byteLength&&(this._byteLength=this.data.reduce((e,t)=>e+t.byteLength,0)),this._byteLength}get nullCount(){return-1===this._nullCount&&(this._nullCount=mn(this.data)),this._nullCount}get ArrayType(){return this.type.ArrayType}get[Symbol.toStringTag](){return"".concat(this.VectorName,"<").concat(this.type[Symbol.toStringTag],">")}get VectorName(){return"".concat(c[this.type.typeId],"Vector")}isValid(e){return!1}get(e){return null}set(e,t){}indexOf(e,t){return-1}includes(e,t){return this.indexOf(e,t)>0}getByteLength(e){return 0}[Symbol.iterator](){return Un.visit(this)}concat(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return new Qn(this.data.concat(t.flatMap(e=>e.data).flat(Number.POSITIVE_INFINITY)))}slice(e,t){return new Qn(dn(this,e,t,(e,t,n)=>{let{data:r,_offsets:i}=e;return vn(r,i,t,n)}))}toJSON(){return[...this]}toArray(){const{type:e,data:t,length:n,stride:r,ArrayType:i}=this;switch(e.typeId){case c.Int:case c.Float:case c.Decimal:case c.Time:case c.Timestamp:switch(t.length){case 0:return new i;case 1:return t[0].values.subarray(0,n*r);default:return t.reduce((e,t)=>{let{values:n,length:i}=t;return e.array.set(n.subarray(0,i*r),e.offset),e.offset+=i*r,e},{array:new i(n*r),offset:0}).array}}return[...this]}toString(){return"[".concat([...this].join(","),"]")}getChild(e){var t;return this.getChildAt(null===(t=this.type.children)||void 0===t?void 0:t.findIndex(t=>t.name===e))}getChildAt(e){return e>-1&&e<this.numChildren?new Qn(this.data.map(t=>{let{children:n}=t;return n[e]})):null}get isMemoized(){return!!Be.isDictionary(this.type)&&this.data[0].dictionary.isMemoized}memoize(){if(Be.isDictionary(this.type)){const e=new Kn(this.data[0].dictionary),t=this.data.map(t=>{const n=t.clone();return n.dictionary=e,n});return new Qn(t)}return new Kn(this)}unmemoize(){if(Be.isDictionary(this.type)&&this.isMemoized){const e=this.data[0].dictionary.unmemoize(),t=this.data.map(t=>{const n=t.clone();return n.dictionary=e,n});return new Qn(t)}return this}}Wn=Symbol.toStringTag,Qn[Wn]=(e=>{e.type=Be.prototype,e.data=[],e.length=0,e.stride=1,e.numChildren=0,e._nullCount=-1,e._byteLength=-1,e._offsets=new Uint32Array([0]),e[Symbol.isConcatSpreadable]=!0;const t=Object.keys(c).map(e=>c[e]).filter(e=>"number"===typeof e&&e!==c.NONE);for(const n of t){const t=rn.getVisitFnByTypeId(n),r=Ct.getVisitFnByTypeId(n),i=Fn.getVisitFnByTypeId(n),o=$n.getVisitFnByTypeId(n);Yn[n]={get:t,set:r,indexOf:i,byteLength:o},qn[n]=Object.create(e,{isValid:{value:Sn(_n)},get:{value:Sn(rn.getVisitFnByTypeId(n))},set:{value:kn(Ct.getVisitFnByTypeId(n))},indexOf:{value:In(Fn.getVisitFnByTypeId(n))},getByteLength:{value:Sn($n.getVisitFnByTypeId(n))}})}return"Vector"})(Qn.prototype);class Kn extends Qn{constructor(e){super(e.data);const t=this.get,n=this.set,r=this.slice,i=new Array(this.length);Object.defineProperty(this,"get",{value(e){const n=i[e];if(void 0!==n)return n;const r=t.call(this,e);return i[e]=r,r}}),Object.defineProperty(this,"set",{value(e,t){n.call(this,e,t),i[e]=t}}),Object.defineProperty(this,"slice",{value:(e,t)=>new Kn(r.call(this,e,t))}),Object.defineProperty(this,"isMemoized",{value:!0}),Object.defineProperty(this,"unmemoize",{value:()=>new Qn(this.data)}),Object.defineProperty(this,"memoize",{value:()=>this})}}class Gn{constructor(e,t,n,r,i){let o,s=arguments.length>5&&void 0!==arguments[5]?arguments[5]:[],a=arguments.length>6?arguments[6]:void 0;this.type=e,this.children=s,this.dictionary=a,this.offset=Math.floor(Math.max(t||0,0)),this.length=Math.floor(Math.max(n||0,0)),this._nullCount=Math.floor(Math.max(r||0,-1)),i instanceof Gn?(this.stride=i.stride,this.values=i.values,this.typeIds=i.typeIds,this.nullBitmap=i.nullBitmap,this.valueOffsets=i.valueOffsets):(this.stride=nt(e),i&&((o=i[0])&&(this.valueOffsets=o),(o=i[1])&&(this.values=o),(o=i[2])&&(this.nullBitmap=o),(o=i[3])&&(this.typeIds=o))),this.nullable=0!==this._nullCount&&this.nullBitmap&&this.nullBitmap.byteLength>0}get typeId(){return this.type.typeId}get ArrayType(){return this.type.ArrayType}get buffers(){return[this.valueOffsets,this.values,this.nullBitmap,this.typeIds]}get byteLength(){let e=0;const{valueOffsets:t,values:n,nullBitmap:r,typeIds:i}=this;return t&&(e+=t.byteLength),n&&(e+=n.byteLength),r&&(e+=r.byteLength),i&&(e+=i.byteLength),this.children.reduce((e,t)=>e+t.byteLength,e)}get nullCount(){let e,t=this._nullCount;return t<=-1&&(e=this.nullBitmap)&&(this._nullCount=t=this.length-Cn(e,this.offset,this.offset+this.length)),t}getValid(e){if(this.nullable&&this.nullCount>0){const t=this.offset+e;return 0!==(this.nullBitmap[t>>3]&1<<t%8)}return!0}setValid(e,t){if(!this.nullable)return t;if(!this.nullBitmap||this.nullBitmap.byteLength<=e>>3){const{nullBitmap:e}=this._changeLengthAndBackfillNullBitmap(this.length);Object.assign(this,{nullBitmap:e,_nullCount:0})}const{nullBitmap:n,offset:r}=this,i=r+e>>3,o=(r+e)%8,s=n[i]>>o&1;return t?0===s&&(n[i]|=1<<o,this._nullCount=this.nullCount+1):1===s&&(n[i]&=~(1<<o),this._nullCount=this.nullCount-1),t}clone(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.type,t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.offset,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.length,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:this._nullCount,i=arguments.length>4&&void 0!==arguments[4]?arguments[4]:this,o=arguments.length>5&&void 0!==arguments[5]?arguments[5]:this.children;return new Gn(e,t,n,r,i,o,this.dictionary)}slice(e,t){const{stride:n,typeId:r,children:i}=this,o=+(0===this._nullCount)-1,s=16===r?n:1,a=this._sliceBuffers(e,t,n,r);return this.clone(this.type,this.offset+e,t,o,a,0===i.length||this.valueOffsets?i:this._sliceChildren(i,s*e,s*t))}_changeLengthAndBackfillNullBitmap(e){if(this.typeId===c.Null)return this.clone(this.type,0,e,0);const{length:t,nullCount:n}=this,r=new Uint8Array((e+63&-64)>>3).fill(255,0,t>>3);r[t>>3]=(1<<t-(-8&t))-1,n>0&&r.set(En(this.offset,t,this.nullBitmap),0);const i=this.buffers;return i[d.VALIDITY]=r,this.clone(this.type,0,e,n+(e-t),i)}_sliceBuffers(e,t,n,r){let i;const{buffers:o}=this;return(i=o[d.TYPE])&&(o[d.TYPE]=i.subarray(e,e+t)),(i=o[d.OFFSET])&&(o[d.OFFSET]=i.subarray(e,e+t+1))||(i=o[d.DATA])&&(o[d.DATA]=6===r?i:i.subarray(n*e,n*(e+t))),o}_sliceChildren(e,t,n){return e.map(e=>e.slice(t,n))}}Gn.prototype.children=Object.freeze([]);class Xn extends rt{visit(e){return this.getVisitFn(e.type).call(this,e)}visitNull(e){const{type:t,offset:n=0,length:r=0}=e;return new Gn(t,n,r,0)}visitBool(e){const{type:t,offset:n=0}=e,r=Z(e.nullBitmap),i=X(t.ArrayType,e.data),{length:o=i.length>>3,nullCount:s=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,o,s,[void 0,i,r])}visitInt(e){const{type:t,offset:n=0}=e,r=Z(e.nullBitmap),i=X(t.ArrayType,e.data),{length:o=i.length,nullCount:s=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,o,s,[void 0,i,r])}visitFloat(e){const{type:t,offset:n=0}=e,r=Z(e.nullBitmap),i=X(t.ArrayType,e.data),{length:o=i.length,nullCount:s=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,o,s,[void 0,i,r])}visitUtf8(e){const{type:t,offset:n=0}=e,r=Z(e.data),i=Z(e.nullBitmap),o=J(e.valueOffsets),{length:s=o.length-1,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,s,a,[o,r,i])}visitBinary(e){const{type:t,offset:n=0}=e,r=Z(e.data),i=Z(e.nullBitmap),o=J(e.valueOffsets),{length:s=o.length-1,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,s,a,[o,r,i])}visitFixedSizeBinary(e){const{type:t,offset:n=0}=e,r=Z(e.nullBitmap),i=X(t.ArrayType,e.data),{length:o=i.length/nt(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,o,s,[void 0,i,r])}visitDate(e){const{type:t,offset:n=0}=e,r=Z(e.nullBitmap),i=X(t.ArrayType,e.data),{length:o=i.length/nt(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,o,s,[void 0,i,r])}visitTimestamp(e){const{type:t,offset:n=0}=e,r=Z(e.nullBitmap),i=X(t.ArrayType,e.data),{length:o=i.length/nt(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,o,s,[void 0,i,r])}visitTime(e){const{type:t,offset:n=0}=e,r=Z(e.nullBitmap),i=X(t.ArrayType,e.data),{length:o=i.length/nt(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,o,s,[void 0,i,r])}visitDecimal(e){const{type:t,offset:n=0}=e,r=Z(e.nullBitmap),i=X(t.ArrayType,e.data),{length:o=i.length/nt(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,o,s,[void 0,i,r])}visitList(e){const{type:t,offset:n=0,child:r}=e,i=Z(e.nullBitmap),o=J(e.valueOffsets),{length:s=o.length-1,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,s,a,[o,void 0,i],[r])}visitStruct(e){const{type:t,offset:n=0,children:r=[]}=e,i=Z(e.nullBitmap),{length:o=r.reduce((e,t)=>{let{length:n}=t;return Math.max(e,n)},0),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,o,s,[void 0,void 0,i],r)}visitUnion(e){const{type:t,offset:n=0,children:r=[]}=e,i=Z(e.nullBitmap),o=X(t.ArrayType,e.typeIds),{length:s=o.length,nullCount:a=(e.nullBitmap?-1:0)}=e;if(Be.isSparseUnion(t))return new Gn(t,n,s,a,[void 0,void 0,i,o],r);const l=J(e.valueOffsets);return new Gn(t,n,s,a,[l,void 0,i,o],r)}visitDictionary(e){const{type:t,offset:n=0}=e,r=Z(e.nullBitmap),i=X(t.indices.ArrayType,e.data),{dictionary:o=new Qn([(new Xn).visit({type:t.dictionary})])}=e,{length:s=i.length,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,s,a,[void 0,i,r],[],o)}visitInterval(e){const{type:t,offset:n=0}=e,r=Z(e.nullBitmap),i=X(t.ArrayType,e.data),{length:o=i.length/nt(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,o,s,[void 0,i,r])}visitFixedSizeList(e){const{type:t,offset:n=0,child:r=(new Xn).visit({type:t.valueType})}=e,i=Z(e.nullBitmap),{length:o=r.length/nt(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,o,s,[void 0,void 0,i],[r])}visitMap(e){const{type:t,offset:n=0,child:r=(new Xn).visit({type:t.childType})}=e,i=Z(e.nullBitmap),o=J(e.valueOffsets),{length:s=o.length-1,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Gn(t,n,s,a,[o,void 0,i],[r])}}function Jn(e){return(new Xn).visit(e)}class Zn{constructor(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],t=arguments.length>1?arguments[1]:void 0,n=arguments.length>2?arguments[2]:void 0;this.fields=e||[],this.metadata=t||new Map,n||(n=nr(e)),this.dictionaries=n}get[Symbol.toStringTag](){return"Schema"}get names(){return this.fields.map(e=>e.name)}toString(){return"Schema<{ ".concat(this.fields.map((e,t)=>"".concat(t,": ").concat(e)).join(", ")," }>")}select(e){const t=new Set(e),n=this.fields.filter(e=>t.has(e.name));return new Zn(n,this.metadata)}selectAt(e){const t=e.map(e=>this.fields[e]).filter(Boolean);return new Zn(t,this.metadata)}assign(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];const r=t[0]instanceof Zn?t[0]:Array.isArray(t[0])?new Zn(t[0]):new Zn(t),i=[...this.fields],o=tr(tr(new Map,this.metadata),r.metadata),s=r.fields.filter(e=>{const t=i.findIndex(t=>t.name===e.name);return!~t||(i[t]=e.clone({metadata:tr(tr(new Map,i[t].metadata),e.metadata)}))&&!1}),a=nr(s,new Map);return new Zn([...i,...s],o,new Map([...this.dictionaries,...a]))}}Zn.prototype.fields=null,Zn.prototype.metadata=null,Zn.prototype.dictionaries=null;class er{constructor(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=arguments.length>3?arguments[3]:void 0;this.name=e,this.type=t,this.nullable=n,this.metadata=r||new Map}static new(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];let[r,i,o,s]=t;return t[0]&&"object"===typeof t[0]&&(({name:r}=t[0]),void 0===i&&(i=t[0].type),void 0===o&&(o=t[0].nullable),void 0===s&&(s=t[0].metadata)),new er("".concat(r),i,o,s)}get typeId(){return this.type.typeId}get[Symbol.toStringTag](){return"Field"}toString(){return"".concat(this.name,": ").concat(this.type)}clone(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];let[r,i,o,s]=t;return t[0]&&"object"===typeof t[0]?({name:r=this.name,type:i=this.type,nullable:o=this.nullable,metadata:s=this.metadata}=t[0]):[r=this.name,i=this.type,o=this.nullable,s=this.metadata]=t,er.new(r,i,o,s)}}function tr(e,t){return new Map([...e||new Map,...t||new Map])}function nr(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Map;for(let n=-1,r=e.length;++n<r;){const r=e[n].type;if(Be.isDictionary(r))if(t.has(r.id)){if(t.get(r.id)!==r.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else t.set(r.id,r.dictionary);r.children&&r.children.length>0&&nr(r.children,t)}return t}er.prototype.type=null,er.prototype.name=null,er.prototype.nullable=null,er.prototype.metadata=null;class rr extends rt{compareSchemas(e,t){return e===t||t instanceof e.constructor&&this.compareManyFields(e.fields,t.fields)}compareManyFields(e,t){return e===t||Array.isArray(e)&&Array.isArray(t)&&e.length===t.length&&e.every((e,n)=>this.compareFields(e,t[n]))}compareFields(e,t){return e===t||t instanceof e.constructor&&e.name===t.name&&e.nullable===t.nullable&&this.visit(e.type,t.type)}}function ir(e,t){return t instanceof e.constructor}function or(e,t){return e===t||ir(e,t)}function sr(e,t){return e===t||ir(e,t)&&e.bitWidth===t.bitWidth&&e.isSigned===t.isSigned}function ar(e,t){return e===t||ir(e,t)&&e.precision===t.precision}function lr(e,t){return e===t||ir(e,t)&&e.unit===t.unit}function ur(e,t){return e===t||ir(e,t)&&e.unit===t.unit&&e.timezone===t.timezone}function cr(e,t){return e===t||ir(e,t)&&e.unit===t.unit&&e.bitWidth===t.bitWidth}function dr(e,t){return e===t||ir(e,t)&&e.mode===t.mode&&e.typeIds.every((e,n)=>e===t.typeIds[n])&&hr.compareManyFields(e.children,t.children)}function fr(e,t){return e===t||ir(e,t)&&e.unit===t.unit}rr.prototype.visitNull=or,rr.prototype.visitBool=or,rr.prototype.visitInt=sr,rr.prototype.visitInt8=sr,rr.prototype.visitInt16=sr,rr.prototype.visitInt32=sr,rr.prototype.visitInt64=sr,rr.prototype.visitUint8=sr,rr.prototype.visitUint16=sr,rr.prototype.visitUint32=sr,rr.prototype.visitUint64=sr,rr.prototype.visitFloat=ar,rr.prototype.visitFloat16=ar,rr.prototype.visitFloat32=ar,rr.prototype.visitFloat64=ar,rr.prototype.visitUtf8=or,rr.prototype.visitBinary=or,rr.prototype.visitFixedSizeBinary=function(e,t){return e===t||ir(e,t)&&e.byteWidth===t.byteWidth},rr.prototype.visitDate=lr,rr.prototype.visitDateDay=lr,rr.prototype.visitDateMillisecond=lr,rr.prototype.visitTimestamp=ur,rr.prototype.visitTimestampSecond=ur,rr.prototype.visitTimestampMillisecond=ur,rr.prototype.visitTimestampMicrosecond=ur,rr.prototype.visitTimestampNanosecond=ur,rr.prototype.visitTime=cr,rr.prototype.visitTimeSecond=cr,rr.prototype.visitTimeMillisecond=cr,rr.prototype.visitTimeMicrosecond=cr,rr.prototype.visitTimeNanosecond=cr,rr.prototype.visitDecimal=or,rr.prototype.visitList=function(e,t){return e===t||ir(e,t)&&e.children.length===t.children.length&&hr.compareManyFields(e.children,t.children)},rr.prototype.visitStruct=function(e,t){return e===t||ir(e,t)&&e.children.length===t.children.length&&hr.compareManyFields(e.children,t.children)},rr.prototype.visitUnion=dr,rr.prototype.visitDenseUnion=dr,rr.prototype.visitSparseUnion=dr,rr.prototype.visitDictionary=function(e,t){return e===t||ir(e,t)&&e.id===t.id&&e.isOrdered===t.isOrdered&&hr.visit(e.indices,t.indices)&&hr.visit(e.dictionary,t.dictionary)},rr.prototype.visitInterval=fr,rr.prototype.visitIntervalDayTime=fr,rr.prototype.visitIntervalYearMonth=fr,rr.prototype.visitFixedSizeList=function(e,t){return e===t||ir(e,t)&&e.listSize===t.listSize&&e.children.length===t.children.length&&hr.compareManyFields(e.children,t.children)},rr.prototype.visitMap=function(e,t){return e===t||ir(e,t)&&e.keysSorted===t.keysSorted&&e.children.length===t.children.length&&hr.compareManyFields(e.children,t.children)};const hr=new rr;function pr(e,t){return hr.compareSchemas(e,t)}var yr,br;class mr{constructor(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];switch(t.length){case 2:if([this.schema]=t,!(this.schema instanceof Zn))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");if([,this.data=Jn({nullCount:0,type:new Qe(this.schema.fields),children:this.schema.fields.map(e=>Jn({type:e.type,nullCount:0}))})]=t,!(this.data instanceof Gn))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");[this.schema,this.data]=gr(this.schema,this.data.children);break;case 1:{const[e]=t,{fields:n,children:r,length:i}=Object.keys(e).reduce((t,n,r)=>(t.children[r]=e[n],t.length=Math.max(t.length,e[n].length),t.fields[r]=er.new({name:n,type:e[n].type,nullable:!0}),t),{length:0,fields:new Array,children:new Array}),o=new Zn(n),s=Jn({type:new Qe(n),length:i,children:r,nullCount:0});[this.schema,this.data]=gr(o,s.children,i);break}default:throw new TypeError("RecordBatch constructor expects an Object mapping names to child Data, or a [Schema, Data] pair.")}}get dictionaries(){return this._dictionaries||(this._dictionaries=vr(this.schema.fields,this.data.children))}get numCols(){return this.schema.fields.length}get numRows(){return this.data.length}get nullCount(){return this.data.nullCount}isValid(e){return this.data.getValid(e)}get(e){return rn.visit(this.data,e)}set(e,t){return Ct.visit(this.data,e,t)}indexOf(e,t){return Fn.visit(this.data,e,t)}getByteLength(e){return $n.visit(this.data,e)}[Symbol.iterator](){return Un.visit(new Qn([this.data]))}toArray(){return[...this]}concat(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return new kr(this.schema,[this,...t])}slice(e,t){const[n]=new Qn([this.data]).slice(e,t).data;return new mr(this.schema,n)}getChild(e){var t;return this.getChildAt(null===(t=this.schema.fields)||void 0===t?void 0:t.findIndex(t=>t.name===e))}getChildAt(e){return e>-1&&e<this.schema.fields.length?new Qn([this.data.children[e]]):null}setChild(e,t){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex(t=>t.name===e),t)}setChildAt(e,t){let n=this.schema,r=this.data;if(e>-1&&e<this.numCols){t||(t=new Qn([Jn({type:new Fe,length:this.numRows})]));const i=n.fields.slice(),o=r.children.slice(),s=i[e].clone({type:t.type});[i[e],o[e]]=[s,t.data[0]],n=new Zn(i,new Map(this.schema.metadata)),r=Jn({type:new Qe(i),children:o})}return new mr(n,r)}select(e){const t=this.schema.select(e),n=new Qe(t.fields),r=[];for(const i of e){const e=this.schema.fields.findIndex(e=>e.name===i);~e&&(r[e]=this.data.children[e])}return new mr(t,Jn({type:n,length:this.numRows,children:r}))}selectAt(e){const t=this.schema.selectAt(e),n=e.map(e=>this.data.children[e]).filter(Boolean),r=Jn({type:new Qe(t.fields),length:this.numRows,children:n});return new mr(t,r)}}function gr(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:t.reduce((e,t)=>Math.max(e,t.length),0);var r;const i=[...e.fields],o=[...t],s=(n+63&-64)>>3;for(const[a,l]of e.fields.entries()){const e=t[a];e&&e.length===n||(i[a]=l.clone({nullable:!0}),o[a]=null!==(r=null===e||void 0===e?void 0:e._changeLengthAndBackfillNullBitmap(n))&&void 0!==r?r:Jn({type:l.type,length:n,nullCount:n,nullBitmap:new Uint8Array(s)}))}return[e.assign(i),Jn({type:new Qe(i),length:n,children:o})]}function vr(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:new Map;for(let r=-1,i=e.length;++r<i;){const i=e[r].type,o=t[r];if(Be.isDictionary(i))if(n.has(i.id)){if(n.get(i.id)!==o.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else o.dictionary&&n.set(i.id,o.dictionary);i.children&&i.children.length>0&&vr(i.children,o.children,n)}return n}yr=Symbol.toStringTag,mr[yr]=(e=>(e._nullCount=-1,e[Symbol.isConcatSpreadable]=!0,"RecordBatch"))(mr.prototype);class wr extends mr{constructor(e){const t=e.fields.map(e=>Jn({type:e.type}));super(e,Jn({type:new Qe(e.fields),nullCount:0,children:t}))}}function _r(e,t){return function(e,t){const n=[...e.fields],r=[],i={numBatches:t.reduce((e,t)=>Math.max(e,t.length),0)};let o=0,s=0,a=-1;const l=t.length;let u,c=[];for(;i.numBatches-- >0;){for(s=Number.POSITIVE_INFINITY,a=-1;++a<l;)c[a]=u=t[a].shift(),s=Math.min(s,u?u.length:s);Number.isFinite(s)&&(c=Sr(n,s,c,t,i),s>0&&(r[o++]=Jn({type:new Qe(n),length:s,nullCount:0,children:c.slice()})))}return[e=e.assign(n),r.map(t=>new mr(e,t))]}(e,t.map(e=>e.data.concat()))}function Sr(e,t,n,r,i){var o;const s=(t+63&-64)>>3;for(let a=-1,l=r.length;++a<l;){const l=n[a],u=null===l||void 0===l?void 0:l.length;if(u>=t)u===t?n[a]=l:(n[a]=l.slice(0,t),i.numBatches=Math.max(i.numBatches,r[a].unshift(l.slice(t,u-t))));else{const r=e[a];e[a]=r.clone({nullable:!0}),n[a]=null!==(o=null===l||void 0===l?void 0:l._changeLengthAndBackfillNullBitmap(t))&&void 0!==o?o:Jn({type:r.type,length:t,nullCount:t,nullBitmap:new Uint8Array(s)})}}return n}class kr{constructor(){for(var e,t,n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];if(0===r.length)return this.batches=[],this.schema=new Zn([]),this._offsets=[0],this;let o,s;r[0]instanceof Zn&&(o=r.shift()),r[r.length-1]instanceof Uint32Array&&(s=r.pop());const a=e=>{if(e){if(e instanceof mr)return[e];if(e instanceof kr)return e.batches;if(e instanceof Gn){if(e.type instanceof Qe)return[new mr(new Zn(e.type.children),e)]}else{if(Array.isArray(e))return e.flatMap(e=>a(e));if("function"===typeof e[Symbol.iterator])return[...e].flatMap(e=>a(e));if("object"===typeof e){const t=Object.keys(e),n=t.map(t=>new Qn([e[t]])),r=new Zn(t.map((e,t)=>new er(String(e),n[t].type))),[,i]=_r(r,n);return 0===i.length?[new mr(e)]:i}}}return[]},l=r.flatMap(e=>a(e));if(o=null!==(t=null!==o&&void 0!==o?o:null===(e=l[0])||void 0===e?void 0:e.schema)&&void 0!==t?t:new Zn([]),!(o instanceof Zn))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");for(const u of l){if(!(u instanceof mr))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");if(!pr(o,u.schema))throw new TypeError("Table and inner RecordBatch schemas must be equivalent.")}this.schema=o,this.batches=l,this._offsets=null!==s&&void 0!==s?s:gn(this.data)}get data(){return this.batches.map(e=>{let{data:t}=e;return t})}get numCols(){return this.schema.fields.length}get numRows(){return this.data.reduce((e,t)=>e+t.length,0)}get nullCount(){return-1===this._nullCount&&(this._nullCount=mn(this.data)),this._nullCount}isValid(e){return!1}get(e){return null}set(e,t){}indexOf(e,t){return-1}getByteLength(e){return 0}[Symbol.iterator](){return this.batches.length>0?Un.visit(new Qn(this.data)):new Array(0)[Symbol.iterator]()}toArray(){return[...this]}toString(){return"[\n  ".concat(this.toArray().join(",\n  "),"\n]")}concat(){const e=this.schema;for(var t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];const i=this.data.concat(n.flatMap(e=>{let{data:t}=e;return t}));return new kr(e,i.map(t=>new mr(e,t)))}slice(e,t){const n=this.schema;[e,t]=dn({length:this.numRows},e,t);const r=vn(this.data,this._offsets,e,t);return new kr(n,r.map(e=>new mr(n,e)))}getChild(e){return this.getChildAt(this.schema.fields.findIndex(t=>t.name===e))}getChildAt(e){if(e>-1&&e<this.schema.fields.length){const t=this.data.map(t=>t.children[e]);if(0===t.length){const{type:n}=this.schema.fields[e],r=Jn({type:n,length:0,nullCount:0});t.push(r._changeLengthAndBackfillNullBitmap(this.numRows))}return new Qn(t)}return null}setChild(e,t){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex(t=>t.name===e),t)}setChildAt(e,t){let n=this.schema,r=[...this.batches];if(e>-1&&e<this.numCols){t||(t=new Qn([Jn({type:new Fe,length:this.numRows})]));const i=n.fields.slice(),o=i[e].clone({type:t.type}),s=this.schema.fields.map((e,t)=>this.getChildAt(t));[i[e],s[e]]=[o,t],[n,r]=_r(n,s)}return new kr(n,r)}select(e){const t=this.schema.fields.reduce((e,t,n)=>e.set(t.name,n),new Map);return this.selectAt(e.map(e=>t.get(e)).filter(e=>e>-1))}selectAt(e){const t=this.schema.selectAt(e),n=this.batches.map(t=>t.selectAt(e));return new kr(t,n)}assign(e){const t=this.schema.fields,[n,r]=e.schema.fields.reduce((e,n,r)=>{const[i,o]=e,s=t.findIndex(e=>e.name===n.name);return~s?o[s]=r:i.push(r),e},[[],[]]),i=this.schema.assign(e.schema),o=[...t.map((e,t)=>[t,r[t]]).map(t=>{let[n,r]=t;return void 0===r?this.getChildAt(n):e.getChildAt(r)}),...n.map(t=>e.getChildAt(t))].filter(Boolean);return new kr(..._r(i,o))}}br=Symbol.toStringTag,kr[br]=(e=>(e.schema=null,e.batches=[],e._offsets=new Uint32Array([0]),e._nullCount=-1,e[Symbol.isConcatSpreadable]=!0,e.isValid=Sn(_n),e.get=Sn(rn.getVisitFn(c.Struct)),e.set=kn(Ct.getVisitFn(c.Struct)),e.indexOf=In(Fn.getVisitFn(c.Struct)),e.getByteLength=Sn($n.getVisitFn(c.Struct)),"Table"))(kr.prototype);class Ir{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}offset(){return this.bb.readInt64(this.bb_pos)}metaDataLength(){return this.bb.readInt32(this.bb_pos+8)}bodyLength(){return this.bb.readInt64(this.bb_pos+16)}static sizeOf(){return 24}static createBlock(e,t,n,r){return e.prep(8,24),e.writeInt64(r),e.pad(4),e.writeInt32(n),e.writeInt64(t),e.offset()}}const xr=new Int32Array(2),Tr=new Float32Array(xr.buffer),Er=new Float64Array(xr.buffer),Ar=1===new Uint16Array(new Uint8Array([1,0]).buffer)[0];class Or{constructor(e,t){this.low=0|e,this.high=0|t}static create(e,t){return 0==e&&0==t?Or.ZERO:new Or(e,t)}toFloat64(){return(this.low>>>0)+4294967296*this.high}equals(e){return this.low==e.low&&this.high==e.high}}var Cr,Nr,Dr,Lr,Br;Or.ZERO=new Or(0,0),function(e){e[e.UTF8_BYTES=1]="UTF8_BYTES",e[e.UTF16_STRING=2]="UTF16_STRING"}(Cr||(Cr={}));class Fr{constructor(e){this.bytes_=e,this.position_=0}static allocate(e){return new Fr(new Uint8Array(e))}clear(){this.position_=0}bytes(){return this.bytes_}position(){return this.position_}setPosition(e){this.position_=e}capacity(){return this.bytes_.length}readInt8(e){return this.readUint8(e)<<24>>24}readUint8(e){return this.bytes_[e]}readInt16(e){return this.readUint16(e)<<16>>16}readUint16(e){return this.bytes_[e]|this.bytes_[e+1]<<8}readInt32(e){return this.bytes_[e]|this.bytes_[e+1]<<8|this.bytes_[e+2]<<16|this.bytes_[e+3]<<24}readUint32(e){return this.readInt32(e)>>>0}readInt64(e){return new Or(this.readInt32(e),this.readInt32(e+4))}readUint64(e){return new Or(this.readUint32(e),this.readUint32(e+4))}readFloat32(e){return xr[0]=this.readInt32(e),Tr[0]}readFloat64(e){return xr[Ar?0:1]=this.readInt32(e),xr[Ar?1:0]=this.readInt32(e+4),Er[0]}writeInt8(e,t){this.bytes_[e]=t}writeUint8(e,t){this.bytes_[e]=t}writeInt16(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8}writeUint16(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8}writeInt32(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8,this.bytes_[e+2]=t>>16,this.bytes_[e+3]=t>>24}writeUint32(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8,this.bytes_[e+2]=t>>16,this.bytes_[e+3]=t>>24}writeInt64(e,t){this.writeInt32(e,t.low),this.writeInt32(e+4,t.high)}writeUint64(e,t){this.writeUint32(e,t.low),this.writeUint32(e+4,t.high)}writeFloat32(e,t){Tr[0]=t,this.writeInt32(e,xr[0])}writeFloat64(e,t){Er[0]=t,this.writeInt32(e,xr[Ar?0:1]),this.writeInt32(e+4,xr[Ar?1:0])}getBufferIdentifier(){if(this.bytes_.length<this.position_+4+4)throw new Error("FlatBuffers: ByteBuffer is too short to contain an identifier.");let e="";for(let t=0;t<4;t++)e+=String.fromCharCode(this.readInt8(this.position_+4+t));return e}__offset(e,t){const n=e-this.readInt32(e);return t<this.readInt16(n)?this.readInt16(n+t):0}__union(e,t){return e.bb_pos=t+this.readInt32(t),e.bb=this,e}__string(e,t){e+=this.readInt32(e);const n=this.readInt32(e);let r="",i=0;if(e+=4,t===Cr.UTF8_BYTES)return this.bytes_.subarray(e,e+n);for(;i<n;){let t;const n=this.readUint8(e+i++);if(n<192)t=n;else{const r=this.readUint8(e+i++);if(n<224)t=(31&n)<<6|63&r;else{const o=this.readUint8(e+i++);if(n<240)t=(15&n)<<12|(63&r)<<6|63&o;else{t=(7&n)<<18|(63&r)<<12|(63&o)<<6|63&this.readUint8(e+i++)}}}t<65536?r+=String.fromCharCode(t):(t-=65536,r+=String.fromCharCode(55296+(t>>10),56320+(1023&t)))}return r}__union_with_string(e,t){return"string"===typeof e?this.__string(t):this.__union(e,t)}__indirect(e){return e+this.readInt32(e)}__vector(e){return e+this.readInt32(e)+4}__vector_len(e){return this.readInt32(e+this.readInt32(e))}__has_identifier(e){if(4!=e.length)throw new Error("FlatBuffers: file identifier must be length 4");for(let t=0;t<4;t++)if(e.charCodeAt(t)!=this.readInt8(this.position()+4+t))return!1;return!0}createLong(e,t){return Or.create(e,t)}createScalarList(e,t){const n=[];for(let r=0;r<t;++r)null!==e(r)&&n.push(e(r));return n}createObjList(e,t){const n=[];for(let r=0;r<t;++r){const t=e(r);null!==t&&n.push(t.unpack())}return n}}class Mr{constructor(e){let t;this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null,t=e||1024,this.bb=Fr.allocate(t),this.space=t}clear(){this.bb.clear(),this.space=this.bb.capacity(),this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null}forceDefaults(e){this.force_defaults=e}dataBuffer(){return this.bb}asUint8Array(){return this.bb.bytes().subarray(this.bb.position(),this.bb.position()+this.offset())}prep(e,t){e>this.minalign&&(this.minalign=e);const n=1+~(this.bb.capacity()-this.space+t)&e-1;for(;this.space<n+e+t;){const e=this.bb.capacity();this.bb=Mr.growByteBuffer(this.bb),this.space+=this.bb.capacity()-e}this.pad(n)}pad(e){for(let t=0;t<e;t++)this.bb.writeInt8(--this.space,0)}writeInt8(e){this.bb.writeInt8(this.space-=1,e)}writeInt16(e){this.bb.writeInt16(this.space-=2,e)}writeInt32(e){this.bb.writeInt32(this.space-=4,e)}writeInt64(e){this.bb.writeInt64(this.space-=8,e)}writeFloat32(e){this.bb.writeFloat32(this.space-=4,e)}writeFloat64(e){this.bb.writeFloat64(this.space-=8,e)}addInt8(e){this.prep(1,0),this.writeInt8(e)}addInt16(e){this.prep(2,0),this.writeInt16(e)}addInt32(e){this.prep(4,0),this.writeInt32(e)}addInt64(e){this.prep(8,0),this.writeInt64(e)}addFloat32(e){this.prep(4,0),this.writeFloat32(e)}addFloat64(e){this.prep(8,0),this.writeFloat64(e)}addFieldInt8(e,t,n){(this.force_defaults||t!=n)&&(this.addInt8(t),this.slot(e))}addFieldInt16(e,t,n){(this.force_defaults||t!=n)&&(this.addInt16(t),this.slot(e))}addFieldInt32(e,t,n){(this.force_defaults||t!=n)&&(this.addInt32(t),this.slot(e))}addFieldInt64(e,t,n){!this.force_defaults&&t.equals(n)||(this.addInt64(t),this.slot(e))}addFieldFloat32(e,t,n){(this.force_defaults||t!=n)&&(this.addFloat32(t),this.slot(e))}addFieldFloat64(e,t,n){(this.force_defaults||t!=n)&&(this.addFloat64(t),this.slot(e))}addFieldOffset(e,t,n){(this.force_defaults||t!=n)&&(this.addOffset(t),this.slot(e))}addFieldStruct(e,t,n){t!=n&&(this.nested(t),this.slot(e))}nested(e){if(e!=this.offset())throw new Error("FlatBuffers: struct must be serialized inline.")}notNested(){if(this.isNested)throw new Error("FlatBuffers: object serialization must not be nested.")}slot(e){null!==this.vtable&&(this.vtable[e]=this.offset())}offset(){return this.bb.capacity()-this.space}static growByteBuffer(e){const t=e.capacity();if(3221225472&t)throw new Error("FlatBuffers: cannot grow buffer beyond 2 gigabytes.");const n=t<<1,r=Fr.allocate(n);return r.setPosition(n-t),r.bytes().set(e.bytes(),n-t),r}addOffset(e){this.prep(4,0),this.writeInt32(this.offset()-e+4)}startObject(e){this.notNested(),null==this.vtable&&(this.vtable=[]),this.vtable_in_use=e;for(let t=0;t<e;t++)this.vtable[t]=0;this.isNested=!0,this.object_start=this.offset()}endObject(){if(null==this.vtable||!this.isNested)throw new Error("FlatBuffers: endObject called without startObject");this.addInt32(0);const e=this.offset();let t=this.vtable_in_use-1;for(;t>=0&&0==this.vtable[t];t--);const n=t+1;for(;t>=0;t--)this.addInt16(0!=this.vtable[t]?e-this.vtable[t]:0);this.addInt16(e-this.object_start);const r=2*(n+2);this.addInt16(r);let i=0;const o=this.space;e:for(t=0;t<this.vtables.length;t++){const e=this.bb.capacity()-this.vtables[t];if(r==this.bb.readInt16(e)){for(let t=2;t<r;t+=2)if(this.bb.readInt16(o+t)!=this.bb.readInt16(e+t))continue e;i=this.vtables[t];break}}return i?(this.space=this.bb.capacity()-e,this.bb.writeInt32(this.space,i-e)):(this.vtables.push(this.offset()),this.bb.writeInt32(this.bb.capacity()-e,this.offset()-e)),this.isNested=!1,e}finish(e,t,n){const r=n?4:0;if(t){const e=t;if(this.prep(this.minalign,8+r),4!=e.length)throw new Error("FlatBuffers: file identifier must be length 4");for(let t=3;t>=0;t--)this.writeInt8(e.charCodeAt(t))}this.prep(this.minalign,4+r),this.addOffset(e),r&&this.addInt32(this.bb.capacity()-this.space),this.bb.setPosition(this.space)}finishSizePrefixed(e,t){this.finish(e,t,!0)}requiredField(e,t){const n=this.bb.capacity()-e,r=n-this.bb.readInt32(n);if(!(0!=this.bb.readInt16(r+t)))throw new Error("FlatBuffers: field "+t+" must be set")}startVector(e,t,n){this.notNested(),this.vector_num_elems=t,this.prep(4,e*t),this.prep(n,e*t)}endVector(){return this.writeInt32(this.vector_num_elems),this.offset()}createSharedString(e){if(!e)return 0;if(this.string_maps||(this.string_maps=new Map),this.string_maps.has(e))return this.string_maps.get(e);const t=this.createString(e);return this.string_maps.set(e,t),t}createString(e){if(!e)return 0;let t;if(e instanceof Uint8Array)t=e;else{t=[];let n=0;for(;n<e.length;){let r;const i=e.charCodeAt(n++);if(i<55296||i>=56320)r=i;else{r=(i<<10)+e.charCodeAt(n++)+-56613888}r<128?t.push(r):(r<2048?t.push(r>>6&31|192):(r<65536?t.push(r>>12&15|224):t.push(r>>18&7|240,r>>12&63|128),t.push(r>>6&63|128)),t.push(63&r|128))}}this.addInt8(0),this.startVector(1,t.length,1),this.bb.setPosition(this.space-=t.length);for(let n=0,r=this.space,i=this.bb.bytes();n<t.length;n++)i[r++]=t[n];return this.endVector()}createLong(e,t){return Or.create(e,t)}createObjectOffset(e){return null===e?0:"string"===typeof e?this.createString(e):e.pack(this)}createObjectOffsetList(e){const t=[];for(let n=0;n<e.length;++n){const r=e[n];if(null===r)throw new Error("FlatBuffers: Argument for createObjectOffsetList cannot contain null.");t.push(this.createObjectOffset(r))}return t}createStructOffsetList(e,t){return t(this,e.length),this.createObjectOffsetList(e),this.endVector()}}class Pr{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsKeyValue(e,t){return(t||new Pr).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsKeyValue(e,t){return e.setPosition(e.position()+4),(t||new Pr).__init(e.readInt32(e.position())+e.position(),e)}key(e){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.__string(this.bb_pos+t,e):null}value(e){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__string(this.bb_pos+t,e):null}static startKeyValue(e){e.startObject(2)}static addKey(e,t){e.addFieldOffset(0,t,0)}static addValue(e,t){e.addFieldOffset(1,t,0)}static endKeyValue(e){return e.endObject()}static createKeyValue(e,t,n){return Pr.startKeyValue(e),Pr.addKey(e,t),Pr.addValue(e,n),Pr.endKeyValue(e)}}!function(e){e[e.V1=0]="V1",e[e.V2=1]="V2",e[e.V3=2]="V3",e[e.V4=3]="V4",e[e.V5=4]="V5"}(Nr||(Nr={})),function(e){e[e.Little=0]="Little",e[e.Big=1]="Big"}(Dr||(Dr={})),function(e){e[e.DenseArray=0]="DenseArray"}(Lr||(Lr={}));class zr{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsInt(e,t){return(t||new zr).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsInt(e,t){return e.setPosition(e.position()+4),(t||new zr).__init(e.readInt32(e.position())+e.position(),e)}bitWidth(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}isSigned(){const e=this.bb.__offset(this.bb_pos,6);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}static startInt(e){e.startObject(2)}static addBitWidth(e,t){e.addFieldInt32(0,t,0)}static addIsSigned(e,t){e.addFieldInt8(1,+t,0)}static endInt(e){return e.endObject()}static createInt(e,t,n){return zr.startInt(e),zr.addBitWidth(e,t),zr.addIsSigned(e,n),zr.endInt(e)}}class Ur{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDictionaryEncoding(e,t){return(t||new Ur).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDictionaryEncoding(e,t){return e.setPosition(e.position()+4),(t||new Ur).__init(e.readInt32(e.position())+e.position(),e)}id(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}indexType(e){const t=this.bb.__offset(this.bb_pos,6);return t?(e||new zr).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}isOrdered(){const e=this.bb.__offset(this.bb_pos,8);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}dictionaryKind(){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.readInt16(this.bb_pos+e):Lr.DenseArray}static startDictionaryEncoding(e){e.startObject(4)}static addId(e,t){e.addFieldInt64(0,t,e.createLong(0,0))}static addIndexType(e,t){e.addFieldOffset(1,t,0)}static addIsOrdered(e,t){e.addFieldInt8(2,+t,0)}static addDictionaryKind(e,t){e.addFieldInt16(3,t,Lr.DenseArray)}static endDictionaryEncoding(e){return e.endObject()}}!function(e){e[e.NONE=0]="NONE",e[e.Null=1]="Null",e[e.Int=2]="Int",e[e.FloatingPoint=3]="FloatingPoint",e[e.Binary=4]="Binary",e[e.Utf8=5]="Utf8",e[e.Bool=6]="Bool",e[e.Decimal=7]="Decimal",e[e.Date=8]="Date",e[e.Time=9]="Time",e[e.Timestamp=10]="Timestamp",e[e.Interval=11]="Interval",e[e.List=12]="List",e[e.Struct_=13]="Struct_",e[e.Union=14]="Union",e[e.FixedSizeBinary=15]="FixedSizeBinary",e[e.FixedSizeList=16]="FixedSizeList",e[e.Map=17]="Map",e[e.Duration=18]="Duration",e[e.LargeBinary=19]="LargeBinary",e[e.LargeUtf8=20]="LargeUtf8",e[e.LargeList=21]="LargeList"}(Br||(Br={}));class Rr{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsField(e,t){return(t||new Rr).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsField(e,t){return e.setPosition(e.position()+4),(t||new Rr).__init(e.readInt32(e.position())+e.position(),e)}name(e){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.__string(this.bb_pos+t,e):null}nullable(){const e=this.bb.__offset(this.bb_pos,6);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}typeType(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.readUint8(this.bb_pos+e):Br.NONE}type(e){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.__union(e,this.bb_pos+t):null}dictionary(e){const t=this.bb.__offset(this.bb_pos,12);return t?(e||new Ur).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}children(e,t){const n=this.bb.__offset(this.bb_pos,14);return n?(t||new Rr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}childrenLength(){const e=this.bb.__offset(this.bb_pos,14);return e?this.bb.__vector_len(this.bb_pos+e):0}customMetadata(e,t){const n=this.bb.__offset(this.bb_pos,16);return n?(t||new Pr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}customMetadataLength(){const e=this.bb.__offset(this.bb_pos,16);return e?this.bb.__vector_len(this.bb_pos+e):0}static startField(e){e.startObject(7)}static addName(e,t){e.addFieldOffset(0,t,0)}static addNullable(e,t){e.addFieldInt8(1,+t,0)}static addTypeType(e,t){e.addFieldInt8(2,t,Br.NONE)}static addType(e,t){e.addFieldOffset(3,t,0)}static addDictionary(e,t){e.addFieldOffset(4,t,0)}static addChildren(e,t){e.addFieldOffset(5,t,0)}static createChildrenVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startChildrenVector(e,t){e.startVector(4,t,4)}static addCustomMetadata(e,t){e.addFieldOffset(6,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static endField(e){return e.endObject()}}class jr{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsSchema(e,t){return(t||new jr).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsSchema(e,t){return e.setPosition(e.position()+4),(t||new jr).__init(e.readInt32(e.position())+e.position(),e)}endianness(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Dr.Little}fields(e,t){const n=this.bb.__offset(this.bb_pos,6);return n?(t||new Rr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}fieldsLength(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}customMetadata(e,t){const n=this.bb.__offset(this.bb_pos,8);return n?(t||new Pr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}customMetadataLength(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}features(e){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.readInt64(this.bb.__vector(this.bb_pos+t)+8*e):this.bb.createLong(0,0)}featuresLength(){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.__vector_len(this.bb_pos+e):0}static startSchema(e){e.startObject(4)}static addEndianness(e,t){e.addFieldInt16(0,t,Dr.Little)}static addFields(e,t){e.addFieldOffset(1,t,0)}static createFieldsVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startFieldsVector(e,t){e.startVector(4,t,4)}static addCustomMetadata(e,t){e.addFieldOffset(2,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static addFeatures(e,t){e.addFieldOffset(3,t,0)}static createFeaturesVector(e,t){e.startVector(8,t.length,8);for(let n=t.length-1;n>=0;n--)e.addInt64(t[n]);return e.endVector()}static startFeaturesVector(e,t){e.startVector(8,t,8)}static endSchema(e){return e.endObject()}static finishSchemaBuffer(e,t){e.finish(t)}static finishSizePrefixedSchemaBuffer(e,t){e.finish(t,void 0,!0)}static createSchema(e,t,n,r,i){return jr.startSchema(e),jr.addEndianness(e,t),jr.addFields(e,n),jr.addCustomMetadata(e,r),jr.addFeatures(e,i),jr.endSchema(e)}}class Vr{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFooter(e,t){return(t||new Vr).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFooter(e,t){return e.setPosition(e.position()+4),(t||new Vr).__init(e.readInt32(e.position())+e.position(),e)}version(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Nr.V1}schema(e){const t=this.bb.__offset(this.bb_pos,6);return t?(e||new jr).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}dictionaries(e,t){const n=this.bb.__offset(this.bb_pos,8);return n?(t||new Ir).__init(this.bb.__vector(this.bb_pos+n)+24*e,this.bb):null}dictionariesLength(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}recordBatches(e,t){const n=this.bb.__offset(this.bb_pos,10);return n?(t||new Ir).__init(this.bb.__vector(this.bb_pos+n)+24*e,this.bb):null}recordBatchesLength(){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.__vector_len(this.bb_pos+e):0}customMetadata(e,t){const n=this.bb.__offset(this.bb_pos,12);return n?(t||new Pr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}customMetadataLength(){const e=this.bb.__offset(this.bb_pos,12);return e?this.bb.__vector_len(this.bb_pos+e):0}static startFooter(e){e.startObject(5)}static addVersion(e,t){e.addFieldInt16(0,t,Nr.V1)}static addSchema(e,t){e.addFieldOffset(1,t,0)}static addDictionaries(e,t){e.addFieldOffset(2,t,0)}static startDictionariesVector(e,t){e.startVector(24,t,8)}static addRecordBatches(e,t){e.addFieldOffset(3,t,0)}static startRecordBatchesVector(e,t){e.startVector(24,t,8)}static addCustomMetadata(e,t){e.addFieldOffset(4,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static endFooter(e){return e.endObject()}static finishFooterBuffer(e,t){e.finish(t)}static finishSizePrefixedFooterBuffer(e,t){e.finish(t,void 0,!0)}}var Hr=Or,$r=Mr,Wr=Fr;class Yr{constructor(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:r.V4,n=arguments.length>2?arguments[2]:void 0,i=arguments.length>3?arguments[3]:void 0;this.schema=e,this.version=t,n&&(this._recordBatches=n),i&&(this._dictionaryBatches=i)}static decode(e){e=new Wr(Z(e));const t=Vr.getRootAsFooter(e),n=Zn.decode(t.schema());return new qr(n,t)}static encode(e){const t=new $r,n=Zn.encode(t,e.schema);Vr.startRecordBatchesVector(t,e.numRecordBatches);for(const r of[...e.recordBatches()].slice().reverse())Qr.encode(t,r);const i=t.endVector();Vr.startDictionariesVector(t,e.numDictionaries);for(const r of[...e.dictionaryBatches()].slice().reverse())Qr.encode(t,r);const o=t.endVector();return Vr.startFooter(t),Vr.addSchema(t,n),Vr.addVersion(t,r.V4),Vr.addRecordBatches(t,i),Vr.addDictionaries(t,o),Vr.finishFooterBuffer(t,Vr.endFooter(t)),t.asUint8Array()}get numRecordBatches(){return this._recordBatches.length}get numDictionaries(){return this._dictionaryBatches.length}*recordBatches(){for(let e,t=-1,n=this.numRecordBatches;++t<n;)(e=this.getRecordBatch(t))&&(yield e)}*dictionaryBatches(){for(let e,t=-1,n=this.numDictionaries;++t<n;)(e=this.getDictionaryBatch(t))&&(yield e)}getRecordBatch(e){return e>=0&&e<this.numRecordBatches&&this._recordBatches[e]||null}getDictionaryBatch(e){return e>=0&&e<this.numDictionaries&&this._dictionaryBatches[e]||null}}class qr extends Yr{constructor(e,t){super(e,t.version()),this._footer=t}get numRecordBatches(){return this._footer.recordBatchesLength()}get numDictionaries(){return this._footer.dictionariesLength()}getRecordBatch(e){if(e>=0&&e<this.numRecordBatches){const t=this._footer.recordBatches(e);if(t)return Qr.decode(t)}return null}getDictionaryBatch(e){if(e>=0&&e<this.numDictionaries){const t=this._footer.dictionaries(e);if(t)return Qr.decode(t)}return null}}class Qr{constructor(e,t,n){this.metaDataLength=e,this.offset="number"===typeof n?n:n.low,this.bodyLength="number"===typeof t?t:t.low}static decode(e){return new Qr(e.metaDataLength(),e.bodyLength(),e.offset())}static encode(e,t){const{metaDataLength:n}=t,r=new Hr(t.offset,0),i=new Hr(t.bodyLength,0);return Ir.createBlock(e,r,n,i)}}const Kr={fromIterable:e=>Gr(function*(e){let t,n,r,i,o=!1,s=[],a=0;function l(){return"peek"===r?G(s,i)[0]:([n,s,a]=G(s,i),n)}({cmd:r,size:i}=yield null);const u=(c=e,te(Uint8Array,c))[Symbol.iterator]();var c;try{do{if(({done:t,value:n}=Number.isNaN(i-a)?u.next():u.next(i-a)),!t&&n.byteLength>0&&(s.push(n),a+=n.byteLength),t||i<=a)do{({cmd:r,size:i}=yield l())}while(i<a)}while(!t)}catch(d){(o=!0)&&"function"===typeof u.throw&&u.throw(d)}finally{!1===o&&"function"===typeof u.return&&u.return(null)}return null}(e)),fromAsyncIterable:e=>Gr(function(e){return j(this,arguments,function*(){let t,n,r,i,o=!1,s=[],a=0;function l(){return"peek"===r?G(s,i)[0]:([n,s,a]=G(s,i),n)}({cmd:r,size:i}=yield yield R(null));const u=(c=e,ne(Uint8Array,c))[Symbol.asyncIterator]();var c;try{do{if(({done:t,value:n}=Number.isNaN(i-a)?yield R(u.next()):yield R(u.next(i-a))),!t&&n.byteLength>0&&(s.push(n),a+=n.byteLength),t||i<=a)do{({cmd:r,size:i}=yield yield R(l()))}while(i<a)}while(!t)}catch(d){(o=!0)&&"function"===typeof u.throw&&(yield R(u.throw(d)))}finally{!1===o&&"function"===typeof u.return&&(yield R(u.return(new Uint8Array(0))))}return yield R(null)})}(e)),fromDOMStream:e=>Gr(function(e){return j(this,arguments,function*(){let t,n,r,i=!1,o=!1,s=[],a=0;function l(){return"peek"===n?G(s,r)[0]:([t,s,a]=G(s,r),t)}({cmd:n,size:r}=yield yield R(null));const u=new Xr(e);try{do{if(({done:i,value:t}=Number.isNaN(r-a)?yield R(u.read()):yield R(u.read(r-a))),!i&&t.byteLength>0&&(s.push(Z(t)),a+=t.byteLength),i||r<=a)do{({cmd:n,size:r}=yield yield R(l()))}while(r<a)}while(!i)}catch(c){(o=!0)&&(yield R(u.cancel(c)))}finally{!1===o?yield R(u.cancel()):e.locked&&u.releaseLock()}return yield R(null)})}(e)),fromNodeStream:e=>Gr(function(e){return j(this,arguments,function*(){const t=[];let n,r,i,o="error",s=!1,a=null,l=0,u=[];function c(){return"peek"===n?G(u,r)[0]:([i,u,l]=G(u,r),i)}if(({cmd:n,size:r}=yield yield R(null)),e.isTTY)return yield yield R(new Uint8Array(0)),yield R(null);try{t[0]=Jr(e,"end"),t[1]=Jr(e,"error");do{if(t[2]=Jr(e,"readable"),[o,a]=yield R(Promise.race(t.map(e=>e[2]))),"error"===o)break;if((s="end"===o)||(Number.isFinite(r-l)?(i=Z(e.read(r-l)),i.byteLength<r-l&&(i=Z(e.read()))):i=Z(e.read()),i.byteLength>0&&(u.push(i),l+=i.byteLength)),s||r<=l)do{({cmd:n,size:r}=yield yield R(c()))}while(r<l)}while(!s)}finally{yield R(d(t,"error"===o?a:null))}return yield R(null);function d(t,n){return i=u=null,new Promise((r,i)=>{for(const[n,s]of t)e.off(n,s);try{const t=e.destroy;t&&t.call(e,n),n=void 0}catch(o){n=o||n}finally{null!=n?i(n):r()}})}})}(e)),toDOMStream(e,t){throw new Error('"toDOMStream" not available in this environment')},toNodeStream(e,t){throw new Error('"toNodeStream" not available in this environment')}},Gr=e=>(e.next(),e);class Xr{constructor(e){this.source=e,this.reader=null,this.reader=this.source.getReader(),this.reader.closed.catch(()=>{})}get closed(){return this.reader?this.reader.closed.catch(()=>{}):Promise.resolve()}releaseLock(){this.reader&&this.reader.releaseLock(),this.reader=null}cancel(e){return z(this,void 0,void 0,function*(){const{reader:t,source:n}=this;t&&(yield t.cancel(e).catch(()=>{})),n&&n.locked&&this.releaseLock()})}read(e){return z(this,void 0,void 0,function*(){if(0===e)return{done:null==this.reader,value:new Uint8Array(0)};const t=yield this.reader.read();return!t.done&&(t.value=Z(t)),t})}}const Jr=(e,t)=>{const n=e=>r([t,e]);let r;return[t,n,new Promise(i=>(r=i)&&e.once(t,n))]};const Zr=Object.freeze({done:!0,value:void 0});class ei{constructor(e){this._json=e}get schema(){return this._json.schema}get batches(){return this._json.batches||[]}get dictionaries(){return this._json.dictionaries||[]}}class ti{tee(){return this._getDOMStream().tee()}pipe(e,t){return this._getNodeStream().pipe(e,t)}pipeTo(e,t){return this._getDOMStream().pipeTo(e,t)}pipeThrough(e,t){return this._getDOMStream().pipeThrough(e,t)}_getDOMStream(){return this._DOMStream||(this._DOMStream=this.toDOMStream())}_getNodeStream(){return this._nodeStream||(this._nodeStream=this.toNodeStream())}}class ni extends ti{constructor(){super(),this._values=[],this.resolvers=[],this._closedPromise=new Promise(e=>this._closedPromiseResolve=e)}get closed(){return this._closedPromise}cancel(e){return z(this,void 0,void 0,function*(){yield this.return(e)})}write(e){this._ensureOpen()&&(this.resolvers.length<=0?this._values.push(e):this.resolvers.shift().resolve({done:!1,value:e}))}abort(e){this._closedPromiseResolve&&(this.resolvers.length<=0?this._error={error:e}:this.resolvers.shift().reject({done:!0,value:e}))}close(){if(this._closedPromiseResolve){const{resolvers:e}=this;for(;e.length>0;)e.shift().resolve(Zr);this._closedPromiseResolve(),this._closedPromiseResolve=void 0}}[Symbol.asyncIterator](){return this}toDOMStream(e){return Kr.toDOMStream(this._closedPromiseResolve||this._error?this:this._values,e)}toNodeStream(e){return Kr.toNodeStream(this._closedPromiseResolve||this._error?this:this._values,e)}throw(e){return z(this,void 0,void 0,function*(){return yield this.abort(e),Zr})}return(e){return z(this,void 0,void 0,function*(){return yield this.close(),Zr})}read(e){return z(this,void 0,void 0,function*(){return(yield this.next(e,"read")).value})}peek(e){return z(this,void 0,void 0,function*(){return(yield this.next(e,"peek")).value})}next(){return this._values.length>0?Promise.resolve({done:!1,value:this._values.shift()}):this._error?Promise.reject({done:!0,value:this._error.error}):this._closedPromiseResolve?new Promise((e,t)=>{this.resolvers.push({resolve:e,reject:t})}):Promise.resolve(Zr)}_ensureOpen(){if(this._closedPromiseResolve)return!0;throw new Error("AsyncQueue is closed")}}class ri extends ni{write(e){if((e=Z(e)).byteLength>0)return super.write(e)}toString(){return arguments.length>0&&void 0!==arguments[0]&&arguments[0]?W(this.toUint8Array(!0)):this.toUint8Array(!1).then(W)}toUint8Array(){return arguments.length>0&&void 0!==arguments[0]&&arguments[0]?G(this._values)[0]:(()=>z(this,void 0,void 0,function*(){var e,t;const n=[];let r=0;try{for(var i,o=H(this);!(i=yield o.next()).done;){const e=i.value;n.push(e),r+=e.byteLength}}catch(s){e={error:s}}finally{try{i&&!i.done&&(t=o.return)&&(yield t.call(o))}finally{if(e)throw e.error}}return G(n,r)[0]}))()}}class ii{constructor(e){e&&(this.source=new si(Kr.fromIterable(e)))}[Symbol.iterator](){return this}next(e){return this.source.next(e)}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}peek(e){return this.source.peek(e)}read(e){return this.source.read(e)}}class oi{constructor(e){e instanceof oi?this.source=e.source:e instanceof ri?this.source=new ai(Kr.fromAsyncIterable(e)):M(e)?this.source=new ai(Kr.fromNodeStream(e)):F(e)?this.source=new ai(Kr.fromDOMStream(e)):L(e)?this.source=new ai(Kr.fromDOMStream(e.body)):A(e)?this.source=new ai(Kr.fromIterable(e)):(E(e)||O(e))&&(this.source=new ai(Kr.fromAsyncIterable(e)))}[Symbol.asyncIterator](){return this}next(e){return this.source.next(e)}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}get closed(){return this.source.closed}cancel(e){return this.source.cancel(e)}peek(e){return this.source.peek(e)}read(e){return this.source.read(e)}}class si{constructor(e){this.source=e}cancel(e){this.return(e)}peek(e){return this.next(e,"peek").value}read(e){return this.next(e,"read").value}next(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"read";return this.source.next({cmd:t,size:e})}throw(e){return Object.create(this.source.throw&&this.source.throw(e)||Zr)}return(e){return Object.create(this.source.return&&this.source.return(e)||Zr)}}class ai{constructor(e){this.source=e,this._closedPromise=new Promise(e=>this._closedPromiseResolve=e)}cancel(e){return z(this,void 0,void 0,function*(){yield this.return(e)})}get closed(){return this._closedPromise}read(e){return z(this,void 0,void 0,function*(){return(yield this.next(e,"read")).value})}peek(e){return z(this,void 0,void 0,function*(){return(yield this.next(e,"peek")).value})}next(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"read";return z(this,void 0,void 0,function*(){return yield this.source.next({cmd:t,size:e})})}throw(e){return z(this,void 0,void 0,function*(){const t=this.source.throw&&(yield this.source.throw(e))||Zr;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(t)})}return(e){return z(this,void 0,void 0,function*(){const t=this.source.return&&(yield this.source.return(e))||Zr;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(t)})}}class li extends ii{constructor(e,t){super(),this.position=0,this.buffer=Z(e),this.size="undefined"===typeof t?this.buffer.byteLength:t}readInt32(e){const{buffer:t,byteOffset:n}=this.readAt(e,4);return new DataView(t,n).getInt32(0,!0)}seek(e){return this.position=Math.min(e,this.size),e<this.size}read(e){const{buffer:t,size:n,position:r}=this;return t&&r<n?("number"!==typeof e&&(e=Number.POSITIVE_INFINITY),this.position=Math.min(n,r+Math.min(n-r,e)),t.subarray(r,this.position)):null}readAt(e,t){const n=this.buffer,r=Math.min(this.size,e+t);return n?n.subarray(e,r):new Uint8Array(t)}close(){this.buffer&&(this.buffer=null)}throw(e){return this.close(),{done:!0,value:e}}return(e){return this.close(),{done:!0,value:e}}}class ui extends oi{constructor(e,t){super(),this.position=0,this._handle=e,"number"===typeof t?this.size=t:this._pending=(()=>z(this,void 0,void 0,function*(){this.size=(yield e.stat()).size,delete this._pending}))()}readInt32(e){return z(this,void 0,void 0,function*(){const{buffer:t,byteOffset:n}=yield this.readAt(e,4);return new DataView(t,n).getInt32(0,!0)})}seek(e){return z(this,void 0,void 0,function*(){return this._pending&&(yield this._pending),this.position=Math.min(e,this.size),e<this.size})}read(e){return z(this,void 0,void 0,function*(){this._pending&&(yield this._pending);const{_handle:t,size:n,position:r}=this;if(t&&r<n){"number"!==typeof e&&(e=Number.POSITIVE_INFINITY);let i=r,o=0,s=0;const a=Math.min(n,i+Math.min(n-i,e)),l=new Uint8Array(Math.max(0,(this.position=a)-i));for(;(i+=s)<a&&(o+=s)<l.byteLength;)({bytesRead:s}=yield t.read(l,o,l.byteLength-o,i));return l}return null})}readAt(e,t){return z(this,void 0,void 0,function*(){this._pending&&(yield this._pending);const{_handle:n,size:r}=this;if(n&&e+t<r){const i=Math.min(r,e+t),o=new Uint8Array(i-e);return(yield n.read(o,0,t,e)).buffer}return new Uint8Array(t)})}close(){return z(this,void 0,void 0,function*(){const e=this._handle;this._handle=null,e&&(yield e.close())})}throw(e){return z(this,void 0,void 0,function*(){return yield this.close(),{done:!0,value:e}})}return(e){return z(this,void 0,void 0,function*(){return yield this.close(),{done:!0,value:e}})}}function ci(e){return e<0&&(e=4294967295+e+1),"0x".concat(e.toString(16))}const di=[1,10,100,1e3,1e4,1e5,1e6,1e7,1e8];class fi{constructor(e){this.buffer=e}high(){return this.buffer[1]}low(){return this.buffer[0]}_times(e){const t=new Uint32Array([this.buffer[1]>>>16,65535&this.buffer[1],this.buffer[0]>>>16,65535&this.buffer[0]]),n=new Uint32Array([e.buffer[1]>>>16,65535&e.buffer[1],e.buffer[0]>>>16,65535&e.buffer[0]]);let r=t[3]*n[3];this.buffer[0]=65535&r;let i=r>>>16;return r=t[2]*n[3],i+=r,r=t[3]*n[2]>>>0,i+=r,this.buffer[0]+=i<<16,this.buffer[1]=i>>>0<r?65536:0,this.buffer[1]+=i>>>16,this.buffer[1]+=t[1]*n[3]+t[2]*n[2]+t[3]*n[1],this.buffer[1]+=t[0]*n[3]+t[1]*n[2]+t[2]*n[1]+t[3]*n[0]<<16,this}_plus(e){const t=this.buffer[0]+e.buffer[0]>>>0;this.buffer[1]+=e.buffer[1],t<this.buffer[0]>>>0&&++this.buffer[1],this.buffer[0]=t}lessThan(e){return this.buffer[1]<e.buffer[1]||this.buffer[1]===e.buffer[1]&&this.buffer[0]<e.buffer[0]}equals(e){return this.buffer[1]===e.buffer[1]&&this.buffer[0]==e.buffer[0]}greaterThan(e){return e.lessThan(this)}hex(){return"".concat(ci(this.buffer[1])," ").concat(ci(this.buffer[0]))}}class hi extends fi{times(e){return this._times(e),this}plus(e){return this._plus(e),this}static from(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);return hi.fromString("string"===typeof e?e:e.toString(),t)}static fromNumber(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);return hi.fromString(e.toString(),t)}static fromString(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);const n=e.length,r=new hi(t);for(let i=0;i<n;){const t=8<n-i?8:n-i,o=new hi(new Uint32Array([Number.parseInt(e.slice(i,i+t),10),0])),s=new hi(new Uint32Array([di[t],0]));r.times(s),r.plus(o),i+=t}return r}static convertArray(e){const t=new Uint32Array(2*e.length);for(let n=-1,r=e.length;++n<r;)hi.from(e[n],new Uint32Array(t.buffer,t.byteOffset+2*n*4,2));return t}static multiply(e,t){return new hi(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new hi(new Uint32Array(e.buffer)).plus(t)}}class pi extends fi{negate(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],0==this.buffer[0]&&++this.buffer[1],this}times(e){return this._times(e),this}plus(e){return this._plus(e),this}lessThan(e){const t=this.buffer[1]|0,n=e.buffer[1]|0;return t<n||t===n&&this.buffer[0]<e.buffer[0]}static from(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);return pi.fromString("string"===typeof e?e:e.toString(),t)}static fromNumber(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);return pi.fromString(e.toString(),t)}static fromString(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);const n=e.startsWith("-"),r=e.length,i=new pi(t);for(let o=n?1:0;o<r;){const t=8<r-o?8:r-o,n=new pi(new Uint32Array([Number.parseInt(e.slice(o,o+t),10),0])),s=new pi(new Uint32Array([di[t],0]));i.times(s),i.plus(n),o+=t}return n?i.negate():i}static convertArray(e){const t=new Uint32Array(2*e.length);for(let n=-1,r=e.length;++n<r;)pi.from(e[n],new Uint32Array(t.buffer,t.byteOffset+2*n*4,2));return t}static multiply(e,t){return new pi(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new pi(new Uint32Array(e.buffer)).plus(t)}}class yi{constructor(e){this.buffer=e}high(){return new pi(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2))}low(){return new pi(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset,2))}negate(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],this.buffer[2]=~this.buffer[2],this.buffer[3]=~this.buffer[3],0==this.buffer[0]&&++this.buffer[1],0==this.buffer[1]&&++this.buffer[2],0==this.buffer[2]&&++this.buffer[3],this}times(e){const t=new hi(new Uint32Array([this.buffer[3],0])),n=new hi(new Uint32Array([this.buffer[2],0])),r=new hi(new Uint32Array([this.buffer[1],0])),i=new hi(new Uint32Array([this.buffer[0],0])),o=new hi(new Uint32Array([e.buffer[3],0])),s=new hi(new Uint32Array([e.buffer[2],0])),a=new hi(new Uint32Array([e.buffer[1],0])),l=new hi(new Uint32Array([e.buffer[0],0]));let u=hi.multiply(i,l);this.buffer[0]=u.low();const c=new hi(new Uint32Array([u.high(),0]));u=hi.multiply(r,l),c.plus(u),u=hi.multiply(i,a),c.plus(u),this.buffer[1]=c.low(),this.buffer[3]=c.lessThan(u)?1:0,this.buffer[2]=c.high();return new hi(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2)).plus(hi.multiply(n,l)).plus(hi.multiply(r,a)).plus(hi.multiply(i,s)),this.buffer[3]+=hi.multiply(t,l).plus(hi.multiply(n,a)).plus(hi.multiply(r,s)).plus(hi.multiply(i,o)).low(),this}plus(e){const t=new Uint32Array(4);return t[3]=this.buffer[3]+e.buffer[3]>>>0,t[2]=this.buffer[2]+e.buffer[2]>>>0,t[1]=this.buffer[1]+e.buffer[1]>>>0,t[0]=this.buffer[0]+e.buffer[0]>>>0,t[0]<this.buffer[0]>>>0&&++t[1],t[1]<this.buffer[1]>>>0&&++t[2],t[2]<this.buffer[2]>>>0&&++t[3],this.buffer[3]=t[3],this.buffer[2]=t[2],this.buffer[1]=t[1],this.buffer[0]=t[0],this}hex(){return"".concat(ci(this.buffer[3])," ").concat(ci(this.buffer[2])," ").concat(ci(this.buffer[1])," ").concat(ci(this.buffer[0]))}static multiply(e,t){return new yi(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new yi(new Uint32Array(e.buffer)).plus(t)}static from(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(4);return yi.fromString("string"===typeof e?e:e.toString(),t)}static fromNumber(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(4);return yi.fromString(e.toString(),t)}static fromString(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(4);const n=e.startsWith("-"),r=e.length,i=new yi(t);for(let o=n?1:0;o<r;){const t=8<r-o?8:r-o,n=new yi(new Uint32Array([Number.parseInt(e.slice(o,o+t),10),0,0,0])),s=new yi(new Uint32Array([di[t],0,0,0]));i.times(s),i.plus(n),o+=t}return n?i.negate():i}static convertArray(e){const t=new Uint32Array(4*e.length);for(let n=-1,r=e.length;++n<r;)yi.from(e[n],new Uint32Array(t.buffer,t.byteOffset+16*n,4));return t}}class bi extends rt{constructor(e,t,n,r){super(),this.nodesIndex=-1,this.buffersIndex=-1,this.bytes=e,this.nodes=t,this.buffers=n,this.dictionaries=r}visit(e){return super.visit(e instanceof er?e.type:e)}visitNull(e){let{length:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t})}visitBool(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitInt(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitFloat(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitUtf8(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),valueOffsets:this.readOffsets(e),data:this.readData(e)})}visitBinary(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),valueOffsets:this.readOffsets(e),data:this.readData(e)})}visitFixedSizeBinary(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitDate(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitTimestamp(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitTime(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitDecimal(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitList(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),valueOffsets:this.readOffsets(e),child:this.visit(e.children[0])})}visitStruct(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),children:this.visitMany(e.children)})}visitUnion(e){return e.mode===i.Sparse?this.visitSparseUnion(e):this.visitDenseUnion(e)}visitDenseUnion(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),typeIds:this.readTypeIds(e),valueOffsets:this.readOffsets(e),children:this.visitMany(e.children)})}visitSparseUnion(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),typeIds:this.readTypeIds(e),children:this.visitMany(e.children)})}visitDictionary(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e.indices),dictionary:this.readDictionary(e)})}visitInterval(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitFixedSizeList(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),child:this.visit(e.children[0])})}visitMap(e){let{length:t,nullCount:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode();return Jn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),valueOffsets:this.readOffsets(e),child:this.visit(e.children[0])})}nextFieldNode(){return this.nodes[++this.nodesIndex]}nextBufferRange(){return this.buffers[++this.buffersIndex]}readNullBitmap(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.nextBufferRange();return t>0&&this.readData(e,n)||new Uint8Array(0)}readOffsets(e,t){return this.readData(e,t)}readTypeIds(e,t){return this.readData(e,t)}readData(e){let{length:t,offset:n}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextBufferRange();return this.bytes.subarray(n,n+t)}readDictionary(e){return this.dictionaries.get(e.id)}}class mi extends bi{constructor(e,t,n,r){super(new Uint8Array(0),t,n,r),this.sources=e}readNullBitmap(e,t){let{offset:n}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.nextBufferRange();return t<=0?new Uint8Array(0):An(this.sources[n])}readOffsets(e){let{offset:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextBufferRange();return X(Uint8Array,X(Int32Array,this.sources[t]))}readTypeIds(e){let{offset:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextBufferRange();return X(Uint8Array,X(e.ArrayType,this.sources[t]))}readData(e){let{offset:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextBufferRange();const{sources:n}=this;return Be.isTimestamp(e)||(Be.isInt(e)||Be.isTime(e))&&64===e.bitWidth||Be.isDate(e)&&e.unit===s.MILLISECOND?X(Uint8Array,pi.convertArray(n[t])):Be.isDecimal(e)?X(Uint8Array,yi.convertArray(n[t])):Be.isBinary(e)||Be.isFixedSizeBinary(e)?function(e){const t=e.join(""),n=new Uint8Array(t.length/2);for(let r=0;r<t.length;r+=2)n[r>>1]=Number.parseInt(t.slice(r,r+2),16);return n}(n[t]):Be.isBool(e)?An(n[t]):Be.isUtf8(e)?q(n[t].join("")):X(Uint8Array,X(e.ArrayType,n[t].map(e=>+e)))}}var gi,vi,wi,_i,Si,ki,Ii,xi;!function(e){e[e.BUFFER=0]="BUFFER"}(gi||(gi={})),function(e){e[e.LZ4_FRAME=0]="LZ4_FRAME",e[e.ZSTD=1]="ZSTD"}(vi||(vi={}));class Ti{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsBodyCompression(e,t){return(t||new Ti).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsBodyCompression(e,t){return e.setPosition(e.position()+4),(t||new Ti).__init(e.readInt32(e.position())+e.position(),e)}codec(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt8(this.bb_pos+e):vi.LZ4_FRAME}method(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt8(this.bb_pos+e):gi.BUFFER}static startBodyCompression(e){e.startObject(2)}static addCodec(e,t){e.addFieldInt8(0,t,vi.LZ4_FRAME)}static addMethod(e,t){e.addFieldInt8(1,t,gi.BUFFER)}static endBodyCompression(e){return e.endObject()}static createBodyCompression(e,t,n){return Ti.startBodyCompression(e),Ti.addCodec(e,t),Ti.addMethod(e,n),Ti.endBodyCompression(e)}}class Ei{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}offset(){return this.bb.readInt64(this.bb_pos)}length(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createBuffer(e,t,n){return e.prep(8,16),e.writeInt64(n),e.writeInt64(t),e.offset()}}class Ai{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}length(){return this.bb.readInt64(this.bb_pos)}nullCount(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createFieldNode(e,t,n){return e.prep(8,16),e.writeInt64(n),e.writeInt64(t),e.offset()}}class Oi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsRecordBatch(e,t){return(t||new Oi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsRecordBatch(e,t){return e.setPosition(e.position()+4),(t||new Oi).__init(e.readInt32(e.position())+e.position(),e)}length(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}nodes(e,t){const n=this.bb.__offset(this.bb_pos,6);return n?(t||new Ai).__init(this.bb.__vector(this.bb_pos+n)+16*e,this.bb):null}nodesLength(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}buffers(e,t){const n=this.bb.__offset(this.bb_pos,8);return n?(t||new Ei).__init(this.bb.__vector(this.bb_pos+n)+16*e,this.bb):null}buffersLength(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}compression(e){const t=this.bb.__offset(this.bb_pos,10);return t?(e||new Ti).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}static startRecordBatch(e){e.startObject(4)}static addLength(e,t){e.addFieldInt64(0,t,e.createLong(0,0))}static addNodes(e,t){e.addFieldOffset(1,t,0)}static startNodesVector(e,t){e.startVector(16,t,8)}static addBuffers(e,t){e.addFieldOffset(2,t,0)}static startBuffersVector(e,t){e.startVector(16,t,8)}static addCompression(e,t){e.addFieldOffset(3,t,0)}static endRecordBatch(e){return e.endObject()}}class Ci{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDictionaryBatch(e,t){return(t||new Ci).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDictionaryBatch(e,t){return e.setPosition(e.position()+4),(t||new Ci).__init(e.readInt32(e.position())+e.position(),e)}id(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}data(e){const t=this.bb.__offset(this.bb_pos,6);return t?(e||new Oi).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}isDelta(){const e=this.bb.__offset(this.bb_pos,8);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}static startDictionaryBatch(e){e.startObject(3)}static addId(e,t){e.addFieldInt64(0,t,e.createLong(0,0))}static addData(e,t){e.addFieldOffset(1,t,0)}static addIsDelta(e,t){e.addFieldInt8(2,+t,0)}static endDictionaryBatch(e){return e.endObject()}}!function(e){e[e.HALF=0]="HALF",e[e.SINGLE=1]="SINGLE",e[e.DOUBLE=2]="DOUBLE"}(wi||(wi={}));class Ni{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFloatingPoint(e,t){return(t||new Ni).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFloatingPoint(e,t){return e.setPosition(e.position()+4),(t||new Ni).__init(e.readInt32(e.position())+e.position(),e)}precision(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):wi.HALF}static startFloatingPoint(e){e.startObject(1)}static addPrecision(e,t){e.addFieldInt16(0,t,wi.HALF)}static endFloatingPoint(e){return e.endObject()}static createFloatingPoint(e,t){return Ni.startFloatingPoint(e),Ni.addPrecision(e,t),Ni.endFloatingPoint(e)}}class Di{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDecimal(e,t){return(t||new Di).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDecimal(e,t){return e.setPosition(e.position()+4),(t||new Di).__init(e.readInt32(e.position())+e.position(),e)}precision(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}scale(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb_pos+e):0}bitWidth(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.readInt32(this.bb_pos+e):128}static startDecimal(e){e.startObject(3)}static addPrecision(e,t){e.addFieldInt32(0,t,0)}static addScale(e,t){e.addFieldInt32(1,t,0)}static addBitWidth(e,t){e.addFieldInt32(2,t,128)}static endDecimal(e){return e.endObject()}static createDecimal(e,t,n,r){return Di.startDecimal(e),Di.addPrecision(e,t),Di.addScale(e,n),Di.addBitWidth(e,r),Di.endDecimal(e)}}!function(e){e[e.DAY=0]="DAY",e[e.MILLISECOND=1]="MILLISECOND"}(_i||(_i={}));class Li{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDate(e,t){return(t||new Li).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDate(e,t){return e.setPosition(e.position()+4),(t||new Li).__init(e.readInt32(e.position())+e.position(),e)}unit(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):_i.MILLISECOND}static startDate(e){e.startObject(1)}static addUnit(e,t){e.addFieldInt16(0,t,_i.MILLISECOND)}static endDate(e){return e.endObject()}static createDate(e,t){return Li.startDate(e),Li.addUnit(e,t),Li.endDate(e)}}!function(e){e[e.SECOND=0]="SECOND",e[e.MILLISECOND=1]="MILLISECOND",e[e.MICROSECOND=2]="MICROSECOND",e[e.NANOSECOND=3]="NANOSECOND"}(Si||(Si={}));class Bi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsTime(e,t){return(t||new Bi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsTime(e,t){return e.setPosition(e.position()+4),(t||new Bi).__init(e.readInt32(e.position())+e.position(),e)}unit(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Si.MILLISECOND}bitWidth(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb_pos+e):32}static startTime(e){e.startObject(2)}static addUnit(e,t){e.addFieldInt16(0,t,Si.MILLISECOND)}static addBitWidth(e,t){e.addFieldInt32(1,t,32)}static endTime(e){return e.endObject()}static createTime(e,t,n){return Bi.startTime(e),Bi.addUnit(e,t),Bi.addBitWidth(e,n),Bi.endTime(e)}}class Fi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsTimestamp(e,t){return(t||new Fi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsTimestamp(e,t){return e.setPosition(e.position()+4),(t||new Fi).__init(e.readInt32(e.position())+e.position(),e)}unit(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Si.SECOND}timezone(e){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__string(this.bb_pos+t,e):null}static startTimestamp(e){e.startObject(2)}static addUnit(e,t){e.addFieldInt16(0,t,Si.SECOND)}static addTimezone(e,t){e.addFieldOffset(1,t,0)}static endTimestamp(e){return e.endObject()}static createTimestamp(e,t,n){return Fi.startTimestamp(e),Fi.addUnit(e,t),Fi.addTimezone(e,n),Fi.endTimestamp(e)}}!function(e){e[e.YEAR_MONTH=0]="YEAR_MONTH",e[e.DAY_TIME=1]="DAY_TIME",e[e.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"}(ki||(ki={}));class Mi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsInterval(e,t){return(t||new Mi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsInterval(e,t){return e.setPosition(e.position()+4),(t||new Mi).__init(e.readInt32(e.position())+e.position(),e)}unit(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):ki.YEAR_MONTH}static startInterval(e){e.startObject(1)}static addUnit(e,t){e.addFieldInt16(0,t,ki.YEAR_MONTH)}static endInterval(e){return e.endObject()}static createInterval(e,t){return Mi.startInterval(e),Mi.addUnit(e,t),Mi.endInterval(e)}}!function(e){e[e.Sparse=0]="Sparse",e[e.Dense=1]="Dense"}(Ii||(Ii={}));class Pi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsUnion(e,t){return(t||new Pi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsUnion(e,t){return e.setPosition(e.position()+4),(t||new Pi).__init(e.readInt32(e.position())+e.position(),e)}mode(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Ii.Sparse}typeIds(e){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt32(this.bb.__vector(this.bb_pos+t)+4*e):0}typeIdsLength(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}typeIdsArray(){const e=this.bb.__offset(this.bb_pos,6);return e?new Int32Array(this.bb.bytes().buffer,this.bb.bytes().byteOffset+this.bb.__vector(this.bb_pos+e),this.bb.__vector_len(this.bb_pos+e)):null}static startUnion(e){e.startObject(2)}static addMode(e,t){e.addFieldInt16(0,t,Ii.Sparse)}static addTypeIds(e,t){e.addFieldOffset(1,t,0)}static createTypeIdsVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addInt32(t[n]);return e.endVector()}static startTypeIdsVector(e,t){e.startVector(4,t,4)}static endUnion(e){return e.endObject()}static createUnion(e,t,n){return Pi.startUnion(e),Pi.addMode(e,t),Pi.addTypeIds(e,n),Pi.endUnion(e)}}class zi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFixedSizeBinary(e,t){return(t||new zi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFixedSizeBinary(e,t){return e.setPosition(e.position()+4),(t||new zi).__init(e.readInt32(e.position())+e.position(),e)}byteWidth(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}static startFixedSizeBinary(e){e.startObject(1)}static addByteWidth(e,t){e.addFieldInt32(0,t,0)}static endFixedSizeBinary(e){return e.endObject()}static createFixedSizeBinary(e,t){return zi.startFixedSizeBinary(e),zi.addByteWidth(e,t),zi.endFixedSizeBinary(e)}}class Ui{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFixedSizeList(e,t){return(t||new Ui).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFixedSizeList(e,t){return e.setPosition(e.position()+4),(t||new Ui).__init(e.readInt32(e.position())+e.position(),e)}listSize(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}static startFixedSizeList(e){e.startObject(1)}static addListSize(e,t){e.addFieldInt32(0,t,0)}static endFixedSizeList(e){return e.endObject()}static createFixedSizeList(e,t){return Ui.startFixedSizeList(e),Ui.addListSize(e,t),Ui.endFixedSizeList(e)}}class Ri{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsMap(e,t){return(t||new Ri).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsMap(e,t){return e.setPosition(e.position()+4),(t||new Ri).__init(e.readInt32(e.position())+e.position(),e)}keysSorted(){const e=this.bb.__offset(this.bb_pos,4);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}static startMap(e){e.startObject(1)}static addKeysSorted(e,t){e.addFieldInt8(0,+t,0)}static endMap(e){return e.endObject()}static createMap(e,t){return Ri.startMap(e),Ri.addKeysSorted(e,t),Ri.endMap(e)}}!function(e){e[e.NONE=0]="NONE",e[e.Schema=1]="Schema",e[e.DictionaryBatch=2]="DictionaryBatch",e[e.RecordBatch=3]="RecordBatch",e[e.Tensor=4]="Tensor",e[e.SparseTensor=5]="SparseTensor"}(xi||(xi={}));class ji{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsMessage(e,t){return(t||new ji).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsMessage(e,t){return e.setPosition(e.position()+4),(t||new ji).__init(e.readInt32(e.position())+e.position(),e)}version(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Nr.V1}headerType(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readUint8(this.bb_pos+e):xi.NONE}header(e){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__union(e,this.bb_pos+t):null}bodyLength(){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}customMetadata(e,t){const n=this.bb.__offset(this.bb_pos,12);return n?(t||new Pr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}customMetadataLength(){const e=this.bb.__offset(this.bb_pos,12);return e?this.bb.__vector_len(this.bb_pos+e):0}static startMessage(e){e.startObject(5)}static addVersion(e,t){e.addFieldInt16(0,t,Nr.V1)}static addHeaderType(e,t){e.addFieldInt8(1,t,xi.NONE)}static addHeader(e,t){e.addFieldOffset(2,t,0)}static addBodyLength(e,t){e.addFieldInt64(3,t,e.createLong(0,0))}static addCustomMetadata(e,t){e.addFieldOffset(4,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static endMessage(e){return e.endObject()}static finishMessageBuffer(e,t){e.finish(t)}static finishSizePrefixedMessageBuffer(e,t){e.finish(t,void 0,!0)}static createMessage(e,t,n,r,i,o){return ji.startMessage(e),ji.addVersion(e,t),ji.addHeaderType(e,n),ji.addHeader(e,r),ji.addBodyLength(e,i),ji.addCustomMetadata(e,o),ji.endMessage(e)}}class Vi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsNull(e,t){return(t||new Vi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsNull(e,t){return e.setPosition(e.position()+4),(t||new Vi).__init(e.readInt32(e.position())+e.position(),e)}static startNull(e){e.startObject(0)}static endNull(e){return e.endObject()}static createNull(e){return Vi.startNull(e),Vi.endNull(e)}}class Hi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsBinary(e,t){return(t||new Hi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsBinary(e,t){return e.setPosition(e.position()+4),(t||new Hi).__init(e.readInt32(e.position())+e.position(),e)}static startBinary(e){e.startObject(0)}static endBinary(e){return e.endObject()}static createBinary(e){return Hi.startBinary(e),Hi.endBinary(e)}}class $i{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsBool(e,t){return(t||new $i).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsBool(e,t){return e.setPosition(e.position()+4),(t||new $i).__init(e.readInt32(e.position())+e.position(),e)}static startBool(e){e.startObject(0)}static endBool(e){return e.endObject()}static createBool(e){return $i.startBool(e),$i.endBool(e)}}class Wi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsUtf8(e,t){return(t||new Wi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsUtf8(e,t){return e.setPosition(e.position()+4),(t||new Wi).__init(e.readInt32(e.position())+e.position(),e)}static startUtf8(e){e.startObject(0)}static endUtf8(e){return e.endObject()}static createUtf8(e){return Wi.startUtf8(e),Wi.endUtf8(e)}}class Yi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsList(e,t){return(t||new Yi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsList(e,t){return e.setPosition(e.position()+4),(t||new Yi).__init(e.readInt32(e.position())+e.position(),e)}static startList(e){e.startObject(0)}static endList(e){return e.endObject()}static createList(e){return Yi.startList(e),Yi.endList(e)}}class qi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsStruct_(e,t){return(t||new qi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsStruct_(e,t){return e.setPosition(e.position()+4),(t||new qi).__init(e.readInt32(e.position())+e.position(),e)}static startStruct_(e){e.startObject(0)}static endStruct_(e){return e.endObject()}static createStruct_(e){return qi.startStruct_(e),qi.endStruct_(e)}}var Qi=Or;const Ki=new class extends rt{visit(e,t){return null==e||null==t?void 0:super.visit(e,t)}visitNull(e,t){return Vi.startNull(t),Vi.endNull(t)}visitInt(e,t){return zr.startInt(t),zr.addBitWidth(t,e.bitWidth),zr.addIsSigned(t,e.isSigned),zr.endInt(t)}visitFloat(e,t){return Ni.startFloatingPoint(t),Ni.addPrecision(t,e.precision),Ni.endFloatingPoint(t)}visitBinary(e,t){return Hi.startBinary(t),Hi.endBinary(t)}visitBool(e,t){return $i.startBool(t),$i.endBool(t)}visitUtf8(e,t){return Wi.startUtf8(t),Wi.endUtf8(t)}visitDecimal(e,t){return Di.startDecimal(t),Di.addScale(t,e.scale),Di.addPrecision(t,e.precision),Di.addBitWidth(t,e.bitWidth),Di.endDecimal(t)}visitDate(e,t){return Li.startDate(t),Li.addUnit(t,e.unit),Li.endDate(t)}visitTime(e,t){return Bi.startTime(t),Bi.addUnit(t,e.unit),Bi.addBitWidth(t,e.bitWidth),Bi.endTime(t)}visitTimestamp(e,t){const n=e.timezone&&t.createString(e.timezone)||void 0;return Fi.startTimestamp(t),Fi.addUnit(t,e.unit),void 0!==n&&Fi.addTimezone(t,n),Fi.endTimestamp(t)}visitInterval(e,t){return Mi.startInterval(t),Mi.addUnit(t,e.unit),Mi.endInterval(t)}visitList(e,t){return Yi.startList(t),Yi.endList(t)}visitStruct(e,t){return qi.startStruct_(t),qi.endStruct_(t)}visitUnion(e,t){Pi.startTypeIdsVector(t,e.typeIds.length);const n=Pi.createTypeIdsVector(t,e.typeIds);return Pi.startUnion(t),Pi.addMode(t,e.mode),Pi.addTypeIds(t,n),Pi.endUnion(t)}visitDictionary(e,t){const n=this.visit(e.indices,t);return Ur.startDictionaryEncoding(t),Ur.addId(t,new Qi(e.id,0)),Ur.addIsOrdered(t,e.isOrdered),void 0!==n&&Ur.addIndexType(t,n),Ur.endDictionaryEncoding(t)}visitFixedSizeBinary(e,t){return zi.startFixedSizeBinary(t),zi.addByteWidth(t,e.byteWidth),zi.endFixedSizeBinary(t)}visitFixedSizeList(e,t){return Ui.startFixedSizeList(t),Ui.addListSize(t,e.listSize),Ui.endFixedSizeList(t)}visitMap(e,t){return Ri.startMap(t),Ri.addKeysSorted(t,e.keysSorted),Ri.endMap(t)}};function Gi(e){return new ao(e.count,Ji(e.columns),Zi(e.columns))}function Xi(e,t){return(e.children||[]).filter(Boolean).map(e=>er.fromJSON(e,t))}function Ji(e){return(e||[]).reduce((e,t)=>{return[...e,new co(t.count,(n=t.VALIDITY,(n||[]).reduce((e,t)=>e+ +(0===t),0))),...Ji(t.children)];var n},[])}function Zi(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[];for(let n=-1,r=(e||[]).length;++n<r;){const r=e[n];r.VALIDITY&&t.push(new uo(t.length,r.VALIDITY.length)),r.TYPE&&t.push(new uo(t.length,r.TYPE.length)),r.OFFSET&&t.push(new uo(t.length,r.OFFSET.length)),r.DATA&&t.push(new uo(t.length,r.DATA.length)),t=Zi(r.children,t)}return t}function eo(e){return new Map(Object.entries(e||{}))}function to(e){return new Me(e.isSigned,e.bitWidth)}function no(e,t){const n=e.type.name;switch(n){case"NONE":case"null":return new Fe;case"binary":return new Ue;case"utf8":return new Re;case"bool":return new je;case"list":return new qe((t||[])[0]);case"struct":case"struct_":return new Qe(t||[])}switch(n){case"int":{const t=e.type;return new Me(t.isSigned,t.bitWidth)}case"floatingpoint":{const t=e.type;return new ze(o[t.precision])}case"decimal":{const t=e.type;return new Ve(t.scale,t.precision,t.bitWidth)}case"date":{const t=e.type;return new He(s[t.unit])}case"time":{const t=e.type;return new $e(a[t.unit],t.bitWidth)}case"timestamp":{const t=e.type;return new We(a[t.unit],t.timezone)}case"interval":{const t=e.type;return new Ye(l[t.unit])}case"union":{const n=e.type;return new Ke(i[n.mode],n.typeIds||[],t||[])}case"fixedsizebinary":{const t=e.type;return new Ge(t.byteWidth)}case"fixedsizelist":{const n=e.type;return new Xe(n.listSize,(t||[])[0])}case"map":{const n=e.type;return new Je((t||[])[0],n.keysSorted)}}throw new Error('Unrecognized type: "'.concat(n,'"'))}var ro=Or,io=Mr,oo=Fr;class so{constructor(e,t,n,r){this._version=t,this._headerType=n,this.body=new Uint8Array(0),r&&(this._createHeader=()=>r),this._bodyLength="number"===typeof e?e:e.low}static fromJSON(e,t){const n=new so(0,r.V4,t);return n._createHeader=function(e,t){return()=>{switch(t){case u.Schema:return Zn.fromJSON(e);case u.RecordBatch:return ao.fromJSON(e);case u.DictionaryBatch:return lo.fromJSON(e)}throw new Error("Unrecognized Message type: { name: ".concat(u[t],", type: ").concat(t," }"))}}(e,t),n}static decode(e){e=new oo(Z(e));const t=ji.getRootAsMessage(e),n=t.bodyLength(),r=t.version(),i=t.headerType(),o=new so(n,r,i);return o._createHeader=function(e,t){return()=>{switch(t){case u.Schema:return Zn.decode(e.header(new jr));case u.RecordBatch:return ao.decode(e.header(new Oi),e.version());case u.DictionaryBatch:return lo.decode(e.header(new Ci),e.version())}throw new Error("Unrecognized Message type: { name: ".concat(u[t],", type: ").concat(t," }"))}}(t,i),o}static encode(e){const t=new io;let n=-1;return e.isSchema()?n=Zn.encode(t,e.header()):e.isRecordBatch()?n=ao.encode(t,e.header()):e.isDictionaryBatch()&&(n=lo.encode(t,e.header())),ji.startMessage(t),ji.addVersion(t,r.V4),ji.addHeader(t,n),ji.addHeaderType(t,e.headerType),ji.addBodyLength(t,new ro(e.bodyLength,0)),ji.finishMessageBuffer(t,ji.endMessage(t)),t.asUint8Array()}static from(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;if(e instanceof Zn)return new so(0,r.V4,u.Schema,e);if(e instanceof ao)return new so(t,r.V4,u.RecordBatch,e);if(e instanceof lo)return new so(t,r.V4,u.DictionaryBatch,e);throw new Error("Unrecognized Message header: ".concat(e))}get type(){return this.headerType}get version(){return this._version}get headerType(){return this._headerType}get bodyLength(){return this._bodyLength}header(){return this._createHeader()}isSchema(){return this.headerType===u.Schema}isRecordBatch(){return this.headerType===u.RecordBatch}isDictionaryBatch(){return this.headerType===u.DictionaryBatch}}class ao{constructor(e,t,n){this._nodes=t,this._buffers=n,this._length="number"===typeof e?e:e.low}get nodes(){return this._nodes}get length(){return this._length}get buffers(){return this._buffers}}class lo{constructor(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2];this._data=e,this._isDelta=n,this._id="number"===typeof t?t:t.low}get id(){return this._id}get data(){return this._data}get isDelta(){return this._isDelta}get length(){return this.data.length}get nodes(){return this.data.nodes}get buffers(){return this.data.buffers}}class uo{constructor(e,t){this.offset="number"===typeof e?e:e.low,this.length="number"===typeof t?t:t.low}}class co{constructor(e,t){this.length="number"===typeof e?e:e.low,this.nullCount="number"===typeof t?t:t.low}}function fo(e,t){const n=[];for(let r,i=-1,o=-1,s=e.childrenLength();++i<s;)(r=e.children(i))&&(n[++o]=er.decode(r,t));return n}function ho(e){const t=new Map;if(e)for(let n,r,i=-1,o=Math.trunc(e.customMetadataLength());++i<o;)(n=e.customMetadata(i))&&null!=(r=n.key())&&t.set(r,n.value());return t}function po(e){return new Me(e.isSigned(),e.bitWidth())}function yo(e,t){const n=e.typeType();switch(n){case Br.NONE:case Br.Null:return new Fe;case Br.Binary:return new Ue;case Br.Utf8:return new Re;case Br.Bool:return new je;case Br.List:return new qe((t||[])[0]);case Br.Struct_:return new Qe(t||[])}switch(n){case Br.Int:{const t=e.type(new zr);return new Me(t.isSigned(),t.bitWidth())}case Br.FloatingPoint:{const t=e.type(new Ni);return new ze(t.precision())}case Br.Decimal:{const t=e.type(new Di);return new Ve(t.scale(),t.precision(),t.bitWidth())}case Br.Date:{const t=e.type(new Li);return new He(t.unit())}case Br.Time:{const t=e.type(new Bi);return new $e(t.unit(),t.bitWidth())}case Br.Timestamp:{const t=e.type(new Fi);return new We(t.unit(),t.timezone())}case Br.Interval:{const t=e.type(new Mi);return new Ye(t.unit())}case Br.Union:{const n=e.type(new Pi);return new Ke(n.mode(),n.typeIdsArray()||[],t||[])}case Br.FixedSizeBinary:{const t=e.type(new zi);return new Ge(t.byteWidth())}case Br.FixedSizeList:{const n=e.type(new Ui);return new Xe(n.listSize(),(t||[])[0])}case Br.Map:{const n=e.type(new Ri);return new Je((t||[])[0],n.keysSorted())}}throw new Error('Unrecognized type: "'.concat(Br[n],'" (').concat(n,")"))}er.encode=function(e,t){let n=-1,r=-1,i=-1;const o=t.type;let s=t.typeId;Be.isDictionary(o)?(s=o.dictionary.typeId,i=Ki.visit(o,e),r=Ki.visit(o.dictionary,e)):r=Ki.visit(o,e);const a=(o.children||[]).map(t=>er.encode(e,t)),l=Rr.createChildrenVector(e,a),u=t.metadata&&t.metadata.size>0?Rr.createCustomMetadataVector(e,[...t.metadata].map(t=>{let[n,r]=t;const i=e.createString("".concat(n)),o=e.createString("".concat(r));return Pr.startKeyValue(e),Pr.addKey(e,i),Pr.addValue(e,o),Pr.endKeyValue(e)})):-1;t.name&&(n=e.createString(t.name));Rr.startField(e),Rr.addType(e,r),Rr.addTypeType(e,s),Rr.addChildren(e,l),Rr.addNullable(e,!!t.nullable),-1!==n&&Rr.addName(e,n);-1!==i&&Rr.addDictionary(e,i);-1!==u&&Rr.addCustomMetadata(e,u);return Rr.endField(e)},er.decode=function(e,t){let n,r,i,o,s,a;t&&(a=e.dictionary())?t.has(n=a.id().low)?(o=(o=a.indexType())?po(o):new Pe,s=new tt(t.get(n),o,n,a.isOrdered()),r=new er(e.name(),s,e.nullable(),ho(e))):(o=(o=a.indexType())?po(o):new Pe,t.set(n,i=yo(e,fo(e,t))),s=new tt(i,o,n,a.isOrdered()),r=new er(e.name(),s,e.nullable(),ho(e))):(i=yo(e,fo(e,t)),r=new er(e.name(),i,e.nullable(),ho(e)));return r||null},er.fromJSON=function(e,t){let n,r,i,o,s,a;return t&&(o=e.dictionary)?t.has(n=o.id)?(r=(r=o.indexType)?to(r):new Pe,a=new tt(t.get(n),r,n,o.isOrdered),i=new er(e.name,a,e.nullable,eo(e.customMetadata))):(r=(r=o.indexType)?to(r):new Pe,t.set(n,s=no(e,Xi(e,t))),a=new tt(s,r,n,o.isOrdered),i=new er(e.name,a,e.nullable,eo(e.customMetadata))):(s=no(e,Xi(e,t)),i=new er(e.name,s,e.nullable,eo(e.customMetadata))),i||null},Zn.encode=function(e,t){const n=t.fields.map(t=>er.encode(e,t));jr.startFieldsVector(e,n.length);const r=jr.createFieldsVector(e,n),i=t.metadata&&t.metadata.size>0?jr.createCustomMetadataVector(e,[...t.metadata].map(t=>{let[n,r]=t;const i=e.createString("".concat(n)),o=e.createString("".concat(r));return Pr.startKeyValue(e),Pr.addKey(e,i),Pr.addValue(e,o),Pr.endKeyValue(e)})):-1;jr.startSchema(e),jr.addFields(e,r),jr.addEndianness(e,bo?Dr.Little:Dr.Big),-1!==i&&jr.addCustomMetadata(e,i);return jr.endSchema(e)},Zn.decode=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Map;const n=function(e,t){const n=[];for(let r,i=-1,o=-1,s=e.fieldsLength();++i<s;)(r=e.fields(i))&&(n[++o]=er.decode(r,t));return n}(e,t);return new Zn(n,ho(e),t)},Zn.fromJSON=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Map;return new Zn(function(e,t){return(e.fields||[]).filter(Boolean).map(e=>er.fromJSON(e,t))}(e,t),eo(e.customMetadata),t)},ao.encode=function(e,t){const n=t.nodes||[],r=t.buffers||[];Oi.startNodesVector(e,n.length);for(const s of n.slice().reverse())co.encode(e,s);const i=e.endVector();Oi.startBuffersVector(e,r.length);for(const s of r.slice().reverse())uo.encode(e,s);const o=e.endVector();return Oi.startRecordBatch(e),Oi.addLength(e,new ro(t.length,0)),Oi.addNodes(e,i),Oi.addBuffers(e,o),Oi.endRecordBatch(e)},ao.decode=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:r.V4;if(null!==e.compression())throw new Error("Record batch compression not implemented");return new ao(e.length(),function(e){const t=[];for(let n,r=-1,i=-1,o=e.nodesLength();++r<o;)(n=e.nodes(r))&&(t[++i]=co.decode(n));return t}(e),function(e,t){const n=[];for(let i,o=-1,s=-1,a=e.buffersLength();++o<a;)(i=e.buffers(o))&&(t<r.V4&&(i.bb_pos+=8*(o+1)),n[++s]=uo.decode(i));return n}(e,t))},ao.fromJSON=Gi,lo.encode=function(e,t){const n=ao.encode(e,t.data);return Ci.startDictionaryBatch(e),Ci.addId(e,new ro(t.id,0)),Ci.addIsDelta(e,t.isDelta),Ci.addData(e,n),Ci.endDictionaryBatch(e)},lo.decode=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:r.V4;return new lo(ao.decode(e.data(),t),e.id(),e.isDelta())},lo.fromJSON=function(e){return new lo(Gi(e.data),e.id,e.isDelta)},co.encode=function(e,t){return Ai.createFieldNode(e,new ro(t.length,0),new ro(t.nullCount,0))},co.decode=function(e){return new co(e.length(),e.nullCount())},uo.encode=function(e,t){return Ei.createBuffer(e,new ro(t.offset,0),new ro(t.length,0))},uo.decode=function(e){return new uo(e.offset(),e.length())};const bo=(()=>{const e=new ArrayBuffer(2);return new DataView(e).setInt16(0,256,!0),256===new Int16Array(e)[0]})(),mo=e=>"Expected ".concat(u[e]," Message in stream, but was null or length 0."),go=e=>"Header pointer of flatbuffer-encoded ".concat(u[e]," Message is null or length 0."),vo=(e,t)=>"Expected to read ".concat(e," metadata bytes, but only read ").concat(t,"."),wo=(e,t)=>"Expected to read ".concat(e," bytes for message body, but only read ").concat(t,".");class _o{constructor(e){this.source=e instanceof ii?e:new ii(e)}[Symbol.iterator](){return this}next(){let e;return(e=this.readMetadataLength()).done||-1===e.value&&(e=this.readMetadataLength()).done||(e=this.readMetadata(e.value)).done?Zr:e}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}readMessage(e){let t;if((t=this.next()).done)return null;if(null!=e&&t.value.headerType!==e)throw new Error(mo(e));return t.value}readMessageBody(e){if(e<=0)return new Uint8Array(0);const t=Z(this.source.read(e));if(t.byteLength<e)throw new Error(wo(e,t.byteLength));return t.byteOffset%8===0&&t.byteOffset+t.byteLength<=t.buffer.byteLength?t:t.slice()}readSchema(){let e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];const t=u.Schema,n=this.readMessage(t),r=null===n||void 0===n?void 0:n.header();if(e&&!r)throw new Error(go(t));return r}readMetadataLength(){const e=this.source.read(Io),t=e&&new Fr(e),n=(null===t||void 0===t?void 0:t.readInt32(0))||0;return{done:0===n,value:n}}readMetadata(e){const t=this.source.read(e);if(!t)return Zr;if(t.byteLength<e)throw new Error(vo(e,t.byteLength));return{done:!1,value:so.decode(t)}}}class So{constructor(e,t){this.source=e instanceof oi?e:D(e)?new ui(e,t):new oi(e)}[Symbol.asyncIterator](){return this}next(){return z(this,void 0,void 0,function*(){let e;return(e=yield this.readMetadataLength()).done||-1===e.value&&(e=yield this.readMetadataLength()).done||(e=yield this.readMetadata(e.value)).done?Zr:e})}throw(e){return z(this,void 0,void 0,function*(){return yield this.source.throw(e)})}return(e){return z(this,void 0,void 0,function*(){return yield this.source.return(e)})}readMessage(e){return z(this,void 0,void 0,function*(){let t;if((t=yield this.next()).done)return null;if(null!=e&&t.value.headerType!==e)throw new Error(mo(e));return t.value})}readMessageBody(e){return z(this,void 0,void 0,function*(){if(e<=0)return new Uint8Array(0);const t=Z(yield this.source.read(e));if(t.byteLength<e)throw new Error(wo(e,t.byteLength));return t.byteOffset%8===0&&t.byteOffset+t.byteLength<=t.buffer.byteLength?t:t.slice()})}readSchema(){let e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return z(this,void 0,void 0,function*(){const t=u.Schema,n=yield this.readMessage(t),r=null===n||void 0===n?void 0:n.header();if(e&&!r)throw new Error(go(t));return r})}readMetadataLength(){return z(this,void 0,void 0,function*(){const e=yield this.source.read(Io),t=e&&new Fr(e),n=(null===t||void 0===t?void 0:t.readInt32(0))||0;return{done:0===n,value:n}})}readMetadata(e){return z(this,void 0,void 0,function*(){const t=yield this.source.read(e);if(!t)return Zr;if(t.byteLength<e)throw new Error(vo(e,t.byteLength));return{done:!1,value:so.decode(t)}})}}class ko extends _o{constructor(e){super(new Uint8Array(0)),this._schema=!1,this._body=[],this._batchIndex=0,this._dictionaryIndex=0,this._json=e instanceof ei?e:new ei(e)}next(){const{_json:e}=this;if(!this._schema){this._schema=!0;return{done:!1,value:so.fromJSON(e.schema,u.Schema)}}if(this._dictionaryIndex<e.dictionaries.length){const t=e.dictionaries[this._dictionaryIndex++];this._body=t.data.columns;return{done:!1,value:so.fromJSON(t,u.DictionaryBatch)}}if(this._batchIndex<e.batches.length){const t=e.batches[this._batchIndex++];this._body=t.columns;return{done:!1,value:so.fromJSON(t,u.RecordBatch)}}return this._body=[],Zr}readMessageBody(e){return function e(t){return(t||[]).reduce((t,n)=>[...t,...n.VALIDITY&&[n.VALIDITY]||[],...n.TYPE&&[n.TYPE]||[],...n.OFFSET&&[n.OFFSET]||[],...n.DATA&&[n.DATA]||[],...e(n.children)],[])}(this._body)}readMessage(e){let t;if((t=this.next()).done)return null;if(null!=e&&t.value.headerType!==e)throw new Error(mo(e));return t.value}readSchema(){const e=u.Schema,t=this.readMessage(e),n=null===t||void 0===t?void 0:t.header();if(!t||!n)throw new Error(go(e));return n}}const Io=4,xo="ARROW1",To=new Uint8Array(6);for(let hs=0;hs<6;hs+=1)To[hs]=xo.codePointAt(hs);function Eo(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;for(let n=-1,r=To.length;++n<r;)if(To[n]!==e[t+n])return!1;return!0}const Ao=To.length,Oo=Ao+Io,Co=2*Ao+Io;class No extends ti{constructor(e){super(),this._impl=e}get closed(){return this._impl.closed}get schema(){return this._impl.schema}get autoDestroy(){return this._impl.autoDestroy}get dictionaries(){return this._impl.dictionaries}get numDictionaries(){return this._impl.numDictionaries}get numRecordBatches(){return this._impl.numRecordBatches}get footer(){return this._impl.isFile()?this._impl.footer:null}isSync(){return this._impl.isSync()}isAsync(){return this._impl.isAsync()}isFile(){return this._impl.isFile()}isStream(){return this._impl.isStream()}next(){return this._impl.next()}throw(e){return this._impl.throw(e)}return(e){return this._impl.return(e)}cancel(){return this._impl.cancel()}reset(e){return this._impl.reset(e),this._DOMStream=void 0,this._nodeStream=void 0,this}open(e){const t=this._impl.open(e);return E(t)?t.then(()=>this):this}readRecordBatch(e){return this._impl.isFile()?this._impl.readRecordBatch(e):null}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}toDOMStream(){return Kr.toDOMStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this})}toNodeStream(){return Kr.toNodeStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this},{objectMode:!0})}static throughNode(e){throw new Error('"throughNode" not available in this environment')}static throughDOM(e,t){throw new Error('"throughDOM" not available in this environment')}static from(e){return e instanceof No?e:C(e)?function(e){return new Do(new jo(e))}(e):D(e)?function(e){return z(this,void 0,void 0,function*(){const{size:t}=yield e.stat(),n=new ui(e,t);return t>=Co&&Eo(yield n.readAt(0,Ao+7&-8))?new Fo(new Ro(n)):new Lo(new zo(n))})}(e):E(e)?(()=>z(this,void 0,void 0,function*(){return yield No.from(yield e)}))():L(e)||F(e)||M(e)||O(e)?function(e){return z(this,void 0,void 0,function*(){const t=yield e.peek(Ao+7&-8);return t&&t.byteLength>=4?Eo(t)?new Bo(new Uo(yield e.read())):new Lo(new zo(e)):new Lo(new zo(function(){return j(this,arguments,function*(){})}()))})}(new oi(e)):function(e){const t=e.peek(Ao+7&-8);return t&&t.byteLength>=4?Eo(t)?new Bo(new Uo(e.read())):new Do(new Po(e)):new Do(new Po(function*(){}()))}(new ii(e))}static readAll(e){return e instanceof No?e.isSync()?Ho(e):$o(e):C(e)||ArrayBuffer.isView(e)||A(e)||N(e)?Ho(e):$o(e)}}class Do extends No{constructor(e){super(e),this._impl=e}readAll(){return[...this]}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return j(this,arguments,function*(){yield R(yield*V(H(this[Symbol.iterator]())))})}}class Lo extends No{constructor(e){super(e),this._impl=e}readAll(){var e,t;return z(this,void 0,void 0,function*(){const n=new Array;try{for(var r,i=H(this);!(r=yield i.next()).done;){const e=r.value;n.push(e)}}catch(o){e={error:o}}finally{try{r&&!r.done&&(t=i.return)&&(yield t.call(i))}finally{if(e)throw e.error}}return n})}[Symbol.iterator](){throw new Error("AsyncRecordBatchStreamReader is not Iterable")}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}}class Bo extends Do{constructor(e){super(e),this._impl=e}}class Fo extends Lo{constructor(e){super(e),this._impl=e}}class Mo{constructor(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:new Map;this.closed=!1,this.autoDestroy=!0,this._dictionaryIndex=0,this._recordBatchIndex=0,this.dictionaries=e}get numDictionaries(){return this._dictionaryIndex}get numRecordBatches(){return this._recordBatchIndex}isSync(){return!1}isAsync(){return!1}isFile(){return!1}isStream(){return!1}reset(e){return this._dictionaryIndex=0,this._recordBatchIndex=0,this.schema=e,this.dictionaries=new Map,this}_loadRecordBatch(e,t){const n=this._loadVectors(e,t,this.schema.fields),r=Jn({type:new Qe(this.schema.fields),length:e.length,children:n});return new mr(this.schema,r)}_loadDictionaryBatch(e,t){const{id:n,isDelta:r}=e,{dictionaries:i,schema:o}=this,s=i.get(n);if(r||!s){const i=o.dictionaries.get(n),a=this._loadVectors(e.data,t,[i]);return(s&&r?s.concat(new Qn(a)):new Qn(a)).memoize()}return s.memoize()}_loadVectors(e,t,n){return new bi(t,e.nodes,e.buffers,this.dictionaries).visitMany(n)}}class Po extends Mo{constructor(e,t){super(t),this._reader=C(e)?new ko(this._handle=e):new _o(this._handle=e)}isSync(){return!0}isStream(){return!0}[Symbol.iterator](){return this}cancel(){!this.closed&&(this.closed=!0)&&(this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}open(e){return this.closed||(this.autoDestroy=Vo(this,e),this.schema||(this.schema=this._reader.readSchema())||this.cancel()),this}throw(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.throw(e):Zr}return(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.return(e):Zr}next(){if(this.closed)return Zr;let e;const{_reader:t}=this;for(;e=this._readNextMessageAndValidate();)if(e.isSchema())this.reset(e.header());else{if(e.isRecordBatch()){this._recordBatchIndex++;const n=e.header(),r=t.readMessageBody(e.bodyLength);return{done:!1,value:this._loadRecordBatch(n,r)}}if(e.isDictionaryBatch()){this._dictionaryIndex++;const n=e.header(),r=t.readMessageBody(e.bodyLength),i=this._loadDictionaryBatch(n,r);this.dictionaries.set(n.id,i)}}return this.schema&&0===this._recordBatchIndex?(this._recordBatchIndex++,{done:!1,value:new wr(this.schema)}):this.return()}_readNextMessageAndValidate(e){return this._reader.readMessage(e)}}class zo extends Mo{constructor(e,t){super(t),this._reader=new So(this._handle=e)}isAsync(){return!0}isStream(){return!0}[Symbol.asyncIterator](){return this}cancel(){return z(this,void 0,void 0,function*(){!this.closed&&(this.closed=!0)&&(yield this.reset()._reader.return(),this._reader=null,this.dictionaries=null)})}open(e){return z(this,void 0,void 0,function*(){return this.closed||(this.autoDestroy=Vo(this,e),this.schema||(this.schema=yield this._reader.readSchema())||(yield this.cancel())),this})}throw(e){return z(this,void 0,void 0,function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.throw(e):Zr})}return(e){return z(this,void 0,void 0,function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.return(e):Zr})}next(){return z(this,void 0,void 0,function*(){if(this.closed)return Zr;let e;const{_reader:t}=this;for(;e=yield this._readNextMessageAndValidate();)if(e.isSchema())yield this.reset(e.header());else{if(e.isRecordBatch()){this._recordBatchIndex++;const n=e.header(),r=yield t.readMessageBody(e.bodyLength);return{done:!1,value:this._loadRecordBatch(n,r)}}if(e.isDictionaryBatch()){this._dictionaryIndex++;const n=e.header(),r=yield t.readMessageBody(e.bodyLength),i=this._loadDictionaryBatch(n,r);this.dictionaries.set(n.id,i)}}return this.schema&&0===this._recordBatchIndex?(this._recordBatchIndex++,{done:!1,value:new wr(this.schema)}):yield this.return()})}_readNextMessageAndValidate(e){return z(this,void 0,void 0,function*(){return yield this._reader.readMessage(e)})}}class Uo extends Po{constructor(e,t){super(e instanceof li?e:new li(e),t)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isSync(){return!0}isFile(){return!0}open(e){if(!this.closed&&!this._footer){this.schema=(this._footer=this._readFooter()).schema;for(const e of this._footer.dictionaryBatches())e&&this._readDictionaryBatch(this._dictionaryIndex++)}return super.open(e)}readRecordBatch(e){var t;if(this.closed)return null;this._footer||this.open();const n=null===(t=this._footer)||void 0===t?void 0:t.getRecordBatch(e);if(n&&this._handle.seek(n.offset)){const e=this._reader.readMessage(u.RecordBatch);if(null===e||void 0===e?void 0:e.isRecordBatch()){const t=e.header(),n=this._reader.readMessageBody(e.bodyLength);return this._loadRecordBatch(t,n)}}return null}_readDictionaryBatch(e){var t;const n=null===(t=this._footer)||void 0===t?void 0:t.getDictionaryBatch(e);if(n&&this._handle.seek(n.offset)){const e=this._reader.readMessage(u.DictionaryBatch);if(null===e||void 0===e?void 0:e.isDictionaryBatch()){const t=e.header(),n=this._reader.readMessageBody(e.bodyLength),r=this._loadDictionaryBatch(t,n);this.dictionaries.set(t.id,r)}}}_readFooter(){const{_handle:e}=this,t=e.size-Oo,n=e.readInt32(t),r=e.readAt(t-n,n);return Yr.decode(r)}_readNextMessageAndValidate(e){var t;if(this._footer||this.open(),this._footer&&this._recordBatchIndex<this.numRecordBatches){const n=null===(t=this._footer)||void 0===t?void 0:t.getRecordBatch(this._recordBatchIndex);if(n&&this._handle.seek(n.offset))return this._reader.readMessage(e)}return null}}class Ro extends zo{constructor(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];const i="number"!==typeof n[0]?n.shift():void 0,o=n[0]instanceof Map?n.shift():void 0;super(e instanceof ui?e:new ui(e,i),o)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isFile(){return!0}isAsync(){return!0}open(e){const t=Object.create(null,{open:{get:()=>super.open}});return z(this,void 0,void 0,function*(){if(!this.closed&&!this._footer){this.schema=(this._footer=yield this._readFooter()).schema;for(const e of this._footer.dictionaryBatches())e&&(yield this._readDictionaryBatch(this._dictionaryIndex++))}return yield t.open.call(this,e)})}readRecordBatch(e){var t;return z(this,void 0,void 0,function*(){if(this.closed)return null;this._footer||(yield this.open());const n=null===(t=this._footer)||void 0===t?void 0:t.getRecordBatch(e);if(n&&(yield this._handle.seek(n.offset))){const e=yield this._reader.readMessage(u.RecordBatch);if(null===e||void 0===e?void 0:e.isRecordBatch()){const t=e.header(),n=yield this._reader.readMessageBody(e.bodyLength);return this._loadRecordBatch(t,n)}}return null})}_readDictionaryBatch(e){var t;return z(this,void 0,void 0,function*(){const n=null===(t=this._footer)||void 0===t?void 0:t.getDictionaryBatch(e);if(n&&(yield this._handle.seek(n.offset))){const e=yield this._reader.readMessage(u.DictionaryBatch);if(null===e||void 0===e?void 0:e.isDictionaryBatch()){const t=e.header(),n=yield this._reader.readMessageBody(e.bodyLength),r=this._loadDictionaryBatch(t,n);this.dictionaries.set(t.id,r)}}})}_readFooter(){return z(this,void 0,void 0,function*(){const{_handle:e}=this;e._pending&&(yield e._pending);const t=e.size-Oo,n=yield e.readInt32(t),r=yield e.readAt(t-n,n);return Yr.decode(r)})}_readNextMessageAndValidate(e){return z(this,void 0,void 0,function*(){if(this._footer||(yield this.open()),this._footer&&this._recordBatchIndex<this.numRecordBatches){const t=this._footer.getRecordBatch(this._recordBatchIndex);if(t&&(yield this._handle.seek(t.offset)))return yield this._reader.readMessage(e)}return null})}}class jo extends Po{constructor(e,t){super(e,t)}_loadVectors(e,t,n){return new mi(t,e.nodes,e.buffers,this.dictionaries).visitMany(n)}}function Vo(e,t){return t&&"boolean"===typeof t.autoDestroy?t.autoDestroy:e.autoDestroy}function*Ho(e){const t=No.from(e);try{if(!t.open({autoDestroy:!1}).closed)do{yield t}while(!t.reset().open().closed)}finally{t.cancel()}}function $o(e){return j(this,arguments,function*(){const t=yield R(No.from(e));try{if(!(yield R(t.open({autoDestroy:!1}))).closed)do{yield yield R(t)}while(!(yield R(t.reset().open())).closed)}finally{yield R(t.cancel())}})}class Wo extends rt{constructor(){super(),this._byteLength=0,this._nodes=[],this._buffers=[],this._bufferRegions=[]}static assemble(){const e=t=>t.flatMap(t=>Array.isArray(t)?e(t):t instanceof mr?t.data.children:t.data),t=new Wo;for(var n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return t.visitMany(e(r)),t}visit(e){if(e instanceof Qn)return this.visitMany(e.data),this;const{type:t}=e;if(!Be.isDictionary(t)){const{length:n,nullCount:r}=e;if(n>2147483647)throw new RangeError("Cannot write arrays larger than 2^31 - 1 in length");Be.isNull(t)||Yo.call(this,r<=0?new Uint8Array(0):En(e.offset,n,e.nullBitmap)),this.nodes.push(new co(n,r))}return super.visit(e)}visitNull(e){return this}visitDictionary(e){return this.visit(e.clone(e.type.indices))}get nodes(){return this._nodes}get buffers(){return this._buffers}get byteLength(){return this._byteLength}get bufferRegions(){return this._bufferRegions}}function Yo(e){const t=e.byteLength+7&-8;return this.buffers.push(e),this.bufferRegions.push(new uo(this._byteLength,t)),this._byteLength+=t,this}function qo(e){return Yo.call(this,e.values.subarray(0,e.length*e.stride))}function Qo(e){const{length:t,values:n,valueOffsets:r}=e,i=r[0],o=r[t],s=Math.min(o-i,n.byteLength-i);return Yo.call(this,re(-r[0],t,r)),Yo.call(this,n.subarray(i,i+s)),this}function Ko(e){const{length:t,valueOffsets:n}=e;return n&&Yo.call(this,re(n[0],t,n)),this.visit(e.children[0])}function Go(e){return this.visitMany(e.type.children.map((t,n)=>e.children[n]).filter(Boolean))[0]}Wo.prototype.visitBool=function(e){let t;return e.nullCount>=e.length?Yo.call(this,new Uint8Array(0)):(t=e.values)instanceof Uint8Array?Yo.call(this,En(e.offset,e.length,t)):Yo.call(this,An(e.values))},Wo.prototype.visitInt=qo,Wo.prototype.visitFloat=qo,Wo.prototype.visitUtf8=Qo,Wo.prototype.visitBinary=Qo,Wo.prototype.visitFixedSizeBinary=qo,Wo.prototype.visitDate=qo,Wo.prototype.visitTimestamp=qo,Wo.prototype.visitTime=qo,Wo.prototype.visitDecimal=qo,Wo.prototype.visitList=Ko,Wo.prototype.visitStruct=Go,Wo.prototype.visitUnion=function(e){const{type:t,length:n,typeIds:r,valueOffsets:o}=e;if(Yo.call(this,r),t.mode===i.Sparse)return Go.call(this,e);if(t.mode===i.Dense){if(e.offset<=0)return Yo.call(this,o),Go.call(this,e);{const i=r.reduce((e,t)=>Math.max(e,t),r[0]),s=new Int32Array(i+1),a=new Int32Array(i+1).fill(-1),l=new Int32Array(n),u=re(-o[0],n,o);for(let e,t,o=-1;++o<n;)-1===(t=a[e=r[o]])&&(t=a[e]=u[e]),l[o]=u[o]-t,++s[e];Yo.call(this,l);for(let r,o=-1,c=t.children.length;++o<c;)if(r=e.children[o]){const e=t.typeIds[o],i=Math.min(n,s[e]);this.visit(r.slice(a[e],i))}}}return this},Wo.prototype.visitInterval=qo,Wo.prototype.visitFixedSizeList=Ko,Wo.prototype.visitMap=Ko;class Xo extends ti{constructor(e){super(),this._position=0,this._started=!1,this._sink=new ri,this._schema=null,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,T(e)||(e={autoDestroy:!0,writeLegacyIpcFormat:!1}),this._autoDestroy="boolean"!==typeof e.autoDestroy||e.autoDestroy,this._writeLegacyIpcFormat="boolean"===typeof e.writeLegacyIpcFormat&&e.writeLegacyIpcFormat}static throughNode(e){throw new Error('"throughNode" not available in this environment')}static throughDOM(e,t){throw new Error('"throughDOM" not available in this environment')}toString(){let e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return this._sink.toString(e)}toUint8Array(){let e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return this._sink.toUint8Array(e)}writeAll(e){return E(e)?e.then(e=>this.writeAll(e)):O(e)?ts(this,e):es(this,e)}get closed(){return this._sink.closed}[Symbol.asyncIterator](){return this._sink[Symbol.asyncIterator]()}toDOMStream(e){return this._sink.toDOMStream(e)}toNodeStream(e){return this._sink.toNodeStream(e)}close(){return this.reset()._sink.close()}abort(e){return this.reset()._sink.abort(e)}finish(){return this._autoDestroy?this.close():this.reset(this._sink,this._schema),this}reset(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this._sink,t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null;var n;return e===this._sink||e instanceof ri?this._sink=e:(this._sink=new ri,e&&(T(n=e)&&x(n.abort)&&x(n.getWriter)&&!B(n))?this.toDOMStream({type:"bytes"}).pipeTo(e):e&&(e=>T(e)&&x(e.end)&&x(e.write)&&I(e.writable)&&!B(e))(e)&&this.toNodeStream({objectMode:!1}).pipe(e)),this._started&&this._schema&&this._writeFooter(this._schema),this._started=!1,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,t&&pr(t,this._schema)||(null==t?(this._position=0,this._schema=null):(this._started=!0,this._schema=t,this._writeSchema(t))),this}write(e){let t=null;if(!this._sink)throw new Error("RecordBatchWriter is closed");if(null==e)return this.finish()&&void 0;if(e instanceof kr&&!(t=e.schema))return this.finish()&&void 0;if(e instanceof mr&&!(t=e.schema))return this.finish()&&void 0;if(t&&!pr(t,this._schema)){if(this._started&&this._autoDestroy)return this.close();this.reset(this._sink,t)}e instanceof mr?e instanceof wr||this._writeRecordBatch(e):e instanceof kr?this.writeAll(e.batches):A(e)&&this.writeAll(e)}_writeMessage(e){const t=(arguments.length>1&&void 0!==arguments[1]?arguments[1]:8)-1,n=so.encode(e),r=n.byteLength,i=this._writeLegacyIpcFormat?4:8,o=r+i+t&~t,s=o-r-i;return e.headerType===u.RecordBatch?this._recordBatchBlocks.push(new Qr(o,e.bodyLength,this._position)):e.headerType===u.DictionaryBatch&&this._dictionaryBlocks.push(new Qr(o,e.bodyLength,this._position)),this._writeLegacyIpcFormat||this._write(Int32Array.of(-1)),this._write(Int32Array.of(o-i)),r>0&&this._write(n),this._writePadding(s)}_write(e){if(this._started){const t=Z(e);t&&t.byteLength>0&&(this._sink.write(t),this._position+=t.byteLength)}return this}_writeSchema(e){return this._writeMessage(so.from(e))}_writeFooter(e){return this._writeLegacyIpcFormat?this._write(Int32Array.of(0)):this._write(Int32Array.of(-1,0))}_writeMagic(){return this._write(To)}_writePadding(e){return e>0?this._write(new Uint8Array(e)):this}_writeRecordBatch(e){const{byteLength:t,nodes:n,bufferRegions:r,buffers:i}=Wo.assemble(e),o=new ao(e.numRows,n,r),s=so.from(o,t);return this._writeDictionaries(e)._writeMessage(s)._writeBodyBuffers(i)}_writeDictionaryBatch(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2];this._dictionaryDeltaOffsets.set(t,e.length+(this._dictionaryDeltaOffsets.get(t)||0));const{byteLength:r,nodes:i,bufferRegions:o,buffers:s}=Wo.assemble(new Qn([e])),a=new ao(e.length,i,o),l=new lo(a,t,n),u=so.from(l,r);return this._writeMessage(u)._writeBodyBuffers(s)}_writeBodyBuffers(e){let t,n,r;for(let i=-1,o=e.length;++i<o;)(t=e[i])&&(n=t.byteLength)>0&&(this._write(t),(r=(n+7&-8)-n)>0&&this._writePadding(r));return this}_writeDictionaries(e){for(let[t,n]of e.dictionaries){let e=this._dictionaryDeltaOffsets.get(t)||0;if(0===e||(n=null===n||void 0===n?void 0:n.slice(e)).length>0)for(const r of n.data)this._writeDictionaryBatch(r,t,e>0),e+=r.length}return this}}class Jo extends Xo{static writeAll(e,t){const n=new Jo(t);return E(e)?e.then(e=>n.writeAll(e)):O(e)?ts(n,e):es(n,e)}}class Zo extends Xo{static writeAll(e){const t=new Zo;return E(e)?e.then(e=>t.writeAll(e)):O(e)?ts(t,e):es(t,e)}constructor(){super(),this._autoDestroy=!0}_writeSchema(e){return this._writeMagic()._writePadding(2)}_writeFooter(e){const t=Yr.encode(new Yr(e,r.V4,this._recordBatchBlocks,this._dictionaryBlocks));return super._writeFooter(e)._write(t)._write(Int32Array.of(t.byteLength))._writeMagic()}}function es(e,t){let n=t;t instanceof kr&&(n=t.batches,e.reset(void 0,t.schema));for(const r of n)e.write(r);return e.finish()}function ts(e,t){var n,r,i,o;return z(this,void 0,void 0,function*(){try{for(n=H(t);!(r=yield n.next()).done;){const t=r.value;e.write(t)}}catch(s){i={error:s}}finally{try{r&&!r.done&&(o=n.return)&&(yield o.call(n))}finally{if(i)throw i.error}}return e.finish()})}function ns(e){const t=No.from(e);return E(t)?t.then(e=>ns(e)):t.isAsync()?t.readAll().then(e=>new kr(e)):new kr(t.readAll())}function rs(e){return("stream"===(arguments.length>1&&void 0!==arguments[1]?arguments[1]:"stream")?Jo:Zo).writeAll(e).toUint8Array(!0)}var is,os=function(){function e(e,t,n,r){var i=this;this.getCell=function(e,t){var n=e<i.headerRows&&t<i.headerColumns,r=e>=i.headerRows&&t<i.headerColumns,o=e<i.headerRows&&t>=i.headerColumns;if(n){var s=["blank"];return t>0&&s.push("level"+e),{type:"blank",classNames:s.join(" "),content:""}}if(o)return{type:"columns",classNames:(s=["col_heading","level"+e,"col"+(l=t-i.headerColumns)]).join(" "),content:i.getContent(i.columnsTable,l,e)};if(r){s=["row_heading","level"+t,"row"+(a=e-i.headerRows)];return{type:"index",id:"T_".concat(i.uuid,"level").concat(t,"_row").concat(a),classNames:s.join(" "),content:i.getContent(i.indexTable,a,t)}}s=["data","row"+(a=e-i.headerRows),"col"+(l=t-i.headerColumns)];var a,l,u=i.styler?i.getContent(i.styler.displayValuesTable,a,l):i.getContent(i.dataTable,a,l);return{type:"data",id:"T_".concat(i.uuid,"row").concat(a,"_col").concat(l),classNames:s.join(" "),content:u}},this.getContent=function(e,t,n){var r=e.getChildAt(n);return null===r?"":i.getColumnTypeId(e,n)===c.Timestamp?i.nanosToDate(r.get(t)):r.get(t)},this.dataTable=ns(e),this.indexTable=ns(t),this.columnsTable=ns(n),this.styler=r?{caption:r.caption,displayValuesTable:ns(r.displayValues),styles:r.styles,uuid:r.uuid}:void 0}return Object.defineProperty(e.prototype,"rows",{get:function(){return this.indexTable.numRows+this.columnsTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"columns",{get:function(){return this.indexTable.numCols+this.columnsTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"headerRows",{get:function(){return this.rows-this.dataRows},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"headerColumns",{get:function(){return this.columns-this.dataColumns},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"dataRows",{get:function(){return this.dataTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"dataColumns",{get:function(){return this.dataTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"uuid",{get:function(){return this.styler&&this.styler.uuid},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"caption",{get:function(){return this.styler&&this.styler.caption},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"styles",{get:function(){return this.styler&&this.styler.styles},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"table",{get:function(){return this.dataTable},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"index",{get:function(){return this.indexTable},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"columnTable",{get:function(){return this.columnsTable},enumerable:!1,configurable:!0}),e.prototype.serialize=function(){return{data:rs(this.dataTable),index:rs(this.indexTable),columns:rs(this.columnsTable)}},e.prototype.getColumnTypeId=function(e,t){return e.schema.fields[t].type.typeId},e.prototype.nanosToDate=function(e){return new Date(e/1e6)},e}(),ss=function(){return ss=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++)for(var i in t=arguments[n])Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i]);return e},ss.apply(this,arguments)};!function(e){e.COMPONENT_READY="streamlit:componentReady",e.SET_COMPONENT_VALUE="streamlit:setComponentValue",e.SET_FRAME_HEIGHT="streamlit:setFrameHeight"}(is||(is={}));var as=function(){function e(){}return e.API_VERSION=1,e.RENDER_EVENT="streamlit:render",e.events=new EventTarget,e.registeredMessageListener=!1,e.setComponentReady=function(){e.registeredMessageListener||(window.addEventListener("message",e.onMessageEvent),e.registeredMessageListener=!0),e.sendBackMsg(is.COMPONENT_READY,{apiVersion:e.API_VERSION})},e.setFrameHeight=function(t){void 0===t&&(t=document.body.scrollHeight),t!==e.lastFrameHeight&&(e.lastFrameHeight=t,e.sendBackMsg(is.SET_FRAME_HEIGHT,{height:t}))},e.setComponentValue=function(t){var n;t instanceof os?(n="dataframe",t=t.serialize()):!function(e){var t=!1;try{t=e instanceof BigInt64Array||e instanceof BigUint64Array}catch(n){}return e instanceof Int8Array||e instanceof Uint8Array||e instanceof Uint8ClampedArray||e instanceof Int16Array||e instanceof Uint16Array||e instanceof Int32Array||e instanceof Uint32Array||e instanceof Float32Array||e instanceof Float64Array||t}(t)?t instanceof ArrayBuffer?(n="bytes",t=new Uint8Array(t)):n="json":(n="bytes",t=new Uint8Array(t.buffer)),e.sendBackMsg(is.SET_COMPONENT_VALUE,{value:t,dataType:n})},e.onMessageEvent=function(t){if(t.data.type===e.RENDER_EVENT)e.onRenderMessage(t.data)},e.onRenderMessage=function(t){var n=t.args;null==n&&(console.error("Got null args in onRenderMessage. This should never happen"),n={});var r=t.dfs&&t.dfs.length>0?e.argsDataframeToObject(t.dfs):{};n=ss(ss({},n),r);var i=Boolean(t.disabled),o=t.theme;o&&ls(o);var s={disabled:i,args:n,theme:o},a=new CustomEvent(e.RENDER_EVENT,{detail:s});e.events.dispatchEvent(a)},e.argsDataframeToObject=function(t){var n=t.map(function(t){var n=t.key,r=t.value;return[n,e.toArrowTable(r)]});return Object.fromEntries(n)},e.toArrowTable=function(e){var t,n=(t=e.data).data,r=t.index,i=t.columns,o=t.styler;return new os(n,r,i,o)},e.sendBackMsg=function(e,t){window.parent.postMessage(ss({isStreamlitMessage:!0,type:e},t),"*")},e}(),ls=function(e){var t=document.createElement("style");document.head.appendChild(t),t.innerHTML="\n    :root {\n      --primary-color: ".concat(e.primaryColor,";\n      --background-color: ").concat(e.backgroundColor,";\n      --secondary-background-color: ").concat(e.secondaryBackgroundColor,";\n      --text-color: ").concat(e.textColor,";\n      --font: ").concat(e.font,";\n    }\n\n    body {\n      background-color: var(--background-color);\n      color: var(--text-color);\n    }\n  ")};var us=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(e,t){e.__proto__=t}||function(e,t){for(var n in t)Object.prototype.hasOwnProperty.call(t,n)&&(e[n]=t[n])},e(t,n)};return function(t,n){if("function"!==typeof n&&null!==n)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");function r(){this.constructor=t}e(t,n),t.prototype=null===n?Object.create(n):(r.prototype=n.prototype,new r)}}();!function(e){function t(){return null!==e&&e.apply(this,arguments)||this}us(t,e),t.prototype.componentDidMount=function(){as.setFrameHeight()},t.prototype.componentDidUpdate=function(){as.setFrameHeight()}}(b.PureComponent);var cs=n(579);const ds=function(e){var t=function(t){function n(e){var n=t.call(this,e)||this;return n.componentDidMount=function(){as.events.addEventListener(as.RENDER_EVENT,n.onRenderEvent),as.setComponentReady()},n.componentDidUpdate=function(){null!=n.state.componentError&&as.setFrameHeight()},n.componentWillUnmount=function(){as.events.removeEventListener(as.RENDER_EVENT,n.onRenderEvent)},n.onRenderEvent=function(e){n.setState({renderData:e.detail})},n.state={renderData:void 0,componentError:void 0},n}return us(n,t),n.prototype.render=function(){return null!=this.state.componentError?b.createElement("div",null,b.createElement("h1",null,"Component Error"),b.createElement("span",null,this.state.componentError.message)):null==this.state.renderData?null:b.createElement(e,{width:window.innerWidth,disabled:this.state.renderData.disabled,args:this.state.renderData.args,theme:this.state.renderData.theme})},n.getDerivedStateFromError=function(e){return{componentError:e}},n}(b.PureComponent);return y()(t,e)}(e=>{let{args:t}=e;const[n,r]=(0,f.useState)([{role:"assistant",content:"Welcome to Elite Auto Sales Academy. Use the commands from the sidebar (e.g., !scripts) or type your message below."}]),[i,o]=(0,f.useState)(""),[s,a]=(0,f.useState)("User"),[l,u]=(0,f.useState)(!1),[c,d]=(0,f.useState)(!1),[h,p]=(0,f.useState)(!0);(0,f.useEffect)(()=>{null!==t&&void 0!==t&&t.messages&&(r(t.messages),u(!1)),null!==t&&void 0!==t&&t.user_name&&a(t.user_name)},[t]),(0,f.useEffect)(()=>{as.setComponentReady(),as.setFrameHeight(800)},[]);const y=(0,f.useCallback)(e=>{e.trim()&&!l&&(u(!0),as.setComponentValue({action:"send_message",message:e,user_name:s}))},[l,s]),b=(0,f.useCallback)(e=>{u(!0),as.setComponentValue({action:"send_command",command:e,user_name:s})},[s]);return(0,cs.jsxs)("div",{className:"chat-container",children:[(0,cs.jsx)("header",{className:"chat-header",children:(0,cs.jsxs)("div",{className:"header-content",children:[(0,cs.jsxs)("div",{className:"header-left",children:[(0,cs.jsx)("button",{className:"sidebar-toggle",onClick:()=>d(!c),children:"\u2630 Menu"}),(0,cs.jsxs)("div",{className:"brand",children:[(0,cs.jsx)("h2",{children:"Sales Coach AI"}),(0,cs.jsxs)("p",{children:["Elite Auto Sales Academy Bot ",(0,cs.jsx)("span",{className:"chip",children:"powered by AG Goldsmith"})]})]})]}),(0,cs.jsx)("img",{src:"/Logo 1.png",alt:"Elite Auto Sales Shield Logo",className:"logo",onError:e=>{e.currentTarget.style.display="none"}})]})}),(0,cs.jsxs)("div",{className:"chat-layout",children:[(0,cs.jsx)("aside",{className:"sidebar ".concat(c?"open":""),children:(0,cs.jsxs)("div",{className:"sidebar-content",children:[(0,cs.jsxs)("div",{className:"sidebar-section",children:[(0,cs.jsx)("h3",{children:"Message Mastery"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!scripts"),children:"Scripts & Templates"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!trust"),children:"Trust Building"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!tonality"),children:"Voice & Tonality"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!firstimpression"),children:"First Impressions"})]}),(0,cs.jsxs)("div",{className:"sidebar-section",children:[(0,cs.jsx)("h3",{children:"Closer Moves"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!pvf"),children:"Pain-Vision-Fit Close"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!checkpoints"),children:"Emotional Checkpoints"})]}),(0,cs.jsxs)("div",{className:"sidebar-section",children:[(0,cs.jsx)("h3",{children:"Objection Handling"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!objection price"),children:"Price Objections"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!objection paymenttoohigh"),children:"Payment Too High"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!objection tradevalue"),children:"Trade Value"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!objection thinkaboutit"),children:"Think About It"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!objection shoparound"),children:"Shop Around"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!objection spouse"),children:"Spouse Decision"})]}),(0,cs.jsxs)("div",{className:"sidebar-section",children:[(0,cs.jsx)("h3",{children:"Role-Play Scenarios"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!roleplay price"),children:"Price Role-Play"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!roleplay trade"),children:"Trade Role-Play"})]}),(0,cs.jsxs)("div",{className:"sidebar-section",children:[(0,cs.jsx)("h3",{children:"Money Momentum"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!dailylog"),children:"Daily Activity Log"}),(0,cs.jsx)("button",{className:"sidebar-btn",onClick:()=>b("!earn"),children:"E.A.R.N. System"})]}),(0,cs.jsxs)("div",{className:"sidebar-section",children:[(0,cs.jsx)("h3",{children:"Quick Actions"}),(0,cs.jsxs)("div",{className:"quick-actions",children:[(0,cs.jsx)("button",{className:"sidebar-btn small",onClick:()=>b("continue"),children:"Continue"}),(0,cs.jsx)("button",{className:"sidebar-btn small",onClick:()=>b("restart"),children:"Restart"}),(0,cs.jsx)("button",{className:"sidebar-btn small",onClick:()=>b("end"),children:"End"})]})]})]})}),(0,cs.jsxs)("main",{className:"chat-main",children:[(0,cs.jsx)("div",{className:"messages",children:n.map((e,t)=>(0,cs.jsx)("div",{className:"message ".concat(e.role),children:(0,cs.jsx)("p",{children:e.content})},t))}),(0,cs.jsxs)("form",{className:"composer",onSubmit:e=>{e.preventDefault(),i.trim()&&(y(i),o(""))},children:[(0,cs.jsx)("input",{type:"text",value:i,onChange:e=>o(e.target.value),placeholder:"Type a command or message\u2026",disabled:l,className:"message-input"}),(0,cs.jsx)("button",{type:"submit",disabled:l||!i.trim(),className:"send-btn",children:l?"...":"Send"})]})]})]}),h&&(0,cs.jsx)("div",{className:"modal",children:(0,cs.jsxs)("div",{className:"modal-content",children:[(0,cs.jsx)("h3",{children:"Welcome to Training!"}),(0,cs.jsx)("p",{children:"Please enter your name to begin your personalized sales training experience."}),(0,cs.jsxs)("form",{onSubmit:e=>{e.preventDefault();const t=e.currentTarget.querySelector("input");var n;(n=t.value).trim()&&(a(n.trim()),p(!1))},children:[(0,cs.jsx)("label",{children:"Your Name"}),(0,cs.jsx)("input",{type:"text",placeholder:"Enter your full name",required:!0,autoComplete:"name"}),(0,cs.jsxs)("div",{className:"modal-actions",children:[(0,cs.jsx)("button",{type:"button",onClick:()=>function(){let e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];p(!1),e&&a("User")}(!0),className:"btn-secondary",children:"Skip"}),(0,cs.jsx)("button",{type:"submit",className:"btn-primary",children:"Start Training"})]})]}),(0,cs.jsx)("p",{className:"modal-note",children:"Your name helps us personalize your training experience."})]})})]})}),fs=e=>{e&&e instanceof Function&&n.e(453).then(n.bind(n,453)).then(t=>{let{getCLS:n,getFID:r,getFCP:i,getLCP:o,getTTFB:s}=t;n(e),r(e),i(e),o(e),s(e)})};h.createRoot(document.getElementById("root")).render((0,cs.jsx)(f.StrictMode,{children:(0,cs.jsx)(ds,{})})),fs()})();
-//# sourceMappingURL=main.01850ca4.js.map
\ No newline at end of file
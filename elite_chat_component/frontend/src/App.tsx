@@ -1,15 +1,16 @@
-import React, { useState, useCallback, useEffect } from 'react';
+import React, { useState, useCallback, useEffect, useRef, lazy, Suspense } from 'react';
 import { Streamlit, RenderData } from "streamlit-component-lib";
-import ReactMarkdown from 'react-markdown';
+import MessageList from './MessageList';
+import { SyncedMessage, SyncPatch, applyPatch, hasGap } from './sync';
 import './ChatApp.css';
 
-interface Message {
-  role: 'user' | 'assistant';
-  content: string;
-}
+const Sidebar = lazy(() => import(/* webpackChunkName: "sidebar" */ './Sidebar'));
+
+type Message = SyncedMessage;
 
 interface Args {
-  messages?: Message[];
+  sync?: SyncPatch;
+  messages?: Message[];  // Legacy full-transcript mode
   user_name?: string;
   session_id?: string;
 }
@@ -17,6 +18,21 @@ interface Args {
 // Create a standalone mode for development and a connected mode for Streamlit
 const isStreamlit = window.parent !== window;
 
+// Client-generated id for every event so Python can tell a repeated command
+// from the same event being handed back on a rerun
+let eventCounter = 0;
+const newEventId = (): string => {
+  eventCounter += 1;
+  if (typeof crypto !== 'undefined' && 'randomUUID' in crypto) {
+    return crypto.randomUUID();
+  }
+  return `${Date.now().toString(36)}-${eventCounter}-${Math.random().toString(36).slice(2, 10)}`;
+};
+
+// Python may drop an event without re-rendering (a duplicate id, or the turn
+// lock timing out). Unlock the input if no patch arrives within this long.
+const SEND_TIMEOUT_MS = 30000;
+
 const App: React.FC = () => {
   const [messages, setMessages] = useState<Message[]>([
     { role: 'assistant', content: 'Welcome to Elite Auto Sales Academy. Use the commands from the sidebar (e.g., Scripts & Templates) or type your message below.' }
@@ -27,6 +43,36 @@ const App: React.FC = () => {
   const [sidebarOpen, setSidebarOpen] = useState(true); // Set to true to show sidebar by default
   const [showModal, setShowModal] = useState(true); // Show modal by default for both standalone and Streamlit
   const [args, setArgs] = useState<Args>({});
+  // Last sync sequence applied; acknowledged back to Python with every event
+  const localSeq = useRef(0);
+  const resyncRequestedAt = useRef(-1);
+  // Synchronous mirror of isLoading: two clicks in the same tick both see stale state
+  const inFlight = useRef(false);
+  const sendTimer = useRef<ReturnType<typeof setTimeout> | null>(null);
+
+  const setBusy = useCallback((busy: boolean) => {
+    inFlight.current = busy;
+    setIsLoading(busy);
+    if (sendTimer.current !== null) {
+      clearTimeout(sendTimer.current);
+      sendTimer.current = null;
+    }
+  }, []);
+
+  // Lock the input until a patch answers this send, or SEND_TIMEOUT_MS passes
+  const startSend = useCallback(() => {
+    setBusy(true);
+    sendTimer.current = setTimeout(() => {
+      sendTimer.current = null;
+      console.warn("No reply to the last event; unlocking the input");
+      inFlight.current = false;
+      setIsLoading(false);
+    }, SEND_TIMEOUT_MS);
+  }, [setBusy]);
+
+  useEffect(() => () => {
+    if (sendTimer.current !== null) clearTimeout(sendTimer.current);
+  }, []);
   
   // Initialize Streamlit communication
   useEffect(() => {
@@ -69,9 +115,29 @@ const App: React.FC = () => {
   // Update from Streamlit args
   useEffect(() => {
     if (isStreamlit && args) {
-      if (args.messages && args.messages.length > 0) {
+      if (args.sync) {
+        const patch = args.sync;
+        if (hasGap(patch, localSeq.current)) {
+          // Ask once per server sequence to be resent from what we actually have
+          if (resyncRequestedAt.current !== patch.seq) {
+            resyncRequestedAt.current = patch.seq;
+            Streamlit.setComponentValue({
+              event_id: newEventId(),
+              action: 'resync',
+              ack_seq: localSeq.current
+            });
+          }
+        } else if (patch.seq !== localSeq.current) {
+          const seqBefore = localSeq.current;
+          setMessages(prev => applyPatch(prev, patch, seqBefore));
+          localSeq.current = patch.seq;
+          // Stay busy while the reply is still a placeholder; the server
+          // fails a placeholder whose turn stops renewing its lease
+          setBusy(patch.upserts.some(m => m.pending));
+        }
+      } else if (args.messages && args.messages.length > 0) {
         setMessages(args.messages);
-        setIsLoading(false);
+        setBusy(false);
       }
       
       if (args.user_name) {
@@ -82,7 +148,7 @@ const App: React.FC = () => {
         }
       }
     }
-  }, [args]);
+  }, [args, setBusy]);
 
   const mockResponse = (message: string) => {
     // For standalone demo: simulate a response when not in Streamlit
@@ -95,25 +161,26 @@ const App: React.FC = () => {
         }
         
         setMessages(prev => [...prev, { role: 'assistant', content: response }]);
-        setIsLoading(false);
+        setBusy(false);
       }, 1000);
     }
   };
 
   const sendMessage = useCallback((message: string) => {
-    if (!message.trim() || isLoading) return;
+    if (!message.trim() || isLoading || inFlight.current) return;
+    startSend();
     
     // Add user message to the chat (in standalone mode only)
     if (!isStreamlit) {
       setMessages(prev => [...prev, { role: 'user', content: message }]);
     }
     
-    setIsLoading(true);
-    
     if (isStreamlit) {
       // Send to Streamlit
       Streamlit.setComponentValue({
+        event_id: newEventId(),
         action: 'send_message',
+        ack_seq: localSeq.current,
         message: message,
         user_name: userName
       });
@@ -121,10 +188,12 @@ const App: React.FC = () => {
       // Mock response in standalone mode
       mockResponse(message);
     }
-  }, [isLoading, userName]);
+  }, [isLoading, userName, startSend]);
 
   const sendCommand = useCallback((command: string) => {
-    setIsLoading(true);
+    // One in-flight action at a time — a double-click must not fire two LLM calls
+    if (isLoading || inFlight.current) return;
+    startSend();
     
     // Add command as user message (in standalone mode only)
     if (!isStreamlit) {
@@ -134,7 +203,9 @@ const App: React.FC = () => {
     if (isStreamlit) {
       // Send to Streamlit
       Streamlit.setComponentValue({
+        event_id: newEventId(),
         action: 'send_command',
+        ack_seq: localSeq.current,
         command: command,
         user_name: userName
       });
@@ -142,7 +213,7 @@ const App: React.FC = () => {
       // Mock response in standalone mode
       mockResponse(command);
     }
-  }, [userName]);
+  }, [isLoading, userName, startSend]);
 
   const handleSubmit = (e: React.FormEvent) => {
     e.preventDefault();
@@ -159,7 +230,9 @@ const App: React.FC = () => {
       // Send the default name to Streamlit if we're in Streamlit mode
       if (isStreamlit) {
         Streamlit.setComponentValue({
+          event_id: newEventId(),
           action: 'set_name',
+          ack_seq: localSeq.current,
           user_name: 'User'
         });
       }
@@ -176,7 +249,9 @@ const App: React.FC = () => {
       if (isStreamlit) {
         console.log("Sending name to Streamlit:", trimmedName);
         Streamlit.setComponentValue({
+          event_id: newEventId(),
           action: 'set_name',
+          ack_seq: localSeq.current,
           user_name: trimmedName
         });
       }
@@ -228,144 +303,16 @@ const App: React.FC = () => {
 
       <div className="chat-layout">
         {/* Sidebar */}
-        <aside className={`sidebar ${sidebarOpen ? 'open' : ''}`}>
-          <div className="sidebar-content">
-            <div className="sidebar-header">
-              <h2>AG Bot • Controls</h2>
-            </div>
-
-            {/* Message Mastery */}
-            <div className="sidebar-section">
-              <h3>Message Mastery</h3>
-              <button className="sidebar-btn" onClick={() => sendCommand('!scripts')}>!scripts</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!trust')}>!trust</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!tonality')}>!tonality</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!firstimpression')}>!firstimpression</button>
-            </div>
-            
-            <div className="sidebar-divider"></div>
-            
-            {/* Closer Moves */}
-            <div className="sidebar-section">
-              <h3>Closer Moves</h3>
-              <button className="sidebar-btn" onClick={() => sendCommand('!pvf')}>!pvf</button>
-            </div>
-
-            <div className="sidebar-divider"></div>
-
-            {/* Objection Handling */}
-            <div className="sidebar-section">
-              <h3>Objection Handling</h3>
-              <button className="sidebar-btn" onClick={() => sendCommand('!objection price')}>!objection price</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!objection paymenttoohigh')}>!objection paymenttoohigh</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!objection tradevalue')}>!objection tradevalue</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!objection thinkaboutit')}>!objection thinkaboutit</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!objection shoparound')}>!objection shoparound</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!objection spouse')}>!objection spouse</button>
-              {/* <button className="sidebar-btn" onClick={() => sendCommand('!objection paymentvsprice')}>!objection paymentvsprice</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!objection timingstall')}>!objection timingstall</button> */}
-            </div>
-            
-            <div className="sidebar-divider"></div>
-            
-            {/* Roleplay Scenarios */}
-            <div className="sidebar-section">
-              <h3>Role-Play Scenarios</h3>
-              <button className="sidebar-btn" onClick={() => sendCommand('!roleplay price')}>!roleplay price</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!roleplay trade')}>!roleplay trade</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!roleplay think')}>!roleplay think</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!roleplay shop')}>!roleplay shop</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!roleplay spouse')}>!roleplay spouse</button>
-            </div>
-            
-            <div className="sidebar-divider"></div>
-            
-            {/* Money Momentum */}
-            <div className="sidebar-section">
-              <h3>Money Momentum</h3>
-              <button className="sidebar-btn" onClick={() => sendCommand('!dailylog')}>!dailylog</button>
-              <button className="sidebar-btn" onClick={() => sendCommand('!earn')}>!earn</button>
-            </div>
-            
-            <div className="sidebar-divider"></div>
-            
-            {/* Five Emotional Checkpoints */}
-            <div className="sidebar-section">
-              <h3>Five Emotional Checkpoints</h3>
-              <button className="sidebar-btn" onClick={() => sendCommand('!checkpoints')}>!checkpoints</button>
-            </div>
-            
-            <div className="sidebar-divider"></div>
-            
-
-            {/* Coaching Resources */}
-            <div className="sidebar-section">
-              <h3>Coaching Resources</h3>
-              <button className="sidebar-btn" title="Show coaching menu" onClick={() => sendCommand('!coaching')}>!coaching</button>
-              <button className="sidebar-btn" title="Coaching tips (aliases: !coaching-tips, !coachingtips)" onClick={() => sendCommand('!coaching-tips')}>!coaching-tips</button>
-              <button className="sidebar-btn" title="Coaching roleplay (aliases: !coaching-roleplay, !coachingroleplay)" onClick={() => sendCommand('!coaching-roleplay')}>!coaching-roleplay</button>
-            </div>
-
-            <div className="sidebar-divider"></div>
-
-            {/* Help & Commands */}
-            <div className="sidebar-section">
-              <h3>Help & Commands</h3>
-              <button className="sidebar-btn" title="Show all commands and examples" onClick={() => sendCommand('!help')}>!help / !commands</button>
-            </div>
-            <div className="sidebar-divider"></div>
-            
-            {/* Quick Actions */}
-            <div className="sidebar-section">
-              <h3>Quick Actions</h3>
-              <div className="quick-actions">
-                <button className="sidebar-btn small" onClick={() => sendCommand('continue')}>Continue</button>
-                <button className="sidebar-btn small" onClick={() => sendCommand('restart')}>Restart</button>
-                <button className="sidebar-btn small" onClick={() => sendCommand('end')}>End</button>
-              </div>
-            </div>
-          </div>
-        </aside>
+        <Suspense fallback={<aside className={`sidebar ${sidebarOpen ? 'open' : ''}`} />}>
+          <Sidebar open={sidebarOpen} sendCommand={sendCommand} />
+        </Suspense>
         
         {/* Overlay for mobile - closes sidebar when clicked */}
         <div className="sidebar-overlay" onClick={() => setSidebarOpen(false)}></div>
 
         {/* Main Chat */}
         <main className="chat-main">
-          <div className="messages" style={forceConsistentStyle}>
-            {messages.map((msg, index) => (
-              <div key={index} className={`message ${msg.role}`} style={{color: 'var(--elite-text)'}}>
-                {msg.content.startsWith("COACHING_TIP:") && (
-                  <div className="coaching-tip">
-                    <div className="coaching-tip-header">
-                      <span className="coaching-icon">💡</span>
-                      <h4>Coaching Tip</h4>
-                    </div>
-                    <p>{msg.content.match(/COACHING_TIP:([\s\S]+?)END_COACHING_TIP/)?.[1].trim() || ""}</p>
-                  </div>
-                )}
-                
-                {msg.content.includes("ROLE_PLAY_LEVEL:") && (
-                  <div className="role-play-level">
-                    Role-Play Depth: Level {msg.content.match(/ROLE_PLAY_LEVEL:(\d+)END_ROLE_PLAY_LEVEL/)?.[1] || "1"}
-                  </div>
-                )}
-                
-                {msg.role === 'assistant' ? (
-                  <div className="markdown-content" style={{color: 'var(--elite-text)'}}>
-                    <ReactMarkdown>
-                      {msg.content
-                        .replace(/COACHING_TIP:[\s\S]+?END_COACHING_TIP/, '')
-                        .replace(/ROLE_PLAY_LEVEL:\d+END_ROLE_PLAY_LEVEL/, '')
-                        .trim()}
-                    </ReactMarkdown>
-                  </div>
-                ) : (
-                  <p style={{color: 'var(--elite-text)'}}>{msg.content}</p>
-                )}
-              </div>
-            ))}
-          </div>
+          <MessageList messages={messages} style={forceConsistentStyle} />
 
           <form className="composer" onSubmit={handleSubmit}>
             <input
@@ -0,0 +1,14 @@
+import React from 'react';
+import ReactMarkdown from 'react-markdown';
+
+interface MarkdownProps {
+  children: string;
+}
+
+// react-markdown (and its unified/remark dependencies) live in their own
+// chunk; Message loads this lazily the first time an assistant reply renders
+const Markdown: React.FC<MarkdownProps> = ({ children }) => (
+  <ReactMarkdown>{children}</ReactMarkdown>
+);
+
+export default Markdown;
@@ -1,81 +1,84 @@
-import React from 'react';
-import ReactMarkdown from 'react-markdown';
+import React, { lazy, Suspense, useMemo } from 'react';
 import CoachingTip from './CoachingTip';
 
+const Markdown = lazy(() => import(/* webpackChunkName: "markdown" */ './Markdown'));
+
 interface MessageProps {
   role: 'user' | 'assistant';
   content: string;
   hasCoaching?: boolean;
   coachingTip?: string;
   rolePlayLevel?: number;
+  pending?: boolean;
 }
 
-// Function to extract coaching tip from message content if present
-const extractCoachingTip = (content: string): { tip: string | null, cleanContent: string } => {
-  const coachingRegex = /^COACHING_TIP:([\s\S]+?)END_COACHING_TIP/;
-  const match = content.match(coachingRegex);
-  
-  if (match) {
-    return {
-      tip: match[1].trim(),
-      cleanContent: content.replace(coachingRegex, '').trim()
-    };
-  }
-  
-  return {
-    tip: null,
-    cleanContent: content
-  };
-};
+interface ParsedContent {
+  tip: string | null;
+  level: number | null;
+  body: string;
+}
+
+const COACHING_TIP_RE = /COACHING_TIP:([\s\S]+?)END_COACHING_TIP/;
+const ROLE_PLAY_LEVEL_RE = /ROLE_PLAY_LEVEL:(\d+)END_ROLE_PLAY_LEVEL/;
+
+// Pull the coaching tip and role-play level markers out of the message body
+const parseContent = (content: string): ParsedContent => {
+  const tipMatch = content.startsWith('COACHING_TIP:') ? content.match(COACHING_TIP_RE) : null;
+  const levelMatch = content.includes('ROLE_PLAY_LEVEL:') ? content.match(ROLE_PLAY_LEVEL_RE) : null;
 
-// Function to extract role-play level from message content if present
-const extractRolePlayLevel = (content: string): { level: number | null, cleanContent: string } => {
-  const levelRegex = /^ROLE_PLAY_LEVEL:(\d+)END_ROLE_PLAY_LEVEL/;
-  const match = content.match(levelRegex);
-  
-  if (match) {
-    return {
-      level: parseInt(match[1]),
-      cleanContent: content.replace(levelRegex, '').trim()
-    };
-  }
-  
   return {
-    level: null,
-    cleanContent: content
+    tip: tipMatch ? tipMatch[1].trim() : null,
+    level: levelMatch ? parseInt(levelMatch[1]) : (content.includes('ROLE_PLAY_LEVEL:') ? 1 : null),
+    body: content.replace(COACHING_TIP_RE, '').replace(ROLE_PLAY_LEVEL_RE, '').trim()
   };
 };
 
-const Message: React.FC<MessageProps> = ({ role, content, hasCoaching, coachingTip, rolePlayLevel }) => {
-  // Process content to extract coaching tips and role-play levels if they exist
-  const { tip: extractedTip, cleanContent: contentWithoutTip } = extractCoachingTip(content);
-  const { level: extractedLevel, cleanContent: finalContent } = extractRolePlayLevel(contentWithoutTip);
-  
+const Message: React.FC<MessageProps> = ({ role, content, coachingTip, rolePlayLevel, pending }) => {
+  // Parse markers and markdown once per content change, not on every parent render
+  const parsed = useMemo(() => parseContent(content), [content]);
+  const markdown = useMemo(
+    () => role === 'assistant' ? (
+      // Plain text until the markdown chunk arrives (first reply only)
+      <Suspense fallback={<p className="markdown-loading">{parsed.body}</p>}>
+        <Markdown>{parsed.body}</Markdown>
+      </Suspense>
+    ) : null,
+    [role, parsed.body]
+  );
+
   // Use either passed props or extracted values
-  const finalCoachingTip = coachingTip || extractedTip;
-  const finalRolePlayLevel = rolePlayLevel || extractedLevel;
+  const finalCoachingTip = coachingTip || parsed.tip;
+  const finalRolePlayLevel = rolePlayLevel || parsed.level;
 
   return (
-    <div className={`message ${role}`}>
+    <div className={`message ${role}${pending ? ' pending' : ''}`} style={{color: 'var(--elite-text)'}}>
       {finalCoachingTip && (
         <CoachingTip tip={finalCoachingTip} />
       )}
-      
+
       {finalRolePlayLevel && (
         <div className="role-play-level">
           Role-Play Depth: Level {finalRolePlayLevel}
         </div>
       )}
-      
+
       {role === 'assistant' ? (
-        <div className="markdown-content">
-          <ReactMarkdown>{finalContent}</ReactMarkdown>
+        <div className="markdown-content" style={{color: 'var(--elite-text)'}}>
+          {markdown}
         </div>
       ) : (
-        <p>{finalContent}</p>
+        <p style={{color: 'var(--elite-text)'}}>{content}</p>
       )}
     </div>
   );
 };
 
-export default Message;
+// A message only changes by its content or by leaving the pending state;
+// skip re-rendering otherwise
+export default React.memo(Message, (prev, next) =>
+  prev.role === next.role &&
+  prev.content === next.content &&
+  prev.pending === next.pending &&
+  prev.coachingTip === next.coachingTip &&
+  prev.rolePlayLevel === next.rolePlayLevel
+);
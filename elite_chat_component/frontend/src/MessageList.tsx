@@ -0,0 +1,115 @@
+import React, { useCallback, useLayoutEffect, useRef, useState } from 'react';
+import Message from './Message';
+import { SyncedMessage } from './sync';
+
+interface MessageListProps {
+  messages: SyncedMessage[];
+  style?: React.CSSProperties;
+}
+
+// Windowing: only rows near the viewport are mounted. Row heights are measured
+// as they render; unmeasured rows use an estimate until they scroll into view.
+const ESTIMATED_ROW_HEIGHT = 110;
+const OVERSCAN_PX = 600;
+const STICK_TO_BOTTOM_PX = 80;
+
+const rowKey = (msg: SyncedMessage, index: number): string =>
+  msg.id !== undefined ? String(msg.id) : `local-${index}`;
+
+interface MeasuredRowProps {
+  id: string;
+  onHeight: (id: string, height: number) => void;
+  children: React.ReactNode;
+}
+
+const MeasuredRow: React.FC<MeasuredRowProps> = ({ id, onHeight, children }) => {
+  const ref = useRef<HTMLDivElement>(null);
+
+  useLayoutEffect(() => {
+    const el = ref.current;
+    if (!el) return;
+    const report = () => onHeight(id, el.offsetHeight);
+    report();
+    if (typeof ResizeObserver === 'undefined') return;
+    const observer = new ResizeObserver(report);
+    observer.observe(el);
+    return () => observer.disconnect();
+  }, [id, onHeight]);
+
+  return <div ref={ref} className="message-row">{children}</div>;
+};
+
+const MessageList: React.FC<MessageListProps> = ({ messages, style }) => {
+  const containerRef = useRef<HTMLDivElement>(null);
+  const heights = useRef(new Map<string, number>());
+  const atBottom = useRef(true);
+  const frame = useRef<number | null>(null);
+  const [viewport, setViewport] = useState({ top: 0, height: 800 });
+  const [, setMeasureVersion] = useState(0);
+
+  const onHeight = useCallback((id: string, height: number) => {
+    if (heights.current.get(id) !== height) {
+      heights.current.set(id, height);
+      setMeasureVersion(v => v + 1);
+    }
+  }, []);
+
+  const onScroll = useCallback(() => {
+    if (frame.current !== null) return;
+    frame.current = requestAnimationFrame(() => {
+      frame.current = null;
+      const el = containerRef.current;
+      if (!el) return;
+      atBottom.current = el.scrollHeight - el.scrollTop - el.clientHeight < STICK_TO_BOTTOM_PX;
+      setViewport({ top: el.scrollTop, height: el.clientHeight });
+    });
+  }, []);
+
+  // Follow new messages only if the user was already reading the latest ones
+  const lastKey = messages.length ? rowKey(messages[messages.length - 1], messages.length - 1) : '';
+  const lastSeq = messages.length ? messages[messages.length - 1].seq : undefined;
+  useLayoutEffect(() => {
+    const el = containerRef.current;
+    if (el && atBottom.current) {
+      el.scrollTop = el.scrollHeight;
+      setViewport({ top: el.scrollTop, height: el.clientHeight });
+    }
+  }, [lastKey, lastSeq, messages.length]);
+
+  useLayoutEffect(() => () => {
+    if (frame.current !== null) cancelAnimationFrame(frame.current);
+  }, []);
+
+  // Prefix offsets of each row; O(n) arithmetic is cheap next to mounting rows
+  const keys = messages.map(rowKey);
+  const offsets = new Array<number>(keys.length + 1);
+  offsets[0] = 0;
+  for (let i = 0; i < keys.length; i++) {
+    offsets[i + 1] = offsets[i] + (heights.current.get(keys[i]) ?? ESTIMATED_ROW_HEIGHT);
+  }
+  const total = offsets[keys.length];
+
+  const windowTop = viewport.top - OVERSCAN_PX;
+  const windowBottom = viewport.top + viewport.height + OVERSCAN_PX;
+  let start = 0;
+  while (start < keys.length && offsets[start + 1] < windowTop) start++;
+  let end = start;
+  while (end < keys.length && offsets[end] <= windowBottom) end++;
+
+  return (
+    <div className="messages virtual" style={style} ref={containerRef} onScroll={onScroll}>
+      <div style={{ height: offsets[start] }} />
+      {messages.slice(start, end).map((msg, i) => {
+        const id = keys[start + i];
+        return (
+          <MeasuredRow key={id} id={id} onHeight={onHeight}>
+            <Message role={msg.role} content={msg.content} pending={msg.pending} />
+          </MeasuredRow>
+        );
+      })}
+      <div style={{ height: total - offsets[end] }} />
+    </div>
+  );
+};
+
+export default MessageList;
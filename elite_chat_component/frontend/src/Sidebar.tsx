@@ -0,0 +1,110 @@
+import React from 'react';
+
+interface SidebarProps {
+  open: boolean;
+  sendCommand: (command: string) => void;
+}
+
+// Command menu; loaded as its own chunk so the first paint doesn't wait on it
+const Sidebar: React.FC<SidebarProps> = ({ open, sendCommand }) => (
+    <aside className={`sidebar ${open ? 'open' : ''}`}>
+      <div className="sidebar-content">
+        <div className="sidebar-header">
+          <h2>AG Bot • Controls</h2>
+        </div>
+
+        {/* Message Mastery */}
+        <div className="sidebar-section">
+          <h3>Message Mastery</h3>
+          <button className="sidebar-btn" onClick={() => sendCommand('!scripts')}>!scripts</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!trust')}>!trust</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!tonality')}>!tonality</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!firstimpression')}>!firstimpression</button>
+        </div>
+
+        <div className="sidebar-divider"></div>
+
+        {/* Closer Moves */}
+        <div className="sidebar-section">
+          <h3>Closer Moves</h3>
+          <button className="sidebar-btn" onClick={() => sendCommand('!pvf')}>!pvf</button>
+        </div>
+
+        <div className="sidebar-divider"></div>
+
+        {/* Objection Handling */}
+        <div className="sidebar-section">
+          <h3>Objection Handling</h3>
+          <button className="sidebar-btn" onClick={() => sendCommand('!objection price')}>!objection price</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!objection paymenttoohigh')}>!objection paymenttoohigh</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!objection tradevalue')}>!objection tradevalue</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!objection thinkaboutit')}>!objection thinkaboutit</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!objection shoparound')}>!objection shoparound</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!objection spouse')}>!objection spouse</button>
+          {/* <button className="sidebar-btn" onClick={() => sendCommand('!objection paymentvsprice')}>!objection paymentvsprice</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!objection timingstall')}>!objection timingstall</button> */}
+        </div>
+
+        <div className="sidebar-divider"></div>
+
+        {/* Roleplay Scenarios */}
+        <div className="sidebar-section">
+          <h3>Role-Play Scenarios</h3>
+          <button className="sidebar-btn" onClick={() => sendCommand('!roleplay price')}>!roleplay price</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!roleplay trade')}>!roleplay trade</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!roleplay think')}>!roleplay think</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!roleplay shop')}>!roleplay shop</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!roleplay spouse')}>!roleplay spouse</button>
+        </div>
+
+        <div className="sidebar-divider"></div>
+
+        {/* Money Momentum */}
+        <div className="sidebar-section">
+          <h3>Money Momentum</h3>
+          <button className="sidebar-btn" onClick={() => sendCommand('!dailylog')}>!dailylog</button>
+          <button className="sidebar-btn" onClick={() => sendCommand('!earn')}>!earn</button>
+        </div>
+
+        <div className="sidebar-divider"></div>
+
+        {/* Five Emotional Checkpoints */}
+        <div className="sidebar-section">
+          <h3>Five Emotional Checkpoints</h3>
+          <button className="sidebar-btn" onClick={() => sendCommand('!checkpoints')}>!checkpoints</button>
+        </div>
+
+        <div className="sidebar-divider"></div>
+
+
+        {/* Coaching Resources */}
+        <div className="sidebar-section">
+          <h3>Coaching Resources</h3>
+          <button className="sidebar-btn" title="Show coaching menu" onClick={() => sendCommand('!coaching')}>!coaching</button>
+          <button className="sidebar-btn" title="Coaching tips (aliases: !coaching-tips, !coachingtips)" onClick={() => sendCommand('!coaching-tips')}>!coaching-tips</button>
+          <button className="sidebar-btn" title="Coaching roleplay (aliases: !coaching-roleplay, !coachingroleplay)" onClick={() => sendCommand('!coaching-roleplay')}>!coaching-roleplay</button>
+        </div>
+
+        <div className="sidebar-divider"></div>
+
+        {/* Help & Commands */}
+        <div className="sidebar-section">
+          <h3>Help & Commands</h3>
+          <button className="sidebar-btn" title="Show all commands and examples" onClick={() => sendCommand('!help')}>!help / !commands</button>
+        </div>
+        <div className="sidebar-divider"></div>
+
+        {/* Quick Actions */}
+        <div className="sidebar-section">
+          <h3>Quick Actions</h3>
+          <div className="quick-actions">
+            <button className="sidebar-btn small" onClick={() => sendCommand('continue')}>Continue</button>
+            <button className="sidebar-btn small" onClick={() => sendCommand('restart')}>Restart</button>
+            <button className="sidebar-btn small" onClick={() => sendCommand('end')}>End</button>
+          </div>
+        </div>
+      </div>
+    </aside>
+);
+
+export default React.memo(Sidebar);
@@ -0,0 +1,45 @@
+// Delta sync with the Python side (see chat_sync.py).
+// The backend only sends messages created or changed after the last sequence
+// we acknowledged; we upsert them by id and drop history it has trimmed.
+
+export interface SyncedMessage {
+  id?: number;
+  seq?: number;
+  role: 'user' | 'assistant';
+  content: string;
+  pending?: boolean;  // "Working on it…" placeholder the final reply will replace
+}
+
+export interface SyncPatch {
+  seq: number;        // Latest sequence on the server
+  base: number;       // Sequence the patch was built against (our last ack)
+  first_id: number;   // Oldest message id the server still keeps
+  upserts: SyncedMessage[];
+}
+
+// A patch built against a sequence we never reached means we lost state
+// (e.g. the iframe was remounted) and must ask for a resync.
+export const hasGap = (patch: SyncPatch, localSeq: number): boolean =>
+  patch.base > localSeq;
+
+export const applyPatch = (
+  current: SyncedMessage[],
+  patch: SyncPatch,
+  localSeq: number
+): SyncedMessage[] => {
+  // A patch from sequence 0 is a full snapshot, not an increment
+  const next = patch.base === 0
+    ? []
+    : current.filter(m => m.id === undefined || m.id >= patch.first_id);
+
+  for (const msg of patch.upserts) {
+    if (patch.base !== 0 && (msg.seq ?? 0) <= localSeq) continue;
+    const idx = next.findIndex(m => m.id === msg.id);
+    if (idx >= 0) {
+      next[idx] = msg;
+    } else {
+      next.push(msg);
+    }
+  }
+  return next;
+};
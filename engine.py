@@ -0,0 +1,1035 @@
+# engine.py
+"""
+Conversation engine for the Elite Auto Sales Academy Bot: Google Sheets
+logging, roleplay number tracking and the text -> OpenAI -> tool-calls ->
+reply loop around the CHARACTER prompt (prompts/character/, loaded by
+prompt_registry.py). Kept free of Streamlit UI calls so it can run against
+any session record (see session_store.py).
+"""
+import os
+import re
+import json
+import time
+import uuid
+import datetime
+from typing import Dict, Any, List, Optional
+import streamlit as st
+from dotenv import load_dotenv
+import openai
+
+# Google Sheets API
+from google.oauth2 import service_account
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+import google.auth.transport.requests
+
+import amounts
+import chat_sync
+import llm
+import logs
+import metrics
+import recorder
+import routing
+import tracing
+import usage
+from prompt_registry import PROMPTS, Prompt, record_completion
+from admission import ADMISSION, RESPONSE_CACHE, BUSY_MESSAGE, is_cacheable, normalize_command
+
+log = logs.get_logger("engine")
+
+load_dotenv()
+
+OPENAI_MODEL = routing.DEFAULT_MODEL
+openai.api_key = os.getenv("OPENAI_API_KEY", "")
+
+# =========================
+# Google Sheets config
+# =========================
+# Try to get spreadsheet IDs from Streamlit secrets first, fallback to environment variables
+DAILY_LOG_SPREADSHEET_ID = ""
+SESSION_LOG_SPREADSHEET_ID = ""
+
+# Check Streamlit secrets first
+try:
+    if hasattr(st, 'secrets'):
+        DAILY_LOG_SPREADSHEET_ID = st.secrets.get("DAILY_LOG_SPREADSHEET_ID", "")
+        SESSION_LOG_SPREADSHEET_ID = st.secrets.get("SESSION_LOG_SPREADSHEET_ID", "")
+except Exception:
+    pass
+
+# Fall back to environment variables
+if not DAILY_LOG_SPREADSHEET_ID:
+    DAILY_LOG_SPREADSHEET_ID = os.getenv("DAILY_LOG_SPREADSHEET_ID", "")
+if not SESSION_LOG_SPREADSHEET_ID:
+    SESSION_LOG_SPREADSHEET_ID = os.getenv("SESSION_LOG_SPREADSHEET_ID", "")
+
+log.info("Sheets configured", daily_log=DAILY_LOG_SPREADSHEET_ID, session_log=SESSION_LOG_SPREADSHEET_ID)
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+    "https://www.googleapis.com/auth/drive.file"
+]
+# Try to get the service account JSON from multiple sources
+# 1. First check for Streamlit secrets (preferred for deployed apps)
+SERVICE_ACCOUNT_JSON = None
+try:
+    if hasattr(st, 'secrets') and 'gcp_service_account' in st.secrets:
+        log.info("Using service account from Streamlit secrets")
+        SERVICE_ACCOUNT_JSON = json.dumps(dict(st.secrets["gcp_service_account"]))
+except Exception as e:
+    log.warning("Could not load service account from Streamlit secrets", error=str(e))
+
+# 2. Fall back to environment variable if no secrets
+if not SERVICE_ACCOUNT_JSON:
+    SERVICE_ACCOUNT_JSON = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON")
+    if SERVICE_ACCOUNT_JSON and not SERVICE_ACCOUNT_JSON.startswith("{"):
+        # If it's not already a JSON string but a file path
+        try:
+            with open(SERVICE_ACCOUNT_JSON, 'r') as f:
+                SERVICE_ACCOUNT_JSON = f.read()
+        except Exception as e:
+            log.warning("Could not read service account file", path=SERVICE_ACCOUNT_JSON, error=str(e))
+
+# Test/load-harness hook: when set, get_sheets_service() returns this factory's
+# service instead of authenticating against Google (see tools/fakes.py).
+SHEETS_SERVICE_FACTORY = None
+
+def configure_sheets(service_factory=None, daily_log_spreadsheet_id: Optional[str] = None,
+                     session_log_spreadsheet_id: Optional[str] = None) -> None:
+    """Point the Sheets helpers at another service (e.g. an in-memory fake) and spreadsheets."""
+    global SHEETS_SERVICE_FACTORY, DAILY_LOG_SPREADSHEET_ID, SESSION_LOG_SPREADSHEET_ID
+    SHEETS_SERVICE_FACTORY = service_factory
+    if daily_log_spreadsheet_id is not None:
+        DAILY_LOG_SPREADSHEET_ID = daily_log_spreadsheet_id
+    if session_log_spreadsheet_id is not None:
+        SESSION_LOG_SPREADSHEET_ID = session_log_spreadsheet_id
+
+def get_sheets_service():
+    """Create and return a Google Sheets API service (every call metered)."""
+    service = SHEETS_SERVICE_FACTORY() if SHEETS_SERVICE_FACTORY is not None else _build_sheets_service()
+    return metrics.MeteredService(service) if service is not None else None
+
+def _build_sheets_service():
+    try:
+        # First, try to use the service_account.json file directly
+        service_account_path = os.path.join(os.path.dirname(__file__), 'service_account.json')
+        if os.path.exists(service_account_path):
+            try:
+                log.debug("Found service_account.json file, using it for authentication")
+                
+                # Verify the contents of the JSON file
+                import json
+                try:
+                    with open(service_account_path, 'r') as f:
+                        service_account_info = json.load(f)
+                    
+                    # Check for required fields
+                    required_fields = ['type', 'project_id', 'private_key_id', 'private_key', 'client_email']
+                    missing_fields = [field for field in required_fields if field not in service_account_info]
+                    
+                    if missing_fields:
+                        log.warning("Service account JSON file is missing required fields", missing=missing_fields)
+                    else:
+                        log.debug("Service account JSON file contains all required fields",
+                                  project_id=service_account_info.get("project_id"),
+                                  client_email=service_account_info.get("client_email"))
+                except Exception as e:
+                    log.error("Error reading service_account.json", error=str(e))
+                
+                # Create credentials from the service account file with explicit token URI
+                credentials = service_account.Credentials.from_service_account_file(
+                    service_account_path, 
+                    scopes=SCOPES
+                )
+                
+                # Force token refresh to get access token
+                try:
+                    credentials.refresh(google.auth.transport.requests.Request())
+                    log.debug("Refreshed access token")
+                except Exception as e:
+                    log.warning("Error refreshing token", error=str(e))
+                
+                # Print the service account email for debugging/setup purposes
+                if hasattr(credentials, 'service_account_email'):
+                    log.debug("Using service account; share your Google Sheets with this email",
+                              email=credentials.service_account_email)
+                
+                service = build("sheets", "v4", credentials=credentials)
+                log.info("Created Google Sheets service", source="service_account.json")
+                
+                # Test access to spreadsheets if they're configured
+                if DAILY_LOG_SPREADSHEET_ID:
+                    try:
+                        service.spreadsheets().get(spreadsheetId=DAILY_LOG_SPREADSHEET_ID).execute()
+                        log.debug("Test access successful", spreadsheet="daily_log")
+                    except Exception as e:
+                        log.warning("Cannot access daily log spreadsheet; share it with the service account email",
+                                    error=str(e))
+                
+                if SESSION_LOG_SPREADSHEET_ID:
+                    try:
+                        service.spreadsheets().get(spreadsheetId=SESSION_LOG_SPREADSHEET_ID).execute()
+                        log.debug("Test access successful", spreadsheet="session_log")
+                    except Exception as e:
+                        log.warning("Cannot access session log spreadsheet; share it with the service account email",
+                                    error=str(e))
+                
+                return service
+            except Exception as e:
+                log.error("Error using service_account.json file", error=str(e))
+        
+        # Fall back to GOOGLE_SERVICE_ACCOUNT_JSON environment variable
+        elif SERVICE_ACCOUNT_JSON:
+            try:
+                # Try to parse as JSON
+                import json
+                info_dict = json.loads(SERVICE_ACCOUNT_JSON)
+                credentials = service_account.Credentials.from_service_account_info(
+                    info_dict, 
+                    scopes=SCOPES
+                )
+                
+                # Print the service account email for debugging
+                if hasattr(credentials, 'service_account_email'):
+                    log.debug("Using service account from env var", email=credentials.service_account_email)
+                
+                service = build("sheets", "v4", credentials=credentials)
+                log.info("Created Google Sheets service", source="GOOGLE_SERVICE_ACCOUNT_JSON")
+                return service
+            except Exception as e:
+                log.error("Error using GOOGLE_SERVICE_ACCOUNT_JSON", error=str(e))
+        
+        # Last resort - try credentials.json
+        creds_file = os.path.join(os.path.dirname(__file__), 'credentials.json')
+        if os.path.exists(creds_file):
+            try:
+                credentials = service_account.Credentials.from_service_account_file(
+                    creds_file, 
+                    scopes=SCOPES
+                )
+                service = build("sheets", "v4", credentials=credentials)
+                log.info("Created Google Sheets service", source=creds_file)
+                return service
+            except Exception as e:
+                log.error("Error using credentials.json file", error=str(e))
+        
+        # No credentials found
+        log.warning("No Google Sheets credentials found; set GOOGLE_SERVICE_ACCOUNT_JSON in .env "
+                    "or place a credentials.json file in the project directory")
+        return None
+    except Exception as e:
+        log.error("Error initializing Google Sheets service", error=str(e))
+        return None
+
+def add_sheet_if_missing(service, spreadsheet_id: str, sheet_title: str):
+    """Create a sheet if it doesn't exist already."""
+    if not service or not spreadsheet_id:
+        log.warning("Cannot add sheet: service or spreadsheet_id missing")
+        return False
+        
+    try:
+        # First check if the sheet already exists
+        try:
+            sheets_metadata = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+            sheets = sheets_metadata.get('sheets', [])
+            for sheet in sheets:
+                if sheet.get('properties', {}).get('title') == sheet_title:
+                    log.debug("Sheet already exists", sheet=sheet_title, sample=True)
+                    return True
+        except Exception as e:
+            log.warning("Error checking existing sheets", error=str(e))
+            # Continue to creation attempt
+        
+        # Sheet doesn't exist, try to create it
+        log.info("Creating new sheet", sheet=sheet_title)
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={"requests": [{"addSheet": {"properties": {"title": sheet_title}}}]}
+        ).execute()
+        log.debug("Created sheet", sheet=sheet_title)
+        return True
+        
+    except HttpError as e:
+        if getattr(e, "resp", None) and e.resp.status in (400, 409):
+            # 400 or 409 usually means the sheet already exists
+            log.info("Sheet may already exist", sheet=sheet_title, reason=getattr(e, "reason", str(e)))
+            return True
+        else:
+            # Other HTTP errors - likely permissions or invalid spreadsheet ID
+            error_details = e.content.decode('utf-8') if hasattr(e, 'content') else str(e)
+            status_code = e.resp.status if hasattr(e, 'resp') and hasattr(e.resp, 'status') else 'unknown'
+            log.error("HTTP error adding sheet", status=status_code, details=error_details)
+            
+            if status_code == 403:
+                log.error("PERMISSION DENIED: give the service account email Editor access to the spreadsheet")
+            
+            raise
+    except Exception as e:
+        log.error("Error adding sheet", sheet=sheet_title, error=str(e))
+        raise
+
+def ensure_header_row(service, spreadsheet_id: str, sheet_title: str, headers: List[str]):
+    """Make sure the first row of the sheet has the correct headers."""
+    if not service or not spreadsheet_id:
+        log.warning("Cannot ensure header row: service or spreadsheet_id missing")
+        return False
+        
+    try:
+        # Try to get the current header row
+        try:
+            res = service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id, range=f"'{sheet_title}'!1:1"
+            ).execute()
+            row = res.get("values", [[]])
+            cur = row[0] if row else []
+            
+            # Update headers if they don't match
+            if cur != headers:
+                log.info("Updating headers", sheet=sheet_title, headers=headers)
+                service.spreadsheets().values().update(
+                    spreadsheetId=spreadsheet_id,
+                    range=f"'{sheet_title}'!1:1",
+                    valueInputOption="RAW",
+                    body={"values": [headers]}
+                ).execute()
+                return True
+            return True
+                
+        except HttpError as e:
+            if getattr(e, "resp", None) and e.resp.status == 400:
+                # Sheet likely doesn't exist, try to create it
+                log.info("Sheet not found, creating it", sheet=sheet_title)
+                sheet_created = add_sheet_if_missing(service, spreadsheet_id, sheet_title)
+                
+                if sheet_created:
+                    # Now try to add headers
+                    try:
+                        log.debug("Adding headers to new sheet", sheet=sheet_title)
+                        service.spreadsheets().values().update(
+                            spreadsheetId=spreadsheet_id,
+                            range=f"'{sheet_title}'!1:1",
+                            valueInputOption="RAW",
+                            body={"values": [headers]}
+                        ).execute()
+                        return True
+                    except Exception as header_error:
+                        log.error("Error adding headers to new sheet", sheet=sheet_title, error=str(header_error))
+                        raise
+            else:
+                # Other HTTP error
+                error_details = e.content.decode('utf-8') if hasattr(e, 'content') else str(e)
+                log.error("HTTP error getting/setting headers", details=error_details)
+                raise
+                
+    except Exception as e:
+        log.error("Error ensuring header row", sheet=sheet_title, error=str(e))
+        raise
+
+def sanitize_sheet_title(name: str) -> str:
+    n = (name or "session").strip()
+    n = re.sub(r"[:\\\/\?\*\[\]]", "-", n)
+    return n[:99] if len(n) > 99 else n or "session"
+
+# Daily Log (idempotent by LogId user|YYYY-MM-DD)
+DAILY_HEADERS = ["DateUTC","User","Ups","Calls","FollowUps","Appointments","LogId"]
+
+def daily_log_append_or_update(user: str, ups: str, calls: str, followups: str, appointments: str) -> Dict[str, Any]:
+    if not DAILY_LOG_SPREADSHEET_ID:
+        return {"ok": False, "error": "DAILY_LOG_SPREADSHEET_ID not set"}
+    
+    try:
+        service = get_sheets_service()
+        if service is None:
+            return {"ok": False, "error": "Failed to initialize Google Sheets service"}
+            
+        sheet_title = "DailyLog"
+        
+        # Set up the sheet if needed
+        try:
+            add_sheet_if_missing(service, DAILY_LOG_SPREADSHEET_ID, sheet_title)
+            ensure_header_row(service, DAILY_LOG_SPREADSHEET_ID, sheet_title, DAILY_HEADERS)
+        except Exception as e:
+            log.error("Error setting up sheet", sheet=sheet_title, error=str(e))
+            return {"ok": False, "error": f"Error setting up sheet: {str(e)}"}
+            
+        now_utc = datetime.datetime.utcnow().isoformat()
+        log_id = f"{user}|{now_utc[:10]}".lower()
+    
+        # Get existing values
+        try:
+            existing = service.spreadsheets().values().get(
+                spreadsheetId=DAILY_LOG_SPREADSHEET_ID,
+                range=f"'{sheet_title}'!G2:G"
+            ).execute().get("values", [])
+        except HttpError as e:
+            log.warning("Error getting existing values", error=str(e))
+            existing = []
+    
+        # Look for existing entry
+        found_row_idx = None
+        for i, row in enumerate(existing, start=2):
+            val = (row[0] if row else "").strip().lower()
+            if val == log_id:
+                found_row_idx = i
+                break
+    
+        # Prepare data row
+        row_values = [[now_utc, user, ups, calls, followups, appointments, log_id]]
+        
+        # Update or append
+        if found_row_idx:
+            try:
+                service.spreadsheets().values().update(
+                    spreadsheetId=DAILY_LOG_SPREADSHEET_ID,
+                    range=f"'{sheet_title}'!A{found_row_idx}:G{found_row_idx}",
+                    valueInputOption="RAW",
+                    body={"values": row_values}
+                ).execute()
+                return {"ok": True, "mode": "update", "row": found_row_idx}
+            except Exception as e:
+                log.error("Error updating row", row=found_row_idx, error=str(e))
+                return {"ok": False, "error": f"Error updating row: {str(e)}"}
+        else:
+            try:
+                service.spreadsheets().values().append(
+                    spreadsheetId=DAILY_LOG_SPREADSHEET_ID,
+                    range=f"'{sheet_title}'!A1",
+                    valueInputOption="RAW",
+                    insertDataOption="INSERT_ROWS",
+                    body={"values": row_values}
+                ).execute()
+                return {"ok": True, "mode": "append"}
+            except Exception as e:
+                log.error("Error appending row", sheet=sheet_title, error=str(e))
+                return {"ok": False, "error": f"Error appending row: {str(e)}"}
+    except Exception as e:
+        log.exception("Unexpected error in daily_log_append_or_update")
+        return {"ok": False, "error": f"Unexpected error: {str(e)}"}
+
+# Per-session logs (one tab per session)
+SESSION_HEADERS = ["TimestampUTC","UserName","SessionId","Scenario","Step","TargetPayment","OfferPayment","Band","Message"]
+
+def session_log_append(session_id: str, user_name: str,
+                       scenario: str, step: int, target_payment: Optional[int],
+                       offer_payment: Optional[int], band: str, message: str) -> Dict[str, Any]:
+    if not SESSION_LOG_SPREADSHEET_ID:
+        return {"ok": False, "error": "SESSION_LOG_SPREADSHEET_ID not set"}
+    
+    try:
+        service = get_sheets_service()
+        if service is None:
+            return {"ok": False, "error": "Failed to initialize Google Sheets service"}
+            
+        tab = sanitize_sheet_title(session_id)
+        
+        try:
+            add_sheet_if_missing(service, SESSION_LOG_SPREADSHEET_ID, tab)
+            ensure_header_row(service, SESSION_LOG_SPREADSHEET_ID, tab, SESSION_HEADERS)
+        except Exception as e:
+            log.error("Error setting up sheet", sheet=tab, error=str(e))
+            return {"ok": False, "error": f"Error setting up sheet: {str(e)}"}
+    
+        now_utc = datetime.datetime.utcnow().isoformat()
+        row = [[
+            now_utc, user_name, session_id, scenario, step,
+            target_payment if target_payment is not None else "",
+            offer_payment if offer_payment is not None else "",
+            band, message
+        ]]
+        
+        try:
+            service.spreadsheets().values().append(
+                spreadsheetId=SESSION_LOG_SPREADSHEET_ID,
+                range=f"'{tab}'!A1",
+                valueInputOption="RAW",
+                insertDataOption="INSERT_ROWS",
+                body={"values": row}
+            ).execute()
+            return {"ok": True, "sheet": tab}
+        except Exception as e:
+            log.error("Error appending data", sheet=tab, error=str(e))
+            return {"ok": False, "error": f"Error appending data: {str(e)}"}
+            
+    except Exception as e:
+        log.exception("Unexpected error in session_log_append")
+        return {"ok": False, "error": f"Unexpected error: {str(e)}"}
+
+# =========================
+# Number helpers & roleplay
+# =========================
+SESSION_TTL = 30 * 60
+def compute_band(target: Optional[int], offer: Optional[int]) -> str:
+    if target is None or offer is None:
+        return ""
+    delta = offer - target
+    if delta <= 0: return "A"
+    if 1 <= delta <= 40: return "B"
+    return "C"
+
+def capture_numbers(state: Dict[str, Any], found: List[amounts.Amount]) -> None:
+    """
+    Store what the rep's amounts say in the roleplay state: monthly payments
+    they're at (offer) or the customer wants (target), and the latest price,
+    down, term and trade figures under state["deal"].
+    """
+    deal = state.setdefault("deal", {})
+    for a in found:
+        if a.kind == "monthly":
+            if a.role in ("offer", "target"):
+                state[a.role] = a.value
+        else:
+            deal[a.kind] = a.value
+
+def infer_scenario_from_text(txt: str) -> Optional[str]:
+    t = txt.lower()
+    if "!priceobjection" in t or "!roleplay price" in t: return "price"
+    if "!paymenttoohigh" in t or "!roleplay payment" in t: return "payment"
+    if "!tradevalue" in t or "!roleplay trade" in t: return "trade"
+    if "!thinkaboutit" in t: return "think"
+    if "!shoparound" in t: return "shop"
+    if "!spouse" in t: return "spouse"
+    if "!paymentvsprice" in t: return "paymentvsprice"
+    if "!timingstall" in t: return "timing"
+    if "!roleplay budget" in t or (t.startswith("!roleplay") and "budget" in t): return "budget"
+    return None
+
+# =========================
+# OpenAI tools (function calling)
+# =========================
+OPENAI_FUNCTIONS = [
+    {
+        "name": "append_daily_log",
+        "description": "Append exactly one row to the daily log Google Sheet after the four answers.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "user": {"type": "string"},
+                "ups": {"type": "string"},
+                "calls": {"type": "string"},
+                "followups": {"type": "string"},
+                "appointments": {"type": "string"}
+            },
+            "required": ["user", "ups", "calls", "followups", "appointments"]
+        }
+    },
+    {
+        "name": "log_session_turn",
+        "description": "Write one turn of the roleplay to the per-session sheet tab.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "session_id": {"type": "string"},
+                "user_name": {"type": "string"},
+                "scenario": {"type": "string"},
+                "step": {"type": "integer"},
+                "target_payment": {"type": "integer"},
+                "offer_payment": {"type": "integer"},
+                "band": {"type": "string"},
+                "message": {"type": "string"}
+            },
+            "required": ["session_id", "user_name", "scenario", "step", "band", "message"]
+        }
+    }
+]
+
+# Per-session system lines; stateless commands are sent, and coalesce, without them
+_IDENTITY_PREFIXES = ("User: ", "SESSION_STATE_JSON=")
+
+def shared_prompt(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    return [m for m in messages if not (m["role"] == "system" and m["content"].startswith(_IDENTITY_PREFIXES))]
+
+def select_functions(names: List[str]) -> List[Dict[str, Any]]:
+    """The OPENAI_FUNCTIONS schemas a route offers the model."""
+    return [f for f in OPENAI_FUNCTIONS if f["name"] in names]
+
+def run_openai(messages: List[Dict[str, str]], fair_key: str = "anonymous",
+               route: Optional[Dict[str, Any]] = None, model: Optional[str] = None,
+               shared: bool = False, prompt: Optional[Prompt] = None,
+               functions: List[Dict[str, Any]] = OPENAI_FUNCTIONS) -> Dict[str, Any]:
+    """First completion of a turn. ``shared`` sends a stateless command without the
+    rep's identity lines, so reps sending it at the same moment share one
+    upstream call and none gets a reply written for another rep. ``prompt`` is the system
+    prompt in ``messages``; the response is tagged with its version. With no
+    ``functions`` the request carries no tool schemas at all."""
+    params = routing.completion_params(route or routing.route_for("chat"), model)
+    if functions:
+        params = dict(params, functions=functions, function_call="auto")
+    coalesce_key = None
+    if shared:
+        messages = shared_prompt(messages)  # Key on exactly what goes upstream
+        key_messages = messages
+        if prompt is not None:
+            # Key on the prompt's hash instead of rehashing its full text
+            key_messages = [m for m in key_messages if m["content"] is not prompt.text]
+            params_key = dict(params, prompt=prompt.prefix_hash)
+        else:
+            params_key = params
+        coalesce_key = llm.request_key(messages=key_messages, **params_key)
+    if prompt is not None:
+        tracing.set_attributes(prompt_version=prompt.tag)
+    try:
+        if log.debug_enabled:
+            log.debug("Running OpenAI", roles=[m["role"] for m in messages], sample=True,
+                      **{k: v for k, v in params.items() if k != "functions"},
+                      tools=[f["name"] for f in functions])
+
+        response = llm.chat_completion(
+            fair_key,
+            coalesce_key=coalesce_key,
+            messages=messages,
+            **params
+        )
+        log.debug("OpenAI API call successful", sample=True)
+        if prompt is not None:
+            record_completion(prompt, response)
+        return response
+    except Exception as e:
+        log.error("OpenAI API call failed", error=str(e),
+                  details=e.__dict__ if hasattr(e, "__dict__") else None)
+        # Return a fallback response
+        return {
+            "fallback": True,
+            "choices": [
+                {
+                    "message": {
+                        "content": f"Sorry, I encountered an error: {str(e)}. Please try again or contact support."
+                    }
+                }
+            ]
+        }
+
+# =========================
+# Session records
+# =========================
+WELCOME_MESSAGE = "Welcome to Elite Auto Sales Academy. Use the commands from the sidebar (e.g., !scripts) or type your message below."
+MAX_HISTORY = 30  # Messages kept per session
+
+def new_engine_state() -> Dict[str, Any]:
+    return {
+        "scenario": "",
+        "step": 0,
+        "target": None,
+        "offer": None,
+        "band": "",
+        "deal": {},
+        "flow": "",  # "dailylog" while the rep is answering the !dailylog questions
+        "last_updated": time.time(),
+    }
+
+def new_session(session_id: Optional[str] = None, user_name: str = "User") -> Dict[str, Any]:
+    """A fresh session record: everything a turn needs, JSON-serializable."""
+    sync = chat_sync.new_sync_state()
+    return {
+        "session_id": session_id or f"sess-{uuid.uuid4().hex[:10]}",
+        "user_name": user_name,
+        "messages": [chat_sync.stamp(sync, {"role": "assistant", "content": WELCOME_MESSAGE})],
+        "engine_state": new_engine_state(),
+        "sync": sync,
+        "usage": usage.new_usage(),
+    }
+
+def trim_history(session: Dict[str, Any], max_messages: int = MAX_HISTORY) -> None:
+    """Cleanup message history to prevent it from growing too large."""
+    if len(session["messages"]) > max_messages:
+        session["messages"] = session["messages"][-max_messages:]
+        log.debug("Message history trimmed", kept=max_messages, sample=True)
+
+# =========================
+# Message history management
+# =========================
+def truncate_messages(messages: List[Dict[str, str]], max_messages: int = 10) -> List[Dict[str, str]]:
+    """Truncate message history to avoid context length issues."""
+    # Always keep system messages and the last max_messages non-system messages
+    system_messages = [msg for msg in messages if msg['role'] == 'system']
+    non_system_messages = [msg for msg in messages if msg['role'] != 'system']
+    
+    # Keep only the most recent non-system messages
+    if len(non_system_messages) > max_messages:
+        log.debug("Truncating message history", before=len(non_system_messages), after=max_messages, sample=True)
+        non_system_messages = non_system_messages[-max_messages:]
+    
+    # Combine and return
+    return system_messages + non_system_messages
+
+def select_context(session: Dict[str, Any], route: Dict[str, Any], character: Prompt,
+                   system_state: Dict[str, Any]) -> List[Dict[str, str]]:
+    """System prompt plus only the context ``route`` asks for: the last
+    ``history`` messages before the rep's own and, for ``session_state``
+    routes, SESSION_STATE_JSON."""
+    messages = [
+        {"role": "system", "content": character.text},
+        {"role": "system", "content": f"User: {session['user_name']}. Session: {session['session_id']}."},
+        {"role": "system", "content": "Short, natural dealership language. ~2 sentences per turn. End with a clear next step."},
+    ]
+    if route.get("session_state"):
+        messages.append({"role": "system", "content": f"SESSION_STATE_JSON={json.dumps(system_state)}"})
+    conversation_messages = chat_sync.openai_view(
+        [m for m in session["messages"] if m["role"] in ("user", "assistant")]
+    )
+    return truncate_messages(messages + conversation_messages, max_messages=int(route.get("history", 14)) + 1)
+
+# =========================
+# Load shedding: answers that need no LLM call
+# =========================
+HELP_TEXT = """
+Elite Bot Command List:
+
+!scripts — Standard sales scripts library
+!trust — Trust-building coaching
+!tonality — Voice/tonality coaching
+!firstimpression — Greeting & intro roleplay
+!pvf — Guided PVF close
+!roleplay price — Price/Payment Too High (3-deep branching)
+!roleplay trade — Trade value objection
+!roleplay think — “Let me think about it”
+!roleplay shop — “I want to shop around”
+!roleplay spouse — “I need to check with my spouse”
+!objection price — Price objection (value + options trade-offs)
+!objection paymenttoohigh — Payment Too High (monthly range → choices → soft commit)
+!objection tradevalue — Trade value objection
+!objection thinkaboutit — Think about it objection
+!objection shoparound — Shop around objection
+!objection spouse — Spouse objection
+!objection paymentvsprice — Payment vs Price objection
+!objection timingstall — Timing stall objection
+!dailylog — Daily log
+!earn — E.A.R.N. overview
+!checkpoints — Five Emotional Checkpoints
+!coaching — Coaching menu
+!coaching-tips (alias !coachingtips) — Coaching tips
+!coaching-roleplay (alias !coachingroleplay) — Coaching roleplay
+"""
+
+STATIC_ANSWERS = {
+    "!help": HELP_TEXT,
+    "!commands": HELP_TEXT,
+    "!checkpoints": "The five emotional checkpoints: Research Mode, Trust Check, Control Test, Reassurance Loop, Post-Test Drift. Pick one to drill into.",
+    "end": "Roleplay ended. Pick your next command when you're ready.",
+}
+
+def shed_answer(text: str, fallback: str = BUSY_MESSAGE) -> str:
+    """Best answer available without the LLM: cached, then static, then ``fallback``."""
+    cached = RESPONSE_CACHE.get(text, PROMPTS.get("character").tag)
+    return cached or STATIC_ANSWERS.get(normalize_command(text)) or fallback
+
+def shed_turn(session: Dict[str, Any], text: str, reply_to: Optional[int], reason: str) -> str:
+    """Answer a turn without the LLM (see ADMISSION), filling in its placeholder."""
+    log.warning("Shedding LLM turn", session_id=session["session_id"], reason=reason)
+    assistant_text = shed_answer(text)
+    post_reply(session, assistant_text, reply_to)
+    return assistant_text
+
+def command_class(text: str, state: Optional[Dict[str, Any]] = None) -> str:
+    """Coarse label for a turn (static, dailylog, roleplay, objection, coaching, command, chat)."""
+    cmd = normalize_command(text)
+    if cmd in STATIC_ANSWERS:
+        return "static"
+    if cmd.startswith("!dailylog"):
+        return "dailylog"
+    if cmd.startswith(("!roleplay", "!priceobjection", "!paymenttoohigh", "!tradevalue", "!firstimpression", "!pvf")):
+        return "roleplay"
+    if cmd.startswith("!objection"):
+        return "objection"
+    if cmd.startswith("!coaching"):
+        return "coaching"
+    if cmd.startswith("!"):
+        return "command"
+    if state and state.get("flow") == "dailylog":
+        return "dailylog"
+    if state and state.get("scenario"):
+        return "roleplay"
+    return "chat"
+
+# =========================
+# Deferred turns: placeholder now, final reply later
+# =========================
+WORKING_MESSAGE = "Working on it…"
+FAILED_MESSAGE = "Sorry, that one didn't go through. Please send it again."
+
+def begin_turn(session: Dict[str, Any], text: str) -> int:
+    """Append the rep's message and a pending "Working on it…" reply; return the reply's id."""
+    session["messages"].append(chat_sync.stamp(session["sync"], {"role": "user", "content": text}))
+    placeholder = chat_sync.stamp(session["sync"], {"role": "assistant", "content": WORKING_MESSAGE,
+                                                    "pending": time.time()})
+    session["messages"].append(placeholder)
+    return placeholder["id"]
+
+def post_reply(session: Dict[str, Any], content: str, reply_to: Optional[int] = None) -> None:
+    """Fill in the placeholder ``reply_to`` (if still in history) or append a new reply."""
+    if reply_to is not None:
+        for msg in reversed(session["messages"]):
+            if msg.get("id") == reply_to:
+                msg["content"] = content
+                msg.pop("pending", None)
+                msg.pop("heartbeat", None)
+                chat_sync.touch(session["sync"], msg)
+                return
+    session["messages"].append(chat_sync.stamp(session["sync"], {"role": "assistant", "content": content}))
+
+def finish_turn(latest: Dict[str, Any], worked: Dict[str, Any], reply_to: int) -> None:
+    """Fold a turn run on a copy of the session back into the latest stored
+    record, and trim its history. The caller holds the session lock and puts
+    ``latest`` afterwards, so this is the only place a stored session is trimmed."""
+    latest["engine_state"] = worked["engine_state"]
+    latest["usage"] = worked.get("usage") or usage.new_usage()
+    reply = next((m for m in worked["messages"] if m.get("id") == reply_to), None)
+    content = reply["content"] if reply is not None and not reply.get("pending") else FAILED_MESSAGE
+    post_reply(latest, content, reply_to)
+    trim_history(latest)
+
+def pending_since(session: Dict[str, Any]) -> Optional[float]:
+    """When the oldest still-pending reply was started, or None."""
+    stamps = [m["pending"] for m in session["messages"] if m.get("pending")]
+    return min(stamps) if stamps else None
+
+def renew_lease(session: Dict[str, Any], reply_ids: List[int], now: Optional[float] = None) -> bool:
+    """Mark the pending replies ``reply_ids`` as still being worked on; True if any were."""
+    now = now or time.time()
+    renewed = False
+    for msg in session["messages"]:
+        if msg.get("pending") and msg.get("id") in reply_ids:
+            msg["heartbeat"] = now
+            renewed = True
+    return renewed
+
+def lapsed_pending(session: Dict[str, Any], lease: float, ceiling: float,
+                   now: Optional[float] = None) -> List[int]:
+    """Ids of pending replies no worker has renewed within ``lease`` seconds,
+    or that have been pending longer than ``ceiling``."""
+    now = now or time.time()
+    return [m["id"] for m in session["messages"]
+            if m.get("pending") and (now - m.get("heartbeat", m["pending"]) > lease
+                                     or now - m["pending"] > ceiling)]
+
+# =========================
+# Core responder (text -> OpenAI -> tool-calls -> reply)
+# =========================
+def respond_to(session: Dict[str, Any], text: str, reply_to: Optional[int] = None) -> str:
+    """
+    Run one turn against a session record (see new_session) and return the reply.
+    With ``reply_to`` (see begin_turn) the rep's message is already in history and
+    the reply fills in that placeholder instead of being appended.
+    """
+    cls = command_class(text, session["engine_state"])
+    started = time.perf_counter()
+    outcome = "error"
+    with tracing.span("turn", session_id=session["session_id"], user_name=session["user_name"],
+                      chars=len(text), command_class=cls) as turn:
+        try:
+            with recorder.RECORDER.turn(session, text, reply_to, cls) as record:
+                reply = _respond(session, text, cls, reply_to)
+                if record is not None:
+                    record.reply = reply
+            turn.set(scenario=session["engine_state"].get("scenario") or "", reply_chars=len(reply))
+            outcome = ("shed" if turn.attributes.get("shed")
+                       else "budget" if turn.attributes.get("budget") == "hard"
+                       else "fallback" if turn.attributes.get("fallback") else "ok")
+            return reply
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.TURN_SECONDS.labels(command_class=cls).observe(elapsed)
+            if outcome == "ok":
+                routing.check_slo(cls, elapsed)
+            metrics.TURNS.labels(command_class=cls, outcome=outcome).inc()
+
+def _respond(session: Dict[str, Any], text: str, cls: str, reply_to: Optional[int]) -> str:
+    state = session["engine_state"]
+
+    with tracing.span("turn.state") as span:
+        # TTL reset
+        now = time.time()
+        if now - state.get("last_updated", now) > SESSION_TTL:
+            state.update({"scenario": "", "step": 0, "target": None, "offer": None, "band": "", "deal": {},
+                          "flow": ""})
+            span.set(ttl_reset=True)
+
+        txt_lower = text.lower().strip()
+        scenario_cmd = infer_scenario_from_text(text)
+        if scenario_cmd:
+            state["scenario"] = scenario_cmd
+            state["step"] = 0
+
+        if cls == "dailylog" and txt_lower.startswith("!dailylog"):
+            state["flow"] = "dailylog"
+        elif txt_lower.startswith("!"):
+            state["flow"] = ""
+
+        if txt_lower in ("continue", "end", "restart"):
+            if txt_lower == "restart":
+                state["step"] = 0
+            elif txt_lower == "end":
+                state.update({"scenario": "", "step": 0, "target": None, "offer": None, "band": "", "deal": {},
+                              "flow": ""})
+        else:
+            capture_numbers(state, amounts.extract(text))
+
+        state["band"] = compute_band(state.get("target"), state.get("offer"))
+        state["last_updated"] = time.time()
+        span.set(scenario=state.get("scenario") or "", step=state.get("step"), band=state.get("band"))
+
+    # Push user message (a deferred turn already did, see begin_turn)
+    if reply_to is None:
+        session["messages"].append(chat_sync.stamp(session["sync"], {"role": "user", "content": text}))
+
+    route = routing.route_for(cls)
+    with tracing.span("turn.prompt_build") as span:
+        # Build OpenAI messages
+        system_state = {
+            "user_name": session["user_name"],
+            "session_id": session["session_id"],
+            "scenario": state.get("scenario") or "",
+            "step": int(state.get("step", 0)),
+            "target_payment": state.get("target"),
+            "offer_payment": state.get("offer"),
+            "band": state.get("band"),
+            "last_updated": datetime.datetime.utcnow().isoformat()
+        }
+        if state.get("deal"):
+            system_state["deal"] = state["deal"]  # price / down / term / trade the rep has mentioned
+        # Build the complete message list
+        character = PROMPTS.get("character")
+        span.set(prompt_version=character.tag, prompt_tokens=character.tokens)
+        messages = select_context(session, route, character, system_state)
+        functions = select_functions(route.get("tools") or [])
+        span.set(messages=len(messages), tools=len(functions),
+                 context_chars=sum(len(m["content"]) for m in messages[1:]))
+    
+    log.debug("Prompt built", session_id=session["session_id"], messages=len(messages), sample=True)
+
+    # Admission control: past the queue/latency threshold, answer without the LLM
+    shed_reason = ADMISSION.shed_reason(llm.LIMITER.queue_depth())
+    if shed_reason:
+        tracing.set_attributes(shed=shed_reason)
+        return shed_turn(session, text, reply_to, shed_reason)
+
+    # Budgets: past the soft limit use the cheaper model, past the hard one skip the LLM
+    fair_key = llm.fair_key(session)
+    budget = usage.budget_state(session, fair_key)
+    model = usage.DOWNGRADE_MODEL if budget == "soft" else None
+    if budget != "ok":
+        tracing.set_attributes(budget=budget)
+        log.info("Session over budget", session_id=session["session_id"], user=fair_key, budget=budget)
+    if budget == "hard":
+        assistant_text = shed_answer(text, usage.BUDGET_MESSAGE)
+        post_reply(session, assistant_text, reply_to)
+        return assistant_text
+
+    # Call OpenAI (with function calling)
+    ai = run_openai(messages, fair_key, route, model,
+                    shared=is_cacheable(text) and not state.get("scenario"), prompt=character,
+                    functions=functions)
+    msg = ai["choices"][0]["message"]
+    if ai.get("fallback"):
+        tracing.set_attributes(fallback=True)
+    else:
+        usage.LEDGER.record(session, fair_key, cls, ai)
+    followup_params = routing.completion_params(routing.route_for("followup"), model)
+
+    # Tool calls
+    if "function_call" in msg and msg["function_call"]:
+        fn = msg["function_call"]["name"]
+        args_json = msg["function_call"].get("arguments") or "{}"
+        try:
+            args = json.loads(args_json)
+        except json.JSONDecodeError:
+            args = {}
+
+        if fn == "append_daily_log":
+            with tracing.span("turn.tool", tool=fn, sheet_tab="DailyLog") as span:
+                try:
+                    result = daily_log_append_or_update(
+                        user=args.get("user", session["user_name"]),
+                        ups=args.get("ups", ""),
+                        calls=args.get("calls", ""),
+                        followups=args.get("followups", ""),
+                        appointments=args.get("appointments", "")
+                    )
+                    span.set(ok=result.get("ok"), mode=result.get("mode"))
+                    if result.get("ok"):
+                        state["flow"] = ""
+                    messages.append(msg)
+                    messages.append({"role": "function", "name": "append_daily_log", "content": json.dumps(result)})
+                except Exception as e:
+                    log.error("Error in append_daily_log", error=str(e))
+                    span.set(ok=False, error=str(e))
+                    messages.append(msg)
+                    messages.append({
+                        "role": "function", 
+                        "name": "append_daily_log", 
+                        "content": json.dumps({
+                            "ok": False, 
+                            "error": f"Error logging data: {str(e)}"
+                        })
+                    })
+            
+            with tracing.span("turn.followup", tool=fn):
+                try:
+                    ai = llm.chat_completion(fair_key, messages=messages, **followup_params)
+                    usage.LEDGER.record(session, fair_key, cls, ai)
+                    record_completion(character, ai)
+                    msg = ai["choices"][0]["message"]
+                except Exception as e:
+                    log.error("Error in OpenAI API call after append_daily_log", error=str(e))
+                    msg = {"content": "I've recorded your daily log, but encountered an error processing the final response."}
+
+        elif fn == "log_session_turn":
+            with tracing.span("turn.tool", tool=fn, sheet_tab=sanitize_sheet_title(session["session_id"])) as span:
+                try:
+                    result = session_log_append(
+                        session_id=session["session_id"],
+                        user_name=session["user_name"],
+                        scenario=state.get("scenario",""),
+                        step=int(args.get("step", state.get("step", 0))),
+                        target_payment=args.get("target_payment", state.get("target")),
+                        offer_payment=args.get("offer_payment", state.get("offer")),
+                        band=args.get("band", state.get("band", "")),
+                        message=args.get("message", text)
+                    )
+                    span.set(ok=result.get("ok"))
+                    messages.append(msg)
+                    messages.append({"role": "function", "name": "log_session_turn", "content": json.dumps(result)})
+                except Exception as e:
+                    log.error("Error in log_session_turn", error=str(e))
+                    span.set(ok=False, error=str(e))
+                    messages.append(msg)
+                    messages.append({"role": "function", "name": "log_session_turn", "content": json.dumps({"ok": False, "error": str(e)})})
+            with tracing.span("turn.followup", tool=fn):
+                ai = llm.chat_completion(fair_key, messages=messages, **followup_params)
+                usage.LEDGER.record(session, fair_key, cls, ai)
+                record_completion(character, ai)
+                msg = ai["choices"][0]["message"]
+
+    assistant_text = msg.get("content") or FAILED_MESSAGE
+    # Remember stateless command answers for when we have to shed load
+    if (msg.get("content") and not state.get("scenario") and not state.get("flow")
+            and not ai.get("fallback") and not msg.get("function_call")):
+        RESPONSE_CACHE.put(text, assistant_text, character.tag)
+
+    # Increment step for roleplay
+    if state.get("scenario"):
+        state["step"] = min(int(state.get("step", 0)) + 1, 10)
+
+    post_reply(session, assistant_text, reply_to)
+
+    # Best-effort per-turn session log
+    with tracing.span("turn.session_log", sheet_tab=sanitize_sheet_title(session["session_id"])) as span:
+        try:
+            result = session_log_append(
+                session_id=session["session_id"],
+                user_name=session["user_name"],
+                scenario=state.get("scenario",""),
+                step=int(state.get("step", 0)),
+                target_payment=state.get("target"),
+                offer_payment=state.get("offer"),
+                band=state.get("band",""),
+                message=assistant_text
+            )
+            span.set(ok=result.get("ok"))
+            if not result.get("ok"):
+                log.warning("Failed to log session", error=result.get("error"))
+        except Exception as e:
+            log.error("Error logging session", error=str(e))
+            span.set(ok=False, error=str(e))
+            # Don't show error to user, just silently log it
+
+    return assistant_text
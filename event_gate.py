@@ -0,0 +1,133 @@
+# event_gate.py
+"""
+Idempotency and in-flight control for chat component events.
+
+The component sends a client-generated ``event_id`` with every action. The
+gate remembers a bounded window of recently seen ids per session, so the
+same event delivered again (Streamlit returns the last component value on
+every rerun) is dropped, while the same command sent twice is not. A
+per-session lock serializes turns: a second event arriving while a turn is
+in flight waits its turn instead of firing an overlapping LLM call.
+"""
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+import logs
+
+log = logs.get_logger("event_gate")
+
+EVENT_WINDOW = 256          # Event ids remembered per session
+MAX_TRACKED_SESSIONS = 10000
+INFLIGHT_TIMEOUT = 120.0    # Seconds a queued event waits for the running turn
+
+
+class _SessionGate:
+    __slots__ = ("seen", "lock", "waiting")
+
+    def __init__(self):
+        self.seen: "OrderedDict[str, bool]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.waiting = 0
+
+
+class EventGate:
+    def __init__(self, window: int = EVENT_WINDOW, max_sessions: int = MAX_TRACKED_SESSIONS):
+        self.window = window
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, _SessionGate]" = OrderedDict()
+
+    def _get(self, session_id: str) -> _SessionGate:
+        # Caller holds self._lock
+        gate = self._sessions.get(session_id)
+        if gate is None:
+            gate = self._sessions[session_id] = _SessionGate()
+            self._evict()
+        else:
+            self._sessions.move_to_end(session_id)
+        return gate
+
+    def _evict(self) -> None:
+        # Drop least recently used sessions that have nothing in flight
+        for sid in list(self._sessions):
+            if len(self._sessions) <= self.max_sessions:
+                break
+            g = self._sessions[sid]
+            if not g.lock.locked() and g.waiting == 0:
+                del self._sessions[sid]
+
+    def seen(self, session_id: str, event_id: str) -> bool:
+        """Check-and-record: True if this event id was already accepted for the session."""
+        with self._lock:
+            gate = self._get(session_id)
+            if event_id in gate.seen:
+                gate.seen.move_to_end(event_id)
+                return True
+            gate.seen[event_id] = True
+            while len(gate.seen) > self.window:
+                gate.seen.popitem(last=False)
+            return False
+
+    def forget(self, session_id: str, event_id: str) -> None:
+        """Remove an id so a client retry of the same event is accepted."""
+        with self._lock:
+            gate = self._sessions.get(session_id)
+            if gate is not None:
+                gate.seen.pop(event_id, None)
+
+    def in_flight(self, session_id: str) -> bool:
+        with self._lock:
+            gate = self._sessions.get(session_id)
+            return bool(gate and gate.lock.locked())
+
+    @contextmanager
+    def turn(self, session_id: str, event_id: Optional[str]) -> Iterator[bool]:
+        """
+        Admit one event for processing. Yields False for duplicates (and for
+        events that timed out waiting behind a running turn); otherwise holds
+        the session's in-flight lock for the duration of the block.
+        """
+        if event_id and self.seen(session_id, event_id):
+            yield False
+            return
+
+        with self._lock:
+            gate = self._get(session_id)
+            gate.waiting += 1
+        try:
+            acquired = gate.lock.acquire(timeout=INFLIGHT_TIMEOUT)
+        finally:
+            with self._lock:
+                gate.waiting -= 1
+
+        if not acquired:
+            log.warning("Timed out waiting for the in-flight turn", session_id=session_id, event_id=event_id)
+            if event_id:
+                self.forget(session_id, event_id)
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            gate.lock.release()
+
+
+# Process-wide gate shared by all Streamlit sessions
+GATE = EventGate()
+
+
+def remember_event(session: Dict, event_id: str, window: int = 32) -> bool:
+    """
+    Record an event id on the session record itself. The gate above is
+    per-process; this copy travels with the session through the shared store,
+    so a duplicate delivered to another worker is still recognised.
+    Returns False if the id was already recorded.
+    """
+    recent = session.setdefault("recent_events", [])
+    if event_id in recent:
+        return False
+    recent.append(event_id)
+    del recent[:-window]
+    return True
@@ -0,0 +1,150 @@
+# hedging.py
+"""
+Hedged requests for tail latency.
+
+    response = HEDGER.call(lambda: openai.ChatCompletion.create(**kwargs), model, may_hedge)
+
+The primary request runs on a small thread pool. If it hasn't answered
+within the hedge delay — the AGBOT_HEDGE_PERCENTILE latency of recent calls
+for that model, never less than AGBOT_HEDGE_MIN_DELAY — a duplicate is sent
+and whichever finishes first wins. The loser is cancelled if it hasn't
+started and otherwise left to finish (a non-streaming completion can't be
+aborted mid-flight); either way it is handed to the caller's ``on_loser``,
+which accounts for what it spent. At most AGBOT_HEDGE_MAX_RATE of the calls in the last five
+minutes are hedged, so the extra spend stays bounded. Off unless AGBOT_HEDGE=1.
+Completions aren't streamed here, so the delay is measured to the full
+response rather than the first token.
+
+Context variables (the current tracing span) don't follow work onto pool
+threads by themselves; each request runs in a copy of the caller's context.
+"""
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Callable, Deque, Dict, Optional
+
+import metrics
+import tracing
+
+ENABLED = os.getenv("AGBOT_HEDGE", "0") == "1"
+PERCENTILE = float(os.getenv("AGBOT_HEDGE_PERCENTILE", "95"))
+MIN_DELAY = float(os.getenv("AGBOT_HEDGE_MIN_DELAY", "1.0"))
+MAX_RATE = float(os.getenv("AGBOT_HEDGE_MAX_RATE", "0.05"))
+POOL_SIZE = int(os.getenv("AGBOT_HEDGE_POOL", "32"))
+SAMPLE_WINDOW = 200   # Recent latencies kept per model
+MIN_SAMPLES = 20      # Below this, use MIN_DELAY x 4 (don't hedge on a guess)
+RATE_WINDOW_SECONDS = 300.0  # The hedge-rate cap is measured over this window
+
+HEDGES = metrics.Counter("agbot_llm_hedges_total", "Hedged OpenAI requests", ["model", "outcome"])
+
+
+class Hedger:
+    def __init__(self, enabled: bool = ENABLED, percentile: float = PERCENTILE,
+                 min_delay: float = MIN_DELAY, max_rate: float = MAX_RATE, pool_size: int = POOL_SIZE):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_rate = max_rate
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._calls: Deque[float] = deque()   # Start times of recent calls
+        self._hedges: Deque[float] = deque()  # Start times of recent hedges
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_size = pool_size
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self._pool_size, thread_name_prefix="llm-hedge")
+            return self._pool
+
+    def record(self, model: str, seconds: float) -> None:
+        with self._lock:
+            self._latencies.setdefault(model, deque(maxlen=SAMPLE_WINDOW)).append(seconds)
+
+    def delay(self, model: str) -> float:
+        with self._lock:
+            samples = sorted(self._latencies.get(model) or ())
+        if len(samples) < MIN_SAMPLES:
+            return self.min_delay * 4
+        k = min(len(samples) - 1, int(round((len(samples) - 1) * self.percentile / 100.0)))
+        return max(self.min_delay, samples[k])
+
+    def _count_call(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._calls.append(now)
+            for q in (self._calls, self._hedges):
+                while q and now - q[0] > RATE_WINDOW_SECONDS:
+                    q.popleft()
+
+    def _take_hedge_slot(self) -> bool:
+        """True (and counted) if one more hedge stays within max_rate of recent calls."""
+        with self._lock:
+            if self.max_rate <= 0 or len(self._hedges) + 1 > self.max_rate * len(self._calls):
+                return False
+            self._hedges.append(time.monotonic())
+            return True
+
+    def _submit(self, fn: Callable[[], Any], model: str) -> Future:
+        ctx = contextvars.copy_context()
+
+        def timed():
+            started = time.monotonic()
+            result = ctx.run(fn)
+            self.record(model, time.monotonic() - started)
+            return result
+        return self._executor().submit(timed)
+
+    def call(self, fn: Callable[[], Any], model: str,
+             may_hedge: Callable[[], bool] = lambda: True,
+             on_loser: Optional[Callable[[Future], None]] = None) -> Any:
+        """Run ``fn``, hedging once if it is slow. ``may_hedge`` is asked before
+        the duplicate is sent (e.g. to reserve rate-limit budget for it).
+        ``on_loser`` gets each request that didn't win, once a winner is
+        picked: cancelled if it never started, else failed, done or running."""
+        if not self.enabled:
+            started = time.monotonic()
+            result = fn()
+            self.record(model, time.monotonic() - started)
+            return result
+
+        self._count_call()
+        primary = self._submit(fn, model)
+        try:
+            return primary.result(timeout=self.delay(model))
+        except FutureTimeout:
+            pass
+
+        if not self._take_hedge_slot():
+            HEDGES.labels(model=model, outcome="capped").inc()
+            return primary.result()
+        if not may_hedge():
+            HEDGES.labels(model=model, outcome="no_budget").inc()
+            return primary.result()
+
+        HEDGES.labels(model=model, outcome="fired").inc()
+        tracing.set_attributes(hedged=True)
+        hedge = self._submit(fn, model)
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                if f.exception() is None:
+                    for other in {primary, hedge} - {f}:
+                        other.cancel()
+                        if on_loser is not None:
+                            on_loser(other)
+                    HEDGES.labels(model=model, outcome="won" if f is hedge else "primary_won").inc()
+                    tracing.set_attributes(hedge_won=f is hedge)
+                    return f.result()
+                error = error or f.exception()
+        raise error
+
+
+HEDGER = Hedger()
@@ -1,6 +1,6 @@
-import os
 import streamlit as st
-from streamlit.components.v1 import html
+
+import static_assets
 
 # =========================
 # Setup
@@ -16,31 +16,32 @@ div[data-testid="stSidebar"] {display:none;}
 </style>
 """, unsafe_allow_html=True)
 
-# Path to your React build
-build_dir = os.path.join(os.path.dirname(__file__), "elite_chat_component", "frontend", "build")
-
-# Create an iframe that points to a local HTML file
-st.markdown("""
+# The React build is served by a listener this app starts (static_assets.py);
+# workers on the same host share whichever one bound the port first.
+@st.cache_resource
+def asset_server():
+    return static_assets.start_asset_server()
+
+asset_server()
+health = static_assets.check_health()
+if not health.get("ok"):
+    st.error(f"Frontend assets unavailable: {health.get('error') or 'build not loaded'} "
+             f"(build dir: {static_assets.BUILD_DIR})")
+    st.stop()
+
+def page_host():
+    """Host the browser opened this page on (None before Streamlit 1.37)."""
+    context = getattr(st, "context", None)
+    return context.headers.get("Host") if context is not None else None
+
+try:
+    base_url = static_assets.asset_url(page_host=page_host())
+except static_assets.AssetConfigError as e:
+    st.error(str(e))
+    st.stop()
+
+st.markdown(f"""
 <div style="height: 800px; width: 100%;">
-    <iframe src="http://localhost:8000" width="100%" height="800px" frameBorder="0"></iframe>
+    <iframe src="{base_url}/" width="100%" height="800px" frameBorder="0"></iframe>
 </div>
 """, unsafe_allow_html=True)
-
-st.markdown("""
-## Instructions
-
-To view the React component:
-
-1. Open a new terminal window
-2. Navigate to your build directory with:
-   ```
-   cd "/Users/huzaifaghori/Python Projects/streamlit component/elite_chat_component/frontend/build"
-   ```
-3. Start a simple HTTP server:
-   ```
-   python -m http.server
-   ```
-4. The React app should now be visible in the iframe above
-
-This approach avoids module loading issues by serving your React app through a proper web server.
-""")
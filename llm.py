@@ -0,0 +1,178 @@
+# llm.py
+"""
+Single entry point for OpenAI chat completions. Every call the engine makes —
+the first turn completion and the follow-up after a tool call — goes
+through chat_completion(), which waits its fair turn on the process-wide
+rate limiter and backs off together with every other caller on a 429, and
+shares one upstream call with identical requests already in flight.
+"""
+import copy
+import hashlib
+import json
+import re
+import time
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional
+
+import openai
+
+import logs
+import metrics
+import recorder
+import tracing
+from admission import ADMISSION
+from rate_limiter import RateLimiter, estimate_tokens
+from hedging import HEDGER
+from singleflight import SingleFlight
+
+log = logs.get_logger("llm")
+LIMITER = RateLimiter()
+MAX_RATE_LIMIT_RETRIES = 3
+FLIGHTS = SingleFlight("llm")
+_WS_RE = re.compile(r"\s+")
+_CLIENT_OPTIONS = ("request_timeout", "api_key", "api_base")
+
+metrics.register_gauge("agbot_llm_queue_depth", "Calls waiting on the OpenAI rate limiter",
+                       lambda: LIMITER.queue_depth())
+
+
+def request_key(**kwargs) -> str:
+    """
+    Hash of a request's normalized prompt and generation parameters: whitespace
+    in message contents is collapsed and client-side options are ignored.
+    """
+    messages = [
+        {k: (_WS_RE.sub(" ", v).strip() if k == "content" and isinstance(v, str) else v) for k, v in m.items()}
+        for m in kwargs.get("messages", [])
+    ]
+    payload = {k: v for k, v in kwargs.items() if k not in _CLIENT_OPTIONS}
+    payload["messages"] = messages
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def chat_completion(fair_key: str, coalesce_key: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+    """
+    openai.ChatCompletion.create(**kwargs) behind the shared limiter.
+    ``fair_key`` identifies the rep/session whose queue the call waits in.
+    The seconds spent queued are reported in ``response["queue_wait"]``.
+
+    Identical requests already in flight (same request_key, or the same
+    caller-supplied ``coalesce_key``) share one upstream call; the copies
+    handed to the waiting callers are marked ``response["coalesced"]``.
+    """
+    record = recorder.current()
+    if record is None:
+        return _chat_completion(fair_key, coalesce_key, kwargs)
+    started = time.monotonic()
+    try:
+        response = _chat_completion(fair_key, coalesce_key, kwargs)
+    except Exception as e:
+        record.add_llm(kwargs, None, time.monotonic() - started, error=str(e))
+        raise
+    record.add_llm(kwargs, response, time.monotonic() - started)
+    return response
+
+
+def _chat_completion(fair_key: str, coalesce_key: Optional[str], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    key = coalesce_key or request_key(**kwargs)
+    with tracing.span("llm.completion", model=kwargs.get("model"), messages=len(kwargs.get("messages", [])),
+                      functions=bool(kwargs.get("functions"))) as span:
+        response, shared = FLIGHTS.do(key, lambda: _create(fair_key, kwargs, span))
+        if not shared:
+            return response
+        response = copy.deepcopy(response)
+        if coalesce_key and response["choices"][0]["message"].get("function_call"):
+            # Tool-call arguments name the leader's session: make our own call
+            span.set(coalesced=False, coalesce_miss="function_call")
+            return _create(fair_key, kwargs, span)
+        response["coalesced"] = True
+        span.set(coalesced=True)
+        return response
+
+
+def _create(fair_key: str, kwargs: Dict[str, Any], span: tracing.Span) -> Dict[str, Any]:
+    estimated = estimate_tokens(kwargs.get("messages", []), kwargs.get("max_tokens"))
+    model = str(kwargs.get("model"))
+    span.set(estimated_tokens=estimated)
+    queue_wait = 0.0
+    attempt = 0
+    losers: List[Future] = []
+    while True:
+        queue_wait += LIMITER.acquire(fair_key, estimated)
+        started = time.monotonic()
+        try:
+            response = HEDGER.call(lambda: openai.ChatCompletion.create(**kwargs), model,
+                                   may_hedge=lambda: _reserve(fair_key, estimated), on_loser=losers.append)
+            ADMISSION.record_latency(time.monotonic() - started)
+            metrics.LLM_SECONDS.labels(model=model).observe(time.monotonic() - started)
+            break
+        except openai.error.RateLimitError:
+            ADMISSION.record_latency(time.monotonic() - started)
+            metrics.LLM_ERRORS.labels(model=model, error="RateLimitError").inc()
+            if attempt == MAX_RATE_LIMIT_RETRIES:
+                span.set(retries=attempt, queue_wait_ms=round(queue_wait * 1000, 1))
+                raise
+            # Slow the whole process down, not just this caller
+            LIMITER.backoff(2 ** attempt)
+            log.warning("OpenAI rate limited; backing off", seconds=2 ** attempt, attempt=attempt + 1)
+            attempt += 1
+        except Exception as e:
+            metrics.LLM_ERRORS.labels(model=model, error=type(e).__name__).inc()
+            raise
+
+    usage = response.get("usage") or {}
+    LIMITER.settle(estimated, usage.get("total_tokens"))
+    for loser in losers:
+        _account_loser(loser, estimated, model, response)
+    response["queue_wait"] = queue_wait
+    metrics.LLM_QUEUE_SECONDS.observe(queue_wait)
+    metrics.LLM_TOKENS.labels(model=model, direction="in").inc(usage.get("prompt_tokens") or 0)
+    metrics.LLM_TOKENS.labels(model=model, direction="out").inc(usage.get("completion_tokens") or 0)
+    message = response["choices"][0]["message"]
+    span.set(
+        retries=attempt,
+        queue_wait_ms=round(queue_wait * 1000, 1),
+        prompt_tokens=usage.get("prompt_tokens"),
+        completion_tokens=usage.get("completion_tokens"),
+        function_call=(message.get("function_call") or {}).get("name"),
+    )
+    if queue_wait > 1.0:
+        log.info("OpenAI call waited in the rate limit queue", fair_key=fair_key, seconds=round(queue_wait, 2))
+    return response
+
+
+def _account_loser(loser: Future, estimated: int, model: str, response: Dict[str, Any]) -> None:
+    """
+    Account for the request that lost a hedge. One that never started gives
+    back its reservation. One that was sent is charged to the turn now, as the
+    same prompt and a reply as long as the winner's (``response["hedge_usage"]``,
+    which usage.LEDGER adds in), and settles the token bucket with its real
+    usage when it finishes.
+    """
+    if loser.cancelled() or (loser.done() and loser.exception() is not None):
+        LIMITER.settle(estimated, 0)
+        return
+    usage = response.get("usage") or {}
+    response["hedge_usage"] = {k: usage.get(k) or 0 for k in ("prompt_tokens", "completion_tokens")}
+
+    def finished(f: Future) -> None:
+        actual = {} if f.cancelled() or f.exception() is not None else (f.result().get("usage") or {})
+        LIMITER.settle(estimated, actual.get("total_tokens") or 0)
+        metrics.LLM_TOKENS.labels(model=model, direction="in").inc(actual.get("prompt_tokens") or 0)
+        metrics.LLM_TOKENS.labels(model=model, direction="out").inc(actual.get("completion_tokens") or 0)
+    loser.add_done_callback(finished)
+
+
+def _reserve(fair_key: str, tokens: int) -> bool:
+    """Take rate-limit budget for a hedge only if it's available right now."""
+    try:
+        LIMITER.acquire(fair_key, tokens, timeout=0)
+        return True
+    except TimeoutError:
+        return False
+
+
+def fair_key(session: Dict[str, Any]) -> str:
+    """Queue per named rep; unnamed reps ("User") are told apart by session."""
+    name = (session.get("user_name") or "").strip()
+    return name.lower() if name and name != "User" else session.get("session_id", "anonymous")
@@ -0,0 +1,238 @@
+# logs.py
+"""
+Leveled, structured, non-blocking logging.
+
+    log = logs.get_logger("engine")
+    log.info("OpenAI call ok", model="gpt-4o", ms=812)
+    log.debug("Prompt roles", roles=roles, sample=True)   # hot path: sampled
+
+Records go onto a bounded in-memory queue and a background listener thread
+formats and writes them, so a turn never blocks on stderr. When the queue is
+full, records are dropped (and counted) rather than stalling the caller.
+
+Debug lines marked ``sample=True`` are kept at AGBOT_LOG_SAMPLE_RATE (a
+fraction, default 0.1); set it to 1 for every line.
+
+jsonl_sink() gives other data streams (trace spans, turn cassettes) the same
+treatment: each record's fields are appended to a file as one JSON line by the
+sink's own writer thread. A sink over a directory writes each record to the
+file its ``file_field`` names, so one thread serves any number of files.
+
+Environment:
+  AGBOT_LOG_LEVEL        DEBUG | INFO (default) | WARNING | ERROR
+  AGBOT_LOG_FORMAT       text (default) | json
+  AGBOT_LOG_SAMPLE_RATE  share of sampled debug lines kept (default 0.1)
+  AGBOT_LOG_QUEUE        max queued records before dropping (default 10000)
+"""
+import atexit
+import datetime
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+from typing import Any, Dict, List, Optional
+
+LOG_LEVEL = os.getenv("AGBOT_LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("AGBOT_LOG_FORMAT", "text").lower()
+SAMPLE_RATE = float(os.getenv("AGBOT_LOG_SAMPLE_RATE", "0.1"))
+QUEUE_SIZE = int(os.getenv("AGBOT_LOG_QUEUE", "10000"))
+ROOT = "agbot"
+
+
+class TextFormatter(logging.Formatter):
+    """``<time> LEVEL logger message key=value ...``"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        ts = datetime.datetime.utcfromtimestamp(record.created).isoformat(timespec="milliseconds") + "Z"
+        line = f"{ts} {record.levelname:7} {record.name} {record.getMessage()}"
+        fields: Dict[str, Any] = getattr(record, "fields", None) or {}
+        if fields:
+            line += " " + " ".join(f"{k}={v!r}" if isinstance(v, str) and " " in v else f"{k}={v}"
+                                   for k, v in fields.items())
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        out: Dict[str, Any] = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "thread": record.threadName,
+        }
+        out.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            out["exc"] = self.formatException(record.exc_info)
+        return json.dumps(out, default=str, ensure_ascii=False)
+
+
+class FieldsJsonFormatter(logging.Formatter):
+    """Only the record's fields, as one compact JSON object (for data sinks)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(getattr(record, "fields", None) or {}, default=str, separators=(",", ":"))
+
+
+class JsonlDirectoryHandler(logging.Handler):
+    """Appends each record's fields, minus ``file_field``, to
+    <directory>/<fields[file_field]>. Runs on a sink's writer thread."""
+
+    def __init__(self, directory: str, file_field: str):
+        super().__init__()
+        self.directory = directory
+        self.file_field = file_field
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            fields = dict(getattr(record, "fields", None) or {})
+            name = fields.pop(self.file_field)
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, name), "a", encoding="utf-8") as f:
+                f.write(json.dumps(fields, default=str, separators=(",", ":")) + "\n")
+        except Exception:
+            self.handleError(record)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never blocks: a full queue drops the record."""
+
+    def __init__(self, q: "queue.Queue"):
+        super().__init__(q)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Format the message now (args may change later), keep structured fields
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class StructuredLogger:
+    """Thin wrapper over logging.Logger: keyword arguments become structured fields."""
+
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+
+    @property
+    def name(self) -> str:
+        return self._logger.name
+
+    def is_enabled(self, level: int) -> bool:
+        return self._logger.isEnabledFor(level)
+
+    @property
+    def debug_enabled(self) -> bool:
+        """Guard for debug lines whose fields are costly to build."""
+        return self._logger.isEnabledFor(logging.DEBUG)
+
+    def _log(self, level: int, msg: str, fields: Dict[str, Any], exc_info: Any = None) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
+        self._logger.log(level, msg, exc_info=exc_info, extra={"fields": fields}, stacklevel=3)
+
+    def debug(self, msg: str, sample: bool = False, **fields: Any) -> None:
+        if sample and SAMPLE_RATE < 1.0 and random.random() >= SAMPLE_RATE:
+            return
+        self._log(logging.DEBUG, msg, fields)
+
+    def info(self, msg: str, **fields: Any) -> None:
+        self._log(logging.INFO, msg, fields)
+
+    def warning(self, msg: str, **fields: Any) -> None:
+        self._log(logging.WARNING, msg, fields)
+
+    def error(self, msg: str, exc_info: Any = None, **fields: Any) -> None:
+        self._log(logging.ERROR, msg, fields, exc_info)
+
+    def exception(self, msg: str, **fields: Any) -> None:
+        self._log(logging.ERROR, msg, fields, True)
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_handler: Optional[DroppingQueueHandler] = None
+_configure_lock = threading.Lock()
+_sinks: Dict[str, StructuredLogger] = {}
+_sink_listeners: List[logging.handlers.QueueListener] = []
+
+
+def configure(level: str = LOG_LEVEL, fmt: str = LOG_FORMAT, stream=None) -> None:
+    """(Re)install the queue handler and writer thread with this level, format and stream."""
+    global _listener, _handler
+    with _configure_lock:
+        root = logging.getLogger(ROOT)
+        root.setLevel(getattr(logging, level.upper(), logging.INFO))
+        if _listener is not None:
+            _listener.stop()
+        if _handler is None:
+            _handler = DroppingQueueHandler(queue.Queue(maxsize=QUEUE_SIZE))
+            root.addHandler(_handler)
+            root.propagate = False
+            atexit.register(shutdown)
+        sink = logging.StreamHandler(stream or sys.stderr)
+        sink.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+        _listener = logging.handlers.QueueListener(_handler.queue, sink, respect_handler_level=False)
+        _listener.start()
+
+
+def shutdown() -> None:
+    """Flush queued records and stop the writer threads."""
+    global _listener
+    with _configure_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        while _sink_listeners:
+            _sink_listeners.pop().stop()
+        _sinks.clear()
+
+
+def jsonl_sink(path: str, file_field: Optional[str] = None) -> StructuredLogger:
+    """Logger whose records' fields are appended to ``path`` as JSON lines,
+    off the caller's thread; ``sink.info("span", **fields)`` never blocks.
+    With ``file_field``, ``path`` is a directory and each record goes to the
+    file named by that field."""
+    with _configure_lock:
+        sink = _sinks.get(path)
+        if sink is None:
+            logger = logging.getLogger(f"{ROOT}.sink.{len(_sinks)}")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            handler = DroppingQueueHandler(queue.Queue(maxsize=QUEUE_SIZE))
+            logger.addHandler(handler)
+            if file_field:
+                writer: logging.Handler = JsonlDirectoryHandler(path, file_field)
+            else:
+                writer = logging.FileHandler(path, encoding="utf-8")
+                writer.setFormatter(FieldsJsonFormatter())
+            listener = logging.handlers.QueueListener(handler.queue, writer, respect_handler_level=False)
+            listener.start()
+            _sink_listeners.append(listener)
+            if _handler is None:
+                atexit.register(shutdown)
+            sink = _sinks[path] = StructuredLogger(logger)
+        return sink
+
+
+def dropped() -> int:
+    return _handler.dropped if _handler is not None else 0
+
+
+def get_logger(name: str) -> StructuredLogger:
+    if _handler is None:
+        configure()
+    return StructuredLogger(logging.getLogger(f"{ROOT}.{name}"))
@@ -0,0 +1,297 @@
+# metrics.py
+"""
+In-process metrics in Prometheus text format, served from a small side HTTP
+listener (GET /metrics) so Prometheus can scrape each worker.
+
+    TURN_SECONDS.labels(command_class="roleplay").observe(1.42)
+
+Set AGBOT_METRICS_PORT (default 9464; 0 disables) to choose the port. The
+listener binds 127.0.0.1 (AGBOT_METRICS_HOST); set it to 0.0.0.0 for a
+Prometheus on another machine, and firewall the port.
+"""
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import logs
+import recorder
+
+log = logs.get_logger("metrics")
+
+METRICS_PORT = int(os.getenv("AGBOT_METRICS_PORT", "9464"))
+METRICS_HOST = os.getenv("AGBOT_METRICS_HOST", "127.0.0.1")
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0)
+FAST_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        REGISTRY.register(self)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class _Child:
+    def __init__(self, metric: "_Metric", key: Tuple[str, ...]):
+        self._metric = metric
+        self._key = key
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._metric.inc(amount, _key=self._key)
+
+    def set(self, value: float) -> None:
+        self._metric.set(value, _key=self._key)
+
+    def observe(self, value: float) -> None:
+        self._metric.observe(value, _key=self._key)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def labels(self, **labels: str) -> _Child:
+        return _Child(self, self._key(labels))
+
+    def inc(self, amount: float = 1.0, _key: Tuple[str, ...] = ()) -> None:
+        with self._lock:
+            self._values[_key] = self._values.get(_key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self.header() + [f"{self.name}{_labels(self.labelnames, k)} {v}" for k, v in items]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 callback: Optional[Callable[[], float]] = None):
+        super().__init__(name, help, labelnames)
+        self.callback = callback
+
+    def set(self, value: float, _key: Tuple[str, ...] = ()) -> None:
+        with self._lock:
+            self._values[_key] = value
+
+    def render(self) -> List[str]:
+        if self.callback is not None:
+            try:
+                self.set(float(self.callback()))
+            except Exception as e:
+                log.warning("Gauge callback failed", gauge=self.name, error=str(e))
+        return super().render()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[Tuple[str, ...], List[float]] = {}  # bucket counts..., sum, count
+
+    def labels(self, **labels: str) -> _Child:
+        return _Child(self, self._key(labels))
+
+    def observe(self, value: float, _key: Tuple[str, ...] = ()) -> None:
+        with self._lock:
+            row = self._values.get(_key)
+            if row is None:
+                row = self._values[_key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    row[i] += 1
+            row[-2] += value
+            row[-1] += 1
+
+    def count(self, **labels: str) -> float:
+        with self._lock:
+            row = self._values.get(self._key(labels))
+            return row[-1] if row else 0.0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._values.items()]
+        lines = self.header()
+        for key, row in items:
+            for i, bound in enumerate(self.buckets):
+                le = _labels(self.labelnames, key, 'le="%s"' % bound)
+                lines.append(f"{self.name}_bucket{le} {row[i]}")
+            le = _labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {row[-1]}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {row[-2]}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {row[-1]}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> None:
+        with self._lock:
+            self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for m in metrics:
+            lines.extend(m.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# =========================
+# Engine metrics
+# =========================
+TURN_SECONDS = Histogram("agbot_turn_seconds", "End-to-end respond_to latency", ["command_class"])
+TURNS = Counter("agbot_turns_total", "Turns handled", ["command_class", "outcome"])
+LLM_SECONDS = Histogram("agbot_llm_seconds", "OpenAI chat completion latency", ["model"])
+LLM_TOKENS = Counter("agbot_llm_tokens_total", "OpenAI tokens", ["model", "direction"])
+LLM_ERRORS = Counter("agbot_llm_errors_total", "OpenAI call failures", ["model", "error"])
+LLM_QUEUE_SECONDS = Histogram("agbot_llm_queue_seconds", "Time waiting on the rate limiter", buckets=FAST_BUCKETS)
+CACHE_REQUESTS = Counter("agbot_cache_requests_total", "Cache lookups", ["cache", "result"])
+SHEETS_CALLS = Counter("agbot_sheets_calls_total", "Google Sheets API calls", ["method", "status"])
+SHEETS_SECONDS = Histogram("agbot_sheets_seconds", "Google Sheets API call latency", ["method"], buckets=FAST_BUCKETS)
+SHEETS_INFLIGHT = Gauge("agbot_sheets_inflight", "Google Sheets calls in flight")
+RERUNS_PER_MESSAGE = Histogram("agbot_reruns_per_message", "Streamlit script runs between handled messages",
+                               buckets=COUNT_BUCKETS)
+SCRIPT_RUNS = Counter("agbot_script_runs_total", "Streamlit script runs")
+
+
+def register_gauge(name: str, help: str, callback: Callable[[], float]) -> Gauge:
+    """Gauge sampled at scrape time (queue depths, session counts)."""
+    return Gauge(name, help, callback=callback)
+
+
+def cache_result(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+# =========================
+# Side HTTP listener
+# =========================
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = REGISTRY.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+def start_http_server(port: int = METRICS_PORT, host: str = METRICS_HOST) -> Optional[ThreadingHTTPServer]:
+    """Start the /metrics listener once per process; later calls are no-ops."""
+    global _server
+    if not port:
+        return None
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), _Handler)
+            except OSError as e:
+                # Another worker on this host already owns the port
+                log.warning("Metrics listener not started", host=host, port=port, error=str(e))
+                return None
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
+            log.info("Metrics listener started", url=f"http://{host}:{port}/metrics")
+        return _server
+
+
+# =========================
+# Google Sheets call metering
+# =========================
+class MeteredService:
+    """
+    Wraps a googleapiclient service so every ``.execute()`` is counted and
+    timed under its call path, e.g. ``spreadsheets.values.append``.
+    """
+
+    def __init__(self, target, path: str = "", call_kwargs: Optional[Dict[str, Any]] = None):
+        self._target = target
+        self._path = path
+        self._kwargs = call_kwargs or {}  # Arguments of the call that built this request
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if name == "execute":
+            return self._execute(attr)
+        if not callable(attr):
+            return attr
+        path = f"{self._path}.{name}" if self._path else name
+
+        def call(*args, **kwargs):
+            return MeteredService(attr(*args, **kwargs), path, kwargs)
+        return call
+
+    def _execute(self, execute):
+        def run(*args, **kwargs):
+            status = "ok"
+            record = recorder.current()
+            SHEETS_INFLIGHT.inc()
+            started = time.perf_counter()
+            try:
+                result = execute(*args, **kwargs)
+                if record is not None:
+                    record.add_sheets(self._path, self._kwargs, result, time.perf_counter() - started)
+                return result
+            except Exception as e:
+                status = type(e).__name__
+                if record is not None:
+                    record.add_sheets(self._path, self._kwargs, None, time.perf_counter() - started, error=str(e))
+                raise
+            finally:
+                SHEETS_INFLIGHT.inc(-1)
+                SHEETS_SECONDS.labels(method=self._path).observe(time.perf_counter() - started)
+                SHEETS_CALLS.labels(method=self._path, status=status).inc()
+        return run
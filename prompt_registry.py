@@ -0,0 +1,164 @@
+# prompt_registry.py
+"""
+Versioned system prompts, loaded from files and reloaded when they change.
+
+    prompts/character/v1.txt
+    prompts/character/v2.txt   <- active: the highest version, unless pinned
+
+    prompt = PROMPTS.get("character")
+    prompt.text, prompt.version, prompt.tag   # "character@v2"
+    prompt.tokens, prompt.prefix_hash
+
+Each prompt's token count and a short hash of its text are computed once at
+load time. get() re-checks the files at most every AGBOT_PROMPT_RELOAD
+seconds; an edited or newly added version is picked up by the next turn of
+every session, with no restart. A file that fails to load keeps the version
+already in memory.
+
+Each app asks for its prompt under its own name and may default to its own
+version (streamlit_app runs character@v1, its original text). A version is
+chosen in this order:
+1. an explicit ``version``;
+2. the app's pin in AGBOT_PROMPT_PINS, e.g. '{"streamlit_app.character": "v2"}';
+3. the app's default;
+4. the prompt-wide pin, e.g. '{"character": "v1"}';
+5. the newest file.
+A prompt-wide pin therefore moves only apps without a default of their own.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import logs
+import metrics
+from rate_limiter import CHARS_PER_TOKEN
+
+try:
+    import tiktoken  # Optional: exact token counts instead of the chars/4 estimate
+except ImportError:
+    tiktoken = None
+
+PROMPT_DIR = os.getenv("AGBOT_PROMPT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompts"))
+RELOAD_SECONDS = float(os.getenv("AGBOT_PROMPT_RELOAD", "2"))
+PINS: Dict[str, str] = json.loads(os.getenv("AGBOT_PROMPT_PINS", "{}"))
+_VERSION_RE = re.compile(r"^v(\d+)\.(?:txt|md)$")
+
+log = logs.get_logger("prompts")
+
+PROMPT_TOKENS = metrics.Gauge("agbot_prompt_tokens", "Token count of each loaded prompt version",
+                              ["prompt", "version"])
+PROMPT_COMPLETIONS = metrics.Counter("agbot_prompt_completions_total", "Completions by system prompt version",
+                                     ["prompt", "version"])
+PROMPT_RELOADS = metrics.Counter("agbot_prompt_reloads_total", "Prompt files (re)loaded", ["prompt", "result"])
+
+
+class Prompt(NamedTuple):
+    name: str
+    version: str
+    text: str
+    tokens: int
+    prefix_hash: str   # Stands in for the text in cache and coalescing keys
+
+    @property
+    def tag(self) -> str:
+        return f"{self.name}@{self.version}"
+
+
+def count_tokens(text: str) -> int:
+    if tiktoken is not None:
+        return len(tiktoken.get_encoding("cl100k_base").encode(text))
+    return len(text) // CHARS_PER_TOKEN
+
+
+class PromptRegistry:
+    def __init__(self, root: str = PROMPT_DIR, pins: Optional[Dict[str, str]] = None,
+                 reload_seconds: float = RELOAD_SECONDS):
+        self.root = root
+        self.pins = dict(PINS if pins is None else pins)
+        self.reload_seconds = reload_seconds
+        self._lock = threading.Lock()
+        self._loaded: Dict[Tuple[str, str], Tuple[float, Prompt]] = {}  # (name, version) -> (mtime, prompt)
+        self._checked = 0.0
+
+    def _scan(self) -> None:
+        """Load new and changed prompt files. Caller holds the lock."""
+        try:
+            names = sorted(n for n in os.listdir(self.root) if os.path.isdir(os.path.join(self.root, n)))
+        except OSError as e:
+            log.error("Prompt directory unreadable", root=self.root, error=str(e))
+            return
+        for name in names:
+            folder = os.path.join(self.root, name)
+            for filename in os.listdir(folder):
+                m = _VERSION_RE.match(filename)
+                if not m:
+                    continue
+                version = "v" + m.group(1)
+                path = os.path.join(folder, filename)
+                try:
+                    mtime = os.path.getmtime(path)
+                    known = self._loaded.get((name, version))
+                    if known and known[0] == mtime:
+                        continue
+                    with open(path, encoding="utf-8") as f:
+                        text = f.read()
+                    if not text.strip():
+                        raise ValueError("empty prompt file")
+                except (OSError, ValueError) as e:
+                    PROMPT_RELOADS.labels(prompt=name, result="error").inc()
+                    log.error("Prompt file not loaded", path=path, error=str(e))
+                    continue
+                prompt = Prompt(name, version, text, count_tokens(text),
+                                hashlib.sha256(text.encode("utf-8")).hexdigest()[:16])
+                self._loaded[(name, version)] = (mtime, prompt)
+                PROMPT_TOKENS.labels(prompt=name, version=version).set(prompt.tokens)
+                PROMPT_RELOADS.labels(prompt=name, result="loaded").inc()
+                log.info("Prompt loaded", prompt=prompt.tag, tokens=prompt.tokens, prefix_hash=prompt.prefix_hash,
+                         reload=known is not None)
+
+    def _refresh(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._checked and now - self._checked < self.reload_seconds:
+                return
+            self._checked = now
+            self._scan()
+
+    def versions(self, name: str) -> List[str]:
+        self._refresh()
+        with self._lock:
+            return sorted((v for n, v in self._loaded if n == name), key=lambda v: int(v[1:]))
+
+    def get(self, name: str, version: Optional[str] = None, app: Optional[str] = None,
+            default: Optional[str] = None) -> Prompt:
+        """The version of ``name`` that ``app`` should run (see module docstring)."""
+        version = version or (app and self.pins.get(f"{app}.{name}")) or default or self.pins.get(name)
+        if version is None:
+            available = self.versions(name)
+            if not available:
+                raise KeyError(f"No prompt files for {name!r} under {self.root}")
+            version = available[-1]
+        else:
+            self._refresh()
+        with self._lock:
+            loaded = self._loaded.get((name, version))
+        if loaded is None:
+            raise KeyError(f"Prompt {name}@{version} not found under {self.root}")
+        return loaded[1]
+
+    def text(self, name: str, app: Optional[str] = None, default: Optional[str] = None) -> str:
+        return self.get(name, app=app, default=default).text
+
+
+def record_completion(prompt: Prompt, response: Optional[Dict] = None) -> None:
+    """Count a completion made under ``prompt`` and tag ``response`` with its version."""
+    PROMPT_COMPLETIONS.labels(prompt=prompt.name, version=prompt.version).inc()
+    if isinstance(response, dict):
+        response["prompt_version"] = prompt.tag
+
+
+PROMPTS = PromptRegistry()
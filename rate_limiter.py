@@ -0,0 +1,156 @@
+# rate_limiter.py
+"""
+Process-wide OpenAI rate limiter.
+
+Two token buckets track the org budgets — requests/min and tokens/min — and
+refill continuously. Callers wait in per-user queues that are served
+round-robin, so one rep's burst of turns can't starve the rest of the room,
+and the combined request rate stays just under the quota instead of
+tripping 429s for everyone.
+"""
+import os
+import time
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, Any, List, Optional
+
+DEFAULT_RPM = int(os.getenv("AGBOT_OPENAI_RPM", "500"))
+DEFAULT_TPM = int(os.getenv("AGBOT_OPENAI_TPM", "30000"))
+BURST_SECONDS = float(os.getenv("AGBOT_OPENAI_BURST_SECONDS", "10"))  # Bucket size, in seconds of budget
+DEFAULT_COMPLETION_TOKENS = 400  # Reserved when a call sets no max_tokens
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(messages: List[Dict[str, Any]], max_tokens: Optional[int] = None) -> int:
+    """Cheap upfront estimate (prompt chars / 4 + completion reserve); settled with real usage later."""
+    chars = sum(len(str(m.get("content") or "")) for m in messages)
+    return chars // CHARS_PER_TOKEN + len(messages) * 4 + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+
+class _Bucket:
+    __slots__ = ("rate", "capacity", "level", "stamp")
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * BURST_SECONDS)
+        self.level = self.capacity
+        self.stamp = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+    def wait_for(self, amount: float) -> float:
+        """Seconds until ``amount`` is available (0 if it already is)."""
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+
+class _Waiter:
+    __slots__ = ("key", "tokens", "enqueued")
+
+    def __init__(self, key: str, tokens: int):
+        self.key = key
+        self.tokens = tokens
+        self.enqueued = time.monotonic()
+
+
+class RateLimiter:
+    def __init__(self, rpm: int = DEFAULT_RPM, tpm: int = DEFAULT_TPM):
+        self.requests = _Bucket(rpm)
+        self.tokens = _Bucket(tpm)
+        self._cond = threading.Condition()
+        self._queues: "OrderedDict[str, deque]" = OrderedDict()  # Round-robin order of keys
+        self._paused_until = 0.0
+        # Stats
+        self.admitted = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.last_wait = 0.0
+
+    def _head(self) -> Optional[_Waiter]:
+        for q in self._queues.values():
+            if q:
+                return q[0]
+        return None
+
+    def acquire(self, key: str, tokens: int, timeout: Optional[float] = None) -> float:
+        """
+        Block until this caller's turn comes up and both budgets allow the
+        request. Returns the seconds spent queued. Raises TimeoutError if
+        ``timeout`` elapses first.
+        """
+        waiter = _Waiter(key or "anonymous", tokens)
+        deadline = None if timeout is None else waiter.enqueued + timeout
+        with self._cond:
+            self._queues.setdefault(waiter.key, deque()).append(waiter)
+            try:
+                while True:
+                    now = time.monotonic()
+                    if self._head() is waiter:
+                        self.requests.refill(now)
+                        self.tokens.refill(now)
+                        delay = max(self.requests.wait_for(1),
+                                    self.tokens.wait_for(waiter.tokens),
+                                    self._paused_until - now)
+                        if delay <= 0:
+                            break
+                    else:
+                        delay = None
+                    if deadline is not None:
+                        if now >= deadline:
+                            raise TimeoutError("Timed out waiting for OpenAI rate limit")
+                        delay = deadline - now if delay is None else min(delay, deadline - now)
+                    self._cond.wait(delay)
+
+                self.requests.level -= 1
+                self.tokens.level -= min(waiter.tokens, self.tokens.capacity)
+                # Served: this key goes to the back of the rotation
+                q = self._queues.pop(waiter.key)
+                q.popleft()
+                if q:
+                    self._queues[waiter.key] = q
+            except BaseException:
+                q = self._queues.get(waiter.key)
+                if q and waiter in q:
+                    q.remove(waiter)
+                    if not q:
+                        del self._queues[waiter.key]
+                self._cond.notify_all()
+                raise
+
+            waited = time.monotonic() - waiter.enqueued
+            self.admitted += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            self.last_wait = waited
+            self._cond.notify_all()
+            return waited
+
+    def settle(self, estimated: int, actual: Optional[int]) -> None:
+        """Correct the token bucket once the real usage is known."""
+        if actual is None:
+            return
+        with self._cond:
+            self.tokens.level -= (actual - estimated)
+            self._cond.notify_all()
+
+    def backoff(self, seconds: float) -> None:
+        """Hold all admissions after an upstream 429."""
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def queue_depth(self) -> int:
+        with self._cond:
+            return sum(len(q) for q in self._queues.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "queued": sum(len(q) for q in self._queues.values()),
+                "queued_by_key": {k: len(q) for k, q in self._queues.items() if q},
+                "admitted": self.admitted,
+                "wait_avg": self.wait_total / self.admitted if self.admitted else 0.0,
+                "wait_max": self.wait_max,
+                "wait_last": self.last_wait,
+            }
@@ -0,0 +1,172 @@
+# recorder.py
+"""
+Turn recording for offline replay (see tools/replay.py).
+
+With AGBOT_RECORD_DIR set, every engine.respond_to call appends one JSON
+line to <dir>/<session_id>.jsonl (a "cassette"):
+
+    {"type": "session", "session": {...}}    # once per session per process, before its first turn
+    {"type": "turn", "text": "...", "reply_to": null, "command_class": "roleplay",
+     "state_before": {...}, "state_after": {...}, "reply": "...", "error": null,
+     "seconds": 1.23, "llm": [...], "sheets": [...]}
+
+"llm" holds each chat completion the turn asked for: the request (messages
+longer than COMPACT_CHARS, such as CHARACTER, are stored as a hash and
+length), the full response and its latency. "sheets" holds each Sheets
+.execute() with its method path, arguments, result and latency. Lines are
+queued to a logs.py writer thread, so a turn never waits on the disk, and
+recording never fails a turn: a full queue or a write error drops the line.
+
+The process remembers which sessions it has written a snapshot for, up to
+MAX_TRACKED_SESSIONS, dropping the least recently active. A dropped session
+that comes back gets a fresh snapshot line, which replay picks up as its new
+starting point.
+"""
+import contextvars
+import copy
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import logs
+
+RECORD_DIR = os.getenv("AGBOT_RECORD_DIR", "")
+COMPACT_CHARS = 400  # Message contents longer than this are stored as a hash
+MAX_TRACKED_SESSIONS = 10000
+_REQUEST_FIELDS = ("model", "temperature", "max_tokens", "stop", "function_call")
+_FILENAME_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+log = logs.get_logger("recorder")
+
+_CURRENT: "contextvars.ContextVar[Optional[TurnRecord]]" = contextvars.ContextVar("agbot_turn_record", default=None)
+
+
+def compact_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    out = []
+    for m in messages:
+        content = m.get("content")
+        if isinstance(content, str) and len(content) > COMPACT_CHARS:
+            m = {k: v for k, v in m.items() if k != "content"}
+            m["content_sha"] = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+            m["chars"] = len(content)
+        out.append(dict(m))
+    return out
+
+
+def compact_request(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """What a completion request asked for, without client options or bulky text."""
+    request = {k: kwargs[k] for k in _REQUEST_FIELDS if kwargs.get(k) is not None}
+    request["messages"] = compact_messages(kwargs.get("messages", []))
+    if kwargs.get("functions"):
+        request["functions"] = [f.get("name") for f in kwargs["functions"]]
+    return request
+
+
+class TurnRecord:
+    def __init__(self, session: Dict[str, Any], text: str, reply_to: Optional[int], command_class: str):
+        self.text = text
+        self.reply_to = reply_to
+        self.command_class = command_class
+        self.state_before = copy.deepcopy(session.get("engine_state", {}))
+        self.reply: Optional[str] = None
+        self.llm: List[Dict[str, Any]] = []
+        self.sheets: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()  # Hedged calls report from pool threads
+
+    def add_llm(self, kwargs: Dict[str, Any], response: Optional[Dict[str, Any]],
+                seconds: float, error: Optional[str] = None) -> None:
+        entry = {"request": compact_request(kwargs), "response": copy.deepcopy(response),
+                 "seconds": round(seconds, 4), "error": error}
+        with self._lock:
+            self.llm.append(entry)
+
+    def add_sheets(self, method: str, kwargs: Dict[str, Any], result: Any,
+                   seconds: float, error: Optional[str] = None) -> None:
+        entry = {"method": method, "args": kwargs, "result": result, "seconds": round(seconds, 4), "error": error}
+        with self._lock:
+            self.sheets.append(entry)
+
+
+class Recorder:
+    def __init__(self, directory: str = RECORD_DIR, max_sessions: int = MAX_TRACKED_SESSIONS):
+        self.directory = directory
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._seen: "OrderedDict[str, bool]" = OrderedDict()  # Sessions whose snapshot this process has written
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory)
+
+    @contextmanager
+    def turn(self, session: Dict[str, Any], text: str, reply_to: Optional[int],
+             command_class: str) -> Iterator[Optional[TurnRecord]]:
+        """Record the turn run inside the block; yields None when recording is off."""
+        if not self.enabled:
+            yield None
+            return
+        session_id = session.get("session_id", "anonymous")
+        snapshot = None
+        with self._lock:
+            if session_id in self._seen:
+                self._seen.move_to_end(session_id)
+            else:
+                self._seen[session_id] = True
+                while len(self._seen) > self.max_sessions:
+                    self._seen.popitem(last=False)
+                snapshot = copy.deepcopy(session)
+        record = TurnRecord(session, text, reply_to, command_class)
+        token = _CURRENT.set(record)
+        started = time.perf_counter()
+        error = None
+        try:
+            yield record
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _CURRENT.reset(token)
+            line = {
+                "type": "turn",
+                "at": time.time(),
+                "text": text,
+                "reply_to": reply_to,
+                "command_class": command_class,
+                "state_before": record.state_before,
+                # Snapshots: the writer thread serializes the line after the session moves on
+                "state_after": copy.deepcopy(session.get("engine_state", {})),
+                "reply": record.reply,
+                "error": error,
+                "seconds": round(time.perf_counter() - started, 4),
+                "llm": list(record.llm),
+                "sheets": list(record.sheets),
+            }
+            lines = ([{"type": "session", "session": snapshot}] if snapshot is not None else []) + [line]
+            self._write(session_id, lines)
+
+    def filename(self, session_id: str) -> str:
+        return _FILENAME_RE.sub("_", session_id) + ".jsonl"
+
+    def path(self, session_id: str) -> str:
+        return os.path.join(self.directory, self.filename(session_id))
+
+    def _write(self, session_id: str, lines: List[Dict[str, Any]]) -> None:
+        try:
+            sink = logs.jsonl_sink(self.directory, file_field="cassette")  # One writer per directory
+            for line in lines:
+                sink.info("turn", cassette=self.filename(session_id), **line)
+        except Exception as e:
+            log.error("Turn not recorded", session_id=session_id, error=str(e))
+
+
+def current() -> Optional[TurnRecord]:
+    """The turn being recorded on this thread/context, if any."""
+    return _CURRENT.get()
+
+
+RECORDER = Recorder()
@@ -0,0 +1,83 @@
+# routing.py
+"""
+Model routing: each command class (see engine.command_class) gets its own
+generation profile — model, max_tokens, temperature, stop sequences and a
+latency SLO — and its own context: how many earlier messages to send
+(``history``), which tool schemas (``tools``) and whether the roleplay
+SESSION_STATE_JSON goes along (``session_state``). A stateless lookup like
+!objection spouse needs none of them; live roleplay needs all three.
+
+Cheap, fast models answer lookups and confirmations; the full model is kept
+for live roleplay and coaching. max_tokens caps generation time (CHARACTER
+asks for ~2 sentences per turn anyway) and each call's request timeout is a
+multiple of its SLO so a stalled upstream can't hold a turn indefinitely.
+
+A profile's model of None means AGBOT_MODEL. Override any field per class
+with AGBOT_ROUTES, e.g. '{"roleplay": {"model": "gpt-4o-mini", "max_tokens": 120}}'.
+"""
+import json
+import os
+from typing import Dict, Any, Optional
+
+import metrics
+
+DEFAULT_MODEL = os.getenv("AGBOT_MODEL", "gpt-4o")
+FAST_MODEL = os.getenv("AGBOT_FAST_MODEL", "gpt-4o-mini")
+TIMEOUT_FACTOR = 3.0  # Request timeout = SLO x this
+
+ROUTES: Dict[str, Dict[str, Any]] = {
+    # Lookups that CHARACTER answers near-verbatim (!help, !checkpoints, end)
+    "static":    {"model": FAST_MODEL, "max_tokens": 400, "temperature": 0.0, "stop": None, "slo_seconds": 3.0,
+                  "history": 0, "tools": [], "session_state": False},
+    # Library commands (!scripts, !earn, !trust ...) can run long
+    "command":   {"model": FAST_MODEL, "max_tokens": 700, "temperature": 0.2, "stop": None, "slo_seconds": 6.0,
+                  "history": 0, "tools": [], "session_state": False},
+    "objection": {"model": FAST_MODEL, "max_tokens": 300, "temperature": 0.4, "stop": None, "slo_seconds": 5.0,
+                  "history": 0, "tools": [], "session_state": False},
+    # !dailylog and its four answers: the model needs them all to fill in the row
+    "dailylog":  {"model": FAST_MODEL, "max_tokens": 150, "temperature": 0.0, "stop": None, "slo_seconds": 4.0,
+                  "history": 10, "tools": ["append_daily_log"], "session_state": False},
+    "coaching":  {"model": None, "max_tokens": 400, "temperature": 0.4, "stop": None, "slo_seconds": 8.0,
+                  "history": 8, "tools": [], "session_state": False},
+    # Live roleplay: the customer speaks ~2 sentences and must not write the rep's lines
+    "roleplay":  {"model": None, "max_tokens": 160, "temperature": 0.5, "stop": ["\nRep:", "\nSalesperson:"],
+                  "slo_seconds": 6.0, "history": 14, "tools": ["log_session_turn"], "session_state": True},
+    "chat":      {"model": None, "max_tokens": 250, "temperature": 0.3, "stop": None, "slo_seconds": 8.0,
+                  "history": 6, "tools": [], "session_state": True},
+    # Confirmation after a tool call ("Logged. ...")
+    "followup":  {"model": FAST_MODEL, "max_tokens": 120, "temperature": 0.2, "stop": None, "slo_seconds": 3.0},
+}
+
+for _cls, _overrides in json.loads(os.getenv("AGBOT_ROUTES", "{}")).items():
+    ROUTES.setdefault(_cls, dict(ROUTES["chat"])).update(_overrides)
+
+SLO_MISSES = metrics.Counter("agbot_slo_misses_total", "Turns slower than their route's latency SLO",
+                             ["command_class"])
+
+
+def route_for(command_class: str) -> Dict[str, Any]:
+    return ROUTES.get(command_class) or ROUTES["chat"]
+
+
+def completion_params(route: Dict[str, Any], model: Optional[str] = None) -> Dict[str, Any]:
+    """ChatCompletion.create keyword arguments for a route (``model`` overrides its model)."""
+    params = {
+        "model": model or route.get("model") or DEFAULT_MODEL,
+        "temperature": route.get("temperature", 0.3),
+    }
+    if route.get("max_tokens"):
+        params["max_tokens"] = route["max_tokens"]
+    if route.get("stop"):
+        params["stop"] = route["stop"]
+    if route.get("slo_seconds"):
+        params["request_timeout"] = route["slo_seconds"] * TIMEOUT_FACTOR
+    return params
+
+
+def check_slo(command_class: str, seconds: float) -> bool:
+    """Count a miss when a turn overran its route's SLO; True if it was within."""
+    slo = route_for(command_class).get("slo_seconds")
+    if slo and seconds > slo:
+        SLO_MISSES.labels(command_class=command_class).inc()
+        return False
+    return True
@@ -0,0 +1,469 @@
+# session_store.py
+"""
+Pluggable storage for conversation sessions (messages, engine_state, sync
+counters). A session is a plain JSON-serializable dict keyed by
+``session_id``; the Streamlit tab only holds the id, so a dropped socket, a
+page reload or a reconnect routed to another worker process can pick the
+conversation back up.
+
+Stores:
+  * MemorySessionStore  – bounded LRU in process memory.
+  * SQLiteSessionStore  – durable tier on local disk, shareable by every
+                          worker process on the host.
+  * RedisSessionStore   – shared tier for workers on several hosts (needs the
+                          optional ``redis`` package; a fakeredis server works
+                          as a local stand-in).
+  * TieredSessionStore  – LRU in front of a shared tier, write-through. Each
+                          read checks the shared version so a copy cached by
+                          this worker is never served stale.
+
+Shared tiers hold sessions as zlib-compressed compact JSON and provide a
+cross-process per-session lock, so any worker can serve any turn.
+
+An IdleSweeper thread evicts sessions that have been idle longer than the
+configured TTL from memory (they stay restorable from the shared tier) and
+purges rows past the retention window.
+"""
+import os
+import json
+import time
+import uuid
+import zlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Callable, Iterator, List, Union
+
+import logs
+import metrics
+
+try:
+    import redis  # Optional: only needed for AGBOT_SESSION_STORE=redis
+except ImportError:
+    redis = None
+
+Session = Dict[str, Any]
+log = logs.get_logger("session_store")
+
+DEFAULT_MAX_SESSIONS = int(os.getenv("AGBOT_SESSION_MAX", "2000"))
+DEFAULT_IDLE_SECONDS = int(os.getenv("AGBOT_SESSION_IDLE", str(30 * 60)))
+DEFAULT_RETENTION_SECONDS = int(os.getenv("AGBOT_SESSION_RETENTION", str(7 * 24 * 3600)))
+DEFAULT_SWEEP_SECONDS = int(os.getenv("AGBOT_SESSION_SWEEP", "60"))
+LOCK_LEASE_SECONDS = 180.0   # A crashed worker's lock expires after this
+LOCK_TIMEOUT_SECONDS = 120.0
+LOCK_POLL_SECONDS = 0.05
+
+
+def dumps(session: Session) -> str:
+    return json.dumps(session, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data: str) -> Session:
+    return json.loads(data)
+
+
+def encode(session: Session) -> bytes:
+    """Compact wire/disk format: compressed JSON without whitespace."""
+    return zlib.compress(dumps(session).encode("utf-8"), 6)
+
+
+def decode(data: Union[bytes, str]) -> Session:
+    if isinstance(data, str):
+        return loads(data)
+    return loads(zlib.decompress(data).decode("utf-8"))
+
+
+def session_size(session: Session) -> int:
+    """Approximate memory footprint of a session: its serialized size in bytes."""
+    return len(dumps(session).encode("utf-8"))
+
+
+def _lock_owner() -> str:
+    return f"{os.getpid()}-{threading.get_ident()}-{uuid.uuid4().hex[:8]}"
+
+
+class SessionStore:
+    """Interface every backend implements."""
+
+    def get(self, session_id: str) -> Optional[Session]:
+        raise NotImplementedError
+
+    def put(self, session: Session) -> None:
+        raise NotImplementedError
+
+    def delete(self, session_id: str) -> None:
+        raise NotImplementedError
+
+    def version(self, session_id: str) -> Optional[int]:
+        """Current stored version of a session, or None if unknown."""
+        return None
+
+    @contextmanager
+    def lock(self, session_id: str, timeout: float = LOCK_TIMEOUT_SECONDS) -> Iterator[None]:
+        """Exclusive access to one session for the duration of a turn."""
+        yield
+
+    def evict_idle(self, idle_seconds: float) -> List[str]:
+        """Drop sessions idle longer than ``idle_seconds``; return their ids."""
+        return []
+
+    def memory_report(self) -> Dict[str, int]:
+        """Bytes held in process memory per session id."""
+        return {}
+
+    def close(self) -> None:
+        pass
+
+
+class MemorySessionStore(SessionStore):
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS,
+                 on_evict: Optional[Callable[[Session], None]] = None):
+        self.max_sessions = max_sessions
+        self.on_evict = on_evict
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self._session_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, session_id: str) -> Optional[Session]:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def put(self, session: Session) -> None:
+        session["last_seen"] = time.time()
+        evicted = []
+        with self._lock:
+            self._sessions[session["session_id"]] = session
+            self._sessions.move_to_end(session["session_id"])
+            while len(self._sessions) > self.max_sessions:
+                evicted.append(self._sessions.popitem(last=False)[1])
+        for s in evicted:
+            if self.on_evict:
+                self.on_evict(s)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    @contextmanager
+    def lock(self, session_id: str, timeout: float = LOCK_TIMEOUT_SECONDS) -> Iterator[None]:
+        with self._lock:
+            lk = self._session_locks.setdefault(session_id, threading.Lock())
+        if not lk.acquire(timeout=timeout):
+            raise TimeoutError(f"Timed out waiting for session lock {session_id}")
+        try:
+            yield
+        finally:
+            lk.release()
+
+    def evict_idle(self, idle_seconds: float) -> List[str]:
+        cutoff = time.time() - idle_seconds
+        with self._lock:
+            idle = [sid for sid, s in self._sessions.items() if s.get("last_seen", 0) < cutoff]
+            evicted = [self._sessions.pop(sid) for sid in idle]
+            for sid in idle:
+                lk = self._session_locks.get(sid)
+                if lk is not None and not lk.locked():
+                    del self._session_locks[sid]
+        for s in evicted:
+            if self.on_evict:
+                self.on_evict(s)
+        return idle
+
+    def memory_report(self) -> Dict[str, int]:
+        with self._lock:
+            sessions = list(self._sessions.values())
+        return {s["session_id"]: session_size(s) for s in sessions}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class SQLiteSessionStore(SessionStore):
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            " session_id TEXT PRIMARY KEY,"
+            " data BLOB NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " version INTEGER NOT NULL DEFAULT 0)"
+        )
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(sessions)")]
+        if "version" not in columns:
+            conn.execute("ALTER TABLE sessions ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+        conn.execute("CREATE INDEX IF NOT EXISTS sessions_updated_at ON sessions(updated_at)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS session_locks ("
+            " session_id TEXT PRIMARY KEY,"
+            " owner TEXT NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread; Streamlit runs each script on its own thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, session_id: str) -> Optional[Session]:
+        row = self._conn().execute(
+            "SELECT data, version FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if not row:
+            return None
+        session = decode(row[0])
+        session["version"] = row[1]
+        return session
+
+    def version(self, session_id: str) -> Optional[int]:
+        row = self._conn().execute(
+            "SELECT version FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, session: Session) -> None:
+        now = time.time()
+        session["last_seen"] = now
+        session["version"] = int(session.get("version") or 0) + 1
+        conn = self._conn()
+        conn.execute(
+            "INSERT INTO sessions (session_id, data, updated_at, version) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT(session_id) DO UPDATE SET data = excluded.data,"
+            " updated_at = excluded.updated_at, version = excluded.version",
+            (session["session_id"], encode(session), now, session["version"]),
+        )
+        conn.commit()
+
+    def delete(self, session_id: str) -> None:
+        conn = self._conn()
+        conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+        conn.commit()
+
+    @contextmanager
+    def lock(self, session_id: str, timeout: float = LOCK_TIMEOUT_SECONDS) -> Iterator[None]:
+        """Lease lock in the shared database; works across worker processes."""
+        conn = self._conn()
+        owner = _lock_owner()
+        deadline = time.time() + timeout
+        while True:
+            now = time.time()
+            cur = conn.execute(
+                "INSERT INTO session_locks (session_id, owner, expires_at) VALUES (?, ?, ?)"
+                " ON CONFLICT(session_id) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at"
+                " WHERE session_locks.expires_at < ?",
+                (session_id, owner, now + LOCK_LEASE_SECONDS, now),
+            )
+            conn.commit()
+            if cur.rowcount == 1:
+                break
+            if now >= deadline:
+                raise TimeoutError(f"Timed out waiting for session lock {session_id}")
+            time.sleep(LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            conn.execute("DELETE FROM session_locks WHERE session_id = ? AND owner = ?", (session_id, owner))
+            conn.commit()
+
+    def purge(self, older_than_seconds: float) -> int:
+        conn = self._conn()
+        cur = conn.execute("DELETE FROM sessions WHERE updated_at < ?", (time.time() - older_than_seconds,))
+        conn.execute("DELETE FROM session_locks WHERE expires_at < ?", (time.time(),))
+        conn.commit()
+        return cur.rowcount
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class RedisSessionStore(SessionStore):
+    """Shared tier in Redis (or any server speaking its protocol, e.g. fakeredis)."""
+
+    def __init__(self, url: str, retention_seconds: float = DEFAULT_RETENTION_SECONDS,
+                 prefix: str = "agbot:"):
+        if redis is None:
+            raise RuntimeError("AGBOT_SESSION_STORE=redis requires the 'redis' package")
+        self.client = redis.Redis.from_url(url)
+        self.retention_seconds = int(retention_seconds)
+        self.prefix = prefix
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.prefix}session:{session_id}"
+
+    def get(self, session_id: str) -> Optional[Session]:
+        data, version = self.client.hmget(self._key(session_id), "data", "version")
+        if data is None:
+            return None
+        session = decode(data)
+        session["version"] = int(version or 0)
+        return session
+
+    def version(self, session_id: str) -> Optional[int]:
+        version = self.client.hget(self._key(session_id), "version")
+        return int(version) if version is not None else None
+
+    def put(self, session: Session) -> None:
+        session["last_seen"] = time.time()
+        session["version"] = int(session.get("version") or 0) + 1
+        key = self._key(session["session_id"])
+        pipe = self.client.pipeline()
+        pipe.hset(key, mapping={"data": encode(session), "version": session["version"]})
+        pipe.expire(key, self.retention_seconds)  # Redis expires idle sessions itself
+        pipe.execute()
+
+    def delete(self, session_id: str) -> None:
+        self.client.delete(self._key(session_id))
+
+    @contextmanager
+    def lock(self, session_id: str, timeout: float = LOCK_TIMEOUT_SECONDS) -> Iterator[None]:
+        key = f"{self.prefix}lock:{session_id}"
+        owner = _lock_owner()
+        deadline = time.time() + timeout
+        while not self.client.set(key, owner, nx=True, px=int(LOCK_LEASE_SECONDS * 1000)):
+            if time.time() >= deadline:
+                raise TimeoutError(f"Timed out waiting for session lock {session_id}")
+            time.sleep(LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            # Compare-and-delete so an expired lease never releases someone else's lock
+            with self.client.pipeline() as pipe:
+                try:
+                    pipe.watch(key)
+                    if pipe.get(key) == owner.encode():
+                        pipe.multi()
+                        pipe.delete(key)
+                        pipe.execute()
+                except redis.WatchError:
+                    pass
+
+    def purge(self, older_than_seconds: float) -> int:
+        return 0
+
+
+class TieredSessionStore(SessionStore):
+    """Bounded in-memory LRU in front of a shared tier. Writes go through, so an
+    evicted (or crashed-away) session restores on its next turn, and a cached
+    copy is only served while its version matches the shared one."""
+
+    def __init__(self, backend: SessionStore, max_sessions: int = DEFAULT_MAX_SESSIONS,
+                 retention_seconds: float = DEFAULT_RETENTION_SECONDS):
+        self.backend = backend
+        self.memory = MemorySessionStore(max_sessions=max_sessions)
+        self.retention_seconds = retention_seconds
+
+    def get(self, session_id: str) -> Optional[Session]:
+        session = self.memory.get(session_id)
+        if session is not None:
+            shared_version = self.backend.version(session_id)
+            if shared_version is None or shared_version == session.get("version"):
+                metrics.cache_result("session_memory", True)
+                return session
+        metrics.cache_result("session_memory", False)
+        session = self.backend.get(session_id)
+        if session is not None:
+            self.memory.put(session)
+        return session
+
+    def put(self, session: Session) -> None:
+        self.backend.put(session)
+        self.memory.put(session)
+
+    def delete(self, session_id: str) -> None:
+        self.memory.delete(session_id)
+        self.backend.delete(session_id)
+
+    def version(self, session_id: str) -> Optional[int]:
+        return self.backend.version(session_id)
+
+    def lock(self, session_id: str, timeout: float = LOCK_TIMEOUT_SECONDS):
+        return self.backend.lock(session_id, timeout)
+
+    def evict_idle(self, idle_seconds: float) -> List[str]:
+        evicted = self.memory.evict_idle(idle_seconds)
+        purge = getattr(self.backend, "purge", None)
+        if purge:
+            purge(self.retention_seconds)
+        return evicted
+
+    def memory_report(self) -> Dict[str, int]:
+        return self.memory.memory_report()
+
+    def close(self) -> None:
+        self.backend.close()
+
+    def __len__(self) -> int:
+        return len(self.memory)
+
+
+class IdleSweeper(threading.Thread):
+    """Background thread that proactively reclaims idle sessions."""
+
+    def __init__(self, store: SessionStore, idle_seconds: float = DEFAULT_IDLE_SECONDS,
+                 interval: float = DEFAULT_SWEEP_SECONDS):
+        super().__init__(name="session-sweeper", daemon=True)
+        self.store = store
+        self.idle_seconds = idle_seconds
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                evicted = self.store.evict_idle(self.idle_seconds)
+                if evicted:
+                    report = self.store.memory_report()
+                    log.info("Session sweeper evicted idle sessions", evicted=len(evicted),
+                             in_memory=len(report), bytes=sum(report.values()))
+            except Exception:
+                log.exception("Session sweeper error")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+def build_store_from_env() -> SessionStore:
+    """
+    AGBOT_SESSION_STORE=memory|sqlite|redis (default sqlite).
+      * sqlite: memory LRU + SQLite at AGBOT_SESSION_DB (default sessions.db next
+        to this file). Every worker process on the host can share the file.
+      * redis: memory LRU + Redis at AGBOT_REDIS_URL, for workers on several hosts.
+      * memory: single-process only; sessions are lost on restart.
+    """
+    kind = os.getenv("AGBOT_SESSION_STORE", "sqlite").lower()
+    if kind == "memory":
+        return MemorySessionStore()
+    if kind == "redis":
+        return TieredSessionStore(RedisSessionStore(os.getenv("AGBOT_REDIS_URL", "redis://localhost:6379/0")))
+    path = os.getenv("AGBOT_SESSION_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "sessions.db"))
+    return TieredSessionStore(SQLiteSessionStore(path))
+
+
+_STORE: Optional[SessionStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_store() -> SessionStore:
+    """Process-wide store (and its sweeper), created on first use."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = build_store_from_env()
+            IdleSweeper(_STORE).start()
+            metrics.register_gauge("agbot_sessions", "Sessions held in this process's memory",
+                                   lambda: len(_STORE))
+        return _STORE
@@ -18,6 +18,8 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import google.auth.transport.requests
 
+from prompt_registry import PROMPTS, Prompt, record_completion
+
 # =========================
 # Setup
 # =========================
@@ -41,78 +43,10 @@ COMPONENT_DIR = os.path.join(root_dir, "frontend/build")
 
 
 # =========================
-# CHARACTER (Master Build Doc – Updated)
+# CHARACTER (Master Build Doc): prompts/character/, reloaded when edited
 # =========================
-CHARACTER = """
-You are the Elite Auto Sales Academy Bot (powered by AG Goldsmith).  
-Your role: dealer-floor training assistant.  
-Tone: natural and professional, sharp and concise. Use short lines, clean authority, no fluff. Mass-friendly dealership talk — no slang, no corporate jargon. End each turn with a clear respectful next step.  
-
-Core Framework: the M3 Pillars  
-• Message Mastery → Scripts, trust-building, tonality, first impressions.  
-• Closer Moves → Objection handling, PVF close, roleplays.  
-• Money Momentum → Daily log, E.A.R.N. system, follow-up habits.  
-
-Supporting Frameworks:  
-• Signature Close: Pain–Vision–Fit (PVF).  
-• Five Emotional Checkpoints: Research Mode, Trust Check, Control Test, Reassurance Loop, Post-Test Drift.  
-
----  
-COMMAND LIBRARY (respond only to these triggers):  
-
-Message Mastery  
-• !scripts → Provide standard sales scripts.  
-• !trust → Tips + roleplay on trust-building.  
-• !tonality → Coaching on voice tone + delivery.  
-• !firstimpression → Training lines for greetings + openings.  
-
-Closer Moves  
-• !pvf → Walkthrough of Pain–Vision–Fit close.  
-• !objection <type> → Objection handling by category. Supported types: price, paymenttoohigh, tradevalue, thinkaboutit, shoparound, spouse, paymentvsprice, timingstall.  
-• !roleplay price → Role-play price objection scenario.  
-• !roleplay trade → Role-play trade-in objection scenario.  
-
-Money Momentum  
-• !dailylog → Ask 4 prompts in order (ups, calls, follow-ups, appointments). After responses, append one row to Google Sheet (Date | User | Ups | Calls | FollowUps | Appointments). Return summary message with numbers + one encouragement line + one tip.  
-• !earn → Explain the E.A.R.N. system (exact lines provided by admin).  
-
-Five Emotional Checkpoints  
-• !checkpoints → Return the five checkpoints (Research Mode, Trust Check, Control Test, Reassurance Loop, Post-Test Drift).  
-
----  
-ROLEPLAY RULES  
-• Default length 5–6 turns.  
-• Each objection roleplay branches based on numbers:  
-   - Base → empathy + discovery + one clean commitment.  
-   - Slightly over target → anchor value → calm choice → split difference.  
-   - Far apart → reset expectations (model norms), test levers (term/down/selection), coach customer up.  
-• Capture numbers: when user gives target/offer, parse and store. Branch by delta.  
-• Controls: continue (+2–4 steps), end (clear session), restart (step = 1). Stop at max 10 steps.  
-• If user types without “!”, reply: “Looks like you meant ![command]. Try it with the exclamation point.”  
-
----  
-DAILY LOG PROMPTS  
-1) “How many ups did you take today?”  
-2) “How many calls did you make?”  
-3) “How many follow-ups did you complete?”  
-4) “How many appointments did you set?”  
-
-Close-out:  
-“Logged. Great work today! You logged [X ups, Y calls, Z follow-ups, A appointments]. Keep stacking clean reps. [Encouragement] Tip: [Tip]”  
-Where [Encouragement] is randomly chosen from the Encouragement list and [Tip] from the Tip Library.  
-
----  
-FIRST IMPRESSION SCRIPT (for !firstimpression)  
-Rep: “Welcome in! I’m [Name]. Are you looking at something specific today, or open to a few options?”  
-Customer: “Just looking.”  
-Rep: “Perfect. Let’s take a walk together, and you can tell me what matters most in your next car.”  
-
----  
-TONE GUARD  
-• Short, direct, mass-friendly dealership talk.  
-• Replies ~2 sentences per turn.  
-• Never invent outside lines. Use only the content from this prompt.  
-"""
+# Follows the newest (or prompt-wide pinned) version; pin this app alone with
+# AGBOT_PROMPT_PINS='{"simple_app.character": "v1"}'.
 
 # =========================
 # Google Sheets config
@@ -552,7 +486,7 @@ OPENAI_FUNCTIONS = [
     }
 ]
 
-def run_openai(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+def run_openai(messages: List[Dict[str, str]], prompt: Prompt) -> Dict[str, Any]:
     try:
         print(f"Running OpenAI with model: {OPENAI_MODEL}")
         print("Messages summary:")
@@ -567,6 +501,7 @@ def run_openai(messages: List[Dict[str, str]]) -> Dict[str, Any]:
             temperature=0.3
         )
         print("OpenAI API call successful")
+        record_completion(prompt, response)
         return response
     except Exception as e:
         print(f"OpenAI API call failed: {str(e)}")
@@ -686,8 +621,9 @@ def respond_to(text: str) -> str:
         "last_updated": datetime.datetime.utcnow().isoformat()
     }
     # Build the complete message list
+    character = PROMPTS.get("character", app="simple_app")
     system_messages = [
-        {"role": "system", "content": CHARACTER},
+        {"role": "system", "content": character.text},
         {"role": "system", "content": f"User: {st.session_state.user_name}. Session: {st.session_state.session_id}."},
         {"role": "system", "content": "Short, natural dealership language. ~2 sentences per turn. End with a clear next step."},
         {"role": "system", "content": f"SESSION_STATE_JSON={json.dumps(system_state)}"}
@@ -702,7 +638,7 @@ def respond_to(text: str) -> str:
     print(f"Using truncated message history with {len(messages)} messages")
 
     # Call OpenAI (with function calling)
-    ai = run_openai(messages)
+    ai = run_openai(messages, character)
     msg = ai["choices"][0]["message"]
 
     # Tool calls
@@ -739,6 +675,7 @@ def respond_to(text: str) -> str:
             
             try:
                 ai = openai.ChatCompletion.create(model=OPENAI_MODEL, messages=messages, temperature=0.3)
+                record_completion(character, ai)
                 msg = ai["choices"][0]["message"]
             except Exception as e:
                 print(f"Error in OpenAI API call after append_daily_log: {e}")
@@ -763,6 +700,7 @@ def respond_to(text: str) -> str:
                 messages.append(msg)
                 messages.append({"role": "function", "name": "log_session_turn", "content": json.dumps({"ok": False, "error": str(e)})})
             ai = openai.ChatCompletion.create(model=OPENAI_MODEL, messages=messages, temperature=0.3)
+            record_completion(character, ai)
             msg = ai["choices"][0]["message"]
 
     assistant_text = msg.get("content") or "Working on it…"
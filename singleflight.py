@@ -0,0 +1,81 @@
+# singleflight.py
+"""
+Request coalescing: concurrent callers with the same key share one call.
+
+    result, shared = FLIGHTS.do(key, lambda: expensive())
+
+The first caller for a key (the leader) runs the function; callers that
+arrive while it is in flight wait for it and receive the same result (or
+exception). Nothing is cached: once the leader returns, the next caller
+starts a new call.
+"""
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import metrics
+
+COALESCED = metrics.Counter("agbot_singleflight_total", "Coalescable calls by role", ["name", "role"])
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self, name: str = "default"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.leaders = 0
+        self.hits = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run ``fn`` once per in-flight ``key``; returns (result, shared_with_leader)."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.hits += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+                leader = True
+        COALESCED.labels(name=self.name, role="leader" if leader else "follower").inc()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.leaders + self.hits
+            return {
+                "in_flight": len(self._calls),
+                "leaders": self.leaders,
+                "hits": self.hits,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
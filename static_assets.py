@@ -0,0 +1,389 @@
+# static_assets.py
+"""
+The React build (elite_chat_component/frontend/build), loaded once per build.
+
+AssetBundle reads every file in the build when its hash changes (the hash of
+asset-manifest.json, which lists the content-hashed bundle names), and
+keeps in memory:
+
+- each file's bytes, plus gzip and (with the optional ``brotli`` package)
+  brotli copies of text assets, compressed once;
+- a content-hash ETag, so browsers revalidate with a 304;
+- Cache-Control: content-hashed files (main.5db7e1bf.js) are immutable for
+  a year, index.html is always revalidated, other files cache for an hour;
+- index.html with a <base href> pointing at where the assets are served,
+  computed once per base URL. The build is relative (``"homepage": "."``), so
+  the base covers the tags in index.html and the chunks webpack loads later.
+
+Between checks of the manifest's mtime (every AGBOT_ASSET_RECHECK seconds),
+a Streamlit rerun does no file I/O.
+
+start_asset_server() runs the listener that serves the bundle, once per
+process: a threaded HTTP/1.1 server (keep-alive, one thread per connection)
+with explicit MIME types, compression, ETag revalidation, single byte-range
+requests (for source maps and images) and GET/HEAD. /_health reports the
+loaded build, and check_health() lets the app probe it.
+
+The listener binds 127.0.0.1 (AGBOT_ASSET_HOST) and the browser is pointed at
+http://localhost:<port>, which only works for a browser on this machine. For
+any other deployment, put the listener behind the proxy that serves the app
+and set AGBOT_ASSET_URL to its public base URL. asset_url() raises
+AssetConfigError when the page was requested from another host and
+AGBOT_ASSET_URL is unset, rather than hand out URLs that will never load.
+"""
+import gzip
+import hashlib
+import html as html_lib
+import json
+import mimetypes
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, NamedTuple, Optional, Tuple
+from urllib.error import URLError
+from urllib.parse import unquote
+from urllib.request import urlopen
+
+import logs
+import metrics
+
+try:
+    import brotli  # Optional: br copies alongside gzip
+except ImportError:
+    brotli = None
+
+BUILD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "elite_chat_component", "frontend", "build")
+ASSET_PORT = int(os.getenv("AGBOT_ASSET_PORT", "8502"))
+ASSET_HOST = os.getenv("AGBOT_ASSET_HOST", "127.0.0.1")
+ASSET_URL = os.getenv("AGBOT_ASSET_URL", "")  # Public base URL of the listener; default http://localhost:<port>
+CORS_ORIGIN = os.getenv("AGBOT_ASSET_CORS_ORIGIN", "")  # Sent as Access-Control-Allow-Origin when set
+_LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+RECHECK_SECONDS = float(os.getenv("AGBOT_ASSET_RECHECK", "30"))
+COMPRESS_MIN_BYTES = 1024
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+SHORT = "public, max-age=3600"
+_HASHED_RE = re.compile(r"\.[0-9a-f]{8,}\.(?:chunk\.)?(?:js|css)(?:\.map)?$")
+_COMPRESSIBLE = ("text/", "application/javascript", "application/json", "image/svg+xml", "application/manifest+json")
+_HEAD_RE = re.compile(r"<head[^>]*>", re.IGNORECASE)
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+HEALTH_PATH = "/_health"
+
+# mimetypes depends on the host's /etc/mime.types; pin what the build ships
+_MIME_TYPES = {
+    ".html": "text/html", ".js": "application/javascript", ".css": "text/css",
+    ".map": "application/json", ".json": "application/json", ".txt": "text/plain",
+    ".svg": "image/svg+xml", ".png": "image/png", ".ico": "image/x-icon",
+    ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".webp": "image/webp",
+    ".woff": "font/woff", ".woff2": "font/woff2", ".webmanifest": "application/manifest+json",
+}
+
+ASSET_REQUESTS = metrics.Counter("agbot_asset_requests_total", "Frontend asset requests by status", ["status"])
+
+log = logs.get_logger("assets")
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+class Asset(NamedTuple):
+    body: bytes
+    gzip: Optional[bytes]
+    br: Optional[bytes]
+    etag: str
+    content_type: str
+    cache_control: str
+
+
+def _load_asset(path: str, rel: str) -> Asset:
+    with open(path, "rb") as f:
+        body = f.read()
+    content_type = (_MIME_TYPES.get(os.path.splitext(rel)[1].lower())
+                    or mimetypes.guess_type(rel)[0] or "application/octet-stream")
+    if content_type.startswith("text/") or content_type in ("application/javascript", "application/json"):
+        content_type += "; charset=utf-8"
+    gz = br = None
+    if len(body) >= COMPRESS_MIN_BYTES and content_type.startswith(_COMPRESSIBLE):
+        gz = gzip.compress(body, compresslevel=9, mtime=0)
+        if brotli is not None:
+            br = brotli.compress(body)
+    if rel == "index.html":
+        cache_control = REVALIDATE
+    elif _HASHED_RE.search(rel):
+        cache_control = IMMUTABLE
+    else:
+        cache_control = SHORT
+    etag = '"%s"' % hashlib.sha256(body).hexdigest()[:20]
+    return Asset(body, gz, br, etag, content_type, cache_control)
+
+
+def build_hash(build_dir: str) -> str:
+    """Hash of the build's manifest (or index.html when there is none)."""
+    for name in ("asset-manifest.json", "index.html"):
+        path = os.path.join(build_dir, name)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()[:16]
+    return ""
+
+
+class AssetBundle:
+    def __init__(self, build_dir: str = BUILD_DIR, recheck_seconds: float = RECHECK_SECONDS):
+        self.build_dir = build_dir
+        self.recheck_seconds = recheck_seconds
+        self._lock = threading.Lock()
+        self.hash = ""
+        self._assets: Dict[str, Asset] = {}
+        self._index_html: Dict[str, str] = {}  # Base URL -> index.html with its <base>
+        self._manifest_mtime: Optional[float] = None
+        self._checked = 0.0
+        self.loaded_at = 0.0
+
+    def _manifest_path(self) -> str:
+        manifest = os.path.join(self.build_dir, "asset-manifest.json")
+        return manifest if os.path.exists(manifest) else os.path.join(self.build_dir, "index.html")
+
+    def refresh(self, force: bool = False) -> None:
+        """Reload the build if its manifest changed; at most once per recheck interval."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._checked and now - self._checked < self.recheck_seconds:
+                return
+            self._checked = now
+            try:
+                mtime = os.path.getmtime(self._manifest_path())
+            except OSError as e:
+                log.error("Frontend build missing", build_dir=self.build_dir, error=str(e))
+                return
+            if mtime == self._manifest_mtime and not force:
+                return
+            new_hash = build_hash(self.build_dir)
+            self._manifest_mtime = mtime
+            if new_hash == self.hash and not force:
+                return
+            self._load(new_hash)
+
+    def _load(self, new_hash: str) -> None:
+        """Read and compress every file of the build. Caller holds the lock."""
+        started = time.perf_counter()
+        assets: Dict[str, Asset] = {}
+        for root, _dirs, files in os.walk(self.build_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                rel = os.path.relpath(path, self.build_dir).replace(os.sep, "/")
+                try:
+                    assets[rel] = _load_asset(path, rel)
+                except OSError as e:
+                    log.warning("Asset not loaded", path=path, error=str(e))
+        self._assets = assets
+        self._index_html = {}
+        self.hash = new_hash
+        self.loaded_at = time.time()
+        log.info("Frontend build loaded", build_hash=new_hash, files=len(assets),
+                 bytes=sum(len(a.body) for a in assets.values()),
+                 seconds=round(time.perf_counter() - started, 3))
+
+    def index_html(self, base_url: str) -> str:
+        """index.html with a <base href> at ``base_url``, so the relative references
+        in it, and the chunks webpack loads at runtime, resolve there."""
+        self.refresh()
+        with self._lock:
+            html = self._index_html.get(base_url)
+            if html is None:
+                index = self._assets.get("index.html")
+                if index is None:
+                    raise FileNotFoundError(os.path.join(self.build_dir, "index.html"))
+                base = '<base href="%s">' % html_lib.escape(base_url.rstrip("/") + "/", quote=True)
+                html = index.body.decode("utf-8")
+                head = _HEAD_RE.search(html)
+                at = head.end() if head else 0
+                html = html[:at] + base + html[at:]
+                self._index_html[base_url] = html
+            return html
+
+    def get(self, rel: str) -> Optional[Asset]:
+        self.refresh()
+        with self._lock:
+            return self._assets.get(rel)
+
+    def status(self) -> Dict[str, object]:
+        self.refresh()
+        with self._lock:
+            return {
+                "ok": "index.html" in self._assets,
+                "build_hash": self.hash,
+                "files": len(self._assets),
+                "bytes": sum(len(a.body) for a in self._assets.values()),
+                "loaded_at": self.loaded_at,
+            }
+
+    def respond(self, path: str, accept_encoding: str = "", if_none_match: str = "",
+                range_header: str = "") -> Response:
+        """Status, headers and body for a GET of ``path``."""
+        rel = unquote(path.split("?", 1)[0]).lstrip("/") or "index.html"
+        asset = self.get(rel)
+        if asset is None:
+            return 404, {"Content-Type": "text/plain; charset=utf-8", "Cache-Control": REVALIDATE}, b"Not found"
+        headers = {
+            "Content-Type": asset.content_type,
+            "Cache-Control": asset.cache_control,
+            "ETag": asset.etag,
+            "Accept-Ranges": "bytes",
+        }
+        if CORS_ORIGIN:
+            headers["Access-Control-Allow-Origin"] = CORS_ORIGIN
+        if asset.gzip is not None:
+            headers["Vary"] = "Accept-Encoding"
+        if if_none_match and asset.etag in (t.strip() for t in if_none_match.split(",")):
+            return 304, headers, b""
+        if range_header:
+            # Ranges are served from the uncompressed body
+            size = len(asset.body)
+            span = _parse_range(range_header, size)
+            if span is None:
+                headers["Content-Range"] = f"bytes */{size}"
+                return 416, headers, b""
+            start, end = span
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            return 206, headers, asset.body[start:end + 1]
+        body = asset.body
+        accepted = {e.split(";")[0].strip() for e in accept_encoding.lower().split(",")}
+        if asset.br is not None and "br" in accepted:
+            body, headers["Content-Encoding"] = asset.br, "br"
+        elif asset.gzip is not None and "gzip" in accepted:
+            body, headers["Content-Encoding"] = asset.gzip, "gzip"
+        return 200, headers, body
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Inclusive (start, end) of a single ``bytes=`` range, or None if unsatisfiable."""
+    m = _RANGE_RE.match(header.strip())
+    if not m or (not m.group(1) and not m.group(2)):
+        return None
+    if not m.group(1):
+        # Suffix range: the last N bytes
+        length = int(m.group(2))
+        return (max(0, size - length), size - 1) if length and size else None
+    start = int(m.group(1))
+    end = min(int(m.group(2)), size - 1) if m.group(2) else size - 1
+    return (start, end) if start <= end else None
+
+
+_BUNDLE: Optional[AssetBundle] = None
+_BUNDLE_LOCK = threading.Lock()
+
+
+def get_bundle() -> AssetBundle:
+    """Process-wide bundle for BUILD_DIR."""
+    global _BUNDLE
+    with _BUNDLE_LOCK:
+        if _BUNDLE is None:
+            _BUNDLE = AssetBundle()
+        return _BUNDLE
+
+
+# =========================
+# Side HTTP listener
+# =========================
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive: a page load reuses its connections
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self, send_body: bool) -> None:
+        bundle = get_bundle()
+        if self.path.split("?", 1)[0] == HEALTH_PATH:
+            health = bundle.status()
+            status = 200 if health["ok"] else 503
+            headers = {"Content-Type": "application/json", "Cache-Control": REVALIDATE}
+            body = json.dumps(health).encode("utf-8")
+        else:
+            status, headers, body = bundle.respond(
+                self.path, self.headers.get("Accept-Encoding", ""), self.headers.get("If-None-Match", ""),
+                self.headers.get("Range", ""))
+        ASSET_REQUESTS.labels(status=str(status)).inc()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not send_body:
+            return
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True  # The browser navigated away mid-download
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+def start_asset_server(port: int = ASSET_PORT, host: str = ASSET_HOST) -> Optional[ThreadingHTTPServer]:
+    """Serve the build once per process; later calls are no-ops."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), _Handler)
+            except OSError as e:
+                # Another worker on this host already serves the build
+                log.warning("Asset listener not started", host=host, port=port, error=str(e))
+                return None
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="assets-http", daemon=True).start()
+            log.info("Asset listener started", url=f"http://{host}:{port}/")
+        return _server
+
+
+class AssetConfigError(RuntimeError):
+    """The browser has no URL it can load the assets from."""
+
+
+def _hostname(host: str) -> str:
+    """A Host header without its port (example.com:8501 -> example.com, [::1]:8501 -> ::1)."""
+    if host.startswith("["):
+        return host[1:].split("]", 1)[0]
+    return host.rsplit(":", 1)[0] if host.count(":") == 1 else host
+
+
+def asset_url(port: int = ASSET_PORT, page_host: Optional[str] = None) -> str:
+    """Base URL the browser loads assets from. ``page_host`` is the Host header
+    the Streamlit page was requested with, when the app knows it."""
+    if ASSET_URL:
+        return ASSET_URL.rstrip("/")
+    if page_host and _hostname(page_host.strip().lower()) not in _LOCAL_HOSTS:
+        raise AssetConfigError(
+            f"The page was opened at {page_host}, but frontend assets are only served to this machine "
+            f"(http://localhost:{port}). Set AGBOT_ASSET_URL to the listener's public base URL.")
+    return f"http://localhost:{port}"
+
+
+def health_url(port: int = ASSET_PORT) -> str:
+    """Where check_health() probes: AGBOT_ASSET_URL when set (so a broken proxy
+    route shows up), else the listener on ASSET_HOST."""
+    if ASSET_URL:
+        return ASSET_URL.rstrip("/") + HEALTH_PATH
+    host = "127.0.0.1" if ASSET_HOST in ("", "0.0.0.0") else "::1" if ASSET_HOST == "::" else ASSET_HOST
+    if ":" in host:
+        host = f"[{host}]"
+    return f"http://{host}:{port}{HEALTH_PATH}"
+
+
+def check_health(port: int = ASSET_PORT, timeout: float = 1.0) -> Dict[str, object]:
+    """Probe the listener (ours or another worker's) over HTTP, at the URL
+    health_url() gives."""
+    url = health_url(port)
+    try:
+        with urlopen(url, timeout=timeout) as resp:
+            return json.loads(resp.read().decode("utf-8"))
+    except (URLError, OSError, ValueError) as e:
+        return {"ok": False, "error": f"{url}: {e}"}
@@ -18,6 +18,8 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import google.auth.transport.requests
 
+from prompt_registry import PROMPTS, Prompt, record_completion
+
 # =========================
 # Setup
 # =========================
@@ -41,103 +43,10 @@ COMPONENT_DIR = os.path.join(root_dir, "frontend/build")
 
 
 # =========================
-# CHARACTER (Master Build Doc – Updated)
+# CHARACTER (Master Build Doc): prompts/character/, reloaded when edited
 # =========================
-CHARACTER = """
-You are the Elite Auto Sales Academy Bot (Sales Coach AI), powered by AG Goldsmith.  
-Your role: dealer-floor training assistant.  
-Tone: professional, confident, short, natural dealership language. No slang. No corporate trainer talk.  
-Replies should be concise (1–2 sentences per turn), scannable, and end with a clear next step.  
-Branding: Elite colors (Blue #0D3B66, Gold #FFD700). Identity always references “Elite Auto Sales Academy Bot, powered by AG Goldsmith.”
-
-CORE FRAMEWORK (M3):
-- Message Mastery → scripts, trust-building, tonality, first impressions.  
-- Closer Moves → objections, PVF close, roleplays.  
-- Money Momentum → daily log, E.A.R.N. system, follow-up habits.  
-
-SUPPORTING FRAMEWORKS:  
-- PVF Close: Pain → Vision → Fit → Close.  
-- Five Emotional Checkpoints: Research Mode, Trust Check, Control Test, Reassurance Loop, Post-Test Drift.  
-
-COMMAND RULES:
-- Commands are case-insensitive.  
-- If a user types a known command without "!", reply once: “Looks like you meant ![command]. Try it with the exclamation point.”  
-- Normalize commands: strip whitespace, convert spaces to hyphens.  
-- Aliases must work:  
-  • !coaching-tips (aliases: !coachingtips, !coaching tips)  
-  • !coaching-roleplay (aliases: !coachingroleplay, !coaching roleplay)  
-
-COMMAND INDEX:
-Message Mastery  
-- !scripts → Show script library (Greeting, Discovery, Test Drive, Numbers, Closing, Follow-up). Compact menu first, drill-down allowed.  
-- !trust → Coaching on building trust.  
-- !tonality → Coaching on voice and pace.  
-- !firstimpression → Greeting / intro roleplay.  
-
-Closer Moves  
-- !pvf → PVF guided close (Pain, Vision, Fit, Close).  
-- !objection price → General price objection flow.  
-- !objection paymenttoohigh → Specific monthly payment objection flow.  
-- !objection tradevalue → Trade value objection flow.  
-- !objection thinkaboutit → “I need to think about it.”  
-- !objection shoparound → “I want to shop around.”  
-- !objection spouse → “I need to check with my spouse.”  
-- !objection paymentvsprice → Payment vs. total price objection.  
-- !objection timingstall → Timing stall objection.  
-
-Role-Play Scenarios  
-- !roleplay price, !roleplay trade, !roleplay think, !roleplay shop, !roleplay spouse → Run multi-branch objection simulations (3-deep).  
-Each roleplay: 2–3 branching responses max, short lines.  
-
-Money Momentum  
-- !dailylog → Sequentially ask:  
-  1) How many ups did you take today?  
-  2) How many calls did you make?  
-  3) How many follow-ups did you complete?  
-  4) How many appointments did you set? 
-Append one row to Google Sheets (timestamp, user_name, ups, calls, followups, appointments, hardest_objection, notes).  
-After logging, return: “Logged. Keep stacking clean reps. [Encouragement] Tip: [Tip]”  
-where [Encouragement] = random encouragement line, [Tip] = random tip from library.  
-- !earn → Overview of the E.A.R.N. system with one actionable prompt per step.  
-
-Five Emotional Checkpoints  
-- !checkpoints → Show five checkpoints. Allow drill-down. Some checkpoints include coaching, others include roleplays.  
-
-Coaching Resources  
-- !coaching → Menu of coaching options (tips, roleplay, trust, tonality, firstimpression).  
-- !coaching-tips → Quick coaching lines (trust first, tonality calm, one ask, clean choices, protect value).  
-- !coaching-roleplay → Roleplay starters (payment too high, think about it, trade pushback).  
-
-Help  
-- !help or !commands → List all available commands with usage examples.  
-
-SESSION & STATE MANAGEMENT:
-- Track per user: user_id, session_id, scenario, step, target_payment, offer_payment, last_updated.  
-- Session expires if idle > 30 min.  
-- Roleplays: default 6 steps, max 10. Controls: “continue”, “restart”, “end.”  
-- Parse numbers (e.g. $450) for payment handling.  
-- Branch by delta:  
-  • Band A (on/under): close cleanly.  
-  • Band B (slightly over: +1–40): anchor value → calm choice → split difference.  
-  • Band C (far apart: >40): reset expectations, test levers, coach up.  
-
-ERROR HANDLING:  
-- If unknown input: “Not sure what you meant. Try a command like !pvf, !roleplay price, or !dailylog.”  
-- If expected number not found: “What monthly number keeps you comfortable?”  
-- If slow: send “Working on it…” then follow with final.  
-
-TONE GUARD:  
-- Replies are natural dealership-floor talk.  
-- Short, mass-friendly, no jargon.  
-- End with a respectful next step.  
-
-ACCEPTANCE:  
-- Commands trigger reliably.  
-- Roleplays branch correctly.  
-- Daily log appends one row.  
-- Coaching commands return correct content.  
-- Admin can edit this CHARACTER file to update content without rebuilding backend.  
-"""
+# This app runs its own variant, character@v1; pin another with
+# AGBOT_PROMPT_PINS='{"streamlit_app.character": "v2"}'.
 
 
 
@@ -579,7 +488,7 @@ OPENAI_FUNCTIONS = [
     }
 ]
 
-def run_openai(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+def run_openai(messages: List[Dict[str, str]], prompt: Prompt) -> Dict[str, Any]:
     try:
         print(f"Running OpenAI with model: {OPENAI_MODEL}")
         print("Messages summary:")
@@ -594,6 +503,7 @@ def run_openai(messages: List[Dict[str, str]]) -> Dict[str, Any]:
             temperature=0.3
         )
         print("OpenAI API call successful")
+        record_completion(prompt, response)
         return response
     except Exception as e:
         print(f"OpenAI API call failed: {str(e)}")
@@ -774,8 +684,9 @@ Elite Bot Command List:
         "last_updated": datetime.datetime.utcnow().isoformat()
     }
     # Build the complete message list
+    character = PROMPTS.get("character", app="streamlit_app", default="v1")
     system_messages = [
-        {"role": "system", "content": CHARACTER},
+        {"role": "system", "content": character.text},
         {"role": "system", "content": f"User: {st.session_state.user_name}. Session: {st.session_state.session_id}."},
         {"role": "system", "content": "Short, natural dealership language. ~2 sentences per turn. End with a clear next step."},
         {"role": "system", "content": f"SESSION_STATE_JSON={json.dumps(system_state)}"}
@@ -790,7 +701,7 @@ Elite Bot Command List:
     print(f"Using truncated message history with {len(messages)} messages")
 
     # Call OpenAI (with function calling)
-    ai = run_openai(messages)
+    ai = run_openai(messages, character)
     msg = ai["choices"][0]["message"]
 
     # Tool calls
@@ -827,6 +738,7 @@ Elite Bot Command List:
             
             try:
                 ai = openai.ChatCompletion.create(model=OPENAI_MODEL, messages=messages, temperature=0.3)
+                record_completion(character, ai)
                 msg = ai["choices"][0]["message"]
             except Exception as e:
                 print(f"Error in OpenAI API call after append_daily_log: {e}")
@@ -851,6 +763,7 @@ Elite Bot Command List:
                 messages.append(msg)
                 messages.append({"role": "function", "name": "log_session_turn", "content": json.dumps({"ok": False, "error": str(e)})})
             ai = openai.ChatCompletion.create(model=OPENAI_MODEL, messages=messages, temperature=0.3)
+            record_completion(character, ai)
             msg = ai["choices"][0]["message"]
 
     assistant_text = msg.get("content") or "Working on it…"
@@ -0,0 +1,35 @@
+from amounts import Amount, extract, first
+
+
+def test_docstring_example():
+    assert extract("budget is 32k out the door, we're at $489/mo, 72 months") == [
+        Amount("price", 32000, "target"), Amount("monthly", 489, "offer"), Amount("term", 72, None)]
+
+
+def test_decimal_thousands():
+    assert first(extract("we are at 12.5k"), "price", "offer") == 12500
+    assert first(extract("trade was 8.75k"), "trade") == 8750
+
+
+def test_model_year_is_not_an_amount():
+    assert extract("at 2024 model year") == []
+    assert extract("the 2019 civic, we're at 450/mo") == [Amount("monthly", 450, "offer")]
+    assert first(extract("2000 down"), "down") == 2000
+    assert first(extract("$2024 out the door"), "price") == 2024
+
+
+def test_term_keeps_the_role_cue():
+    assert extract("at 72 months 450/mo") == [Amount("term", 72, None), Amount("monthly", 450, "offer")]
+    assert first(extract("under 84 months, 399 a month"), "monthly", "target") == 399
+
+
+def test_time_of_day_is_not_an_amount():
+    assert extract("at 10am") == []
+    assert extract("call them at 3 pm, we're at 450/mo") == [Amount("monthly", 450, "offer")]
+    assert extract("at 10:30") == []
+
+
+def test_misgrouped_thousands_are_skipped():
+    assert extract("around 1,5000") == []
+    assert extract("around 1,5000 then 450 a month") == [Amount("monthly", 450, None)]
+    assert first(extract("price is 31,500"), "price") == 31500
@@ -0,0 +1,20 @@
+import time
+
+from session_store import IdleSweeper, MemorySessionStore
+
+
+def test_sweeper_evicts_then_stops_and_joins():
+    store = MemorySessionStore()
+    store.put({"session_id": "sess-0000000001"})
+    store.get("sess-0000000001")["last_seen"] = time.time() - 60
+
+    sweeper = IdleSweeper(store, idle_seconds=30, interval=0.01)
+    sweeper.start()
+    deadline = time.time() + 2
+    while store.get("sess-0000000001") is not None and time.time() < deadline:
+        time.sleep(0.01)
+    sweeper.stop()
+    sweeper.join(timeout=2)
+
+    assert store.get("sess-0000000001") is None
+    assert not sweeper.is_alive()
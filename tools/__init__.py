@@ -0,0 +1 @@
+"""Offline tooling: load tests, benchmarks and local service stand-ins."""
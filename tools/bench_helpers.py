@@ -0,0 +1,221 @@
+# tools/bench_helpers.py
+"""
+Microbenchmarks for the engine helpers that run on every turn.
+
+    python -m tools.bench_helpers                    # run and compare with the baseline
+    python -m tools.bench_helpers --save-baseline    # record this machine's baseline
+    python -m tools.bench_helpers --check            # exit 1 on a regression (CI)
+
+For each helper it reports ops/sec (best of several timed repeats over a
+realistic input corpus) and the transient bytes allocated per call
+(tracemalloc peak), and compares both against tools/bench_baseline.json.
+Baselines are machine-specific: record one on the machine you compare on.
+None is committed, so --check exits 1 until one is saved, and also when a
+helper has no baseline entry.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+import amounts
+import engine
+from prompt_registry import PROMPTS
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+SPEED_TOLERANCE = 0.20   # Flag when ops/sec drops more than this
+ALLOC_TOLERANCE = 0.25   # Flag when bytes/op grows more than this (plus a small absolute slack)
+ALLOC_SLACK_BYTES = 64
+
+
+# =========================
+# Input corpora
+# =========================
+def rep_messages(n: int = 400, seed: int = 11) -> List[str]:
+    """What reps actually type: payments, prices, commas, ranges, typos, commands."""
+    rng = random.Random(seed)
+    templates = [
+        "We're at ${p} a month",
+        "we’re at {p}",
+        "we;re at {p} right now",             # typo, only "at" matches
+        "${big} out the door, {p}/mo for {term} months",
+        "price is {big}, down payment of {down}",
+        "they want {trade} for their trade, payment around {p} a month",
+        "72 months at {p}, 20k price",
+        "They said they want to be under {p}",
+        "closer to $ {p} if we can",
+        "around {p}/mo is their target",
+        "${p}",
+        "offer = {p}",
+        "at {p} they walk",
+        "budget is {big} out the door",
+        "${big} otd, trade was {trade}",
+        "somewhere between {p}-{p2}",
+        "cap at {p}, 72 months, {down} down",
+        "can you do 4 fifty",                 # no digits at all
+        "!roleplay price",
+        "!objection spouse",
+        "continue",
+        "restart",
+        "I need to think about it, my wife has to see the numbers first",
+    ]
+    out = []
+    for _ in range(n):
+        t = rng.choice(templates)
+        out.append(t.format(
+            p=rng.randint(199, 899),
+            p2=rng.randint(400, 999),
+            big=f"{rng.randint(12, 68)},{rng.randint(0, 999):03d}",
+            trade=f"{rng.randint(4, 25)},{rng.randint(0, 9)}00",
+            down=f"${rng.randint(1, 5)},000",
+            term=rng.choice([36, 48, 60, 72, 84]),
+        ))
+    # A few long pastes, like a rep replying under a big !help or !scripts block
+    out += [engine.HELP_TEXT + " we're at $489", PROMPTS.text("character")[:2000]] * 5
+    return out
+
+
+def band_pairs(n: int = 400, seed: int = 12) -> List[Tuple[Any, Any]]:
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(n):
+        target = rng.choice([None, rng.randint(300, 700)])
+        offer = rng.choice([None, rng.randint(300, 800)])
+        pairs.append((target, offer))
+    return pairs
+
+
+def sheet_titles(n: int = 200, seed: int = 13) -> List[str]:
+    rng = random.Random(seed)
+    names = ["sess-%010x" % rng.getrandbits(40) for _ in range(n // 2)]
+    names += ["Rep: John/Smith [floor]?", "", "   ", "a" * 150, "DailyLog", "x*y\\z"] * (n // 12)
+    return names
+
+
+def transcripts(seed: int = 14) -> List[List[Dict[str, str]]]:
+    rng = random.Random(seed)
+    out = []
+    for length in (4, 15, 30, 60):
+        msgs = [{"role": "system", "content": PROMPTS.text("character")}] * 4
+        for i in range(length):
+            msgs.append({"role": "user" if i % 2 == 0 else "assistant",
+                         "content": " ".join(rng.choice(["we're", "at", "$450", "ok", "continue"]) for _ in range(20))})
+        out.append(msgs)
+    return out
+
+
+# =========================
+# Benchmarks
+# =========================
+def _capture(text: str) -> None:
+    engine.capture_numbers({"target": None, "offer": None}, amounts.extract(text))
+
+
+def benchmarks() -> Dict[str, Tuple[Callable[[Any], Any], List[Any]]]:
+    messages = rep_messages()
+    return {
+        "extract_amounts": (amounts.extract, messages),
+        "compute_band": (lambda pair: engine.compute_band(*pair), band_pairs()),
+        "infer_scenario_from_text": (engine.infer_scenario_from_text, messages),
+        "sanitize_sheet_title": (engine.sanitize_sheet_title, sheet_titles()),
+        "truncate_messages": (lambda msgs: engine.truncate_messages(msgs, max_messages=15), transcripts()),
+        "capture_numbers": (_capture, messages),
+    }
+
+
+def time_ops(fn: Callable[[Any], Any], corpus: List[Any], min_seconds: float = 0.2, repeat: int = 5) -> float:
+    def run():
+        for item in corpus:
+            fn(item)
+    number = 1
+    while timeit.timeit(run, number=number) < min_seconds / repeat:
+        number *= 2
+    best = min(timeit.repeat(run, number=number, repeat=repeat))
+    return len(corpus) * number / best
+
+
+def alloc_per_op(fn: Callable[[Any], Any], corpus: List[Any]) -> float:
+    total = 0
+    tracemalloc.start()
+    try:
+        for item in corpus:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            fn(item)
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return total / len(corpus)
+
+
+def run_all(only: List[str]) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, (fn, corpus) in benchmarks().items():
+        if only and name not in only:
+            continue
+        results[name] = {
+            "ops_per_sec": round(time_ops(fn, corpus), 1),
+            "alloc_bytes_per_op": round(alloc_per_op(fn, corpus), 1),
+        }
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]) -> List[str]:
+    regressions = []
+    print(f"{'helper':28} {'ops/sec':>12} {'vs base':>8} {'bytes/op':>10} {'vs base':>8}")
+    for name, r in results.items():
+        b = baseline.get(name)
+        speed = alloc = ""
+        if b:
+            speed_ratio = r["ops_per_sec"] / b["ops_per_sec"] if b["ops_per_sec"] else 1.0
+            speed = f"{speed_ratio:7.2f}x"
+            alloc = f"{r['alloc_bytes_per_op'] - b['alloc_bytes_per_op']:+8.0f}"
+            if speed_ratio < 1 - SPEED_TOLERANCE:
+                regressions.append(f"{name}: {speed_ratio:.2f}x baseline ops/sec")
+            if r["alloc_bytes_per_op"] > b["alloc_bytes_per_op"] * (1 + ALLOC_TOLERANCE) + ALLOC_SLACK_BYTES:
+                regressions.append(f"{name}: {r['alloc_bytes_per_op']:.0f} bytes/op vs {b['alloc_bytes_per_op']:.0f}")
+        print(f"{name:28} {r['ops_per_sec']:12.0f} {speed:>8} {r['alloc_bytes_per_op']:10.0f} {alloc:>8}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if any helper regressed")
+    parser.add_argument("--only", nargs="*", default=[], help="Run only these helpers")
+    args = parser.parse_args(argv)
+
+    results = run_all(args.only)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    regressions = compare(results, baseline)
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+    elif not baseline:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one.")
+        return 1 if args.check else 0
+    else:
+        unmeasured = [name for name in results if name not in baseline]
+        if unmeasured and args.check:
+            print("No baseline for: " + ", ".join(unmeasured) + "; re-run with --save-baseline.")
+            return 1
+
+    if regressions:
+        print("Regressions:\n  " + "\n  ".join(regressions))
+        return 1 if args.check else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+# tools/bundle_budget.py
+"""
+Bundle-size budget for the chat frontend build.
+
+    python -m tools.bundle_budget            # report sizes against the budgets
+    python -m tools.bundle_budget --check    # exit 1 when over budget (CI)
+    python -m tools.bundle_budget --prune    # delete stale bundles left by earlier builds
+
+Reads elite_chat_component/frontend/build/asset-manifest.json and reports,
+raw and gzipped:
+
+- the initial load (the manifest's entrypoints: what the iframe fetches
+  before first paint);
+- every lazy chunk (markdown, sidebar ...).
+
+It flags JS/CSS files whose names aren't content-hashed, since those can't
+be cached as immutable. It also lists stale bundles: files under
+build/static that the manifest no longer references.
+
+The build has to come from the current source. Every lazy chunk named in
+src (``webpackChunkName``) must appear in the manifest. If one is missing, the
+build predates the split and --check fails, rather than passing a budget
+measured on output the source no longer produces.
+
+The budgets are calibrated against the committed build. Its initial load is
+145 KB gz: React, react-markdown and the Streamlit component runtime in one
+file. Once the split build is committed, lower INITIAL_BUDGET_KB to its
+initial load plus ~5%.
+"""
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+from typing import Any, Dict, List
+
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "elite_chat_component", "frontend")
+BUILD_DIR = os.path.join(FRONTEND_DIR, "build")
+SRC_DIR = os.path.join(FRONTEND_DIR, "src")
+INITIAL_BUDGET_KB = 150.0   # Gzipped JS + CSS fetched before first paint
+CHUNK_BUDGET_KB = 60.0      # Gzipped size of any one lazy chunk
+_HASHED_RE = re.compile(r"\.[0-9a-f]{8,}\.(?:chunk\.)?(?:js|css)$")
+_CHUNK_NAME_RE = re.compile(r"webpackChunkName:\s*[\"']([\w-]+)[\"']")
+
+
+def _gzip_size(path: str) -> int:
+    with open(path, "rb") as f:
+        return len(gzip.compress(f.read(), compresslevel=9, mtime=0))
+
+
+def declared_chunks(src_dir: str = SRC_DIR) -> List[str]:
+    """Lazy chunk names the source asks webpack for."""
+    names = set()
+    for root, _dirs, files in os.walk(src_dir):
+        for name in files:
+            if name.endswith((".ts", ".tsx", ".js", ".jsx")):
+                with open(os.path.join(root, name), encoding="utf-8") as f:
+                    names.update(_CHUNK_NAME_RE.findall(f.read()))
+    return sorted(names)
+
+
+def analyze(build_dir: str = BUILD_DIR, src_dir: str = SRC_DIR) -> Dict[str, Any]:
+    with open(os.path.join(build_dir, "asset-manifest.json")) as f:
+        manifest = json.load(f)
+    entrypoints = set(manifest.get("entrypoints", []))
+    referenced = set()
+    files = []
+    for rel in manifest.get("files", {}).values():
+        rel = re.sub(r"^\.?/", "", rel)
+        referenced.add(rel)
+        if not rel.endswith((".js", ".css")):
+            continue
+        path = os.path.join(build_dir, rel)
+        files.append({
+            "file": rel,
+            "initial": rel in entrypoints,
+            "bytes": os.path.getsize(path),
+            "gzip_bytes": _gzip_size(path),
+            "hashed": bool(_HASHED_RE.search(rel)),
+        })
+    stale = []
+    static_dir = os.path.join(build_dir, "static")
+    for root, _dirs, names in os.walk(static_dir):
+        for name in names:
+            rel = os.path.relpath(os.path.join(root, name), build_dir).replace(os.sep, "/")
+            if rel not in referenced and not rel.endswith(".LICENSE.txt"):
+                stale.append(rel)
+    built = {os.path.basename(f["file"]).split(".")[0] for f in files}
+    return {
+        "missing_chunks": [c for c in declared_chunks(src_dir) if c not in built],
+        "files": sorted(files, key=lambda f: (not f["initial"], -f["gzip_bytes"])),
+        "initial_gzip_bytes": sum(f["gzip_bytes"] for f in files if f["initial"]),
+        "stale": sorted(stale),
+    }
+
+
+def check(report: Dict[str, Any], initial_kb: float, chunk_kb: float) -> List[str]:
+    problems = []
+    if report["missing_chunks"]:
+        problems.append("build is older than src (no chunk for " + ", ".join(report["missing_chunks"])
+                        + "); run npm run build and commit frontend/build")
+    if report["initial_gzip_bytes"] > initial_kb * 1024:
+        problems.append(f"initial load {report['initial_gzip_bytes'] / 1024:.1f} KB gz > {initial_kb:.0f} KB")
+    for f in report["files"]:
+        if not f["initial"] and f["gzip_bytes"] > chunk_kb * 1024:
+            problems.append(f"{f['file']}: {f['gzip_bytes'] / 1024:.1f} KB gz > {chunk_kb:.0f} KB")
+        if not f["hashed"]:
+            problems.append(f"{f['file']}: name has no content hash (can't be cached immutable)")
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--build", default=BUILD_DIR, help="Build directory")
+    parser.add_argument("--src", default=SRC_DIR, help="Frontend source directory")
+    parser.add_argument("--initial-kb", type=float, default=INITIAL_BUDGET_KB, help="Initial load budget (KB gz)")
+    parser.add_argument("--chunk-kb", type=float, default=CHUNK_BUDGET_KB, help="Per lazy chunk budget (KB gz)")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if over budget")
+    parser.add_argument("--prune", action="store_true", help="Delete stale files under build/static")
+    parser.add_argument("--json", action="store_true", help="Print the raw report")
+    args = parser.parse_args(argv)
+
+    report = analyze(args.build, args.src)
+    problems = check(report, args.initial_kb, args.chunk_kb)
+    if args.json:
+        print(json.dumps(dict(report, problems=problems), indent=2))
+    else:
+        print(f"{'file':48} {'load':>7} {'KB':>9} {'KB gz':>9}")
+        for f in report["files"]:
+            print(f"{f['file']:48} {'initial' if f['initial'] else 'lazy':>7} "
+                  f"{f['bytes'] / 1024:9.1f} {f['gzip_bytes'] / 1024:9.1f}")
+        print(f"Initial load: {report['initial_gzip_bytes'] / 1024:.1f} KB gz (budget {args.initial_kb:.0f} KB)")
+        if report["stale"]:
+            print("Stale files (not in asset-manifest.json):\n  " + "\n  ".join(report["stale"]))
+        if problems:
+            print("Failed:\n  " + "\n  ".join(problems))
+
+    if args.prune:
+        for rel in report["stale"]:
+            os.remove(os.path.join(args.build, rel))
+        if report["stale"]:
+            print(f"Removed {len(report['stale'])} stale file(s)")
+    return 1 if problems and args.check else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+# tools/fakes.py
+"""
+Local stand-ins for OpenAI and Google Sheets, for load and profiling runs
+that must not touch the real services.
+
+FakeOpenAIServer speaks enough of the chat completions API for openai==0.28
+(point ``openai.api_base`` at ``server.api_base``). It answers after a
+configurable latency and, like the real model under CHARACTER, calls
+``append_daily_log`` once the four daily-log answers are in and
+``log_session_turn`` on a share of roleplay turns.
+
+FakeSheetsService mimics the googleapiclient call chain used by engine.py
+(spreadsheets().get/batchUpdate, values().get/update/append) in memory and
+counts calls per method.
+"""
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+
+CHARS_PER_TOKEN = 4
+_NUMBER_RE = re.compile(r"^\s*\d+\s*$")
+_STATE_RE = re.compile(r"SESSION_STATE_JSON=(\{.*\})")
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+# =========================
+# OpenAI
+# =========================
+class FakeModel:
+    """Decides what the fake model says. Deterministic for a given seed."""
+
+    def __init__(self, function_call_rate: float = 0.3, seed: Optional[int] = None):
+        self.function_call_rate = function_call_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _roll(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def reply(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        messages: List[Dict[str, Any]] = request.get("messages", [])
+        functions = request.get("functions")
+        last = messages[-1] if messages else {"role": "user", "content": ""}
+
+        if last.get("role") == "function":
+            message = {"role": "assistant", "content": f"Logged. Keep stacking clean reps. ({last.get('name')})"}
+            return self._completion(request, message)
+
+        if functions:
+            call = self._function_call(messages)
+            if call is not None:
+                return self._completion(request, {"role": "assistant", "content": None, "function_call": call})
+
+        text = str(last.get("content") or "")
+        reply = (f"Got it: {text[:60]}. Here's the move — stay calm, anchor value, "
+                 f"and give them a clean choice. What do you say next?")
+        return self._completion(request, {"role": "assistant", "content": reply})
+
+    def _function_call(self, messages: List[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+        users = [str(m.get("content") or "") for m in messages if m.get("role") == "user"]
+        # Daily log: "!dailylog" followed by four numeric answers
+        for i in range(len(users) - 1, -1, -1):
+            if users[i].strip().lower() == "!dailylog":
+                answers = [u.strip() for u in users[i + 1:] if _NUMBER_RE.match(u)]
+                if len(answers) == 4 and len(users) - i - 1 == 4:
+                    ups, calls, followups, appointments = answers
+                    args = {"user": "User", "ups": ups, "calls": calls,
+                            "followups": followups, "appointments": appointments}
+                    return {"name": "append_daily_log", "arguments": json.dumps(args)}
+                break
+
+        # Roleplay turns: log a share of them to the session sheet
+        state = {}
+        for m in messages:
+            if m.get("role") == "system":
+                match = _STATE_RE.search(str(m.get("content") or ""))
+                if match:
+                    state = json.loads(match.group(1))
+        if state.get("scenario") and self._roll() < self.function_call_rate:
+            args = {"session_id": state.get("session_id", ""), "user_name": state.get("user_name", ""),
+                    "scenario": state["scenario"], "step": state.get("step", 0),
+                    "band": state.get("band") or "", "message": users[-1] if users else ""}
+            return {"name": "log_session_turn", "arguments": json.dumps(args)}
+        return None
+
+    def _completion(self, request: Dict[str, Any], message: Dict[str, Any]) -> Dict[str, Any]:
+        prompt_tokens = sum(_tokens(str(m.get("content") or "")) + 4 for m in request.get("messages", []))
+        if request.get("functions"):
+            prompt_tokens += _tokens(json.dumps(request["functions"]))
+        completion_text = message.get("content") or json.dumps(message.get("function_call") or {})
+        completion_tokens = _tokens(completion_text)
+        return {
+            "id": f"chatcmpl-fake-{int(time.time() * 1000)}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": "function_call" if message.get("function_call") else "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+
+class FakeOpenAIServer:
+    """Threaded HTTP server on 127.0.0.1 answering /v1/chat/completions."""
+
+    def __init__(self, latency: float = 0.8, jitter: float = 0.4,
+                 function_call_rate: float = 0.3, seed: Optional[int] = None, port: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.model = FakeModel(function_call_rate, seed)
+        self.requests = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                request = json.loads(self.rfile.read(length) or b"{}")
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+                time.sleep(fake._delay())
+                body = json.dumps(fake.model.reply(request)).encode("utf-8")
+                with fake._lock:
+                    fake.requests += 1
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-openai", daemon=True)
+
+    def _delay(self) -> float:
+        with self._lock:
+            return max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+
+    @property
+    def api_base(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "FakeOpenAIServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+# =========================
+# Google Sheets
+# =========================
+_RANGE_RE = re.compile(r"^'?(?P<title>.*?)'?!(?P<a1>.+)$")
+_CELL_RE = re.compile(r"^(?P<col>[A-Z]+)?(?P<row>\d+)?$")
+
+
+def _col_index(col: str) -> int:
+    n = 0
+    for ch in col:
+        n = n * 26 + (ord(ch) - 64)
+    return n - 1
+
+
+class _Request:
+    def __init__(self, fn):
+        self._fn = fn
+
+    def execute(self):
+        return self._fn()
+
+
+class FakeSheetsService:
+    """In-memory spreadsheets keyed by id; each sheet is a list of rows."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls: Counter = Counter()
+        self._books: Dict[str, Dict[str, List[List[Any]]]] = {}
+        self._lock = threading.Lock()
+
+    # googleapiclient surface
+    def spreadsheets(self) -> "FakeSheetsService":
+        return self
+
+    def values(self) -> "_Values":
+        return _Values(self)
+
+    def get(self, spreadsheetId: str, **_) -> _Request:
+        def run():
+            self._call("spreadsheets.get")
+            with self._lock:
+                book = self._books.setdefault(spreadsheetId, {})
+                return {"sheets": [{"properties": {"title": t}} for t in book]}
+        return _Request(run)
+
+    def batchUpdate(self, spreadsheetId: str, body: Dict[str, Any], **_) -> _Request:
+        def run():
+            self._call("spreadsheets.batchUpdate")
+            with self._lock:
+                book = self._books.setdefault(spreadsheetId, {})
+                for req in body.get("requests", []):
+                    title = req.get("addSheet", {}).get("properties", {}).get("title")
+                    if title is not None:
+                        book.setdefault(title, [])
+            return {"replies": []}
+        return _Request(run)
+
+    # helpers
+    def _call(self, method: str) -> None:
+        with self._lock:
+            self.calls[method] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _sheet(self, spreadsheet_id: str, rng: str):
+        match = _RANGE_RE.match(rng)
+        title, a1 = (match.group("title"), match.group("a1")) if match else (rng, "A1")
+        book = self._books.setdefault(spreadsheet_id, {})
+        return book.setdefault(title, []), a1
+
+    def rows(self, spreadsheet_id: str, title: str) -> List[List[Any]]:
+        with self._lock:
+            return [list(r) for r in self._books.get(spreadsheet_id, {}).get(title, [])]
+
+    def total_calls(self) -> int:
+        with self._lock:
+            return sum(self.calls.values())
+
+
+class _Values:
+    def __init__(self, svc: FakeSheetsService):
+        self.svc = svc
+
+    def get(self, spreadsheetId: str, range: str, **_) -> _Request:
+        def run():
+            self.svc._call("values.get")
+            with self.svc._lock:
+                rows, a1 = self.svc._sheet(spreadsheetId, range)
+                start, end = (a1.split(":") + [None])[:2]
+                s = _CELL_RE.match(start)
+                e = _CELL_RE.match(end) if end else s
+                first_row = int(s.group("row") or 1)
+                last_row = int(e.group("row")) if e and e.group("row") else len(rows)
+                col = s.group("col")
+                out = []
+                for r in rows[first_row - 1:last_row]:
+                    out.append([r[_col_index(col)]] if col and _col_index(col) < len(r) else ([] if col else list(r)))
+                return {"values": out}
+        return _Request(run)
+
+    def update(self, spreadsheetId: str, range: str, body: Dict[str, Any], **_) -> _Request:
+        def run():
+            self.svc._call("values.update")
+            with self.svc._lock:
+                rows, a1 = self.svc._sheet(spreadsheetId, range)
+                row = int(_CELL_RE.match(a1.split(":")[0]).group("row") or 1)
+                for i, values in enumerate(body.get("values", [])):
+                    while len(rows) < row + i:
+                        rows.append([])
+                    rows[row + i - 1] = list(values)
+            return {"updatedRows": len(body.get("values", []))}
+        return _Request(run)
+
+    def append(self, spreadsheetId: str, range: str, body: Dict[str, Any], **_) -> _Request:
+        def run():
+            self.svc._call("values.append")
+            with self.svc._lock:
+                rows, _ = self.svc._sheet(spreadsheetId, range)
+                rows.extend(list(v) for v in body.get("values", []))
+            return {"updates": {"updatedRows": len(body.get("values", []))}}
+        return _Request(run)
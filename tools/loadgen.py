@@ -0,0 +1,222 @@
+# tools/loadgen.py
+"""
+Offline load test: N simulated reps run realistic scripts through
+engine.respond_to against a local fake OpenAI server and in-memory Sheets.
+
+    python -m tools.loadgen --reps 60 --rounds 2 --latency 0.8 --jitter 0.4
+
+Reports throughput, p50/p95/p99 turn latency, CPU seconds per session
+(thread CPU time spent inside respond_to), session size and process RSS.
+Pass --json to get the raw report.
+
+The model is fake, so by default the OpenAI rate limiter is unlimited and the
+run measures capacity, not the org quota. Pass --rpm/--tpm to emulate a
+quota, or --production-limits for the AGBOT_OPENAI_RPM/TPM limiter. Time
+spent queued on the limiter is reported per turn, separately from latency.
+"""
+import argparse
+import json
+import random
+import resource
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Dict, Any, List, Optional
+
+import openai
+
+import engine
+import llm
+import usage
+from rate_limiter import RateLimiter
+from session_store import session_size
+from tools.fakes import FakeOpenAIServer, FakeSheetsService
+
+UNLIMITED_RPM = 10 ** 6
+UNLIMITED_TPM = 10 ** 9
+
+# Rep scripts: what a rep actually types or clicks in one sitting
+SCRIPTS: Dict[str, List[str]] = {
+    "dailylog": ["!dailylog", "14", "32", "9", "3"],
+    "roleplay_price": [
+        "!roleplay price",
+        "We're at $519 a month right now",
+        "I need to be closer to $450",
+        "continue",
+        "what if they want 72 months at 489",
+        "end",
+    ],
+    "roleplay_trade": [
+        "!roleplay trade",
+        "They want 18,500 for the trade and we're at $14,200",
+        "continue",
+        "restart",
+        "end",
+    ],
+    "sidebar": ["!scripts", "!pvf", "!objection spouse", "!objection paymenttoohigh", "!checkpoints", "!earn"],
+    "coaching": ["!coaching", "!coaching-tips", "!trust", "!tonality", "!firstimpression"],
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+class MeasuredLimiter(RateLimiter):
+    """RateLimiter that tallies each thread's queue wait, so a rep can split
+    its turn latency into limiter wait and everything else."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._local = threading.local()
+
+    def acquire(self, key: str, tokens: int, timeout: Optional[float] = None) -> float:
+        waited = super().acquire(key, tokens, timeout)
+        self._local.waited = getattr(self._local, "waited", 0.0) + waited
+        return waited
+
+    def take_wait(self) -> float:
+        """Seconds this thread has waited since the last call."""
+        waited = getattr(self._local, "waited", 0.0)
+        self._local.waited = 0.0
+        return waited
+
+
+def run_rep(rep: int, rounds: int, think_time: float, rng: random.Random,
+            results: List[Dict[str, Any]], lock: threading.Lock) -> None:
+    session = engine.new_session(user_name=f"Rep {rep:03d}")
+    script_names = list(SCRIPTS)
+    cpu = 0.0
+    turns = []
+    waits = []
+    for _ in range(rounds):
+        for text in SCRIPTS[rng.choice(script_names)]:
+            cpu_start = time.thread_time()
+            started = time.perf_counter()
+            llm.LIMITER.take_wait()
+            engine.respond_to(session, text)
+            turns.append(time.perf_counter() - started)
+            waits.append(llm.LIMITER.take_wait())
+            cpu += time.thread_time() - cpu_start
+            engine.trim_history(session)
+            if think_time:
+                time.sleep(rng.uniform(0, think_time))
+    with lock:
+        results.append({"rep": rep, "turns": turns, "waits": waits, "cpu": cpu, "session_bytes": session_size(session)})
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reps", type=int, default=20, help="Concurrent simulated reps")
+    parser.add_argument("--rounds", type=int, default=2, help="Scripts each rep runs")
+    parser.add_argument("--think-time", type=float, default=0.5, help="Max seconds a rep pauses between turns")
+    parser.add_argument("--latency", type=float, default=0.8, help="Fake OpenAI mean latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.4, help="Fake OpenAI latency jitter (s)")
+    parser.add_argument("--function-call-rate", type=float, default=0.3, help="Share of roleplay turns that log via a tool call")
+    parser.add_argument("--sheets-latency", type=float, default=0.05, help="Fake Sheets per-call latency (s)")
+    parser.add_argument("--rpm", type=int, default=None, help="Emulate a requests/min quota (default: unlimited)")
+    parser.add_argument("--tpm", type=int, default=None, help="Emulate a tokens/min quota (default: unlimited)")
+    parser.add_argument("--production-limits", action="store_true",
+                        help="Use the AGBOT_OPENAI_RPM/TPM limiter the app runs with")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="Print the raw report as JSON")
+    args = parser.parse_args(argv)
+
+    server = FakeOpenAIServer(args.latency, args.jitter, args.function_call_rate, seed=args.seed).start()
+    openai.api_base = server.api_base
+    openai.api_key = "fake-key"
+    sheets = FakeSheetsService(latency=args.sheets_latency)
+    engine.configure_sheets(lambda: sheets, "fake-daily-log", "fake-session-log")
+    if args.production_limits:
+        llm.LIMITER = MeasuredLimiter()
+    else:
+        llm.LIMITER = MeasuredLimiter(rpm=args.rpm or UNLIMITED_RPM, tpm=args.tpm or UNLIMITED_TPM)
+
+    tracemalloc.start()
+    results: List[Dict[str, Any]] = []
+    lock = threading.Lock()
+    threads = [
+        threading.Thread(target=run_rep, name=f"rep-{i}",
+                         args=(i, args.rounds, args.think_time, random.Random(args.seed + i), results, lock))
+        for i in range(args.reps)
+    ]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - started
+    _, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    server.stop()
+
+    latencies = [t for r in results for t in r["turns"]]
+    waits = [w for r in results for w in r["waits"]]
+    served = [t - w for r in results for t, w in zip(r["turns"], r["waits"])]
+    report = {
+        "reps": args.reps,
+        "turns": len(latencies),
+        "wall_seconds": round(wall, 3),
+        "throughput_turns_per_sec": round(len(latencies) / wall, 3) if wall else 0.0,
+        "latency_seconds": {
+            "p50": round(percentile(latencies, 50), 4),
+            "p95": round(percentile(latencies, 95), 4),
+            "p99": round(percentile(latencies, 99), 4),
+            "max": round(max(latencies), 4) if latencies else 0.0,
+        },
+        # Turn latency minus time queued on the limiter, and that queue time itself
+        "latency_excluding_limiter_seconds": {
+            "p50": round(percentile(served, 50), 4),
+            "p95": round(percentile(served, 95), 4),
+            "p99": round(percentile(served, 99), 4),
+        },
+        "limiter_wait_seconds": {
+            "avg": round(statistics.mean(waits), 4) if waits else 0.0,
+            "p95": round(percentile(waits, 95), 4),
+            "max": round(max(waits), 4) if waits else 0.0,
+        },
+        "limits": ("production" if args.production_limits
+                   else {"rpm": args.rpm, "tpm": args.tpm} if args.rpm or args.tpm else "unlimited"),
+        "cpu_seconds_per_session": round(statistics.mean(r["cpu"] for r in results), 4) if results else 0.0,
+        "session_bytes_avg": int(statistics.mean(r["session_bytes"] for r in results)) if results else 0,
+        "traced_peak_bytes_per_session": int(peak_traced / max(1, args.reps)),
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "openai_requests": server.requests,
+        "sheets_calls": dict(sheets.calls),
+        "limiter": llm.LIMITER.stats(),
+        "coalescing": llm.FLIGHTS.stats(),
+        "usage": usage.LEDGER.report(),
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        lat = report["latency_seconds"]
+        print(f"{report['reps']} reps, {report['turns']} turns in {report['wall_seconds']}s "
+              f"→ {report['throughput_turns_per_sec']} turns/s")
+        print(f"turn latency p50 {lat['p50']}s  p95 {lat['p95']}s  p99 {lat['p99']}s  max {lat['max']}s")
+        ex, wait = report["latency_excluding_limiter_seconds"], report["limiter_wait_seconds"]
+        print(f"  excluding limiter wait: p50 {ex['p50']}s  p95 {ex['p95']}s  p99 {ex['p99']}s")
+        print(f"  limiter wait per turn ({report['limits']} limits): avg {wait['avg']}s  p95 {wait['p95']}s  "
+              f"max {wait['max']}s")
+        print(f"per session: {report['cpu_seconds_per_session']} CPU s, {report['session_bytes_avg']} bytes stored, "
+              f"{report['traced_peak_bytes_per_session']} bytes traced peak")
+        print(f"process max RSS {report['max_rss_kb']} KB; {report['openai_requests']} OpenAI requests; "
+              f"Sheets calls {report['sheets_calls']}")
+        spend = report["usage"].get("day", {})
+        for day, totals in spend.items():
+            print(f"usage {day}: {totals['prompt_tokens']} in / {totals['completion_tokens']} out tokens, "
+                  f"~${totals['cost']:.4f} over {totals['calls']} calls")
+        print(f"coalescing: {report['coalescing']['hits']} shared calls, hit ratio {report['coalescing']['hit_ratio']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
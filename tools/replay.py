@@ -0,0 +1,257 @@
+# tools/replay.py
+"""
+Replay recorded sessions (recorder.py cassettes) through engine.respond_to
+offline, with no OpenAI or Sheets traffic.
+
+    AGBOT_RECORD_DIR=recordings streamlit run app.py      # record
+    python -m tools.replay recordings/                    # replay every cassette in a directory
+    python -m tools.replay recordings/sess-ab12.jsonl --check
+
+Each cassette starts from its recorded session snapshot. Every turn is re-run
+with the recorded model responses and Sheets results played back in order.
+Behavior must match the recording:
+
+- the reply;
+- engine_state after the turn;
+- each request sent to the model (compacted as recorded);
+- each Sheets call (method and arguments).
+
+Dates and timestamps are masked before comparing. Timing is checked too:
+the engine's own time per turn (turn time minus recorded model and Sheets
+time) must stay within --slowdown x the recorded figure plus --slack-ms.
+--check exits 1 on any mismatch or slowdown.
+"""
+import argparse
+import copy
+import glob
+import json
+import os
+import re
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import openai
+
+import engine
+import llm
+import recorder
+from admission import ADMISSION, RESPONSE_CACHE
+from hedging import HEDGER
+from rate_limiter import RateLimiter
+from recorder import compact_request
+from singleflight import SingleFlight
+
+_TS_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?(?:Z|[+-]\d{2}:?\d{2})?")
+_VOLATILE_STATE = ("last_updated",)
+_VOLATILE_SHEETS_ARGS = ("spreadsheetId",)  # Recorded against another deployment's spreadsheets
+
+
+def normalize(value: Any) -> str:
+    return _TS_RE.sub("<ts>", json.dumps(value, sort_keys=True, default=str))
+
+
+def first_diff(expected: str, actual: str, context: int = 40) -> str:
+    i = next((k for k, (a, b) in enumerate(zip(expected, actual)) if a != b), min(len(expected), len(actual)))
+    lo = max(0, i - context // 2)
+    return f"expected {expected[lo:i + context]!r}, got {actual[lo:i + context]!r}"
+
+
+# =========================
+# Playback
+# =========================
+class Playback:
+    """Serves one turn's recorded completions and Sheets results, noting mismatches."""
+
+    def __init__(self):
+        self.llm: List[Dict[str, Any]] = []
+        self.sheets: List[Dict[str, Any]] = []
+        self.mismatches: List[str] = []
+
+    def load(self, turn: Dict[str, Any]) -> None:
+        self.llm = list(turn.get("llm") or [])
+        self.sheets = list(turn.get("sheets") or [])
+        self.mismatches = []
+
+    def create(self, **kwargs) -> Dict[str, Any]:
+        """Stand-in for openai.ChatCompletion.create."""
+        if not self.llm:
+            self.mismatches.append("model: unrecorded completion request")
+            raise RuntimeError("No recorded completion left for this turn")
+        entry = self.llm.pop(0)
+        expected, actual = normalize(entry["request"]), normalize(compact_request(kwargs))
+        if expected != actual:
+            self.mismatches.append("model request: " + first_diff(expected, actual))
+        if entry.get("error"):
+            raise RuntimeError(entry["error"])
+        return copy.deepcopy(entry["response"])
+
+    def execute(self, method: str, args: Dict[str, Any]) -> Any:
+        if not self.sheets:
+            self.mismatches.append(f"sheets: unrecorded {method} call")
+            raise RuntimeError(f"No recorded Sheets call left for {method}")
+        entry = self.sheets.pop(0)
+        if entry["method"] != method:
+            self.mismatches.append(f"sheets: expected {entry['method']}, got {method}")
+        else:
+            strip = lambda a: {k: v for k, v in (a or {}).items() if k not in _VOLATILE_SHEETS_ARGS}
+            expected, actual = normalize(strip(entry.get("args"))), normalize(strip(args))
+            if expected != actual:
+                self.mismatches.append(f"sheets {method}: " + first_diff(expected, actual))
+        if entry.get("error"):
+            raise RuntimeError(entry["error"])
+        return copy.deepcopy(entry["result"])
+
+    def leftovers(self) -> List[str]:
+        out = []
+        if self.llm:
+            out.append(f"model: {len(self.llm)} recorded completion(s) not requested")
+        if self.sheets:
+            out.append(f"sheets: {len(self.sheets)} recorded call(s) not made: "
+                       + ", ".join(e["method"] for e in self.sheets))
+        return out
+
+
+class ReplaySheets:
+    """googleapiclient-shaped chain whose .execute() is answered by a Playback."""
+
+    def __init__(self, playback: Playback, path: str = "", args: Optional[Dict[str, Any]] = None):
+        self._playback = playback
+        self._path = path
+        self._args = args or {}
+
+    def __getattr__(self, name: str):
+        path = f"{self._path}.{name}" if self._path else name
+
+        def call(*_, **kwargs):
+            return ReplaySheets(self._playback, path, kwargs)
+        return call
+
+    def execute(self):
+        return self._playback.execute(self._path, self._args)
+
+
+# =========================
+# Cassettes
+# =========================
+def cassette_paths(targets: List[str]) -> List[str]:
+    paths = []
+    for t in targets:
+        paths += sorted(glob.glob(os.path.join(t, "*.jsonl"))) if os.path.isdir(t) else [t]
+    return paths
+
+
+def read_cassette(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def reset_process_state() -> None:
+    """Start a cassette the way a fresh worker would: no shed history, cached
+    answers or in-flight calls carried over from the previous cassette."""
+    ADMISSION.reset()
+    RESPONSE_CACHE.clear()
+    llm.FLIGHTS = SingleFlight("llm")
+
+
+def _recorded_overhead(turn: Dict[str, Any]) -> float:
+    waited = sum(e.get("seconds") or 0.0 for e in (turn.get("llm") or []) + (turn.get("sheets") or []))
+    return max(0.0, (turn.get("seconds") or 0.0) - waited)
+
+
+def replay_cassette(path: str, playback: Playback, slowdown: float, slack: float,
+                    timing: bool = True) -> Dict[str, Any]:
+    session: Optional[Dict[str, Any]] = None
+    turns: List[Dict[str, Any]] = []
+    reset_process_state()
+    for n, line in enumerate(read_cassette(path)):
+        if line.get("type") == "session":
+            session = copy.deepcopy(line["session"])
+            continue
+        if line.get("type") != "turn" or session is None:
+            continue
+        problems: List[str] = []
+        state = session["engine_state"]
+        # Keep the recorded gap since the last turn so the session TTL behaves the same
+        started_at = (line.get("at") or 0.0) - (line.get("seconds") or 0.0)
+        recorded_last = (line.get("state_before") or {}).get("last_updated")
+        if recorded_last is not None:
+            state["last_updated"] = time.time() - max(0.0, started_at - recorded_last)
+
+        reply_to = line.get("reply_to")
+        if reply_to is not None and not any(m.get("id") == reply_to and m.get("pending")
+                                             for m in session["messages"]):
+            reply_to = engine.begin_turn(session, line["text"])
+
+        playback.load(line)
+        reply, error = None, None
+        started = time.perf_counter()
+        try:
+            reply = engine.respond_to(session, line["text"], reply_to)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        seconds = time.perf_counter() - started
+
+        problems += playback.mismatches + playback.leftovers()
+        if (error is None) != (line.get("error") is None):
+            problems.append(f"error: expected {line.get('error')!r}, got {error!r}")
+        elif error is None and normalize(reply) != normalize(line.get("reply")):
+            problems.append("reply: " + first_diff(normalize(line.get("reply")), normalize(reply)))
+        drop = lambda s: {k: v for k, v in (s or {}).items() if k not in _VOLATILE_STATE}
+        if normalize(drop(session["engine_state"])) != normalize(drop(line.get("state_after"))):
+            problems.append("engine_state: " + first_diff(normalize(drop(line.get("state_after"))),
+                                                          normalize(drop(session["engine_state"]))))
+        recorded = _recorded_overhead(line)
+        if timing and seconds > recorded * slowdown + slack:
+            problems.append(f"timing: {seconds * 1000:.1f} ms engine time vs {recorded * 1000:.1f} ms recorded")
+        turns.append({"line": n + 1, "text": line["text"][:60], "command_class": line.get("command_class"),
+                      "seconds": round(seconds, 4), "recorded_seconds": round(recorded, 4), "problems": problems})
+    return {
+        "cassette": path,
+        "turns": len(turns),
+        "failed": sum(1 for t in turns if t["problems"]),
+        "engine_seconds": round(sum(t["seconds"] for t in turns), 4),
+        "recorded_engine_seconds": round(sum(t["recorded_seconds"] for t in turns), 4),
+        "details": turns,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cassettes", nargs="+", help="Cassette files or directories of them")
+    parser.add_argument("--slowdown", type=float, default=1.5, help="Allowed engine-time ratio vs the recording")
+    parser.add_argument("--slack-ms", type=float, default=20.0, help="Allowed extra engine time per turn (ms)")
+    parser.add_argument("--no-timing", action="store_true", help="Check behavior only")
+    parser.add_argument("--check", action="store_true", help="Exit 1 on any mismatch or slowdown")
+    parser.add_argument("--json", action="store_true", help="Print the raw report as JSON")
+    args = parser.parse_args(argv)
+
+    playback = Playback()
+    openai.ChatCompletion.create = playback.create
+    openai.api_key = "replay"
+    engine.configure_sheets(lambda: ReplaySheets(playback), "replay-daily-log", "replay-session-log")
+    recorder.RECORDER.directory = ""  # Don't record the replay
+    HEDGER.enabled = False            # One completion per recorded request
+    llm.LIMITER = RateLimiter(rpm=10 ** 6, tpm=10 ** 9)  # Measure the engine, not the quota
+
+    reports = [replay_cassette(p, playback, args.slowdown, args.slack_ms / 1000.0, not args.no_timing)
+               for p in cassette_paths(args.cassettes)]
+    failed = sum(r["failed"] for r in reports)
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        for r in reports:
+            print(f"{r['cassette']}: {r['turns']} turns, {r['failed']} failed; engine time "
+                  f"{r['engine_seconds'] * 1000:.0f} ms (recorded {r['recorded_engine_seconds'] * 1000:.0f} ms)")
+            for t in r["details"]:
+                for problem in t["problems"]:
+                    print(f"  line {t['line']} [{t['command_class']}] {t['text']!r}: {problem}")
+        print(f"{len(reports)} cassette(s), {sum(r['turns'] for r in reports)} turns, {failed} failed")
+    return 1 if failed and args.check else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
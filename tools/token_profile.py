@@ -0,0 +1,201 @@
+# tools/token_profile.py
+"""
+Token usage per command: runs every command in the !help list, plus the
+daily-log and roleplay flows from tools/loadgen.py, through
+engine.respond_to against the deterministic fake model (tools/fakes.py) and
+in-memory Sheets, with no API keys or network.
+
+    python -m tools.token_profile                             # profile this build
+    python -m tools.token_profile --save before.json          # keep the results
+    python -m tools.token_profile --compare before.json       # diff against them
+    python -m tools.token_profile --compare before.json --check
+
+Each case runs in a fresh session. For each one it reports prompt and
+completion tokens (as the fake model counts them: chars/4, schemas included),
+LLM calls, Sheets calls and wall time. The model answers in-process with no
+latency, so wall time is the engine's own time (best of --repeat runs).
+Tokens and calls are deterministic for a given --seed. --check exits 1 when a
+case's tokens or calls grow more than --tolerance over the compared build.
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from typing import Any, Dict, List
+
+import openai
+
+import engine
+import llm
+import recorder
+from hedging import HEDGER
+from rate_limiter import RateLimiter
+from tools.fakes import FakeModel, FakeSheetsService
+from tools.loadgen import SCRIPTS
+
+FLOWS = ("dailylog", "roleplay_price", "roleplay_trade")
+_HELP_COMMAND_RE = re.compile(r"^(![\w-]+(?: [a-z]+)?)(?: \(alias [^)]*\))? —", re.MULTILINE)
+_COUNTED = ("prompt_tokens", "completion_tokens", "llm_calls", "sheets_calls")
+
+
+def cases() -> Dict[str, List[str]]:
+    """Case name -> what the rep types, in order."""
+    out = {"!help": ["!help"]}
+    for cmd in _HELP_COMMAND_RE.findall(engine.HELP_TEXT):
+        out[cmd] = [cmd]
+    for name in FLOWS:
+        out[f"flow:{name}"] = SCRIPTS[name]
+    return out
+
+
+# =========================
+# Profiling
+# =========================
+class CountingModel:
+    """Stand-in for openai.ChatCompletion.create that tallies what it served."""
+
+    def __init__(self, function_call_rate: float, seed: int):
+        self.function_call_rate = function_call_rate
+        self.seed = seed
+        self.reset()
+
+    def reset(self) -> None:
+        self.model = FakeModel(self.function_call_rate, self.seed)  # Same rolls for a case on every run
+        self.calls = self.prompt_tokens = self.completion_tokens = 0
+
+    def create(self, **kwargs) -> Dict[str, Any]:
+        response = self.model.reply(kwargs)
+        self.calls += 1
+        self.prompt_tokens += response["usage"]["prompt_tokens"]
+        self.completion_tokens += response["usage"]["completion_tokens"]
+        return response
+
+
+def profile_case(n: int, script: List[str], model: CountingModel, sheets: FakeSheetsService) -> Dict[str, Any]:
+    model.reset()
+    session = engine.new_session(f"profile-{n:03d}", user_name=f"Profile {n:03d}")
+    sheets_before = sheets.total_calls()
+    started = time.perf_counter()
+    for text in script:
+        engine.respond_to(session, text)
+    return {
+        "turns": len(script),
+        "prompt_tokens": model.prompt_tokens,
+        "completion_tokens": model.completion_tokens,
+        "llm_calls": model.calls,
+        "sheets_calls": sheets.total_calls() - sheets_before,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def run_all(only: List[str], repeat: int, function_call_rate: float, seed: int) -> Dict[str, Dict[str, Any]]:
+    model = CountingModel(function_call_rate, seed)
+    sheets = FakeSheetsService()
+    openai.ChatCompletion.create = model.create
+    openai.api_key = "profile"
+    engine.configure_sheets(lambda: sheets, "profile-daily-log", "profile-session-log")
+    llm.LIMITER = RateLimiter(rpm=10 ** 6, tpm=10 ** 9)  # Measure the engine, not the quota
+    recorder.RECORDER.directory = ""
+    HEDGER.enabled = False
+
+    results: Dict[str, Dict[str, Any]] = {}
+    n = 0
+    for name, script in cases().items():
+        if only and name not in only:
+            continue
+        runs = []
+        for _ in range(max(1, repeat)):
+            n += 1
+            runs.append(profile_case(n, script, model, sheets))
+        best = min(runs, key=lambda r: r["seconds"])
+        best["seconds"] = round(best["seconds"], 4)
+        results[name] = best
+    return results
+
+
+# =========================
+# Report and diff
+# =========================
+def totals(results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {k: sum(r[k] for r in results.values()) for k in _COUNTED + ("turns",)}
+    out["seconds"] = round(sum(r["seconds"] for r in results.values()), 4)
+    return out
+
+
+def report(results: Dict[str, Dict[str, Any]], base: Dict[str, Dict[str, Any]]) -> None:
+    def delta(name: str, key: str) -> str:
+        if name not in base or key not in base[name]:
+            return ""
+        d = results[name][key] - base[name][key]
+        return f"{d * 1000:+.1f}" if key == "seconds" else f"{d:+d}" if d else "="
+
+    rows = dict(results, TOTAL=totals(results))
+    base = dict(base, TOTAL=totals(base)) if base else {}
+    print(f"{'case':28} {'prompt':>8} {'diff':>7} {'compl':>6} {'diff':>6} {'llm':>4} {'diff':>4} "
+          f"{'sheets':>6} {'diff':>5} {'ms':>8} {'diff':>7}")
+    for name, r in rows.items():
+        print(f"{name:28} {r['prompt_tokens']:8d} {delta(name, 'prompt_tokens'):>7} "
+              f"{r['completion_tokens']:6d} {delta(name, 'completion_tokens'):>6} "
+              f"{r['llm_calls']:4d} {delta(name, 'llm_calls'):>4} "
+              f"{r['sheets_calls']:6d} {delta(name, 'sheets_calls'):>5} "
+              f"{r['seconds'] * 1000:8.1f} {delta(name, 'seconds'):>7}")
+    for name in base:
+        if name not in rows:
+            print(f"{name:28} (not in this build)")
+
+
+def regressions(results: Dict[str, Dict[str, Any]], base: Dict[str, Dict[str, Any]],
+                tolerance: float) -> List[str]:
+    out = []
+    for name, r in results.items():
+        b = base.get(name)
+        if not b:
+            continue
+        for key in _COUNTED:
+            if r[key] > b.get(key, 0) * (1 + tolerance):
+                out.append(f"{name}: {key} {b.get(key, 0)} -> {r[key]}")
+    return out
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="*", default=[], help="Run only these cases (e.g. '!scripts' flow:dailylog)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the fastest is reported")
+    parser.add_argument("--function-call-rate", type=float, default=0.3,
+                        help="Share of roleplay turns the fake model logs via a tool call")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Diff against results saved with --save")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Allowed growth in tokens or calls per case")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if any case grew past --tolerance")
+    parser.add_argument("--json", action="store_true", help="Print the raw results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run_all(args.only, args.repeat, args.function_call_rate, args.seed)
+    base: Dict[str, Dict[str, Any]] = {}
+    if args.compare:
+        with open(args.compare) as f:
+            base = json.load(f)["cases"]
+        if args.only:
+            base = {k: v for k, v in base.items() if k in results}
+
+    if args.json:
+        print(json.dumps({"cases": results, "totals": totals(results)}, indent=2))
+    else:
+        report(results, base)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"seed": args.seed, "function_call_rate": args.function_call_rate, "cases": results},
+                      f, indent=2, sort_keys=True)
+        print(f"Results written to {args.save}", file=sys.stderr)
+
+    found = regressions(results, base, args.tolerance)
+    if found:
+        print("Grew past tolerance:\n  " + "\n  ".join(found), file=sys.stderr if args.json else sys.stdout)
+        return 1 if args.check else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+# tracing.py
+"""
+Lightweight per-turn tracing.
+
+    with tracing.span("turn", session_id=sid) as turn:
+        with tracing.span("llm.completion", model=model) as s:
+            ...
+            s.set(prompt_tokens=812)
+
+Spans nest through a context variable, carry free-form attributes and are
+handed to every registered exporter when they end. Exporters are local and
+pluggable: JsonlExporter appends one JSON object per span to a file, and
+InMemoryCollector keeps them in a list for tests and tools. With no exporter
+registered, spans are still timed but go nowhere.
+
+Set AGBOT_TRACE_FILE to export every span to that JSONL file.
+"""
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, List, Optional
+
+import logs
+
+log = logs.get_logger("tracing")
+
+_current: ContextVar[Optional["Span"]] = ContextVar("agbot_current_span", default=None)
+
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start", "end", "attributes", "status")
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex[:16]
+        self.span_id = uuid.uuid4().hex[:8]
+        self.parent_id = parent.span_id if parent else None
+        self.start = time.time()
+        self.end: Optional[float] = None
+        self.attributes = dict(attributes)
+        self.status = "ok"
+
+    def set(self, **attributes: Any) -> "Span":
+        self.attributes.update(attributes)
+        return self
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end or time.time()) - self.start) * 1000.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class InMemoryCollector:
+    """Keeps finished spans in memory (bounded) for tests and tools."""
+
+    def __init__(self, limit: int = 10000):
+        self.limit = limit
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+            if len(self.spans) > self.limit:
+                del self.spans[: len(self.spans) - self.limit]
+
+    def find(self, name: str) -> List[Span]:
+        with self._lock:
+            return [s for s in self.spans if s.name == name]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class JsonlExporter:
+    """Appends one JSON line per finished span. Spans are queued to a logs.py
+    writer thread, so a turn never waits on the file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._sink = logs.jsonl_sink(path)
+
+    def export(self, span: Span) -> None:
+        fields = span.to_dict()
+        fields["attributes"] = dict(span.attributes)  # Snapshot: the writer thread serializes it later
+        self._sink.info("span", **fields)
+
+
+_exporters: List[Any] = []
+
+
+def add_exporter(exporter: Any) -> Any:
+    if exporter not in _exporters:
+        _exporters.append(exporter)
+    return exporter
+
+
+def remove_exporter(exporter: Any) -> None:
+    if exporter in _exporters:
+        _exporters.remove(exporter)
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def set_attributes(**attributes: Any) -> None:
+    """Attach attributes to the innermost open span, if any."""
+    s = _current.get()
+    if s is not None:
+        s.attributes.update(attributes)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    parent = _current.get()
+    s = Span(name, parent, attributes)
+    token = _current.set(s)
+    try:
+        yield s
+    except BaseException as e:
+        s.status = "error"
+        s.attributes["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        s.end = time.time()
+        _current.reset(token)
+        for exporter in list(_exporters):
+            try:
+                exporter.export(s)
+            except Exception as e:
+                log.warning("Trace exporter failed", exporter=repr(exporter), error=str(e))
+
+
+if os.getenv("AGBOT_TRACE_FILE"):
+    add_exporter(JsonlExporter(os.environ["AGBOT_TRACE_FILE"]))
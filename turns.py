@@ -0,0 +1,164 @@
+# turns.py
+"""
+Turns run off the Streamlit script thread.
+
+The script appends the rep's message and a "Working on it…" placeholder
+(engine.begin_turn), saves the session and hands the turn to this pool, then
+returns at once so the page renders. A worker runs engine.respond_to on a
+private copy of the session — the script thread keeps reading and acking the
+live record meanwhile — and, under the session lock, folds the result back
+into the latest stored copy (engine.finish_turn). The page polls until the
+placeholder is filled in.
+
+Turns for one session run one at a time, in the order they were sent.
+AGBOT_TURN_WORKERS sets the pool size; 0 runs turns inline on the caller.
+
+While a turn is queued or running, its worker renews a heartbeat on the
+placeholder in the stored session every AGBOT_TURN_LEASE / 3 seconds. The
+page, served by whichever worker process, gives up on a placeholder only when
+its lease lapses (the process holding the turn is gone) or it has been
+pending for AGBOT_TURN_TIMEOUT. A reply that arrives after that still
+replaces the note.
+
+The backlog of turns waiting for a worker is this process's real queue. The
+rate limiter only ever sees about one call per worker. So admission control
+(AGBOT_SHED_QUEUE_DEPTH) is checked here, against running plus waiting turns.
+A turn past the threshold gets its shed answer at once instead of waiting.
+"""
+import copy
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Tuple
+
+import engine
+import logs
+import metrics
+from admission import ADMISSION
+from session_store import SessionStore
+
+TURN_WORKERS = int(os.getenv("AGBOT_TURN_WORKERS", "8"))
+PENDING_TIMEOUT = float(os.getenv("AGBOT_TURN_TIMEOUT", "180"))  # Give up on a placeholder after this
+TURN_LEASE = float(os.getenv("AGBOT_TURN_LEASE", "30"))          # ... or once no worker has renewed it for this
+POLL_SECONDS = float(os.getenv("AGBOT_TURN_POLL", "0.75"))       # Page refresh while a reply is pending
+
+log = logs.get_logger("turns")
+
+Job = Tuple[str, int]  # (text, placeholder id)
+
+
+class TurnRunner:
+    def __init__(self, store: SessionStore, workers: int = TURN_WORKERS):
+        self.store = store
+        self.workers = workers
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="turn") if workers else None
+        self._lock = threading.Lock()
+        self._queues: Dict[str, Deque[Job]] = {}  # Sessions with a running turn -> turns waiting behind it
+        self._running: Dict[str, int] = {}        # Session -> placeholder id of its running turn
+        if self._pool is not None:
+            threading.Thread(target=self._heartbeat, name="turn-heartbeat", daemon=True).start()
+
+    def submit(self, session_id: str, text: str, reply_to: int) -> None:
+        """Queue a turn whose placeholder is already saved in the store."""
+        if self._pool is None:
+            self._run(session_id, (text, reply_to))
+            return
+        reason = ADMISSION.shed_reason(self.depth())
+        if reason:
+            self._shed(session_id, text, reply_to, reason)
+            return
+        with self._lock:
+            waiting = self._queues.get(session_id)
+            if waiting is not None:
+                waiting.append((text, reply_to))
+                return
+            self._queues[session_id] = deque()
+        self._pool.submit(self._drain, session_id, (text, reply_to))
+
+    def _drain(self, session_id: str, job: Job) -> None:
+        while True:
+            with self._lock:
+                self._running[session_id] = job[1]
+            self._run(session_id, job)
+            with self._lock:
+                waiting = self._queues[session_id]
+                if not waiting:
+                    del self._queues[session_id]
+                    self._running.pop(session_id, None)
+                    return
+                job = waiting.popleft()
+
+    def _held(self) -> Dict[str, List[int]]:
+        """Placeholder ids this process is running or holding, per session."""
+        held: Dict[str, List[int]] = {}
+        with self._lock:
+            for sid, waiting in self._queues.items():
+                held[sid] = [reply_to for _, reply_to in waiting]
+                if sid in self._running:
+                    held[sid].append(self._running[sid])
+        return held
+
+    def _heartbeat(self) -> None:
+        while True:
+            time.sleep(TURN_LEASE / 3)
+            for session_id, reply_ids in self._held().items():
+                try:
+                    with self.store.lock(session_id):
+                        session = self.store.get(session_id)
+                        if session is not None and engine.renew_lease(session, reply_ids):
+                            self.store.put(session)
+                except Exception:
+                    log.exception("Turn lease not renewed", session_id=session_id)
+
+    def _shed(self, session_id: str, text: str, reply_to: int, reason: str) -> None:
+        with self.store.lock(session_id):
+            session = self.store.get(session_id)
+            if session is None:
+                return
+            cls = engine.command_class(text, session["engine_state"])
+            engine.shed_turn(session, text, reply_to, reason)
+            self.store.put(session)
+        metrics.TURNS.labels(command_class=cls, outcome="shed").inc()
+
+    def _run(self, session_id: str, job: Job) -> None:
+        text, reply_to = job
+        with self.store.lock(session_id):
+            current = self.store.get(session_id)
+            if current is None:
+                log.warning("Session gone before its turn ran", session_id=session_id)
+                return
+            worked = copy.deepcopy(current)
+        try:
+            engine.respond_to(worked, text, reply_to)
+        except Exception:
+            log.exception("Deferred turn failed", session_id=session_id)
+        with self.store.lock(session_id):
+            latest = self.store.get(session_id) or worked
+            engine.finish_turn(latest, worked, reply_to)
+            self.store.put(latest)
+
+    def busy(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._queues
+
+    def depth(self) -> int:
+        """Turns running or waiting."""
+        with self._lock:
+            return sum(1 + len(q) for q in self._queues.values())
+
+
+_RUNNER: Optional[TurnRunner] = None
+_RUNNER_LOCK = threading.Lock()
+
+
+def get_runner(store: SessionStore) -> TurnRunner:
+    """Process-wide runner, created on first use."""
+    global _RUNNER
+    with _RUNNER_LOCK:
+        if _RUNNER is None:
+            _RUNNER = TurnRunner(store)
+            metrics.register_gauge("agbot_turn_queue_depth", "Deferred turns running or waiting",
+                                   _RUNNER.depth)
+        return _RUNNER
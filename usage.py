@@ -0,0 +1,146 @@
+# usage.py
+"""
+Token and cost accounting for OpenAI calls, with per-session and per-user
+daily budgets.
+
+Every completion's ``usage`` (the first turn call and the follow-up after a
+tool call, plus any ``hedge_usage`` charged for a duplicate request that lost
+a hedge) is recorded against the session, the rep, the command class and
+the UTC day. Session totals live on the session record (so they survive
+worker hops with the session store); user/command/day totals are kept in
+this process's ledger.
+
+Budgets are in USD and optional (0 disables):
+  AGBOT_BUDGET_SESSION_SOFT / AGBOT_BUDGET_SESSION_HARD   per session
+  AGBOT_BUDGET_USER_SOFT    / AGBOT_BUDGET_USER_HARD      per rep per UTC day
+Past a soft budget turns use AGBOT_BUDGET_MODEL (default gpt-4o-mini); past a
+hard budget the engine answers from the cache or static answers only.
+"""
+import datetime
+import json
+import os
+import threading
+from collections import defaultdict
+from typing import Dict, Any, Optional, Tuple
+
+import metrics
+
+# USD per 1M tokens (input, output). AGBOT_MODEL_PRICES='{"model": [in, out]}' overrides.
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+}
+MODEL_PRICES.update({k: tuple(v) for k, v in json.loads(os.getenv("AGBOT_MODEL_PRICES", "{}")).items()})
+
+SESSION_SOFT = float(os.getenv("AGBOT_BUDGET_SESSION_SOFT", "0"))
+SESSION_HARD = float(os.getenv("AGBOT_BUDGET_SESSION_HARD", "0"))
+USER_SOFT = float(os.getenv("AGBOT_BUDGET_USER_SOFT", "0"))
+USER_HARD = float(os.getenv("AGBOT_BUDGET_USER_HARD", "0"))
+DOWNGRADE_MODEL = os.getenv("AGBOT_BUDGET_MODEL", "gpt-4o-mini")
+
+BUDGET_MESSAGE = ("You've used today's practice budget for live coaching. "
+                  "Commands like !help and !checkpoints still work, and it resets tomorrow.")
+
+COST_USD = metrics.Counter("agbot_llm_cost_usd_total", "Estimated OpenAI spend", ["model", "command_class"])
+BUDGET_ACTIONS = metrics.Counter("agbot_budget_actions_total", "Turns downgraded or refused by budget", ["action"])
+
+
+def price(model: str) -> Tuple[float, float]:
+    if model in MODEL_PRICES:
+        return MODEL_PRICES[model]
+    # Dated snapshots (gpt-4o-2024-08-06) are priced like their family
+    for name in sorted(MODEL_PRICES, key=len, reverse=True):
+        if model.startswith(name):
+            return MODEL_PRICES[name]
+    return MODEL_PRICES["gpt-4o"]
+
+
+def cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    p_in, p_out = price(model)
+    return (prompt_tokens * p_in + completion_tokens * p_out) / 1_000_000
+
+
+def today() -> str:
+    return datetime.datetime.utcnow().strftime("%Y-%m-%d")
+
+
+def new_usage() -> Dict[str, Any]:
+    return {"prompt_tokens": 0, "completion_tokens": 0, "cost": 0.0, "calls": 0}
+
+
+def _add(totals: Dict[str, Any], prompt_tokens: int, completion_tokens: int, usd: float) -> None:
+    totals["prompt_tokens"] += prompt_tokens
+    totals["completion_tokens"] += completion_tokens
+    totals["cost"] += usd
+    totals["calls"] += 1
+
+
+class UsageLedger:
+    """Process-wide totals by (dimension, key, day); dimensions are user, command, model, day."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: Dict[Tuple[str, str, str], Dict[str, Any]] = defaultdict(new_usage)
+        self._day = today()
+
+    def record(self, session: Dict[str, Any], user: str, command_class: str,
+               response: Dict[str, Any]) -> float:
+        """Account one completion's ``usage``; returns its estimated cost."""
+        if response.get("coalesced"):
+            return 0.0  # Shared another caller's upstream call: no extra spend
+        u = response.get("usage") or {}
+        hedge = response.get("hedge_usage") or {}
+        prompt_tokens = int(u.get("prompt_tokens") or 0) + int(hedge.get("prompt_tokens") or 0)
+        completion_tokens = int(u.get("completion_tokens") or 0) + int(hedge.get("completion_tokens") or 0)
+        if not prompt_tokens and not completion_tokens:
+            return 0.0
+        model = str(response.get("model") or "")
+        usd = cost(model, prompt_tokens, completion_tokens)
+        day = today()
+        if day != self._day:
+            self._day = day
+            self.prune()
+        _add(session.setdefault("usage", new_usage()), prompt_tokens, completion_tokens, usd)
+        with self._lock:
+            for dimension, key in (("user", user), ("command", command_class), ("model", model), ("day", "")):
+                _add(self._totals[(dimension, key, day)], prompt_tokens, completion_tokens, usd)
+        COST_USD.labels(model=model, command_class=command_class).inc(usd)
+        return usd
+
+    def totals(self, dimension: str, key: str = "", day: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._totals.get((dimension, key, day or today())) or new_usage())
+
+    def report(self, day: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """{dimension: {key: totals}} for one UTC day."""
+        day = day or today()
+        out: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        with self._lock:
+            for (dimension, key, d), totals in self._totals.items():
+                if d == day:
+                    out[dimension][key or day] = dict(totals)
+        return dict(out)
+
+    def prune(self, keep_days: int = 7) -> None:
+        cutoff = (datetime.datetime.utcnow() - datetime.timedelta(days=keep_days)).strftime("%Y-%m-%d")
+        with self._lock:
+            for k in [k for k in self._totals if k[2] < cutoff]:
+                del self._totals[k]
+
+
+LEDGER = UsageLedger()
+
+
+def budget_state(session: Dict[str, Any], user: str) -> str:
+    """Budget verdict for this turn: "ok", "soft" (downgrade the model) or "hard" (no LLM call)."""
+    session_cost = (session.get("usage") or {}).get("cost", 0.0)
+    user_cost = LEDGER.totals("user", user)["cost"]
+    if (SESSION_HARD and session_cost >= SESSION_HARD) or (USER_HARD and user_cost >= USER_HARD):
+        BUDGET_ACTIONS.labels(action="hard").inc()
+        return "hard"
+    if (SESSION_SOFT and session_cost >= SESSION_SOFT) or (USER_SOFT and user_cost >= USER_SOFT):
+        BUDGET_ACTIONS.labels(action="soft").inc()
+        return "soft"
+    return "ok"